@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""Kesit özelliği ve muadil fonksiyonları için mikro + ölçeklenme ölçümleri.
+
+    python -m benchmarks.bench --kaydet benchmarks/sonuclar/taban.json
+    python -m benchmarks.bench --karsilastir benchmarks/sonuclar/taban.json --esik 0.25
+    python -m benchmarks.bench --boyutlar 10,100,1000,10000,100000,1000000 --sadece olcek
+
+Her ölçüm ortanca süre (s/çağrı) ve saniyedeki işlem sayısıyla kaydedilir.
+Karşılaştırmada bir ölçüm tabana göre --esik oranından fazla yavaşlamışsa
+çıkış kodu 1 olur.
+"""
+import argparse
+import datetime
+import inspect
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from profil_core import kesit
+from profil_core.katalog import KatalogIndeksi, build_all_profiles_wx_wy
+from profil_core.kesim import kesim_plani
+from profil_core.metraj import metraj, toplu_agirlik
+from profil_core.lama import lama_muadil_2d
+from profil_core.muadil import (
+    muadil_liste_10yuzde, muadil_knn, en_hafif_muadiller, lama_muadil_wx_wy, t_profil_wx_wy,
+    t_profil_h_araligi, kaynakli_wx_wy,
+)
+from profil_core.pareto import pareto_cephesi_sifirla
+from profil_core.tablolar import tablo
+from benchmarks.sentetik import sentetik_katalog_kur, sentetik_tablo
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Önbelleksiz çağrılar (LRU sarmalayıcı ölçümü bozmasın)
+_muadil = inspect.unwrap(muadil_liste_10yuzde)
+_knn = inspect.unwrap(muadil_knn)
+_en_hafif = inspect.unwrap(en_hafif_muadiller)
+_lama = inspect.unwrap(lama_muadil_wx_wy)
+_t_profil = inspect.unwrap(t_profil_wx_wy)
+_t_h_araligi = inspect.unwrap(t_profil_h_araligi)
+_kaynakli = inspect.unwrap(kaynakli_wx_wy)
+
+
+# ---------------------------------------------------------
+# ZAMANLAMA
+# ---------------------------------------------------------
+def zamanla(fonk, tekrar=5, min_sure=0.2):
+    """fonk'u yeterince çok çağırıp çağrı başına ortanca süreyi (s) döndürür."""
+    sayi = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(sayi):
+            fonk()
+        gecen = time.perf_counter() - t0
+        if gecen >= min_sure or sayi >= 1 << 20:
+            break
+        sayi *= 2 if gecen == 0 else max(2, int(min_sure / gecen) + 1)
+    sureler = [gecen / sayi]
+    for _ in range(tekrar - 1):
+        t0 = time.perf_counter()
+        for _ in range(sayi):
+            fonk()
+        sureler.append((time.perf_counter() - t0) / sayi)
+    return statistics.median(sureler)
+
+
+def _kayit(sure, n=1, **ek):
+    k = {"sn": sure, "n": n, "islem_s": n / sure if sure else None}
+    k.update(ek)
+    return k
+
+
+# ---------------------------------------------------------
+# MIKRO OLCUMLER
+# ---------------------------------------------------------
+def mikro(tekrar):
+    r = {}
+    ornekler = {
+        "wx_wy_boru": (kesit.wx_wy_boru, {"OD": 114.3, "t": 6.02}),
+        "wx_wy_rhs": (kesit.wx_wy_rhs, {"A": 100.0, "B": 50.0, "t": 4.0}),
+        "wx_wy_ipe": (kesit.wx_wy_ipe, {"h": 160.0, "b": 82.0}),
+        "wx_wy_hea": (kesit.wx_wy_hea, {"h": 133.0, "b": 140.0}),
+        "wx_wy_heb": (kesit.wx_wy_heb, {"h": 140.0, "b": 140.0}),
+        "wx_wy_upn": (kesit.wx_wy_upn, {"h": 120.0, "b": 55.0}),
+        "wx_wy_L": (kesit.wx_wy_L, {"a": 60.0, "b": 40.0, "t": 5.0}),
+        "wx_wy_round": (kesit.wx_wy_round, {"d": 40.0}),
+        "wx_wy_square": (kesit.wx_wy_square, {"a": 40.0}),
+        "wx_wy_bulb": (kesit.wx_wy_bulb, {"B": 120.0, "t": 8.0}),
+    }
+    for ad, (fonk, satir) in ornekler.items():
+        r["mikro/" + ad] = _kayit(zamanla(lambda: fonk(satir), tekrar))
+    r["mikro/wx_wy_rect"] = _kayit(zamanla(lambda: kesit.wx_wy_rect(160.0, 82.0), tekrar))
+    r["mikro/wx_wy_flatbar"] = _kayit(zamanla(lambda: kesit.wx_wy_flatbar(8.0, 80.0), tekrar))
+    r["mikro/agirlik_hesap"] = _kayit(zamanla(lambda: kesit.agirlik_hesap(1e-3, 6.0, 7.85), tekrar))
+    return r
+
+
+# ---------------------------------------------------------
+# ARAMA OLCUMLERI (VARSAYILAN TABLOLAR)
+# ---------------------------------------------------------
+def aramalar(tekrar):
+    r = {}
+    rnd = random.Random(0)
+    hedefler = [(rnd.uniform(1e3, 5e5), rnd.uniform(1e3, 5e5)) for _ in range(64)]
+
+    r["arama/build_all_profiles_wx_wy"] = _kayit(zamanla(build_all_profiles_wx_wy, tekrar))
+
+    def muadil():
+        for Wx, Wy in hedefler:
+            _muadil(Wx, Wy)
+    r["arama/muadil_liste_10yuzde"] = _kayit(zamanla(muadil, tekrar), len(hedefler))
+
+    def knn():
+        for Wx, Wy in hedefler:
+            _knn(Wx, Wy, 20.0, k=10)
+    r["arama/muadil_knn"] = _kayit(zamanla(knn, tekrar), len(hedefler))
+
+    def en_hafif():
+        for Wx, Wy in hedefler:
+            _en_hafif(Wx, Wy)
+    r["arama/en_hafif_muadiller"] = _kayit(zamanla(en_hafif, tekrar), len(hedefler))
+
+    def lama():
+        for Wx, Wy in hedefler:
+            _lama(Wx, Wy, 120.0)
+    r["arama/lama_muadil_wx_wy"] = _kayit(zamanla(lama, tekrar), len(hedefler))
+
+    def lama_2d():
+        for Wx, Wy in hedefler:
+            lama_muadil_2d(Wx, Wy)
+    r["arama/lama_muadil_2d"] = _kayit(zamanla(lama_2d, tekrar), len(hedefler))
+
+    # T ızgarası: varsayılan ve genişletilmiş (1-40 mm, 5 / 1 mm genişlik adımı);
+    # budamalı (varsayılan) ve tam ızgara yolları ayrı ölçülür. n, ızgara
+    # yolunun değerlendireceği aday sayısıdır.
+    ts = list(range(1, 41))
+    for ad, kw in (("varsayilan", {}),
+                   ("varsayilan_izgara", {"budama": False}),
+                   ("genis_b5", {"t_adaylari": ts, "b_adim": 5}),
+                   ("genis_b1", {"t_adaylari": ts, "b_adim": 1}),
+                   ("genis_b1_izgara", {"t_adaylari": ts, "b_adim": 1, "budama": False}),
+                   ("genis_surekli", {"t_adaylari": ts, "b_adim": None})):
+        t_min, t_max = (4, 30) if "t_adaylari" not in kw else (1, 40)
+        n_t = len([t for t in kw.get("t_adaylari", [4, 5, 6, 7, 8, 9, 10, 12, 15, 20, 25, 30])
+                   if t_min <= t <= t_max])
+        n_b = len(range(150, 600 + 1, kw.get("b_adim", 10) or 1))
+        sure = zamanla(lambda: _t_profil(2.0e5, 1.0e5, 300.0, t_min, t_max, **kw), tekrar)
+        r["arama/t_profil_wx_wy/" + ad] = _kayit(sure, n_t * n_t * n_b, birim="aday")
+
+    # Kaynaklı yapma kesitler: 1-40 mm kalınlık, 1 mm flanş adımı, en iyi 50
+    for topoloji in ("I", "Kutu", "U", "T"):
+        sure = zamanla(lambda: _kaynakli(topoloji, 1.2e6, 2.0e5, 300.0, 1, 40, t_adaylari=ts,
+                                         b_adim=1, top_k=50), tekrar, min_sure=0)
+        r["arama/kaynakli_wx_wy/" + topoloji] = _kayit(sure, 40 * 40 * 451, birim="aday")
+
+    # Çoklu yükseklik (H 150-450 mm, 10 mm adım): işçi sayısına göre ölçeklenme
+    for isci in sorted({1, 2, 4, os.cpu_count() or 1}):
+        sure = zamanla(lambda: _t_h_araligi(2.0e5, 1.0e5, 150, 450, 10, 1, 40, t_adaylari=ts,
+                                            b_adim=1, top_k=50, isci=isci,
+                                            kalici_havuz=False), tekrar, min_sure=0)
+        r["arama/t_profil_h_araligi/isci{}".format(isci)] = _kayit(sure, 31, birim="H")
+
+    # Kesim planı: büyük listeler FFD, küçük liste süre sınırlı kesin arama
+    boylar = [rnd.choice([350, 720, 1250, 2400, 2950, 3100, 4400, 5200]) for _ in range(5000)]
+    for n in (40, 1000, 5000):
+        sure = zamanla(lambda: kesim_plani(boylar[:n], kerf=4, sure_siniri=0.2), tekrar, min_sure=0)
+        r["arama/kesim_plani/{}".format(n)] = _kayit(sure, n, birim="parça")
+    # Farklı boylu liste: her parça ayrı boy (alt sınırın eşik sayısı en kötü durumda)
+    farkli = [round(rnd.uniform(100, 5900), 1) for _ in range(5000)]
+    for n in (1000, 5000):
+        sure = zamanla(lambda: kesim_plani(farkli[:n], kerf=4, sure_siniri=0.2), tekrar, min_sure=0)
+        r["arama/kesim_plani/farkli/{}".format(n)] = _kayit(sure, n, birim="parça")
+
+    # Toplu metraj: 100k satır, katalog adı + elle boyutlu lama karışık
+    n = 100000
+    adlar = [("ipe", p["profil"]) for p in tablo("ipe")] + [("rhs", p["profil"]) for p in tablo("rhs")]
+    secim = [adlar[rnd.randrange(len(adlar))] for _ in range(n)]
+    lama = np.arange(n) % 4 == 0
+    aile = np.where(lama, "lama", np.asarray([a for a, _ in secim]))
+    profil = np.where(lama, "", np.asarray([p for _, p in secim]))
+    boyutlar = {"h": np.where(lama, 80.0, np.nan), "t": np.where(lama, 8.0, np.nan)}
+    uzunluk = np.asarray([rnd.uniform(500, 12000) for _ in range(n)])
+    malzeme = np.asarray([rnd.choice(list(kesit.MALZEMELER)) for _ in range(n)])
+    r["arama/toplu_agirlik/{}".format(n)] = _kayit(zamanla(
+        lambda: toplu_agirlik(aile, uzunluk, malzeme=malzeme, boyutlar=boyutlar, profil=profil),
+        tekrar, min_sure=0), n, birim="satır")
+    r["arama/metraj/{}".format(n)] = _kayit(zamanla(
+        lambda: metraj(aile, uzunluk, malzeme=malzeme, boyutlar=boyutlar, profil=profil),
+        tekrar, min_sure=0), n, birim="satır")
+    return r
+
+
+# ---------------------------------------------------------
+# OLCEKLENME (SENTETIK KATALOG)
+# ---------------------------------------------------------
+def olcek(boyutlar, tekrar):
+    r = {}
+    rnd = random.Random(1)
+    for n in boyutlar:
+        t0 = time.perf_counter()
+        profiller = sentetik_katalog_kur(n)
+        kurulum = time.perf_counter() - t0
+        m = len(profiller)
+        az = max(1, min(tekrar, 3)) if n >= 100000 else tekrar
+
+        r["olcek/build_all_profiles_wx_wy/{}".format(n)] = _kayit(
+            zamanla(build_all_profiles_wx_wy, az, min_sure=0), m, kurulum_sn=kurulum)
+        r["olcek/KatalogIndeksi/{}".format(n)] = _kayit(
+            zamanla(lambda: KatalogIndeksi.satirlardan(profiller), az, min_sure=0), m)
+
+        ornek = [profiller[rnd.randrange(m)] for _ in range(32)]
+
+        def muadil():
+            for p in ornek:
+                _muadil(p["Wx_mm3"], p["Wy_mm3"], top_k=20)
+        r["olcek/muadil_liste_10yuzde/{}".format(n)] = _kayit(zamanla(muadil, az), len(ornek))
+
+        t0 = time.perf_counter()
+        _knn(ornek[0]["Wx_mm3"], ornek[0]["Wy_mm3"], k=10)  # ağaç ilk sorguda kurulur
+        agac_kurulum = time.perf_counter() - t0
+
+        def knn():
+            for p in ornek:
+                _knn(p["Wx_mm3"], p["Wy_mm3"], 20.0, k=20)
+        r["olcek/muadil_knn/{}".format(n)] = _kayit(zamanla(knn, az), len(ornek),
+                                                   kurulum_sn=agac_kurulum)
+
+        r["olcek/pareto_kurulum/{}".format(n)] = _kayit(
+            zamanla(lambda: pareto_cephesi_sifirla(derle=True), az, min_sure=0), m + n)
+
+        def en_hafif():
+            for p in ornek:
+                _en_hafif(p["Wx_mm3"], p["Wy_mm3"], top_k=20)
+        r["olcek/en_hafif_muadiller/{}".format(n)] = _kayit(zamanla(en_hafif, az), len(ornek))
+
+        lamalar = sentetik_tablo("lama", n)
+
+        def lama_2d():
+            for p in ornek[:8]:
+                lama_muadil_2d(p["Wx_mm3"], p["Wy_mm3"], lamalar)
+        r["olcek/lama_muadil_2d/{}".format(n)] = _kayit(zamanla(lama_2d, az, min_sure=0), 8)
+        print("  {:>8d} satır/aile tamam".format(n), file=sys.stderr)
+    return r
+
+
+# ---------------------------------------------------------
+# KAYIT / KARSILASTIRMA
+# ---------------------------------------------------------
+def _ortam():
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=KOK,
+                             capture_output=True, text=True).stdout.strip()
+    except OSError:
+        rev = ""
+    return {
+        "tarih": datetime.datetime.now().isoformat(timespec="seconds"),
+        "git": rev,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu": os.cpu_count(),
+    }
+
+
+def karsilastir(sonuclar, taban, esik):
+    """Ortak ölçümleri oranlarıyla yazdırır; gerilemiş ölçüm adlarını döndürür."""
+    geriler = []
+    print("{:55s} {:>12s} {:>12s} {:>8s}".format("ölçüm", "taban (s)", "şimdi (s)", "oran"))
+    for ad in sorted(set(sonuclar) & set(taban)):
+        once, simdi = taban[ad]["sn"], sonuclar[ad]["sn"]
+        oran = simdi / once if once else float("inf")
+        isaret = ""
+        if oran > 1.0 + esik:
+            geriler.append(ad)
+            isaret = "  << GERILEME"
+        print("{:55s} {:12.3e} {:12.3e} {:8.2f}{}".format(ad, once, simdi, oran, isaret))
+    return geriler
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Profil hesap ölçümleri")
+    ap.add_argument("--sadece", choices=["mikro", "arama", "olcek"], action="append",
+                    help="yalnızca bu grupları çalıştır (tekrarlanabilir)")
+    ap.add_argument("--boyutlar", default="10,100,1000,10000,100000",
+                    help="ölçeklenme için aile başına satır sayıları (virgüllü)")
+    ap.add_argument("--tekrar", type=int, default=5)
+    ap.add_argument("--kaydet", help="sonuçları bu JSON dosyasına yaz")
+    ap.add_argument("--karsilastir", help="taban JSON dosyası")
+    ap.add_argument("--esik", type=float, default=0.25, help="izin verilen yavaşlama oranı")
+    args = ap.parse_args(argv)
+
+    gruplar = args.sadece or ["mikro", "arama", "olcek"]
+    sonuclar = {}
+    if "mikro" in gruplar:
+        sonuclar.update(mikro(args.tekrar))
+    if "arama" in gruplar:
+        sonuclar.update(aramalar(args.tekrar))
+    if "olcek" in gruplar:
+        sonuclar.update(olcek([int(b) for b in args.boyutlar.split(",")], args.tekrar))
+
+    cikti = {"ortam": _ortam(), "sonuclar": sonuclar}
+    if args.kaydet:
+        os.makedirs(os.path.dirname(os.path.abspath(args.kaydet)), exist_ok=True)
+        with open(args.kaydet, "w", encoding="utf-8") as f:
+            json.dump(cikti, f, indent=2, ensure_ascii=False)
+
+    if args.karsilastir:
+        with open(args.karsilastir, encoding="utf-8") as f:
+            taban = json.load(f)["sonuclar"]
+        return 1 if karsilastir(sonuclar, taban, args.esik) else 0
+
+    for ad, k in sonuclar.items():
+        print("{:55s} {:12.3e} s  {:>14,.0f} /s".format(ad, k["sn"], k["islem_s"] or 0))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
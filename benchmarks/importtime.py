@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Açılış süresi karşılaştırması: hesap çekirdeği ve Streamlit uygulaması.
+
+Her hedef ayrı bir süreçte ``python -X importtime`` ile içe aktarılır;
+en üst modülün kümülatif süresi ve toplam süreç süresi raporlanır.
+
+    python -m benchmarks.importtime --tekrar 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEDEFLER = {
+    "core": "import profil_core",
+    "core_api": "from profil_core import agirlik_hesap, muadil_liste_10yuzde, t_profil_wx_wy",
+    "core_muadil": "import profil_core.muadil",
+    "core_tprofil": "import profil_core.tprofil",
+    "app": "import profil_app",
+}
+
+
+def _kumulatif_us(stderr, modul):
+    """importtime çıktısından modülün kümülatif süresini (µs) okur."""
+    for satir in stderr.splitlines():
+        if not satir.startswith("import time:"):
+            continue
+        parcalar = [p.strip() for p in satir[len("import time:"):].split("|")]
+        if len(parcalar) == 3 and parcalar[2] == modul:
+            return int(parcalar[1])
+    return None
+
+
+def olc(kod, tekrar=5):
+    ust_modul = kod.split()[1].rstrip(",")
+    kumulatif = []
+    duvar = []
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        p = subprocess.run([sys.executable, "-X", "importtime", "-c", kod],
+                           cwd=KOK, capture_output=True, text=True)
+        duvar.append((time.perf_counter() - t0) * 1000.0)
+        if p.returncode != 0:
+            raise RuntimeError(p.stderr.strip().splitlines()[-1])
+        us = _kumulatif_us(p.stderr, ust_modul)
+        if us is not None:
+            kumulatif.append(us / 1000.0)
+    return {
+        "kod": kod,
+        "import_ms": statistics.median(kumulatif) if kumulatif else None,
+        "surec_ms": statistics.median(duvar),
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--tekrar", type=int, default=5)
+    ap.add_argument("--json", action="store_true", help="sonucu JSON olarak yaz")
+    ap.add_argument("hedef", nargs="*", help="ölçülecek hedefler: " + ", ".join(HEDEFLER))
+    args = ap.parse_args(argv)
+    for ad in args.hedef:
+        if ad not in HEDEFLER:
+            ap.error("bilinmeyen hedef: {}".format(ad))
+
+    sonuc = {}
+    for ad in args.hedef or HEDEFLER:
+        try:
+            sonuc[ad] = olc(HEDEFLER[ad], args.tekrar)
+        except RuntimeError as e:
+            sonuc[ad] = {"kod": HEDEFLER[ad], "hata": str(e)}
+
+    if args.json:
+        print(json.dumps(sonuc, indent=2, ensure_ascii=False))
+        return 0
+    for ad, s in sonuc.items():
+        if "hata" in s:
+            print("{:12s} HATA: {}".format(ad, s["hata"]))
+        else:
+            print("{:12s} import {:8.1f} ms   süreç {:8.1f} ms".format(
+                ad, s["import_ms"] or float("nan"), s["surec_ms"]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
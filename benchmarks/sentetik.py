@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""tables/ şemasında sentetik katalog üretici (ölçeklenme ölçümleri için)."""
+import random
+
+from profil_core.katalog import build_all_profiles_wx_wy, katalog_indeksi_sifirla
+from profil_core.kolonsal import katalog_kutleleri
+from profil_core.tablolar import tablo_ayarla
+
+AILELER = ["boru", "rhs", "l_equal", "l_unequal", "ipe", "hea", "heb", "upn",
+           "round", "square", "bulbflat", "lama"]
+
+
+def _satir(aile, i, rnd):
+    u = rnd.uniform
+    if aile == "boru":
+        OD = round(u(10.0, 1000.0), 1)
+        return {"DN": i, "SCH": 40, "OD": OD, "t": round(OD * u(0.02, 0.2), 2)}
+    if aile == "rhs":
+        A = round(u(20.0, 500.0))
+        B = round(u(20.0, A))
+        return {"profil": "RHS S{}".format(i), "A": A, "B": B, "t": round(u(1.0, B / 2.5), 1)}
+    if aile in ("l_equal", "l_unequal"):
+        a = round(u(20.0, 250.0))
+        b = a if aile == "l_equal" else round(u(20.0, a))
+        return {"profil": "L S{}".format(i), "a": a, "b": b, "t": round(u(2.0, b / 5.0), 1)}
+    if aile in ("ipe", "hea", "heb", "upn"):
+        h = round(u(60.0, 1000.0))
+        b = round(u(0.3 * h, h))
+        return {"profil": "{} S{}".format(aile.upper(), i), "h": h, "b": b,
+                "tw": round(u(3.0, min(20.0, b / 3.0)), 1), "tf": round(u(4.0, min(40.0, h / 2.5)), 1)}
+    if aile == "round":
+        return {"profil": "Ø S{}".format(i), "d": round(u(5.0, 300.0))}
+    if aile == "square":
+        return {"profil": "S{}".format(i), "a": round(u(5.0, 300.0))}
+    if aile == "bulbflat":
+        return {"profil": "BF S{}".format(i), "B": round(u(60.0, 430.0)), "t": round(u(5.0, 20.0), 1)}
+    if aile == "lama":
+        h = round(u(10.0, 300.0))
+        return {"profil": "S{}".format(i), "h": h, "t": round(u(2.0, h), 1)}
+    raise ValueError(aile)
+
+
+def sentetik_tablo(aile, n, tohum=0):
+    """aile şemasında n satırlık rastgele (tekrarlanabilir) tablo."""
+    rnd = random.Random("{}:{}".format(aile, tohum))
+    return [_satir(aile, i, rnd) for i in range(n)]
+
+
+def sentetik_katalog_kur(n, aileler=AILELER, tohum=0):
+    """Her aileyi n satırlık sentetik tabloyla değiştirir ve indeksi yeniden kurar."""
+    for aile in aileler:
+        tablo_ayarla(aile, sentetik_tablo(aile, n, tohum))
+    profiller = build_all_profiles_wx_wy()
+    katalog_indeksi_sifirla(profiller, katalog_kutleleri(derle=True))
+    return profiller
@@ -0,0 +1,483 @@
+# -*- coding: utf-8 -*-
+"""Eşzamanlı oturum yük testi: kayıtlı sorguları tekrar oynatır.
+
+Her işçi süreci tek bir Streamlit sunucusu gibi davranır: --oturum
+sayıda oturum aynı süreçte iş parçacığı olarak çalışır ve önbellekleri
+paylaşır. Her oturum kendi sorgu dilimini sırayla işler. Sürücüler:
+
+    app     streamlit.testing AppTest ile profil_app.py; tip, malzeme,
+            metraj ve profil seçilir, Hesapla tıklanır
+    core    Hesapla'nın çağırdığı çekirdek fonksiyonlar (uye_kesit +
+            muadil / k-NN / en hafif / lama / T aramaları)
+    servis  yerel profil_servis (/agirlik, /muadil, /lama, /t_profil);
+            yalnızca localhost adresleri kabul edilir
+
+Sorgular profil_toplu üye alanlarıyla (tip, profil | DN + SCH | h_mm +
+t_mm, metraj_mm, malzeme) tanımlanır. Kaynaklar: PROFIL_OLCUM_LOG
+kaydı (Hesapla ölçümleri, JSONL), profil_toplu üye listesi (CSV/JSONL)
+ya da katalogdan --rastgele N seçim.
+
+AppTest süreç içinde eşzamanlı çalıştırmayı desteklemediğinden app
+sürücüsünde bir işçinin oturumları sırayla yeniden çalışır (bekleme
+gecikmeye dahildir); gerçek paralellik için --isci artırılır.
+
+Rapor: gecikme yüzdelikleri (p50/p95/p99, ms), toplam verim (sorgu/s)
+ve işçi başına RSS (anlık ve tepe, MB). app sürücüsünde gecikme
+Hesapla tıklamasından sonraki yeniden çalıştırmadır; seçimlerin
+yeniden çalıştırmaları "etkilesim" yüzdeliklerindedir.
+
+    python -m benchmarks.yuk --kayit olcum.jsonl --surucu app --isci 2 --oturum 4
+    python -m benchmarks.yuk --rastgele 2000 --surucu core --isci 4 --oturum 8 --kaydet yuk.json
+    python -m benchmarks.yuk --rastgele 500 --surucu servis --adres http://127.0.0.1:8765
+"""
+import argparse
+import datetime
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+UYGULAMA = os.path.join(KOK, "profil_app.py")
+
+# profil_app ile aynı: sayfa boyutu, T flanş adımı, k-NN varsayılanları
+SAYFA_BOYUTU = 50
+T_B_ADIM = 10
+KNN_K = 10
+KNN_AGIRLIKLARI = (1.0, 1.0, 1.0)
+
+YUZDELIKLER = (50, 95, 99)
+
+
+# ---------------------------------------------------------
+# SORGULAR
+# ---------------------------------------------------------
+def _uye(kayit):
+    """Ölçüm kaydı ya da üye satırı -> üye; Hesapla kaydı değilse None."""
+    if "baglam" not in kayit:
+        return dict(kayit)
+    if kayit.get("ad") != "hesapla" or "profil_tipi" not in kayit["baglam"]:
+        return None
+    uye = dict(kayit["baglam"])
+    uye["tip"] = uye.pop("profil_tipi")
+    return uye
+
+
+def sorgulari_oku(yol, ayirici=","):
+    """PROFIL_OLCUM_LOG kaydından ya da üye listesinden sorgular (dosya sırasıyla)."""
+    from profil_toplu import uyeleri_oku
+
+    return [u for u in map(_uye, uyeleri_oku(yol, ayirici)) if u is not None]
+
+
+def rastgele_sorgular(n, tohum=0):
+    """Tüm profil tiplerinden eşit olasılıklı katalog seçimleri."""
+    from profil_core.aileler import ozellik_tablosu
+    from profil_core.kesit import MALZEMELER
+    from profil_core.tablolar import tablo
+    from profil_core.uye import TIP_AILELERI
+
+    rnd = random.Random(tohum)
+    malzemeler = list(MALZEMELER)
+    sorgular = []
+    for _ in range(n):
+        tip, aile = rnd.choice(list(TIP_AILELERI.items()))
+        uye = {"tip": tip, "malzeme": rnd.choice(malzemeler),
+               "metraj_mm": float(rnd.choice((1000, 3000, 6000, 12000)))}
+        if aile == "boru":
+            r = rnd.choice(tablo("boru"))
+            uye.update(DN=r["DN"], SCH=r["SCH"])
+        elif aile == "lama":
+            uye.update(h_mm=float(rnd.randrange(20, 201, 10)), t_mm=float(rnd.randrange(3, 31)))
+        else:
+            uye["profil"] = rnd.choice(list(ozellik_tablosu(aile)))
+        sorgular.append(uye)
+    return sorgular
+
+
+def _sayi(deger, tip=float):
+    if deger is None or deger == "":
+        return None
+    if isinstance(deger, str):
+        deger = deger.replace(",", ".")
+    return tip(float(deger))
+
+
+# ---------------------------------------------------------
+# SURUCULER (oturum başına bir nesne; sorgu() -> (gecikme, etkileşim) s)
+# ---------------------------------------------------------
+# AppTest her çalıştırmada süreç genelindeki Runtime'ı kurup siler; bu
+# yüzden aynı işçideki oturumların yeniden çalıştırmaları sırayla yapılır.
+# Bekleme gecikmeye dahildir (tek sunucu sürecinde GIL çekişmesine yakın).
+_CALISTIRMA_KILIDI = threading.Lock()
+_BETIK_KILIDI = threading.Lock()
+_ortak_betik = None
+
+
+def _betik_onbellegini_paylas():
+    """AppTest her çalıştırmada yeni bir ScriptCache kurup betiği yeniden
+    derler; sunucuda ise tüm oturumlar tek önbelleği paylaşır. İşçi
+    sürecindeki ScriptCache'ler tek bir örneğe yönlendirilir."""
+    global _ortak_betik
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+
+    with _BETIK_KILIDI:
+        if _ortak_betik is None:
+            _ortak_betik = ScriptCache()
+            getir = ScriptCache.get_bytecode
+            ScriptCache.get_bytecode = lambda self, yol: getir(_ortak_betik, yol)
+
+
+class AppSurucusu:
+    """Bir tarayıcı oturumu: profil_app.py AppTest ile yeniden çalıştırılır."""
+
+    def __init__(self, zaman_asimi=120):
+        from streamlit.testing.v1 import AppTest
+
+        _betik_onbellegini_paylas()
+        self.at = AppTest.from_file(UYGULAMA, default_timeout=zaman_asimi)
+        self._calistir()
+
+    def _calistir(self):
+        with _CALISTIRMA_KILIDI:
+            self.at.run()
+        if self.at.exception:
+            raise RuntimeError(self.at.exception[0].message)
+
+    def _sec(self, etiket, deger):
+        for s in self.at.selectbox:
+            if s.label == etiket:
+                secenek = [o for o in s.options if str(o).upper() == str(deger).upper()]
+                if not secenek:
+                    raise ValueError("{} seçeneklerinde yok: {}".format(etiket, deger))
+                s.set_value(secenek[0])
+                return
+        raise ValueError("Seçim kutusu yok: {}".format(etiket))
+
+    def _sayi_gir(self, etiket, deger):
+        [n for n in self.at.number_input if n.label == etiket][0].set_value(deger)
+
+    def sorgu(self, uye):
+        from profil_core.uye import profil_tipi_coz
+
+        t0 = time.perf_counter()
+        self._sec("Profil Tipi:", profil_tipi_coz(uye["tip"]))
+        self._sec("Malzeme:", uye.get("malzeme") or "Çelik")
+        self._sayi_gir("Metraj (mm):", _sayi(uye.get("metraj_mm")) or 0.0)
+        self._calistir()
+        if uye.get("DN") not in (None, ""):
+            self._sec("DN:", _sayi(uye["DN"], int))
+            self._calistir()
+            self._sec("SCH:", uye["SCH"])
+        elif uye.get("h_mm") not in (None, ""):
+            self._sayi_gir("Lama yüksekliği (h, mm):", _sayi(uye["h_mm"]))
+            self._sayi_gir("Lama kalınlığı (t, mm):", _sayi(uye["t_mm"]))
+        else:
+            kutular = [s for s in self.at.selectbox if uye.get("profil") in s.options]
+            if not kutular:
+                raise ValueError("Tabloda bulunamadı: {}".format(uye.get("profil")))
+            kutular[0].set_value(uye["profil"])
+        self._calistir()
+        t1 = time.perf_counter()
+        [b for b in self.at.button if b.label == "Hesapla"][0].click()
+        self._calistir()
+        t2 = time.perf_counter()
+        return t2 - t1, t2 - t0
+
+
+class CoreSurucusu:
+    """Hesapla'nın çekirdek çağrıları, arayüzle aynı argümanlarla."""
+
+    def sorgu(self, uye):
+        from profil_core.kesit import MALZEMELER, agirlik_hesap
+        from profil_core.muadil import (
+            en_hafif_muadiller, lama_muadil_wx_wy, muadil_knn, muadil_liste_10yuzde,
+            t_profil_wx_wy,
+        )
+        from profil_core.uye import uye_kesit
+
+        t0 = time.perf_counter()
+        k = uye_kesit(uye["tip"], profil=uye.get("profil") or None, DN=_sayi(uye.get("DN"), int),
+                      SCH=uye.get("SCH"), h_mm=_sayi(uye.get("h_mm")), t_mm=_sayi(uye.get("t_mm")))
+        malzeme = uye.get("malzeme") or "Çelik"
+        rho = MALZEMELER[malzeme]
+        Wx, Wy = k["Wx"], k["Wy"]
+        kg_m = agirlik_hesap(k["A_m2"], 1.0, rho)
+        muadil_liste_10yuzde(Wx, Wy, sutunlu=True)
+        muadil_knn(Wx, Wy, kg_m, KNN_K, KNN_AGIRLIKLARI, rho)
+        en_hafif_muadiller(Wx, Wy, malzeme, SAYFA_BOYUTU, kg_m)
+        lama_muadil_wx_wy(Wx, Wy, k["H_max"], top_k=SAYFA_BOYUTU + 1, offset=0, sutunlu=True)
+        t_profil_wx_wy(Wx, Wy, k["H_max"], k["t_min"], k["t_max"], None, T_B_ADIM,
+                       top_k=SAYFA_BOYUTU + 1, offset=0, sutunlu=True)
+        sure = time.perf_counter() - t0
+        return sure, sure
+
+
+class ServisSurucusu:
+    """Yerel profil_servis'e Hesapla'nın karşılığı olan dört istek."""
+
+    UC_NOKTALAR = ("/agirlik", "/muadil", "/lama", "/t_profil")
+
+    def __init__(self, adres):
+        self.adres = adres.rstrip("/")
+
+    def _istek(self, yol, govde):
+        istek = urllib.request.Request(self.adres + yol, data=json.dumps(govde).encode(),
+                                       headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(istek, timeout=120) as yanit:
+                yanit.read()
+        except urllib.error.HTTPError as e:
+            # Servisin {"hata": ...} gövdesi hata örneklerinde görünsün
+            raise RuntimeError("{} {}: {}".format(yol, e.code, e.read().decode("utf-8", "replace")))
+
+    def sorgu(self, uye):
+        govde = dict(uye, top_k=SAYFA_BOYUTU + 1, b_adim=T_B_ADIM)
+        t0 = time.perf_counter()
+        for yol in self.UC_NOKTALAR:
+            self._istek(yol, govde)
+        sure = time.perf_counter() - t0
+        return sure, sure
+
+
+def yerel_adres(adres):
+    """adres localhost değilse ValueError; yük testi yalnızca yerel sunucuya yapılır."""
+    from profil_servis import YEREL_ADRESLER
+
+    host = urllib.parse.urlsplit(adres).hostname
+    if host not in YEREL_ADRESLER:
+        raise ValueError("Yalnızca yerel sunucu test edilir ({}): {}".format(
+            ", ".join(YEREL_ADRESLER), adres))
+    return adres
+
+
+def surucu_kur(surucu, adres=None):
+    if surucu == "app":
+        return AppSurucusu()
+    if surucu == "core":
+        return CoreSurucusu()
+    return ServisSurucusu(adres)
+
+
+# ---------------------------------------------------------
+# ISCI SURECI
+# ---------------------------------------------------------
+def _rss_mb():
+    """(anlık, tepe) yerleşik bellek, MB; anlık yalnızca /proc olan sistemlerde."""
+    tepe = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    try:
+        with open("/proc/self/statm") as f:
+            anlik = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2.0 ** 20
+    except (OSError, ValueError):
+        anlik = None
+    return anlik, tepe
+
+
+def isci(no, surucu, dilimler, adres, dusunme, engel, kuyruk):
+    """Bir sunucu süreci: her dilim bir oturum iş parçacığında oynatılır."""
+    logging.disable(logging.WARNING)
+    try:
+        t0 = time.perf_counter()
+        oturumlar = [surucu_kur(surucu, adres) for _ in dilimler]
+        acilis = time.perf_counter() - t0
+    except Exception as e:
+        engel.abort()
+        kuyruk.put({"isci": no, "hata": "{}: {}".format(type(e).__name__, e)})
+        return
+    gecikmeler, etkilesimler, hatalar = [], [], []
+    kilit = threading.Lock()
+    baslangic = threading.Barrier(len(oturumlar) + 1)
+
+    def oturum(surucu_nesnesi, dilim):
+        try:
+            baslangic.wait()
+        except threading.BrokenBarrierError:
+            return
+        for uye in dilim:
+            try:
+                gecikme, etkilesim = surucu_nesnesi.sorgu(uye)
+            except Exception as e:
+                with kilit:
+                    hatalar.append("{}: {}".format(type(e).__name__, e))
+            else:
+                with kilit:
+                    gecikmeler.append(gecikme)
+                    etkilesimler.append(etkilesim)
+            if dusunme:
+                time.sleep(dusunme)
+
+    izler = [threading.Thread(target=oturum, args=a, daemon=True)
+             for a in zip(oturumlar, dilimler)]
+    for iz in izler:
+        iz.start()
+    try:
+        engel.wait()  # tüm işçiler hazır olunca birlikte başlar
+    except threading.BrokenBarrierError:
+        baslangic.abort()
+        kuyruk.put({"isci": no, "hata": "başka bir işçi başlatılamadı"})
+        return
+    t0 = time.perf_counter()
+    baslangic.wait()
+    for iz in izler:
+        iz.join()
+    sure = time.perf_counter() - t0
+    anlik, tepe = _rss_mb()
+    kuyruk.put({
+        "isci": no, "oturum": len(oturumlar), "acilis_sn": acilis, "sure_sn": sure,
+        "gecikmeler": gecikmeler, "etkilesimler": etkilesimler, "hatalar": hatalar,
+        "rss_mb": anlik, "rss_tepe_mb": tepe,
+    })
+
+
+# ---------------------------------------------------------
+# RAPOR
+# ---------------------------------------------------------
+def yuzdelik(sirali, p):
+    """En yakın sıra yöntemiyle p. yüzdelik (sıralı liste)."""
+    if not sirali:
+        return None
+    return sirali[max(0, min(len(sirali) - 1, -(-p * len(sirali) // 100) - 1))]
+
+
+def _yuzdelikler_ms(sureler):
+    sirali = sorted(sureler)
+    return {"p{}".format(p): (None if not sirali else yuzdelik(sirali, p) * 1000.0)
+            for p in YUZDELIKLER}
+
+
+def calistir(sorgular, surucu="core", isci_sayisi=1, oturum=1, adres=None, dusunme=0.0):
+    """sorgular'ı isci_sayisi x oturum eşzamanlı oturuma dağıtıp oynatır; rapor sözlüğü."""
+    if surucu == "servis":
+        yerel_adres(adres)
+    n_oturum = isci_sayisi * oturum
+    # Oturum i, i, i + n_oturum, ... sorgularını kayıt sırasıyla işler
+    dilimler = [sorgular[i::n_oturum] for i in range(n_oturum)]
+    baglam = multiprocessing.get_context("spawn")
+    engel = baglam.Barrier(isci_sayisi + 1)
+    kuyruk = baglam.Queue()
+    surecler = [baglam.Process(target=isci, args=(
+        no, surucu, dilimler[no * oturum:(no + 1) * oturum], adres, dusunme, engel, kuyruk))
+        for no in range(isci_sayisi)]
+    for s in surecler:
+        s.start()
+    try:
+        engel.wait()
+    except threading.BrokenBarrierError:
+        pass
+    t0 = time.perf_counter()
+    isciler = [kuyruk.get() for _ in surecler]
+    sure = time.perf_counter() - t0
+    for s in surecler:
+        s.join()
+    kurulamayan = [i for i in isciler if "hata" in i and "sure_sn" not in i]
+    if kurulamayan:
+        raise RuntimeError("İşçi başlatılamadı: {}".format(kurulamayan[0]["hata"]))
+
+    isciler.sort(key=lambda i: i["isci"])
+    gecikmeler = [g for i in isciler for g in i["gecikmeler"]]
+    etkilesimler = [g for i in isciler for g in i["etkilesimler"]]
+    hatalar = [h for i in isciler for h in i["hatalar"]]
+    return {
+        "ortam": {
+            "tarih": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu": os.cpu_count(),
+        },
+        "ayarlar": {"surucu": surucu, "isci": isci_sayisi, "oturum": oturum,
+                    "sorgu": len(sorgular), "dusunme_sn": dusunme},
+        "sure_sn": sure,
+        "tamamlanan": len(gecikmeler),
+        "hata": len(hatalar),
+        "hata_ornekleri": sorted(set(hatalar))[:5],
+        "verim_sorgu_s": len(gecikmeler) / sure if sure else None,
+        "gecikme_ms": _yuzdelikler_ms(gecikmeler),
+        "etkilesim_ms": _yuzdelikler_ms(etkilesimler),
+        "isciler": [{
+            "isci": i["isci"], "oturum": i["oturum"], "acilis_sn": i["acilis_sn"],
+            "sure_sn": i["sure_sn"], "tamamlanan": len(i["gecikmeler"]),
+            "hata": len(i["hatalar"]),
+            "verim_sorgu_s": len(i["gecikmeler"]) / i["sure_sn"] if i["sure_sn"] else None,
+            "gecikme_ms": _yuzdelikler_ms(i["gecikmeler"]),
+            "rss_mb": i["rss_mb"], "rss_tepe_mb": i["rss_tepe_mb"],
+        } for i in isciler],
+    }
+
+
+def _ms(deger):
+    return "{:9.1f}".format(deger) if deger is not None else "        -"
+
+
+def raporu_yaz(rapor, dosya=sys.stdout):
+    a = rapor["ayarlar"]
+    print("{} sürücü, {} işçi x {} oturum, {} sorgu: {} tamamlandı, {} hata, {:.2f} s".format(
+        a["surucu"], a["isci"], a["oturum"], a["sorgu"], rapor["tamamlanan"], rapor["hata"],
+        rapor["sure_sn"]), file=dosya)
+    print("verim: {:.2f} sorgu/s".format(rapor["verim_sorgu_s"] or 0.0), file=dosya)
+    for ad in ("gecikme_ms", "etkilesim_ms"):
+        print("{:14s}".format(ad) + "".join(
+            "  {} {}".format(p, _ms(v)) for p, v in rapor[ad].items()), file=dosya)
+    print("{:>5s} {:>7s} {:>9s} {:>9s} {:>9s} {:>9s} {:>9s} {:>9s}".format(
+        "işçi", "sorgu", "sorgu/s", "p50 ms", "p95 ms", "p99 ms", "RSS MB", "tepe MB"),
+        file=dosya)
+    for i in rapor["isciler"]:
+        g = i["gecikme_ms"]
+        print("{:5d} {:7d} {:9.2f} {} {} {} {} {}".format(
+            i["isci"], i["tamamlanan"], i["verim_sorgu_s"] or 0.0, _ms(g["p50"]), _ms(g["p95"]),
+            _ms(g["p99"]), _ms(i["rss_mb"]), _ms(i["rss_tepe_mb"])), file=dosya)
+    for h in rapor["hata_ornekleri"]:
+        print("hata: " + h, file=dosya)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Eşzamanlı oturum yük testi (yalnızca yerel)")
+    kaynak = ap.add_mutually_exclusive_group(required=True)
+    kaynak.add_argument("--kayit", help="PROFIL_OLCUM_LOG kaydı ya da üye listesi (.csv/.jsonl)")
+    kaynak.add_argument("--rastgele", type=int, help="katalogdan bu kadar rastgele sorgu")
+    ap.add_argument("--surucu", choices=("app", "core", "servis"), default="app")
+    ap.add_argument("--isci", type=int, default=1, help="sunucu süreci sayısı")
+    ap.add_argument("--oturum", type=int, default=4, help="işçi başına eşzamanlı oturum")
+    ap.add_argument("--tekrar", type=int, default=1, help="sorgu listesi kaç kez oynatılsın")
+    ap.add_argument("--dusunme", type=float, default=0.0,
+                    help="oturumda sorgular arası bekleme (s)")
+    ap.add_argument("--adres", default="http://127.0.0.1:8765", help="servis sürücüsü adresi")
+    ap.add_argument("--tohum", type=int, default=0)
+    ap.add_argument("--ayirici", default=",", help="CSV ayırıcı karakteri")
+    ap.add_argument("--kaydet", help="raporu bu JSON dosyasına yaz")
+    args = ap.parse_args(argv)
+
+    if args.isci < 1 or args.oturum < 1 or args.tekrar < 1:
+        ap.error("--isci, --oturum ve --tekrar en az 1 olmalı")
+    try:
+        if args.surucu == "servis":
+            yerel_adres(args.adres)
+        sorgular = (sorgulari_oku(args.kayit, args.ayirici) if args.kayit
+                    else rastgele_sorgular(args.rastgele, args.tohum))
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    if not sorgular:
+        print("Oynatılacak sorgu yok.", file=sys.stderr)
+        return 2
+
+    rapor = calistir(sorgular * args.tekrar, args.surucu, args.isci, args.oturum, args.adres,
+                     args.dusunme)
+    if args.kaydet:
+        os.makedirs(os.path.dirname(os.path.abspath(args.kaydet)), exist_ok=True)
+        with open(args.kaydet, "w", encoding="utf-8") as f:
+            json.dump(rapor, f, indent=2, ensure_ascii=False)
+    raporu_yaz(rapor)
+    return 1 if rapor["hata"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,419 +1,276 @@
 
 # -*- coding: utf-8 -*-
 import streamlit as st
-import math
 import os
+import tempfile
+
+from profil_core.aileler import AILELER, kesit_ozellikleri, ozellik, ozellik_tablosu
+from profil_core.cizim import kesit_svg, statik_gorsel
+from profil_core.disa_aktar import (
+    BICIMLER, agirlik_bloklari, disa_aktar, lama_bloklari, muadil_bloklari, t_bloklari,
+)
+from profil_core.izleyici import izlemeyi_baslat, yenileme_hatalari
+from profil_core.katalog import katalog_surumu
+from profil_core.kesit import MALZEMELER, agirlik_hesap
+from profil_core.lama import lama_t_araliklari
+from profil_core.muadil import (
+    muadil_liste_10yuzde, muadil_knn, en_hafif_muadiller, lama_muadil_wx_wy, t_profil_wx_wy,
+    t_profil_h_araligi, kaynakli_wx_wy,
+)
+from profil_core.kaynakli import TOPOLOJILER
+from profil_core.kesim import kesim_listesi_coz, kesim_plani
+from profil_core.olcum import Olcum, asama
+from profil_core.onbellek import onbellek_istatistikleri, onbellekleri_temizle
+from profil_core.tablolar import tablo
+from profil_core.uye import PROFIL_TIPLERI, TIP_AILELERI
 
-from tables.boru import BORU_TABLO
-from tables.rhs import RHS_TABLO
-from tables.l_equal import L_EQUAL_TABLO
-from tables.l_unequal import L_UNEQUAL_TABLO
-from tables.ipe import IPE_TABLO
-from tables.hea import HEA_TABLO
-from tables.heb import HEB_TABLO
-from tables.upn import UPN_TABLO
-from tables.bulbflat import BULBFLAT_TABLO
-from tables.round import ROUND_TABLO
-from tables.square import SQUARE_TABLO
 
 BASE_DIR = os.path.dirname(__file__)
 IMG_DIR = os.path.join(BASE_DIR, "img")
 
+# Lama / T listelerinde sayfa başına satır
+SAYFA_BOYUTU = 50
+
+# T aramasında flanş genişliği çözünürlüğü (mm); None: sürekli
+T_B_ADIMLARI = {"10 mm": 10, "5 mm": 5, "1 mm": 1, "Sürekli": None}
+# Kaynaklı kesit araması yalnızca ızgara üzerinde çalışır
+KAYNAKLI_B_ADIMLARI = {ad: adim for ad, adim in T_B_ADIMLARI.items() if adim is not None}
+
+# Dışa aktarılan dosyaların MIME tipleri
+MIME_TIPLERI = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# Kesim planında seçilebilecek stok çubuk boyları (mm)
+STOK_BOYLARI = [6000.0, 12000.0]
+
+# aile -> (alt başlık, seçim etiketi, özet satırları)
+# Özet satırları seçilen satırın alanlarıyla biçimlenir.
+_OZET_I = ["**Seçilen profil:** {profil}",
+           "- h: **{h} mm**, b: **{b} mm**, tw: **{tw} mm**, tf: **{tf} mm**"]
+_OZET_L = ["**Seçilen profil:** {profil}", "- a: **{a} mm**, b: **{b} mm**, t: **{t} mm**"]
+GOSTERIM = {
+    "boru": ("Boru (DN + SCH)", None,
+             ["**Seçilen boru:** DN {DN} SCH {SCH}", "- OD: **{OD:.2f} mm**, t: **{t:.2f} mm**"]),
+    "rhs": ("Kutu Profil (RHS / SHS)", "Profil:",
+            ["**Seçilen profil:** {profil}", "- A: **{A} mm**, B: **{B} mm**, t: **{t} mm**"]),
+    "l_equal": ("Köşebent (L Eşit)", "Profil:", _OZET_L),
+    "l_unequal": ("Köşebent (L Eşit Olmayan)", "Profil:", _OZET_L),
+    "upn": ("U Profil (UPN)", "Profil:", _OZET_I),
+    "ipe": ("I Profil (IPE)", "Profil:", _OZET_I),
+    "hea": ("H Profil (HEA)", "Profil:", _OZET_I),
+    "heb": ("H Profil (HEB)", "Profil:", _OZET_I),
+    "round": ("Yuvarlak Dolu", "Çap:", ["**Seçilen profil:** {profil} (d = {d} mm)"]),
+    "square": ("Kare Dolu", "Profil:", ["**Seçilen profil:** {profil} (a = {a} mm)"]),
+    "bulbflat": ("Hollanda Profili (Bulb Flat)", "Profil:",
+                 ["**Seçilen profil:** {profil}", "- B: **{B} mm**, t: **{t} mm**"]),
+    "lama": ("Lama (Flat Bar)", None, []),
+}
+
 
 # ---------------------------------------------------------
 # TEKNIK CIZIM SECIMI
 # ---------------------------------------------------------
 def get_image_for_type(profil_tipi):
+    """Genel teknik çizim setinin baytları (süreç başına bir kez okunur)."""
     if profil_tipi in ["I Profil (IPE)", "H Profil (HEA)", "H Profil (HEB)", "U Profil (UPN)"]:
         fname = "profil_set2.png"
     else:
         fname = "profil_set1.png"
-    path = os.path.join(IMG_DIR, fname)
-    if os.path.exists(path):
-        return path
-    return None
-
+    return statik_gorsel(os.path.join(IMG_DIR, fname))
 
-# ---------------------------------------------------------
-# AGIRLIK HESABI
-# ---------------------------------------------------------
-def agirlik_hesap(A_m2, L_m, rho_g_cm3):
-    hacim_m3 = A_m2 * L_m
-    return hacim_m3 * rho_g_cm3 * 1000.0
 
+def muadil_cizimleri(lama_sorgu, t_sorgu):
+    """En iyi lama ve T muadilinin (çizim, başlık) çiftleri.
 
-# ---------------------------------------------------------
-# WX – WY HESAPLARI
-# ---------------------------------------------------------
-def wx_wy_boru(row):
-    OD = row.get("OD")
-    t = row.get("t")
-    if not OD or not t:
-        return None, None
-    OD_m = OD / 1000.0
-    t_m = t / 1000.0
-    ID_m = OD_m - 2 * t_m
-    if ID_m <= 0:
-        return None, None
-    Ix_m4 = (math.pi / 64.0) * (OD_m ** 4 - ID_m ** 4)
-    Wx_m3 = Ix_m4 / (OD_m / 2.0)
-    Wx_mm3 = Wx_m3 * 1e9
-    return Wx_mm3, Wx_mm3
-
-
-def wx_wy_rhs(row):
-    A = row.get("A")
-    B = row.get("B")
-    t = row.get("t")
-    if not A or not B or not t:
-        return None, None
-    h = A / 1000.0
-    b = B / 1000.0
-    t_m = t / 1000.0
-    if h <= 2 * t_m or b <= 2 * t_m:
-        return None, None
-    Ix = (b * h ** 3 - (b - 2 * t_m) * (h - 2 * t_m) ** 3) / 12.0
-    Iy = (h * b ** 3 - (h - 2 * t_m) * (b - 2 * t_m) ** 3) / 12.0
-    Wx = Ix / (h / 2.0)
-    Wy = Iy / (b / 2.0)
-    return Wx * 1e9, Wy * 1e9
-
-
-def wx_wy_rect(h_mm, b_mm):
-    if h_mm is None or b_mm is None:
-        return None, None
-    h = h_mm / 1000.0
-    b = b_mm / 1000.0
-    Ix = b * h ** 3 / 12.0
-    Iy = h * b ** 3 / 12.0
-    Wx = Ix / (h / 2.0)
-    Wy = Iy / (b / 2.0)
-    return Wx * 1e9, Wy * 1e9
-
-
-def wx_wy_ipe(row):
-    return wx_wy_rect(row.get("h"), row.get("b"))
-
-
-def wx_wy_hea(row):
-    return wx_wy_rect(row.get("h"), row.get("b"))
-
-
-def wx_wy_heb(row):
-    return wx_wy_rect(row.get("h"), row.get("b"))
-
-
-def wx_wy_upn(row):
-    return wx_wy_rect(row.get("h"), row.get("b"))
-
-
-def wx_wy_L(row):
-    a = row.get("a")
-    b = row.get("b")
-    t = row.get("t")
-    if not a or not b or not t:
-        return None, None
-    a_m = a / 1000.0
-    b_m = b / 1000.0
-    t_m = t / 1000.0
-    Ix = (b_m * a_m ** 3 - (b_m - t_m) * (a_m - t_m) ** 3) / 12.0
-    Iy = (a_m * b_m ** 3 - (a_m - t_m) * (b_m - t_m) ** 3) / 12.0
-    Wx = Ix / (a_m / 2.0)
-    Wy = Iy / (b_m / 2.0)
-    return Wx * 1e9, Wy * 1e9
-
-
-def wx_wy_round(row):
-    d = row.get("d")
-    if not d:
-        return None, None
-    d_m = d / 1000.0
-    Ix = math.pi * d_m ** 4 / 64.0
-    Wx = Ix / (d_m / 2.0)
-    Wx_mm3 = Wx * 1e9
-    return Wx_mm3, Wx_mm3
-
-
-def wx_wy_square(row):
-    a = row.get("a")
-    if not a:
-        return None, None
-    a_m = a / 1000.0
-    Ix = a_m ** 4 / 12.0
-    Wx = Ix / (a_m / 2.0)
-    Wx_mm3 = Wx * 1e9
-    return Wx_mm3, Wx_mm3
-
-
-def wx_wy_bulb(row):
-    B = row.get("B")
-    t = row.get("t")
-    if not B or not t:
-        return None, None
-    return wx_wy_rect(t, B)
-
-
-def wx_wy_flatbar(b_mm, h_mm):
-    """Dikdörtgen lama için Wx, Wy (mm³). b=kalınlık, h=yükseklik."""
-    b = b_mm / 1000.0
-    h = h_mm / 1000.0
-    Ix = b * h ** 3 / 12.0
-    Iy = h * b ** 3 / 12.0
-    Wx = Ix / (h / 2.0)
-    Wy = Iy / (b / 2.0)
-    return Wx * 1e9, Wy * 1e9
+    Aramalar ana sütundaki ilk sayfa çağrısıyla aynı argümanlarla
+    yapılır; sonuçlar önbellekten gelir.
+    """
+    cizimler = []
+    if lama_sorgu:
+        lamalar = lama_muadil_wx_wy(*lama_sorgu, top_k=SAYFA_BOYUTU + 1, offset=0, sutunlu=True)
+        if lamalar:
+            r = lamalar[0]
+            cizimler.append((kesit_svg("lama", {"h": r["h (mm)"], "t": r["t (mm)"]}),
+                             "En yakın muadil lama: {}".format(r["Lama"])))
+    if t_sorgu:
+        t_listesi = t_profil_wx_wy(*t_sorgu, top_k=SAYFA_BOYUTU + 1, offset=0, sutunlu=True)
+        if t_listesi:
+            r = t_listesi[0]
+            cizimler.append((kesit_svg("T", {"H": r["H (mm)"], "b_f": r["b_f (mm)"],
+                                             "t_f": r["t_f (mm)"], "t_w": r["t_w (mm)"]}),
+                             "En yakın muadil {}".format(r["T Profil"])))
+    return cizimler
 
 
 # ---------------------------------------------------------
-# TUM PROFILLERIN WX – WY LISTESI
+# SAYFALI SONUC TABLOSU
 # ---------------------------------------------------------
-def build_all_profiles_wx_wy():
-    lst = []
-
-    for r in BORU_TABLO:
-        Wx, Wy = wx_wy_boru(r)
-        if Wx:
-            lst.append({"Profil": "DN {} SCH {}".format(r["DN"], r["SCH"]), "Tip": "Boru",
-                        "Wx_mm3": Wx, "Wy_mm3": Wy})
-
-    for r in RHS_TABLO:
-        Wx, Wy = wx_wy_rhs(r)
-        if Wx:
-            lst.append({"Profil": r["profil"], "Tip": "RHS/SHS", "Wx_mm3": Wx, "Wy_mm3": Wy})
-
-    for r in L_EQUAL_TABLO:
-        Wx, Wy = wx_wy_L(r)
-        if Wx:
-            lst.append({"Profil": r["profil"], "Tip": "L eşit", "Wx_mm3": Wx, "Wy_mm3": Wy})
-
-    for r in L_UNEQUAL_TABLO:
-        Wx, Wy = wx_wy_L(r)
-        if Wx:
-            lst.append({"Profil": r["profil"], "Tip": "L eşit olmayan", "Wx_mm3": Wx, "Wy_mm3": Wy})
-
-    for r in IPE_TABLO:
-        Wx, Wy = wx_wy_ipe(r)
-        if Wx:
-            lst.append({"Profil": r["profil"], "Tip": "IPE", "Wx_mm3": Wx, "Wy_mm3": Wy})
-
-    for r in HEA_TABLO:
-        Wx, Wy = wx_wy_hea(r)
-        if Wx:
-            lst.append({"Profil": r["profil"], "Tip": "HEA", "Wx_mm3": Wx, "Wy_mm3": Wy})
-
-    for r in HEB_TABLO:
-        Wx, Wy = wx_wy_heb(r)
-        if Wx:
-            lst.append({"Profil": r["profil"], "Tip": "HEB", "Wx_mm3": Wx, "Wy_mm3": Wy})
-
-    for r in UPN_TABLO:
-        Wx, Wy = wx_wy_upn(r)
-        if Wx:
-            lst.append({"Profil": r["profil"], "Tip": "UPN", "Wx_mm3": Wx, "Wy_mm3": Wy})
-
-    for r in ROUND_TABLO:
-        Wx, Wy = wx_wy_round(r)
-        if Wx:
-            lst.append({"Profil": r["profil"], "Tip": "Yuvarlak", "Wx_mm3": Wx, "Wy_mm3": Wy})
-
-    for r in SQUARE_TABLO:
-        Wx, Wy = wx_wy_square(r)
-        if Wx:
-            lst.append({"Profil": r["profil"], "Tip": "Kare", "Wx_mm3": Wx, "Wy_mm3": Wy})
-
-    for r in BULBFLAT_TABLO:
-        Wx, Wy = wx_wy_bulb(r)
-        if Wx:
-            lst.append({"Profil": r["profil"], "Tip": "Bulb Flat", "Wx_mm3": Wx, "Wy_mm3": Wy})
-
-    return lst
+def tablo_goster(sonuc):
+    """Sütunlu sonucu (SonucTablosu) Arrow tablosu olarak çizer; sayı
+    biçimleri veriye değil gösterime uygulanır."""
+    st.dataframe(sonuc.arrow(), use_container_width=True, column_config={
+        ad: st.column_config.NumberColumn(format=bicim) for ad, bicim in sonuc.bicimler().items()})
 
 
-# ---------------------------------------------------------
-# %10 MUADIL PROFIL LISTESI (WX/WY)
-# ---------------------------------------------------------
-def muadil_liste_10yuzde(Wx_target, Wy_target):
-    tum = build_all_profiles_wx_wy()
-    if Wx_target is None or Wy_target is None:
-        return []
-
-    Wx_min = Wx_target * 0.9
-    Wx_max = Wx_target * 1.1
-    Wy_min = Wy_target * 0.9
-    Wy_max = Wy_target * 1.1
-
-    sonuc = []
-    for r in tum:
-        Wx = r["Wx_mm3"]
-        Wy = r["Wy_mm3"]
-        if not ((Wx_min <= Wx <= Wx_max) or (Wy_min <= Wy <= Wy_max)):
-            continue
-        dWx = abs(Wx_target - Wx)
-        dWy = abs(Wy_target - Wy)
-        skor = dWx + dWy
-        r2 = dict(r)
-        r2["ΔWx"] = dWx
-        r2["ΔWy"] = dWy
-        r2["Toplam Skor"] = skor
-        sonuc.append(r2)
-
-    sonuc.sort(key=lambda x: x["Toplam Skor"])
-    return sonuc
+def _sayfa_kaydir(anahtar, adim):
+    st.session_state[anahtar] = max(0, st.session_state[anahtar] + adim)
 
 
-# ---------------------------------------------------------
-# LAMA MUADIL (WX/WY HEDEFINE GORE)
-# ---------------------------------------------------------
-def lama_muadil_wx_wy(Wx_target, Wy_target, h_mm):
-    """Verilen Wx, Wy hedeflerine göre sabit h_mm yükseklikte
-    hangi lama kalınlıkları (%10 toleransla) muadil olabilir?
-    Burada şart Wx veya Wy'den en az biri %10 bandında olsun (VEYA)."""
-    if Wx_target is None or Wy_target is None or h_mm is None:
-        return []
-
-    liste = []
-    for t in range(2, 101):  # 2..100 mm kalınlık taraması
-        Wx_l, Wy_l = wx_wy_flatbar(t, h_mm)
-        if Wx_l is None or Wy_l is None:
-            continue
-
-        if Wx_target <= 0 or Wy_target <= 0:
-            continue
-
-        cond_wx = abs(Wx_l - Wx_target) <= 0.02 * Wx_target
-        cond_wy = abs(Wy_l - Wy_target) <= 0.02 * Wy_target
-
-        if cond_wx or cond_wy:
-            dWx = abs(Wx_l - Wx_target)
-            dWy = abs(Wy_l - Wy_target)
-            skor = dWx + dWy
-            liste.append({
-                "Lama": "{} x {}".format(h_mm, t),
-                "h (mm)": h_mm,
-                "t (mm)": t,
-                "Wx_lama (mm³)": Wx_l,
-                "Wy_lama (mm³)": Wy_l,
-                "ΔWx": dWx,
-                "ΔWy": dWy,
-                "Toplam Skor": skor
-            })
-
-    liste.sort(key=lambda x: x["Toplam Skor"])
-    return liste
-
+@st.fragment
+def sayfali_tablo(anahtar, arama, sorgu, asama_adi):
+    """arama(*sorgu) sonuçlarını SAYFA_BOYUTU satırlık sayfalarla gösterir.
 
-# ---------------------------------------------------------
-# T PROFIL MUADIL (WX/WY HEDEFINE GORE)
-# ---------------------------------------------------------
-def t_profil_wx_wy(Wx_target, Wy_target, H_mm, t_min_mm, t_max_mm):
+    Her sayfa top_k / offset ile ayrıca istenir; sayfa düğmeleri yalnızca
+    bu parçayı yeniden çalıştırır.
     """
-    H_mm toplam yüksekliğe sahip T profil için
-    flanş + gövde kombinasyonlarını tarar.
-    Flanş: b_f x t_f
-    Gövde: h_w x t_w  (H = t_f + h_w)
-    Wx/Wy hedefe %10 içinde olanları listeler.
-    t_min_mm ve t_max_mm: flanş ve gövde kalınlığı için min/max (mm)
-    """
-    if Wx_target is None or Wy_target is None or H_mm is None:
-        return []
-    if t_min_mm is None or t_max_mm is None or t_min_mm <= 0 or t_max_mm < t_min_mm:
-        return []
-
-    H = float(H_mm)
-    if H <= 0:
-        return []
-
-    # Kalınlık adayları (tipik sac/lamalar) – 4-30 mm
-    base_t_candidates = [4, 5, 6, 7, 8, 9, 10, 12, 15, 20, 25, 30]
-    t_list = [t for t in base_t_candidates if t_min_mm <= t <= t_max_mm]
-    if not t_list:
-        return []
-
-    # Flanş genişliği: H'nin yaklaşık 0.5x ile 2x arası, 10 mm adım
-    b_min = max(20.0, 0.5 * H)
-    b_max = 2.0 * H
-    b_start = int(round(b_min / 10.0) * 10)
-    b_end = int(round(b_max / 10.0) * 10)
-
-    sonuc = []
-
-    Wx_t = Wx_target
-    Wy_t = Wy_target
-
-    for t_f in t_list:
-        for t_w in t_list:
-            h_w = H - t_f
-            if h_w <= 0:
-                continue
-
-            for b_f in range(b_start, b_end + 1, 10):
-                # T kesit geometrisi
-                A_f = b_f * t_f         # flanş alanı
-                A_w = t_w * h_w         # gövde alanı
-
-                # Flanş ve gövde ağırlık merkezleri (y)
-                y_f = h_w + t_f / 2.0
-                y_w = h_w / 2.0
-
-                A_toplam = A_f + A_w
-                if A_toplam <= 0:
-                    continue
-
-                y_bar = (A_f * y_f + A_w * y_w) / A_toplam
-
-                # Ix: x eksenine göre
-                Ix_f = b_f * t_f ** 3 / 12.0
-                Ix_w = t_w * h_w ** 3 / 12.0
-                Ix = Ix_f + A_f * (y_f - y_bar) ** 2 + Ix_w + A_w * (y_w - y_bar) ** 2
-
-                # Iy: y eksenine göre
-                Iy_f = t_f * b_f ** 3 / 12.0
-                Iy_w = h_w * t_w ** 3 / 12.0
-                Iy = Iy_f + Iy_w
-
-                # Ekstrem fiber mesafeleri
-                c_top = H - y_bar
-                c_bot = y_bar
-                c_x = max(c_top, c_bot)  # Wx için
-                c_y = b_f / 2.0          # Wy için
-
-                # Birimler: mm^4 -> m^4, sonra Wx,Wy -> mm^3
-                Ix_m4 = Ix * 1e-12
-                Iy_m4 = Iy * 1e-12
-
-                Wx_m3 = Ix_m4 / (c_x / 1000.0)
-                Wy_m3 = Iy_m4 / (c_y / 1000.0)
-
-                Wx_mm3 = Wx_m3 * 1e9
-                Wy_mm3 = Wy_m3 * 1e9
-
-                # %10 tolerans (VEYA)
-                cond_wx = abs(Wx_mm3 - Wx_t) <= 0.10 * Wx_t if Wx_t > 0 else False
-                cond_wy = abs(Wy_mm3 - Wy_t) <= 0.10 * Wy_t if Wy_t > 0 else False
-
-                if not (cond_wx or cond_wy):
-                    continue
-
-                dWx = abs(Wx_mm3 - Wx_t)
-                dWy = abs(Wy_mm3 - Wy_t)
-                skor = dWx + dWy
-
-                sonuc.append({
-                    "T Profil": "T (flanş {}x{}, gövde {}x{})".format(b_f, t_f, h_w, t_w),
-                    "H (mm)": H,
-                    "b_f (mm)": b_f,
-                    "t_f (mm)": t_f,
-                    "h_w (mm)": h_w,
-                    "t_w (mm)": t_w,
-                    "Wx_T (mm³)": Wx_mm3,
-                    "Wy_T (mm³)": Wy_mm3,
-                    "ΔWx": dWx,
-                    "ΔWy": dWy,
-                    "Toplam Skor": skor
-                })
-
-    sonuc.sort(key=lambda x: x["Toplam Skor"])
-    return sonuc
+    offset = st.session_state.setdefault(anahtar, 0)
+    satirlar = arama(*sorgu, top_k=SAYFA_BOYUTU + 1, offset=offset, sutunlu=True)
+    sonraki_var = len(satirlar) > SAYFA_BOYUTU
+    satirlar = satirlar[:SAYFA_BOYUTU]
+
+    with asama(asama_adi, satir=len(satirlar), offset=offset):
+        tablo_goster(satirlar)
+
+    c_onceki, c_sonraki, c_bilgi = st.columns([1, 1, 4])
+    c_onceki.button("◀ Önceki", key=anahtar + "_onceki", disabled=offset == 0,
+                    on_click=_sayfa_kaydir, args=(anahtar, -SAYFA_BOYUTU))
+    c_sonraki.button("Sonraki ▶", key=anahtar + "_sonraki", disabled=not sonraki_var,
+                     on_click=_sayfa_kaydir, args=(anahtar, SAYFA_BOYUTU))
+    c_bilgi.caption("Satır {}–{}".format(offset + 1, offset + len(satirlar)))
+
+
+@st.fragment
+def knn_tablosu(Wx, Wy, kg_m, yogunluk):
+    """Tolerans bandından bağımsız en yakın k profil; ayarlar yalnızca bu parçayı yeniler."""
+    with st.expander("En yakın profiller (k-NN, log Wx / log Wy / kg/m)", expanded=True):
+        c_k, c_wx, c_wy, c_kg = st.columns(4)
+        k = c_k.number_input("k", min_value=1, max_value=100, value=10, step=1)
+        w_x = c_wx.slider("Wx ağırlığı", 0.0, 3.0, 1.0, 0.1)
+        w_y = c_wy.slider("Wy ağırlığı", 0.0, 3.0, 1.0, 0.1)
+        w_kg = c_kg.slider("kg/m ağırlığı", 0.0, 3.0, 1.0, 0.1)
+        satirlar = muadil_knn(Wx, Wy, kg_m, int(k), (w_x, w_y, w_kg), yogunluk)
+        with asama("render_knn", satir=len(satirlar)):
+            st.dataframe(satirlar, use_container_width=True)
+
+
+@st.fragment
+def t_h_araligi_tablosu(t_sorgu):
+    """Aynı Wx/Wy hedefi için H aralığında paralel T araması (istek üzerine)."""
+    Wx, Wy, H, t_min, t_max, t_adaylari, b_adim = t_sorgu
+    with st.expander("Farklı yüksekliklerde T profil ara (H aralığı)"):
+        with st.form("t_h_araligi"):
+            c_min, c_max, c_adim = st.columns(3)
+            H_min = c_min.number_input("H min (mm)", min_value=10.0, value=float(max(10, round(0.5 * H))), step=10.0)
+            H_max = c_max.number_input("H max (mm)", min_value=10.0, value=float(round(1.5 * H)), step=10.0)
+            H_adim = c_adim.number_input("H adımı (mm)", min_value=1.0, value=10.0, step=1.0)
+            ara = st.form_submit_button("Ara")
+        if ara:
+            satirlar = t_profil_h_araligi(Wx, Wy, H_min, H_max, H_adim, t_min, t_max,
+                                          t_adaylari, b_adim, SAYFA_BOYUTU, sutunlu=True)
+            if satirlar:
+                with asama("render_t_h_araligi", satir=len(satirlar)):
+                    tablo_goster(satirlar)
+            else:
+                st.info("Bu H aralığında %10 Wx/Wy toleransı içinde T profil bulunamadı.")
+
+
+@st.fragment
+def kaynakli_tablosu(t_sorgu):
+    """T aramasıyla aynı hedef ve ızgarada levhalardan yapma I / kutu / U / T kesitler."""
+    Wx, Wy, H, t_min, t_max, t_adaylari, b_adim = t_sorgu
+    with st.expander("Kaynaklı yapma kesitler (I, kutu, U, T — levhalardan)"):
+        adimlar = list(KAYNAKLI_B_ADIMLARI)
+        c_top, c_adim = st.columns(2)
+        topoloji = c_top.selectbox("Topoloji:", list(TOPOLOJILER))
+        # T aramasının adımı varsayılır; T sürekliyse adım burada açıkça seçilir
+        varsayilan = next((ad for ad, adim in KAYNAKLI_B_ADIMLARI.items() if adim == b_adim),
+                          "1 mm")
+        adim_adi = c_adim.selectbox("Flanş genişliği adımı:", adimlar,
+                                    index=adimlar.index(varsayilan))
+        if b_adim is None:
+            st.caption("Kaynaklı kesitlerde flanş genişliği sürekli çözülmez; "
+                       "{} adımlı ızgara taranır.".format(adim_adi))
+        satirlar = kaynakli_wx_wy(topoloji, Wx, Wy, H, t_min, t_max, t_adaylari,
+                                  KAYNAKLI_B_ADIMLARI[adim_adi],
+                                  top_k=SAYFA_BOYUTU, sutunlu=True)
+        if satirlar:
+            with asama("render_kaynakli", satir=len(satirlar)):
+                tablo_goster(satirlar)
+        else:
+            st.info("Bu topolojide %10 Wx/Wy toleransı içinde kesit bulunamadı.")
+
+
+@st.fragment
+def kesim_plani_tablosu(A_m2, rho, metraj_mm):
+    """Kesim listesini stok çubuklara yerleştirir; satın alma ve fire ağırlığı."""
+    with st.expander("✂️ Kesim planı (stok çubuk ihtiyacı)"):
+        metin = st.text_area("Kesim boyları (mm; satır başına 'boy' veya 'boy x adet'):",
+                             value="{:g} x 1".format(metraj_mm))
+        c_stok, c_kerf = st.columns([3, 1])
+        stoklar = c_stok.multiselect("Stok boyları (mm):", STOK_BOYLARI, default=STOK_BOYLARI)
+        kerf = c_kerf.number_input("Testere payı (mm):", min_value=0.0, value=3.0, step=0.5)
+        try:
+            plan = kesim_plani(kesim_listesi_coz(metin), stoklar, kerf, A_m2, rho)
+        except ValueError as e:
+            st.warning(str(e))
+            return
+        if not plan["cubuklar"]:
+            return
+
+        st.markdown("Satın alınacak: " + ", ".join(
+            "**{} x {:g} mm**".format(n, stok) for stok, n in plan["stok_adetleri"].items()))
+        st.markdown("Satın alınan: **{:.2f} kg**, gereken: **{:.2f} kg**, fire: **{:.2f} kg** "
+                    "(%{:.1f})".format(plan["satin_alinan_kg"], plan["gereken_kg"],
+                                        plan["fire_kg"], 100.0 * plan["fire_orani"]))
+        if not plan["optimal"]:
+            st.caption("Süre sınırında en iyi plan; alt sınır {} çubuk.".format(plan["alt_sinir"]))
+        satirlar = [{
+            "Çubuk": i,
+            "Stok (mm)": c["stok_mm"],
+            "Parçalar (mm)": " + ".join("{:g}".format(b) for b in c["parcalar"]),
+            "Parça Sayısı": c["parca_sayisi"],
+            "Kalan (mm)": c["kalan_mm"],
+        } for i, c in enumerate(plan["cubuklar"], 1)]
+        with asama("render_kesim", satir=len(satirlar)):
+            st.dataframe(satirlar, use_container_width=True)
+
+
+@st.fragment
+def disa_aktarma_paneli(Wx, Wy, lama_sorgu, t_sorgu, agirlik=None):
+    """Muadil listelerinin tamamını (sayfalamasız) ve seçilen kesitin ağırlık
+    satırını parça parça dosyaya yazar. agirlik: (etiket, A_m2, metraj_mm, malzeme)."""
+    kaynaklar = {"%10 toleranslı muadil profiller": lambda: muadil_bloklari(Wx, Wy)}
+    if agirlik:
+        kaynaklar["Seçilen kesit ağırlık"] = lambda: agirlik_bloklari([agirlik])
+    if lama_sorgu:
+        kaynaklar["Lama"] = lambda: lama_bloklari(Wx, Wy, [lama_sorgu[2]])
+    if t_sorgu:
+        _, _, H, t_min, t_max, t_adaylari, b_adim = t_sorgu
+        kaynaklar["T profil"] = lambda: t_bloklari(Wx, Wy, [H], t_min, t_max, t_adaylari, b_adim)
+    with st.expander("⬇️ Listeleri dışa aktar (CSV / Parquet / XLSX)"):
+        c_liste, c_bicim = st.columns([3, 1])
+        liste = c_liste.selectbox("Liste:", list(kaynaklar))
+        bicim = c_bicim.selectbox("Biçim:", BICIMLER)
+        if not st.button("Dosyayı hazırla"):
+            return
+        with tempfile.TemporaryDirectory() as klasor:
+            yol = os.path.join(klasor, "liste." + bicim)
+            try:
+                n = disa_aktar(kaynaklar[liste](), yol)
+            except ValueError as e:
+                st.warning(str(e))
+                return
+            if n == 0:
+                st.info("Listede satır yok.")
+                return
+            with open(yol, "rb") as f:
+                veri = f.read()
+        st.download_button("{} satırı indir (.{})".format(n, bicim), veri,
+                           file_name="{}.{}".format(liste.split()[-1].lower(), bicim),
+                           mime=MIME_TIPLERI[bicim])
 
 
 # ---------------------------------------------------------
@@ -421,28 +278,18 @@ def t_profil_wx_wy(Wx_target, Wy_target, H_mm, t_min_mm, t_max_mm):
 # ---------------------------------------------------------
 st.set_page_config(page_title="Profil Hesaplama", layout="wide")
 
-st.title("🔧 Profil Hesaplama Sistemi — Wx/Wy Muadil + Lama & T Profil Muadil")
+# tables/*.py değişince ilgili aile yeniden yüklenir (süreç başına tek izleyici)
+izlemeyi_baslat()
 
+st.title("🔧 Profil Hesaplama Sistemi — Wx/Wy Muadil + Lama & T Profil Muadil")
 
+t_b_adim = T_B_ADIMLARI[st.sidebar.selectbox("T flanş genişliği çözünürlüğü:", list(T_B_ADIMLARI))]
+olcum_acik = st.sidebar.checkbox("Ölçüm ayrıntıları (hata ayıklama)")
 col1, col2 = st.columns([3, 1])
 
-with col1:
-    MALZEMELER = {"Çelik": 7.85, "Paslanmaz Çelik": 7.90, "Alüminyum": 2.70}
-
-    profil_tipi = st.selectbox("Profil Tipi:", [
-        "Boru",
-        "Kutu Profil (RHS/SHS)",
-        "Köşebent (L Eşit)",
-        "Köşebent (L Eşit Değil)",
-        "U Profil (UPN)",
-        "I Profil (IPE)",
-        "H Profil (HEA)",
-        "H Profil (HEB)",
-        "Yuvarlak Dolu",
-        "Kare Dolu",
-        "Hollanda Profili (Bulb Flat)",
-        "Lama (Flat Bar)"
-    ])
+# Hata ya da st.stop durumunda da ölçüm kapanır (ContextVar, tracemalloc)
+with col1, Olcum("hesapla", bellek=olcum_acik) as olcum:
+    profil_tipi = st.selectbox("Profil Tipi:", PROFIL_TIPLERI)
 
     malzeme = st.selectbox("Malzeme:", list(MALZEMELER.keys()))
     rho = MALZEMELER[malzeme]
@@ -454,461 +301,61 @@ with col1:
 
     Wx_sec = None
     Wy_sec = None
-    lama_list = []  # muadil lamalar
-    t_list = []     # muadil T profiller
+    A_sec = None       # seçilen kesit alanı (m²)
+    lama_sorgu = None  # muadil lama araması (Wx, Wy, h)
+    t_sorgu = None     # muadil T profil araması (Wx, Wy, H, t_min, t_max)
 
     # ----------------------
-    # BORU
+    # PROFIL SECIMI (AILE KAYDI)
     # ----------------------
-    if profil_tipi == "Boru":
-        st.subheader("Boru (DN + SCH)")
-
-        dn_list = sorted({r["DN"] for r in BORU_TABLO})
+    aile = TIP_AILELERI[profil_tipi]
+    baslik, secim_etiketi, ozet = GOSTERIM[aile]
+    st.subheader(baslik)
+
+    secili = None  # satır + önceden hesaplanmış kesit özellikleri
+    secim = {}     # ölçüm kaydındaki seçim (profil_toplu üye alanları)
+    if aile == "boru":
+        boru_tablo = tablo("boru")
+        dn_list = sorted({r["DN"] for r in boru_tablo})
         dn = st.selectbox("DN:", dn_list)
 
-        sch_list = sorted({r["SCH"] for r in BORU_TABLO if r["DN"] == dn})
+        sch_list = sorted({r["SCH"] for r in boru_tablo if r["DN"] == dn},
+                          key=lambda s: (isinstance(s, str), s if isinstance(s, str) else float(s)))
         sch = st.selectbox("SCH:", sch_list)
+        if sch is not None:
+            secili = ozellik("boru", AILELER["boru"]["etiket"]({"DN": dn, "SCH": sch}))
+        secim = {"DN": dn, "SCH": sch}
 
-        sec = [r for r in BORU_TABLO if r["DN"] == dn and r["SCH"] == sch]
-        if sec:
-            s = sec[0]
-            OD = s["OD"]
-            t = s["t"]
-
-            st.markdown("**Seçilen boru:** DN {} SCH {}".format(dn, sch))
-            st.markdown("- OD: **{:.2f} mm**, t: **{:.2f} mm**".format(OD, t))
-
-            if st.button("Hesapla"):
-                OD_m = OD / 1000.0
-                t_m = t / 1000.0
-                ID_m = OD_m - 2 * t_m
-                A = (math.pi / 4.0) * (OD_m ** 2 - ID_m ** 2)
-
-                w = agirlik_hesap(A, L_m, rho)
-                st.markdown("Kesit alanı: **{:.2f} mm²**".format(A * 1e6))
-                st.success("Toplam ağırlık: **{:.2f} kg**".format(w))
-
-                Wx_sec, Wy_sec = wx_wy_boru(s)
-                H_max = OD
-
-                # Kalınlık aralığı: t .. 2t
-                t_min = t
-                t_max = 2 * t
-
-                lama_list = lama_muadil_wx_wy(Wx_sec, Wy_sec, H_max)
-                t_list = t_profil_wx_wy(Wx_sec, Wy_sec, H_max, t_min, t_max)
-
-    # ----------------------
-    # RHS / SHS
-    # ----------------------
-    elif profil_tipi == "Kutu Profil (RHS/SHS)":
-        st.subheader("Kutu Profil (RHS / SHS)")
-
-        isimler = [p["profil"] for p in RHS_TABLO]
-        isim = st.selectbox("Profil:", isimler)
-        g = next(p for p in RHS_TABLO if p["profil"] == isim)
-
-        A_mm = g["A"]
-        B_mm = g["B"]
-        t_mm = g["t"]
-
-        st.markdown("**Seçilen profil:** {}".format(isim))
-        st.markdown("- A: **{} mm**, B: **{} mm**, t: **{} mm**".format(A_mm, B_mm, t_mm))
-
-        A_m = A_mm / 1000.0
-        B_m = B_mm / 1000.0
-        t_m = t_mm / 1000.0
-
-        A_out = A_m * B_m
-        A_in = (A_m - 2 * t_m) * (B_m - 2 * t_m)
-        A_k = A_out - A_in
-
-        if st.button("Hesapla"):
-            w = agirlik_hesap(A_k, L_m, rho)
-            st.markdown("Kesit alanı: **{:.2f} mm²**".format(A_k * 1e6))
-            st.success("Toplam ağırlık: **{:.2f} kg**".format(w))
-
-            Wx_sec, Wy_sec = wx_wy_rhs(g)
-            H_max = max(A_mm, B_mm)
-
-            # Kalınlık aralığı: t .. 2t
-            t_min = t_mm
-            t_max = 2 * t_mm
-
-            lama_list = lama_muadil_wx_wy(Wx_sec, Wy_sec, H_max)
-            t_list = t_profil_wx_wy(Wx_sec, Wy_sec, H_max, t_min, t_max)
-
-    # ----------------------
-    # L EŞIT
-    # ----------------------
-    elif profil_tipi == "Köşebent (L Eşit)":
-        st.subheader("Köşebent (L Eşit)")
-
-        isimler = [p["profil"] for p in L_EQUAL_TABLO]
-        isim = st.selectbox("Profil:", isimler)
-        g = next(p for p in L_EQUAL_TABLO if p["profil"] == isim)
-
-        a_mm = g["a"]
-        b_mm = g["b"]
-        t_mm = g["t"]
-
-        st.markdown("**Seçilen profil:** {}".format(isim))
-        st.markdown("- a: **{} mm**, b: **{} mm**, t: **{} mm**".format(a_mm, b_mm, t_mm))
-
-        a_m = a_mm / 1000.0
-        b_m = b_mm / 1000.0
-        t_m = t_mm / 1000.0
-        A_k = (a_m * t_m) + (b_m * t_m) - (t_m * t_m)
-
-        if st.button("Hesapla"):
-            w = agirlik_hesap(A_k, L_m, rho)
-            st.markdown("Kesit alanı (yakl.): **{:.2f} mm²**".format(A_k * 1e6))
-            st.success("Toplam ağırlık (yakl.): **{:.2f} kg**".format(w))
-
-            Wx_sec, Wy_sec = wx_wy_L(g)
-            H_max = max(a_mm, b_mm)
-
-            # Kalınlık aralığı: t .. 2t
-            t_min = t_mm
-            t_max = 2 * t_mm
-
-            lama_list = lama_muadil_wx_wy(Wx_sec, Wy_sec, H_max)
-            t_list = t_profil_wx_wy(Wx_sec, Wy_sec, H_max, t_min, t_max)
-
-    # ----------------------
-    # L ESIT OLMAYAN
-    # ----------------------
-    elif profil_tipi == "Köşebent (L Eşit Değil)":
-        st.subheader("Köşebent (L Eşit Olmayan)")
-
-        isimler = [p["profil"] for p in L_UNEQUAL_TABLO]
-        isim = st.selectbox("Profil:", isimler)
-        g = next(p for p in L_UNEQUAL_TABLO if p["profil"] == isim)
-
-        a_mm = g["a"]
-        b_mm = g["b"]
-        t_mm = g["t"]
-
-        st.markdown("**Seçilen profil:** {}".format(isim))
-        st.markdown("- a: **{} mm**, b: **{} mm**, t: **{} mm**".format(a_mm, b_mm, t_mm))
-
-        a_m = a_mm / 1000.0
-        b_m = b_mm / 1000.0
-        t_m = t_mm / 1000.0
-        A_k = (a_m * t_m) + (b_m * t_m) - (t_m * t_m)
-
-        if st.button("Hesapla"):
-            w = agirlik_hesap(A_k, L_m, rho)
-            st.markdown("Kesit alanı (yakl.): **{:.2f} mm²**".format(A_k * 1e6))
-            st.success("Toplam ağırlık (yakl.): **{:.2f} kg**".format(w))
-
-            Wx_sec, Wy_sec = wx_wy_L(g)
-            H_max = max(a_mm, b_mm)
-
-            # Kalınlık aralığı: t .. 2t
-            t_min = t_mm
-            t_max = 2 * t_mm
-
-            lama_list = lama_muadil_wx_wy(Wx_sec, Wy_sec, H_max)
-            t_list = t_profil_wx_wy(Wx_sec, Wy_sec, H_max, t_min, t_max)
-
-    # ----------------------
-    # UPN
-    # ----------------------
-    elif profil_tipi == "U Profil (UPN)":
-        st.subheader("U Profil (UPN)")
-
-        isimler = [p["profil"] for p in UPN_TABLO]
-        isim = st.selectbox("Profil:", isimler)
-        g = next(p for p in UPN_TABLO if p["profil"] == isim)
-
-        h_mm = g["h"]
-        b_mm = g["b"]
-        tw_mm = g["tw"]
-        tf_mm = g["tf"]
-
-        st.markdown("**Seçilen profil:** {}".format(isim))
-        st.markdown("- h: **{} mm**, b: **{} mm**, tw: **{} mm**, tf: **{} mm**".format(
-            h_mm, b_mm, tw_mm, tf_mm))
-
-        h = h_mm / 1000.0
-        b = b_mm / 1000.0
-        tw = tw_mm / 1000.0
-        tf = tf_mm / 1000.0
-
-        A_fl = 2 * (b * tf)
-        A_web = (h - 2 * tf) * tw
-        A_k = A_fl + A_web
-
-        if st.button("Hesapla"):
-            w = agirlik_hesap(A_k, L_m, rho)
-            st.markdown("Kesit alanı (yakl.): **{:.2f} mm²**".format(A_k * 1e6))
-            st.success("Toplam ağırlık (yakl.): **{:.2f} kg**".format(w))
-
-            Wx_sec, Wy_sec = wx_wy_upn(g)
-            H_max = h_mm
-
-            # Kalınlık aralığı: tw .. 2*tw
-            t_min = tw_mm
-            t_max = 2 * tw_mm
-
-            lama_list = lama_muadil_wx_wy(Wx_sec, Wy_sec, H_max)
-            t_list = t_profil_wx_wy(Wx_sec, Wy_sec, H_max, t_min, t_max)
-
-    # ----------------------
-    # IPE
-    # ----------------------
-    elif profil_tipi == "I Profil (IPE)":
-        st.subheader("I Profil (IPE)")
-
-        isimler = [p["profil"] for p in IPE_TABLO]
-        isim = st.selectbox("Profil:", isimler)
-        g = next(p for p in IPE_TABLO if p["profil"] == isim)
-
-        h_mm = g["h"]
-        b_mm = g["b"]
-        tw_mm = g["tw"]
-        tf_mm = g["tf"]
-
-        st.markdown("**Seçilen profil:** {}".format(isim))
-        st.markdown("- h: **{} mm**, b: **{} mm**, tw: **{} mm**, tf: **{} mm**".format(
-            h_mm, b_mm, tw_mm, tf_mm))
-
-        h = h_mm / 1000.0
-        b = b_mm / 1000.0
-        tw = tw_mm / 1000.0
-        tf = tf_mm / 1000.0
-
-        A_fl = 2 * (b * tf)
-        A_web = (h - 2 * tf) * tw
-        A_k = A_fl + A_web
-
-        if st.button("Hesapla"):
-            w = agirlik_hesap(A_k, L_m, rho)
-            st.markdown("Kesit alanı (yakl.): **{:.2f} mm²**".format(A_k * 1e6))
-            st.success("Toplam ağırlık (yakl.): **{:.2f} kg**".format(w))
-
-            Wx_sec, Wy_sec = wx_wy_ipe(g)
-            H_max = h_mm
-
-            # Kalınlık aralığı: tw .. 2*tw
-            t_min = tw_mm
-            t_max = 2 * tw_mm
-
-            lama_list = lama_muadil_wx_wy(Wx_sec, Wy_sec, H_max)
-            t_list = t_profil_wx_wy(Wx_sec, Wy_sec, H_max, t_min, t_max)
-
-    # ----------------------
-    # HEA
-    # ----------------------
-    elif profil_tipi == "H Profil (HEA)":
-        st.subheader("H Profil (HEA)")
-
-        isimler = [p["profil"] for p in HEA_TABLO]
-        isim = st.selectbox("Profil:", isimler)
-        g = next(p for p in HEA_TABLO if p["profil"] == isim)
-
-        h_mm = g["h"]
-        b_mm = g["b"]
-        tw_mm = g["tw"]
-        tf_mm = g["tf"]
-
-        st.markdown("**Seçilen profil:** {}".format(isim))
-        st.markdown("- h: **{} mm**, b: **{} mm**, tw: **{} mm**, tf: **{} mm**".format(
-            h_mm, b_mm, tw_mm, tf_mm))
-
-        h = h_mm / 1000.0
-        b = b_mm / 1000.0
-        tw = tw_mm / 1000.0
-        tf = tf_mm / 1000.0
-
-        A_fl = 2 * (b * tf)
-        A_web = (h - 2 * tf) * tw
-        A_k = A_fl + A_web
-
-        if st.button("Hesapla"):
-            w = agirlik_hesap(A_k, L_m, rho)
-            st.markdown("Kesit alanı (yakl.): **{:.2f} mm²**".format(A_k * 1e6))
-            st.success("Toplam ağırlık (yakl.): **{:.2f} kg**".format(w))
-
-            Wx_sec, Wy_sec = wx_wy_hea(g)
-            H_max = h_mm
-
-            # Kalınlık aralığı: tw .. 2*tw
-            t_min = tw_mm
-            t_max = 2 * tw_mm
-
-            lama_list = lama_muadil_wx_wy(Wx_sec, Wy_sec, H_max)
-            t_list = t_profil_wx_wy(Wx_sec, Wy_sec, H_max, t_min, t_max)
-
-    # ----------------------
-    # HEB
-    # ----------------------
-    elif profil_tipi == "H Profil (HEB)":
-        st.subheader("H Profil (HEB)")
-
-        isimler = [p["profil"] for p in HEB_TABLO]
-        isim = st.selectbox("Profil:", isimler)
-        g = next(p for p in HEB_TABLO if p["profil"] == isim)
-
-        h_mm = g["h"]
-        b_mm = g["b"]
-        tw_mm = g["tw"]
-        tf_mm = g["tf"]
-
-        st.markdown("**Seçilen profil:** {}".format(isim))
-        st.markdown("- h: **{} mm**, b: **{} mm**, tw: **{} mm**, tf: **{} mm**".format(
-            h_mm, b_mm, tw_mm, tf_mm))
-
-        h = h_mm / 1000.0
-        b = b_mm / 1000.0
-        tw = tw_mm / 1000.0
-        tf = tf_mm / 1000.0
-
-        A_fl = 2 * (b * tf)
-        A_web = (h - 2 * tf) * tw
-        A_k = A_fl + A_web
-
-        if st.button("Hesapla"):
-            w = agirlik_hesap(A_k, L_m, rho)
-            st.markdown("Kesit alanı (yakl.): **{:.2f} mm²**".format(A_k * 1e6))
-            st.success("Toplam ağırlık (yakl.): **{:.2f} kg**".format(w))
-
-            Wx_sec, Wy_sec = wx_wy_heb(g)
-            H_max = h_mm
-
-            # Kalınlık aralığı: tw .. 2*tw
-            t_min = tw_mm
-            t_max = 2 * tw_mm
-
-            lama_list = lama_muadil_wx_wy(Wx_sec, Wy_sec, H_max)
-            t_list = t_profil_wx_wy(Wx_sec, Wy_sec, H_max, t_min, t_max)
-
-    # ----------------------
-    # YUVARLAK DOLU
-    # ----------------------
-    elif profil_tipi == "Yuvarlak Dolu":
-        st.subheader("Yuvarlak Dolu")
-
-        isimler = [p["profil"] for p in ROUND_TABLO]
-        isim = st.selectbox("Çap:", isimler)
-        g = next(p for p in ROUND_TABLO if p["profil"] == isim)
-
-        d_mm = g["d"]
-        st.markdown("**Seçilen profil:** {} (d = {} mm)".format(isim, d_mm))
-
-        d_m = d_mm / 1000.0
-        A = math.pi * (d_m / 2.0) ** 2
-
-        if st.button("Hesapla"):
-            w = agirlik_hesap(A, L_m, rho)
-            st.markdown("Kesit alanı: **{:.2f} mm²**".format(A * 1e6))
-            st.success("Toplam ağırlık: **{:.2f} kg**".format(w))
-
-            Wx_sec, Wy_sec = wx_wy_round(g)
-            H_max = d_mm
-
-            # Yuvarlak dolu için sabit kalınlık aralığı: 4–10 mm
-            t_min = 4.0
-            t_max = 10.0
-
-            lama_list = lama_muadil_wx_wy(Wx_sec, Wy_sec, H_max)
-            t_list = t_profil_wx_wy(Wx_sec, Wy_sec, H_max, t_min, t_max)
-
-    # ----------------------
-    # KARE DOLU
-    # ----------------------
-    elif profil_tipi == "Kare Dolu":
-        st.subheader("Kare Dolu")
-
-        isimler = [p["profil"] for p in SQUARE_TABLO]
-        isim = st.selectbox("Profil:", isimler)
-        g = next(p for p in SQUARE_TABLO if p["profil"] == isim)
-
-        a_mm = g["a"]
-        st.markdown("**Seçilen profil:** {} (a = {} mm)".format(isim, a_mm))
-
-        a_m = a_mm / 1000.0
-        A = a_m * a_m
-
-        if st.button("Hesapla"):
-            w = agirlik_hesap(A, L_m, rho)
-            st.markdown("Kesit alanı: **{:.2f} mm²**".format(A * 1e6))
-            st.success("Toplam ağırlık: **{:.2f} kg**".format(w))
-
-            Wx_sec, Wy_sec = wx_wy_square(g)
-            H_max = a_mm
-
-            # Emir'in istediği gibi: kare doluda T kalınlık aralığı 4–10 mm
-            t_min = 4.0
-            t_max = 10.0
-
-            lama_list = lama_muadil_wx_wy(Wx_sec, Wy_sec, H_max)
-            t_list = t_profil_wx_wy(Wx_sec, Wy_sec, H_max, t_min, t_max)
-
-    # ----------------------
-    # BULB FLAT
-    # ----------------------
-    elif profil_tipi == "Hollanda Profili (Bulb Flat)":
-        st.subheader("Hollanda Profili (Bulb Flat)")
-
-        isimler = [p["profil"] for p in BULBFLAT_TABLO]
-        isim = st.selectbox("Profil:", isimler)
-        g = next(p for p in BULBFLAT_TABLO if p["profil"] == isim)
-
-        B_mm = g["B"]
-        t_mm = g["t"]
-
-        st.markdown("**Seçilen profil:** {}".format(isim))
-        st.markdown("- B: **{} mm**, t: **{} mm**".format(B_mm, t_mm))
-
-        B_m = B_mm / 1000.0
-        t_m = t_mm / 1000.0
-        A_k = B_m * t_m * 1.2  # yaklasik
-
-        if st.button("Hesapla"):
-            w = agirlik_hesap(A_k, L_m, rho)
-            st.markdown("Kesit alanı (yakl.): **{:.2f} mm²**".format(A_k * 1e6))
-            st.success("Toplam ağırlık (yakl.): **{:.2f} kg**".format(w))
-
-            Wx_sec, Wy_sec = wx_wy_bulb(g)
-            H_max = B_mm
-
-            # Kalınlık aralığı: t .. 2t
-            t_min = t_mm
-            t_max = 2 * t_mm
-
-            lama_list = lama_muadil_wx_wy(Wx_sec, Wy_sec, H_max)
-            t_list = t_profil_wx_wy(Wx_sec, Wy_sec, H_max, t_min, t_max)
-
-    # ----------------------
-    # LAMA (FLAT BAR) MANUEL
-    # ----------------------
-    elif profil_tipi == "Lama (Flat Bar)":
-        st.subheader("Lama (Flat Bar)")
-
+    elif aile == "lama":
         h_mm = st.number_input("Lama yüksekliği (h, mm):", min_value=1.0, value=80.0)
         t_mm = st.number_input("Lama kalınlığı (t, mm):", min_value=1.0, value=7.0)
+        lama = {"profil": "", "h": h_mm, "t": t_mm}
+        secili = dict(lama, **kesit_ozellikleri("lama", lama))
+        secim = {"h_mm": h_mm, "t_mm": t_mm}
 
-        h = h_mm / 1000.0
-        t_m = t_mm / 1000.0
-        A_k = h * t_m  # m^2
-
-        if st.button("Hesapla"):
-            w = agirlik_hesap(A_k, L_m, rho)
-            st.markdown("Kesit alanı: **{:.2f} mm²**".format(A_k * 1e6))
-            st.success("Toplam ağırlık: **{:.2f} kg**".format(w))
+    else:
+        isim = st.selectbox(secim_etiketi, list(ozellik_tablosu(aile)))
+        secili = ozellik(aile, isim)
+        secim = {"profil": isim}
 
-            Wx_sec, Wy_sec = wx_wy_flatbar(t_mm, h_mm)
-            H_max = h_mm
+    if secili is not None:
+        for satir in ozet:
+            st.markdown(satir.format(**secili))
 
-            # Kalınlık aralığı: t .. 2t
-            t_min = t_mm
-            t_max = 2 * t_mm
+        if st.button("Hesapla"):
+            yakl = " (yakl.)" if AILELER[aile]["yaklasik"] else ""
+            A_sec = secili["A_m2"]
+            w = agirlik_hesap(A_sec, L_m, rho)
+            st.markdown("Kesit alanı{}: **{:.2f} mm²**".format(yakl, secili["A_mm2"]))
+            st.success("Toplam ağırlık{}: **{:.2f} kg**".format(yakl, w))
 
-            lama_list = lama_muadil_wx_wy(Wx_sec, Wy_sec, H_max)
-            t_list = t_profil_wx_wy(Wx_sec, Wy_sec, H_max, t_min, t_max)
+            Wx_sec, Wy_sec = secili["Wx_mm3"], secili["Wy_mm3"]
+            H_max = secili["H_max"]
+            lama_sorgu = (Wx_sec, Wy_sec, H_max)
+            t_sorgu = (Wx_sec, Wy_sec, H_max, secili["t_min"], secili["t_max"])
 
+    if A_sec:
+        kesim_plani_tablosu(A_sec, rho, metraj_mm)
 
     # ----------------------
     # WX / WY TABANLI MUADIL PROFILLER
@@ -924,41 +371,111 @@ with col1:
             unsafe_allow_html=True
         )
 
-        muadiller = muadil_liste_10yuzde(Wx_sec, Wy_sec)
+        muadiller = muadil_liste_10yuzde(Wx_sec, Wy_sec, sutunlu=True)
         if muadiller:
-            st.dataframe(muadiller, use_container_width=True)
+            with olcum.asama("render_muadil", satir=len(muadiller)):
+                tablo_goster(muadiller)
         else:
             st.info("%10 tolerans içinde muadil profil bulunamadı. Tablolara daha fazla profil ekleyebilirsin.")
 
+        kg_m_sec = agirlik_hesap(A_sec, 1.0, rho) if A_sec else None
+        knn_tablosu(Wx_sec, Wy_sec, kg_m_sec, rho)
+
+    # ----------------------
+    # EN HAFIF MUADILLER (PARETO)
+    # ----------------------
+    if Wx_sec is not None and Wy_sec is not None:
+        st.markdown("---")
+        st.subheader("⚖️ En az bu kadar rijit en hafif kesitler (Pareto cephesi)")
+        hafifler = en_hafif_muadiller(Wx_sec, Wy_sec, malzeme, SAYFA_BOYUTU, kg_m_sec)
+        if hafifler:
+            if kg_m_sec:
+                st.caption("Seçilen profil: {:.2f} kg/m ({})".format(kg_m_sec, malzeme))
+            with olcum.asama("render_en_hafif", satir=len(hafifler)):
+                st.dataframe(hafifler, use_container_width=True)
+        else:
+            st.info("Katalogda Wx ve Wy'si bu profilden küçük olmayan kesit bulunamadı.")
+
     # ----------------------
     # LAMA MUADIL LISTESI
     # ----------------------
-    if lama_list:
+    if lama_sorgu and lama_muadil_wx_wy(*lama_sorgu, top_k=SAYFA_BOYUTU + 1, offset=0,
+                                        sutunlu=True):
         st.markdown("---")
         st.subheader("🟫 Bu profile muadil Lama (Flat Bar) boyutları")
-        st.dataframe(lama_list, use_container_width=True)
+        araliklar = lama_t_araliklari(Wx_sec, Wy_sec, lama_sorgu[2], t_min=2, t_max=100)
+        st.caption("Uygun kalınlık aralıkları: " + ", ".join(
+            "{:.2f}–{:.2f} mm".format(a, b) for a, b in araliklar))
+        st.session_state["sayfa_lama"] = 0
+        sayfali_tablo("sayfa_lama", lama_muadil_wx_wy, lama_sorgu, "render_lama")
 
     # ----------------------
     # T PROFIL MUADIL LISTESI
     # ----------------------
-    if t_list:
+    if t_sorgu:
+        t_sorgu = t_sorgu + (None, t_b_adim)
+    if t_sorgu and t_profil_wx_wy(*t_sorgu, top_k=SAYFA_BOYUTU + 1, offset=0, sutunlu=True):
         st.markdown("---")
         st.subheader("🅸 Bu profile muadil T Profiller (flanş + gövde kombinasyonu)")
-        st.dataframe(t_list, use_container_width=True)
+        st.session_state["sayfa_t_profil"] = 0
+        sayfali_tablo("sayfa_t_profil", t_profil_wx_wy, t_sorgu, "render_t_profil")
     elif Wx_sec is not None and Wy_sec is not None:
         st.markdown("---")
         st.info("Bu profil için %10 Wx/Wy toleransı içinde muadil T profil bulunamadı. "
                 "Arama aralığını genişletmek için kalınlık aralıklarının mantığını koddan güncelleyebilirsin.")
+    if t_sorgu:
+        t_h_araligi_tablosu(t_sorgu)
+        kaynakli_tablosu(t_sorgu)
+    if Wx_sec is not None and Wy_sec is not None:
+        etiket = secili["etiket"] or "{:g} x {:g}".format(secili["h"], secili["t"])
+        disa_aktarma_paneli(Wx_sec, Wy_sec, lama_sorgu, t_sorgu,
+                            (etiket, A_sec, metraj_mm, malzeme))
+
+
+olcum.baglam.update(profil_tipi=profil_tipi, malzeme=malzeme, metraj_mm=metraj_mm, **secim)
+if Wx_sec is not None:
+    olcum.yaz()
 
 
 # ---------------------------------------------------------
 # SAG SUTUN — TEKNIK CIZIM GORSELI
 # ---------------------------------------------------------
 with col2:
-    img_path = get_image_for_type(profil_tipi)
-    if img_path:
-        st.image(img_path, caption="Teknik Çizim Seti", use_column_width=True)
+    # Seçilen kesit ve en iyi muadiller gerçek ölçüleriyle (SVG, geometri önbellekli)
+    if secili is not None:
+        st.image(kesit_svg(aile, secili), caption="Seçilen kesit: {}".format(
+            secili["etiket"] or "{:g} x {:g}".format(secili["h"], secili["t"])))
+    for svg, baslik in muadil_cizimleri(lama_sorgu, t_sorgu):
+        st.image(svg, caption=baslik)
+
+    gorsel = get_image_for_type(profil_tipi)
+    if gorsel:
+        st.image(gorsel, caption="Teknik Çizim Seti", use_column_width=True)
         st.markdown(
             "<small>Seçtiğiniz profil için referans teknik ölçü şemaları (genel set).</small>",
             unsafe_allow_html=True
         )
+
+    # ----------------------
+    # ONBELLEK ISTATISTIKLERI
+    # ----------------------
+    with st.expander("Önbellek istatistikleri"):
+        st.caption("Katalog sürümü: {}".format(katalog_surumu()))
+        for aile, mesaj in yenileme_hatalari().items():
+            st.warning("tables/{}.py yüklenemedi, önceki tablo kullanılıyor: {}".format(aile, mesaj))
+        st.dataframe(onbellek_istatistikleri(), use_container_width=True)
+        if st.button("Önbellekleri temizle"):
+            onbellekleri_temizle()
+
+    # ----------------------
+    # OLCUM AYRINTILARI
+    # ----------------------
+    if olcum_acik and Wx_sec is not None:
+        with st.expander("Ölçüm ayrıntıları", expanded=True):
+            st.markdown("Toplam: **{:.1f} ms**".format(olcum.toplam_sn * 1000.0))
+            if olcum.bellek_tepe_kb is not None:
+                st.markdown("Bellek tepe (tracemalloc{}): **{:,.0f} KB**".format(
+                    ", süreç geneli — eşzamanlı ölçümler dahil" if olcum.bellek_paylasimli else "",
+                    olcum.bellek_tepe_kb))
+            st.dataframe(olcum.asamalar, use_container_width=True)
+            st.json(olcum.kayit(), expanded=False)
@@ -0,0 +1,66 @@
+# profil_core package
+"""Streamlit'ten bağımsız hesap çekirdeği.
+
+Alt modüller ve tables/ aileleri ilk kullanımda yüklenir; örneğin
+``from profil_core import agirlik_hesap`` NumPy'yi veya tabloları yüklemez.
+"""
+import importlib
+
+# Ad -> tanımlandığı alt modül
+_API = {
+    "MALZEMELER": "kesit",
+    "agirlik_hesap": "kesit",
+    "wx_wy_boru": "kesit",
+    "wx_wy_rhs": "kesit",
+    "wx_wy_rect": "kesit",
+    "wx_wy_ipe": "kesit",
+    "wx_wy_hea": "kesit",
+    "wx_wy_heb": "kesit",
+    "wx_wy_upn": "kesit",
+    "wx_wy_L": "kesit",
+    "wx_wy_round": "kesit",
+    "wx_wy_square": "kesit",
+    "wx_wy_bulb": "kesit",
+    "wx_wy_flatbar": "kesit",
+    "tablo": "tablolar",
+    "build_all_profiles_wx_wy": "katalog",
+    "katalog_indeksi": "katalog",
+    "katalogu_yenile": "izleyici",
+    "muadil_liste_10yuzde": "muadil",
+    "muadil_knn": "muadil",
+    "en_hafif_muadiller": "muadil",
+    "pareto_cephesi": "pareto",
+    "lama_muadil_wx_wy": "muadil",
+    "t_profil_wx_wy": "muadil",
+    "t_profil_h_araligi": "muadil",
+    "kaynakli_wx_wy": "muadil",
+    "kaynakli_kesit": "kaynakli",
+    "toplu_alan": "metraj",
+    "toplu_agirlik": "metraj",
+    "metraj": "metraj",
+    "disa_aktar": "disa_aktar",
+    "SonucTablosu": "sonuc",
+    "kesit_svg": "cizim",
+    "kesim_plani": "kesim",
+    "kesim_listesi_coz": "kesim",
+    "lama_t_araliklari": "lama",
+    "lama_muadil_2d": "lama",
+    "PROFIL_TIPLERI": "uye",
+    "uye_kesit": "uye",
+    "Olcum": "olcum",
+}
+
+__all__ = sorted(_API)
+
+
+def __getattr__(ad):
+    modul = _API.get(ad)
+    if modul is None:
+        raise AttributeError("module 'profil_core' has no attribute {!r}".format(ad))
+    deger = getattr(importlib.import_module("profil_core." + modul), ad)
+    globals()[ad] = deger
+    return deger
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_API))
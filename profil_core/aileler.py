@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""Profil aileleri kaydı: tablo, boyut şeması, kesit çekirdeği, kalınlık kuralı.
+
+Her aile için A, Ix, Iy, Wx, Wy, kg/m ile muadil aramalarının H_max ve
+T kalınlık aralığı (t_min, t_max) satır başına bir kez, tablo ilk
+kullanıldığında hesaplanır. Arayüz, toplu hesap ve servis bu değerleri
+ozellik() ile okur; sütunsal önbellek (kolonsal) de aynı çekirdeği
+kullanır.
+
+Katalog satırı A_mm2, Ix_mm4, Iy_mm4, Wx_mm3, Wy_mm3 alanlarını
+taşıyorsa (ör. IPE/HEA/HEB/UPN için tablo değerleri) bunlar formülle
+bulunan yaklaşık değerlerin yerine geçer.
+"""
+from profil_core.kesit import (
+    MALZEMELER, agirlik_hesap,
+    alan_boru, alan_rhs, alan_L, alan_I, alan_round, alan_square, alan_bulb, alan_lama,
+    wx_wy_boru, wx_wy_rhs, wx_wy_L, wx_wy_ipe, wx_wy_hea, wx_wy_heb,
+    wx_wy_upn, wx_wy_round, wx_wy_square, wx_wy_bulb, wx_wy_flatbar,
+)
+from profil_core.tablolar import tablo, tablo_ayarla
+
+# kg/m bu malzeme için hesaplanır; diğerleri yoğunluk oranıyla ölçeklenir
+KG_M_MALZEME = "Çelik"
+
+# build_all_profiles_wx_wy sırası (lama katalog listesinde yok)
+KATALOG_AILELERI = ["boru", "rhs", "l_equal", "l_unequal", "ipe", "hea", "heb",
+                    "upn", "round", "square", "bulbflat"]
+
+# Katalogdan okunabilen, formülün önüne geçen özellikler
+KATALOG_OZELLIKLERI = ("A_mm2", "Ix_mm4", "Iy_mm4", "Wx_mm3", "Wy_mm3")
+
+
+def _etiket(r):
+    return r["profil"]
+
+
+def _etiket_boru(r):
+    return "DN {} SCH {}".format(r["DN"], r["SCH"])
+
+
+def _t_2t(H):
+    """Kalınlık aralığı: t .. 2t; H_max = H(r)."""
+    return lambda r: (H(r), r["t"], 2 * r["t"])
+
+
+def _tw_2tw(r):
+    return r["h"], r["tw"], 2 * r["tw"]
+
+
+# aile -> kayıt
+#   tip:      arayüzdeki profil tipi
+#   kisa:     katalog listelerindeki kısa ad
+#   etiket:   satırın katalogdaki adı
+#   alan:     kesit alanı (m²)
+#   wx_wy:    kesit modülleri (mm³)
+#   c:        wx_wy'nin kullandığı ekstrem fiber mesafeleri (c_x, c_y) mm
+#   kalinlik: (H_max, t_min, t_max) — lama / T muadil aramaları
+#   yaklasik: alan formülü yaklaşık mı
+AILELER = {
+    "boru": {
+        "tip": "Boru", "kisa": "Boru", "etiket": _etiket_boru,
+        "alan": alan_boru, "wx_wy": wx_wy_boru,
+        "c": lambda r: (r["OD"] / 2.0, r["OD"] / 2.0),
+        "kalinlik": _t_2t(lambda r: r["OD"]), "yaklasik": False,
+    },
+    "rhs": {
+        "tip": "Kutu Profil (RHS/SHS)", "kisa": "RHS/SHS", "etiket": _etiket,
+        "alan": alan_rhs, "wx_wy": wx_wy_rhs,
+        "c": lambda r: (r["A"] / 2.0, r["B"] / 2.0),
+        "kalinlik": _t_2t(lambda r: max(r["A"], r["B"])), "yaklasik": False,
+    },
+    "l_equal": {
+        "tip": "Köşebent (L Eşit)", "kisa": "L eşit", "etiket": _etiket,
+        "alan": alan_L, "wx_wy": wx_wy_L,
+        "c": lambda r: (r["a"] / 2.0, r["b"] / 2.0),
+        "kalinlik": _t_2t(lambda r: max(r["a"], r["b"])), "yaklasik": True,
+    },
+    "l_unequal": {
+        "tip": "Köşebent (L Eşit Değil)", "kisa": "L eşit olmayan", "etiket": _etiket,
+        "alan": alan_L, "wx_wy": wx_wy_L,
+        "c": lambda r: (r["a"] / 2.0, r["b"] / 2.0),
+        "kalinlik": _t_2t(lambda r: max(r["a"], r["b"])), "yaklasik": True,
+    },
+    "ipe": {
+        "tip": "I Profil (IPE)", "kisa": "IPE", "etiket": _etiket,
+        "alan": alan_I, "wx_wy": wx_wy_ipe,
+        "c": lambda r: (r["h"] / 2.0, r["b"] / 2.0),
+        "kalinlik": _tw_2tw, "yaklasik": True,
+    },
+    "hea": {
+        "tip": "H Profil (HEA)", "kisa": "HEA", "etiket": _etiket,
+        "alan": alan_I, "wx_wy": wx_wy_hea,
+        "c": lambda r: (r["h"] / 2.0, r["b"] / 2.0),
+        "kalinlik": _tw_2tw, "yaklasik": True,
+    },
+    "heb": {
+        "tip": "H Profil (HEB)", "kisa": "HEB", "etiket": _etiket,
+        "alan": alan_I, "wx_wy": wx_wy_heb,
+        "c": lambda r: (r["h"] / 2.0, r["b"] / 2.0),
+        "kalinlik": _tw_2tw, "yaklasik": True,
+    },
+    "upn": {
+        "tip": "U Profil (UPN)", "kisa": "UPN", "etiket": _etiket,
+        "alan": alan_I, "wx_wy": wx_wy_upn,
+        "c": lambda r: (r["h"] / 2.0, r["b"] / 2.0),
+        "kalinlik": _tw_2tw, "yaklasik": True,
+    },
+    "round": {
+        "tip": "Yuvarlak Dolu", "kisa": "Yuvarlak", "etiket": _etiket,
+        "alan": alan_round, "wx_wy": wx_wy_round,
+        "c": lambda r: (r["d"] / 2.0, r["d"] / 2.0),
+        # Yuvarlak dolu için sabit kalınlık aralığı: 4–10 mm
+        "kalinlik": lambda r: (r["d"], 4.0, 10.0), "yaklasik": False,
+    },
+    "square": {
+        "tip": "Kare Dolu", "kisa": "Kare", "etiket": _etiket,
+        "alan": alan_square, "wx_wy": wx_wy_square,
+        "c": lambda r: (r["a"] / 2.0, r["a"] / 2.0),
+        # Kare doluda T kalınlık aralığı 4–10 mm
+        "kalinlik": lambda r: (r["a"], 4.0, 10.0), "yaklasik": False,
+    },
+    "bulbflat": {
+        "tip": "Hollanda Profili (Bulb Flat)", "kisa": "Bulb Flat", "etiket": _etiket,
+        "alan": alan_bulb, "wx_wy": wx_wy_bulb,
+        "c": lambda r: (r["t"] / 2.0, r["B"] / 2.0),
+        "kalinlik": _t_2t(lambda r: r["B"]), "yaklasik": True,
+    },
+    "lama": {
+        "tip": "Lama (Flat Bar)", "kisa": "Lama", "etiket": _etiket,
+        "alan": alan_lama, "wx_wy": lambda r: wx_wy_flatbar(r["t"], r["h"]),
+        "c": lambda r: (r["h"] / 2.0, r["t"] / 2.0),
+        "kalinlik": _t_2t(lambda r: r["h"]), "yaklasik": False,
+    },
+}
+
+
+# ---------------------------------------------------------
+# SATIR OZELLIKLERI
+# ---------------------------------------------------------
+def _katalog_degeri(r, ad):
+    deger = r.get(ad)
+    return None if deger is None or deger == "" else float(deger)
+
+
+def kesit_ozellikleri(aile, r):
+    """Bir satırın etiketi, A_m2, A_mm2, I/W (mm⁴/mm³), kg_m ve kalınlık kuralı.
+
+    Tanımsız Wx/Wy (geçersiz geometri) None döner. Katalogda verilen
+    değerler önceliklidir; yalnızca W ya da yalnızca I verilmişse diğeri
+    ekstrem fiber mesafesiyle türetilir.
+    """
+    k = AILELER[aile]
+    c_x, c_y = k["c"](r)
+    A_mm2 = _katalog_degeri(r, "A_mm2")
+    A = k["alan"](r) if A_mm2 is None else A_mm2 / 1e6
+    W = dict(zip(("Wx_mm3", "Wy_mm3"), k["wx_wy"](r)))
+    I = {}
+    for w, i, c in (("Wx_mm3", "Ix_mm4", c_x), ("Wy_mm3", "Iy_mm4", c_y)):
+        w_k, i_k = _katalog_degeri(r, w), _katalog_degeri(r, i)
+        if w_k is not None:
+            W[w] = w_k
+        elif i_k is not None:
+            W[w] = i_k / c
+        I[i] = i_k if i_k is not None else (None if W[w] is None else W[w] * c)
+    H_max, t_min, t_max = k["kalinlik"](r)
+    return dict({
+        "etiket": k["etiket"](r),
+        "A_m2": A,
+        "A_mm2": A * 1e6 if A_mm2 is None else A_mm2,
+        "kg_m": A * agirlik_hesap(1.0, 1.0, MALZEMELER[KG_M_MALZEME]),
+        "H_max": H_max, "t_min": t_min, "t_max": t_max,
+    }, **W, **I)
+
+
+# aile -> (kaynak satırlar, satır + özellikler listesi, etiket -> satır)
+_OZELLIKLER = {}
+
+
+def _kayit_kur(aile, satirlar):
+    liste = [dict(r, **kesit_ozellikleri(aile, r)) for r in satirlar]
+    sozluk = {}
+    for o in liste:
+        sozluk.setdefault(o["etiket"], o)
+    return satirlar, liste, sozluk
+
+
+def _ozellikler(aile):
+    satirlar = tablo(aile)
+    kayit = _OZELLIKLER.get(aile)
+    if kayit is None or kayit[0] is not satirlar:
+        kayit = _OZELLIKLER[aile] = _kayit_kur(aile, satirlar)
+    return kayit
+
+
+def aile_degistir(aile, satirlar, imza=None):
+    """Ailenin tablosunu satirlar ile değiştirir (bkz. tablolar.tablo_ayarla).
+
+    Özellikler tablo değişmeden önce hesaplanır; hesaplanamayan bir satırda
+    hata yükselir ve eski tablo yerinde kalır.
+    """
+    kayit = _kayit_kur(aile, satirlar)
+    tablo_ayarla(aile, satirlar, imza)
+    _OZELLIKLER[aile] = kayit
+
+
+def ozellik_satirlari(aile):
+    """Tablo satırları + kesit_ozellikleri, tablo sırasıyla.
+
+    Satır başına bir kez hesaplanır; tablo değişmedikçe (tablo_ayarla)
+    aynı liste döner.
+    """
+    return _ozellikler(aile)[1]
+
+
+def ozellik_tablosu(aile):
+    """etiket -> ozellik_satirlari satırı (aynı etiketten ilki)."""
+    return _ozellikler(aile)[2]
+
+
+def ozellik(aile, etiket):
+    """Katalog satırının önceden hesaplanmış özellikleri; yoksa ValueError."""
+    try:
+        return ozellik_tablosu(aile)[etiket]
+    except KeyError:
+        raise ValueError("Tabloda bulunamadı: {}".format(etiket))
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""Kesitlerin gerçek ölçüleriyle SVG çizimi.
+
+Her aile, boyutlarından (mm) y ekseni yukarı bakan koordinatlarda
+kapalı eğri parçalarına çevrilir; parçalar tek bir evenodd yolunda
+birleşir (boru / kutu boşlukları delik olur). Genel genişlik ve
+yükseklik ölçü çizgileriyle, tüm boyutlar alttaki satırda yazılır.
+
+Çizimler (aile, boyutlar) anahtarlı sınırlı bir LRU önbellekte tutulur;
+aynı seçimle yeniden çalıştırmalar SVG'yi yeniden üretmez. Statik
+görseller süreç başına bir kez bayt olarak okunur.
+"""
+from profil_core.ice_aktar import SEMALAR
+from profil_core.kaynakli import TOPOLOJILER
+from profil_core.onbellek import ONBELLEKLER, LRUOnbellek
+
+# Çizimin sığdırıldığı kutu (piksel)
+GENISLIK_PX = 260
+YUKSEKLIK_PX = 320
+
+_DOLGU = "#b8c7d6"
+_CIZGI = "#1f3b57"
+_OLCU = "#666666"
+
+
+# ---------------------------------------------------------
+# KESIT GEOMETRILERI (mm, y yukarı)
+# ---------------------------------------------------------
+def _dikdortgen(x0, y0, w, h):
+    return ("cokgen", [(x0, y0), (x0 + w, y0), (x0 + w, y0 + h), (x0, y0 + h)])
+
+
+def _daire(r):
+    return ("daire", 0.0, 0.0, r)
+
+
+def _I(g):
+    b, h, tw, tf = g["b"], g["h"], g["tw"], g["tf"]
+    x, w = b / 2.0, tw / 2.0
+    return [("cokgen", [(-x, 0), (x, 0), (x, tf), (w, tf), (w, h - tf), (x, h - tf), (x, h),
+                        (-x, h), (-x, h - tf), (-w, h - tf), (-w, tf), (-x, tf)])]
+
+
+def _U(g):
+    b, h, tw, tf = g["b"], g["h"], g["tw"], g["tf"]
+    return [("cokgen", [(0, 0), (b, 0), (b, tf), (tw, tf), (tw, h - tf), (b, h - tf),
+                        (b, h), (0, h)])]
+
+
+def _L(g):
+    a, b, t = g["a"], g["b"], g["t"]
+    return [("cokgen", [(0, 0), (b, 0), (b, t), (t, t), (t, a), (0, a)])]
+
+
+def _bulb(g):
+    # Yaklaşık HP profili: gövde + bir yana çıkıntılı baş
+    B, t = g["B"], g["t"]
+    return [("cokgen", [(0, 0), (t, 0), (t, B - 2.5 * t), (2.2 * t, B - 0.6 * t),
+                        (2.2 * t, B), (0, B)])]
+
+
+def _levhalar(topoloji):
+    def parcalar(g):
+        levhalar, _, _ = TOPOLOJILER[topoloji](g["H"], g["t_f"], g["t_w"], g["b_f"])
+        return [_dikdortgen(x_c - b / 2.0, y_c - h / 2.0, b, h) for b, h, x_c, y_c in levhalar]
+    return parcalar
+
+
+# aile (veya kaynaklı topoloji) -> boyutlar -> parçalar
+_GEOMETRILER = {
+    "boru": lambda g: [_daire(g["OD"] / 2.0), _daire(g["OD"] / 2.0 - g["t"])],
+    "rhs": lambda g: [_dikdortgen(0, 0, g["B"], g["A"]),
+                      _dikdortgen(g["t"], g["t"], g["B"] - 2 * g["t"], g["A"] - 2 * g["t"])],
+    "l_equal": _L,
+    "l_unequal": _L,
+    "ipe": _I,
+    "hea": _I,
+    "heb": _I,
+    "upn": _U,
+    "round": lambda g: [_daire(g["d"] / 2.0)],
+    "square": lambda g: [_dikdortgen(0, 0, g["a"], g["a"])],
+    "bulbflat": _bulb,
+    "lama": lambda g: [_dikdortgen(0, 0, g["t"], g["h"])],
+}
+_GEOMETRILER.update({topoloji: _levhalar(topoloji) for topoloji in TOPOLOJILER})
+
+# Kaynaklı topolojilerin boyutları (H, t_f, t_w, b_f)
+_LEVHA_ALANLARI = ("H", "b_f", "t_f", "t_w")
+
+
+def boyut_alanlari(aile):
+    """Çizimde kullanılan boyut adları (ailenin şema sırasıyla)."""
+    if aile in TOPOLOJILER:
+        return list(_LEVHA_ALANLARI)
+    return [a for a in SEMALAR[aile]["alanlar"] if a not in ("profil", "DN", "SCH")]
+
+
+# ---------------------------------------------------------
+# SVG
+# ---------------------------------------------------------
+def _sinirlar(parcalar):
+    xs, ys = [], []
+    for p in parcalar:
+        if p[0] == "daire":
+            _, cx, cy, r = p
+            xs += [cx - r, cx + r]
+            ys += [cy - r, cy + r]
+        else:
+            xs += [x for x, _ in p[1]]
+            ys += [y for _, y in p[1]]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _yol(parcalar, donustur):
+    d = []
+    for p in parcalar:
+        if p[0] == "daire":
+            _, cx, cy, r = p
+            X, Y = donustur(cx, cy)
+            d.append("M{:.3f},{:.3f} a{r:.3f},{r:.3f} 0 1,0 {:.3f},0 a{r:.3f},{r:.3f} 0 1,0 "
+                     "{:.3f},0 Z".format(X - r, Y, 2 * r, -2 * r, r=r))
+        else:
+            d.append("M" + " L".join("{:.3f},{:.3f}".format(*donustur(x, y))
+                                     for x, y in p[1]) + " Z")
+    return " ".join(d)
+
+
+def _svg(aile, boyutlar):
+    parcalar = _GEOMETRILER[aile](boyutlar)
+    x0, y0, x1, y1 = _sinirlar(parcalar)
+    W, H = x1 - x0, y1 - y0
+    S = max(W, H)
+    pay = 0.22 * S
+    font = 0.075 * S
+    cizgi = 0.008 * S
+
+    def donustur(x, y):
+        return x - x0, y1 - y
+
+    yazi = "  ".join("{}={:g}".format(a, boyutlar[a]) for a in boyut_alanlari(aile))
+    # Ölçü çizgileri: altta genişlik, solda yükseklik
+    alt = H + 0.45 * pay
+    sol = -0.45 * pay
+    olcu = (
+        '<g stroke="{c}" stroke-width="{w:.3f}" fill="none">'
+        '<path d="M0,{a:.3f} H{W:.3f} M0,{a1:.3f} V{a2:.3f} M{W:.3f},{a1:.3f} V{a2:.3f}"/>'
+        '<path d="M{s:.3f},0 V{H:.3f} M{s1:.3f},0 H{s2:.3f} M{s1:.3f},{H:.3f} H{s2:.3f}"/>'
+        '</g>'
+        '<g fill="{c}" font-family="sans-serif" font-size="{f:.3f}" text-anchor="middle">'
+        '<text x="{xm:.3f}" y="{ay:.3f}">{Wt:g}</text>'
+        '<text transform="translate({sx:.3f},{ym:.3f}) rotate(-90)">{Ht:g}</text>'
+        '<text x="{xm:.3f}" y="{yy:.3f}">{yazi}</text>'
+        '</g>'
+    ).format(c=_OLCU, w=cizgi, a=alt, a1=alt - 0.1 * pay, a2=alt + 0.1 * pay, W=W, H=H,
+             s=sol, s1=sol - 0.1 * pay, s2=sol + 0.1 * pay, f=font, xm=W / 2.0,
+             ay=alt + 1.3 * font, sx=sol - 0.5 * font, ym=H / 2.0, Wt=round(W, 2),
+             Ht=round(H, 2), yy=alt + 2.8 * font, yazi=yazi)
+    # Dar kesitlerde (lama) alt satır şekilden geniş olabilir
+    yari = max(W / 2.0 + pay, 0.3 * font * len(yazi) + 0.1 * pay)
+    vx, vy = min(-pay, W / 2.0 - yari), -0.5 * pay
+    vw, vh = max(W + 0.5 * pay, W / 2.0 + yari) - vx, H + pay + 3.2 * font
+    olcek = min(GENISLIK_PX / vw, YUKSEKLIK_PX / vh)
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="{:.3f} {:.3f} {:.3f} {:.3f}" '
+        'width="{:.0f}" height="{:.0f}">'
+        '<path d="{}" fill="{}" fill-rule="evenodd" stroke="{}" stroke-width="{:.3f}"/>'
+        '{}</svg>'
+    ).format(vx, vy, vw, vh, vw * olcek, vh * olcek,
+             _yol(parcalar, donustur), _DOLGU, _CIZGI, 1.5 * cizgi, olcu)
+
+
+_CIZIMLER = LRUOnbellek(_svg, max_boyut=256)
+_CIZIMLER.__name__ = "kesit_svg"
+ONBELLEKLER["kesit_svg"] = _CIZIMLER
+
+
+def kesit_svg(aile, boyutlar):
+    """Ailenin (veya kaynaklı topolojinin) boyutlarından SVG metni.
+
+    boyutlar fazladan alan içerebilir (ör. özellikli katalog satırı);
+    önbellek anahtarı yalnızca çizimde kullanılan boyutlardır.
+    """
+    g = {a: float(boyutlar[a]) for a in boyut_alanlari(aile)}
+    anahtar = (aile, tuple(g.values()))
+    bulundu, svg = _CIZIMLER.getir(anahtar)
+    if not bulundu:
+        svg = _svg(aile, g)
+        _CIZIMLER.koy(anahtar, svg)
+    return svg
+
+
+# ---------------------------------------------------------
+# STATIK GORSELLER
+# ---------------------------------------------------------
+_STATIK = {}
+
+
+def statik_gorsel(yol):
+    """Dosyanın baytları; süreç başına bir kez okunur, dosya yoksa None."""
+    try:
+        return _STATIK[yol]
+    except KeyError:
+        pass
+    try:
+        with open(yol, "rb") as f:
+            veri = f.read()
+    except OSError:
+        veri = None
+    _STATIK[yol] = veri
+    return veri
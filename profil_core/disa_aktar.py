@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""Muadil ve ağırlık sonuçlarını parça parça CSV / Parquet / XLSX'e yazar.
+
+Kaynaklar satır sözlüğü listelerinden oluşan bloklar üretir (arayüz
+tablolarıyla aynı sütunlar); yazıcılar her bloğu geldiği anda diske
+aktarır. Bellekte aynı anda tek blok bulunur, bu yüzden çok geniş T
+tasarım uzayları da sabit bellekle yazılır. Satırlar üretim sırasıyla
+(T için H, t_f, t_w, b_f ızgara sırası) yazılır; skora göre sıralama
+tüm listeyi gerektirdiğinden yapılmaz.
+
+Parquet için pyarrow, XLSX için openpyxl gerekir.
+
+    python -m profil_core.disa_aktar t 50000 20000 t.parquet --H 80:400:10 --t 4:20
+"""
+import argparse
+import csv
+import os
+import sys
+from itertools import islice
+
+# Bir blokta en fazla bu kadar satır (lama / muadil / ağırlık kaynakları)
+PARCA = 10000
+
+# XLSX sayfa başına veri satırı (Excel sınırı 1 048 576, başlık dahil)
+XLSX_SAYFA_SATIRI = 1048575
+
+BICIMLER = ("csv", "parquet", "xlsx")
+
+
+def satir_bloklari(satirlar, parca=PARCA):
+    """Satır üretecini en fazla parca satırlık listelere böler."""
+    it = iter(satirlar)
+    while True:
+        blok = list(islice(it, parca))
+        if not blok:
+            return
+        yield blok
+
+
+# ---------------------------------------------------------
+# KAYNAKLAR (BLOK URETECLERI)
+# ---------------------------------------------------------
+def muadil_bloklari(Wx_target, Wy_target, tolerans=0.10, parca=PARCA):
+    """muadil_liste_10yuzde satırları, katalog sırasıyla."""
+    from profil_core.katalog import katalog_indeksi
+
+    indeks = katalog_indeksi()
+    ids = indeks.bant(Wx_target * (1.0 - tolerans), Wx_target * (1.0 + tolerans),
+                      Wy_target * (1.0 - tolerans), Wy_target * (1.0 + tolerans))
+
+    # Satır sözlükleri yalnızca o an yazılan parca'lık dilim için kurulur
+    for i in range(0, len(ids), parca):
+        blok = indeks.satirlar(ids[i:i + parca])
+        for r in blok:
+            r["ΔWx"] = abs(Wx_target - r["Wx_mm3"])
+            r["ΔWy"] = abs(Wy_target - r["Wy_mm3"])
+            r["Toplam Skor"] = r["ΔWx"] + r["ΔWy"]
+        yield blok
+
+
+def agirlik_bloklari(kesitler, parca=PARCA):
+    """agirlik_hesap satırları; kesitler (etiket, A_m2, metraj_mm, malzeme)
+    demetlerinin yinelenebilir dizisidir."""
+    from profil_core.kesit import MALZEMELER, agirlik_hesap
+
+    def satirlar():
+        for etiket, A_m2, metraj_mm, malzeme in kesitler:
+            rho = MALZEMELER[malzeme]
+            yield {
+                "Profil": etiket,
+                "Malzeme": malzeme,
+                "Metraj (mm)": metraj_mm,
+                "A (mm²)": A_m2 * 1e6,
+                "kg/m": agirlik_hesap(A_m2, 1.0, rho),
+                "Ağırlık (kg)": agirlik_hesap(A_m2, metraj_mm / 1000.0, rho),
+            }
+
+    return satir_bloklari(satirlar(), parca)
+
+
+def lama_bloklari(Wx_target, Wy_target, h_listesi, t_adaylari=None, tolerans=0.02,
+                  parca=PARCA):
+    """lama_muadil_wx_wy satırları; h_listesi'ndeki her yükseklik için
+    artan kalınlık sırasıyla."""
+    from profil_core.lama import (
+        LAMA_T_ADAYLARI, lama_satiri, lama_t_adaylari, lama_t_araliklari,
+    )
+
+    t_adaylari = LAMA_T_ADAYLARI if t_adaylari is None else t_adaylari
+
+    def satirlar():
+        for h in h_listesi:
+            araliklar = lama_t_araliklari(Wx_target, Wy_target, h, tolerans)
+            for t in lama_t_adaylari(araliklar, t_adaylari):
+                s = lama_satiri(Wx_target, Wy_target, h, t, tolerans)
+                if s:
+                    yield s
+
+    return satir_bloklari(satirlar(), parca)
+
+
+def t_bloklari(Wx_target, Wy_target, H_listesi, t_min_mm, t_max_mm, t_adaylari=None,
+               b_adim=10, genislikler=None):
+    """t_profil_wx_wy satırları; her (H, t_f) çifti bir blok.
+
+    Her blok yalnızca o flanş kalınlığının budanmış adaylarını içerir
+    (en fazla len(t) x len(b_f) satır).
+    """
+    from profil_core.muadil import t_profil_satirlari
+    from profil_core.tprofil import T_ADAYLARI
+
+    t_adaylari = T_ADAYLARI if t_adaylari is None else t_adaylari
+    t_list = [t for t in t_adaylari if t_min_mm <= t <= t_max_mm]
+    for H in H_listesi:
+        for t_f in t_list:
+            if float(H) - t_f <= 0:
+                continue
+            blok = t_profil_satirlari(Wx_target, Wy_target, H, t_f, t_list, b_adim, genislikler)
+            if blok:
+                yield blok
+
+
+# ---------------------------------------------------------
+# YAZICILAR
+# ---------------------------------------------------------
+def _csv_yaz(bloklar, yol, sema):
+    n = 0
+    with open(yol, "w", encoding="utf-8", newline="") as f:
+        yazici = None
+        if sema:
+            yazici = csv.DictWriter(f, fieldnames=[ad for ad, _ in sema], extrasaction="ignore")
+            yazici.writeheader()
+        for blok in bloklar:
+            if yazici is None:
+                yazici = csv.DictWriter(f, fieldnames=list(blok[0]), extrasaction="ignore")
+                yazici.writeheader()
+            yazici.writerows(blok)
+            n += len(blok)
+    return n
+
+
+def _parquet_yaz(bloklar, yol, sema):
+    try:
+        import pyarrow as pa  # Parquet desteği isteğe bağlı
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Parquet yazmak için pyarrow kurulu olmalı")
+    tipler = {float: pa.float64(), int: pa.int64(), str: pa.string()}
+    if sema:
+        sema = pa.schema([pa.field(ad, tipler[tip]) for ad, tip in sema])
+    n = 0
+    yazici = None
+    try:
+        for blok in bloklar:
+            if sema is None:
+                # Tam sayı görünen sayısal sütunlar sonraki bloklarda kesirli olabilir
+                sema = pa.schema([
+                    pa.field(a.name, pa.float64() if pa.types.is_integer(a.type) else a.type)
+                    for a in pa.Table.from_pylist(blok[:1]).schema])
+            if yazici is None:
+                yazici = pq.ParquetWriter(yol, sema)
+            yazici.write_table(pa.Table.from_pylist(blok, schema=sema))
+            n += len(blok)
+    finally:
+        if yazici is not None:
+            yazici.close()
+    return n
+
+
+def _xlsx_yaz(bloklar, yol, sema):
+    try:
+        import openpyxl  # XLSX desteği isteğe bağlı
+    except ImportError:
+        raise ValueError("XLSX yazmak için openpyxl kurulu olmalı")
+    kitap = openpyxl.Workbook(write_only=True)
+    n = 0
+    sayfa = None
+    basliklar = [ad for ad, _ in sema] if sema else None
+    sayfa_satiri = 0
+    for blok in bloklar:
+        if basliklar is None:
+            basliklar = list(blok[0])
+        for r in blok:
+            if sayfa is None or sayfa_satiri == XLSX_SAYFA_SATIRI:
+                sayfa = kitap.create_sheet("Sonuç {}".format(len(kitap.worksheets) + 1))
+                sayfa.append(basliklar)
+                sayfa_satiri = 0
+            sayfa.append([r.get(b) for b in basliklar])
+            sayfa_satiri += 1
+        n += len(blok)
+    if sayfa is None:
+        kitap.create_sheet("Sonuç 1")
+    kitap.save(yol)
+    return n
+
+
+_YAZICILAR = {"csv": _csv_yaz, "parquet": _parquet_yaz, "xlsx": _xlsx_yaz}
+
+
+def bicim_coz(yol, bicim=None):
+    """Açık biçim ya da dosya uzantısından "csv" / "parquet" / "xlsx"."""
+    bicim = (bicim or os.path.splitext(yol)[1].lstrip(".")).lower()
+    if bicim == "pq":
+        bicim = "parquet"
+    if bicim not in _YAZICILAR:
+        raise ValueError("Bilinmeyen biçim: {} ({})".format(bicim, ", ".join(BICIMLER)))
+    return bicim
+
+
+def disa_aktar(bloklar, yol, bicim=None, sema=None):
+    """Blokları (satır sözlüğü listeleri) dosyaya yazar; yazılan satır sayısı.
+
+    sema: [(sütun, float | int | str), ...]; verilmezse sütunlar ilk
+    bloktan, Parquet tipleri ilk satırdan çıkarılır (eksik değerler None
+    olmalı). Boş bloklar atlanır; hiç satır ve sema yoksa Parquet
+    dosyası yazılmaz.
+    """
+    return _YAZICILAR[bicim_coz(yol, bicim)]((b for b in bloklar if b), yol, sema)
+
+
+# ---------------------------------------------------------
+# KOMUT SATIRI
+# ---------------------------------------------------------
+def _aralik(metin):
+    """"80:400:10" -> [80, 90, ..., 400]; "4:20" adımı 1; tek sayı da olur."""
+    parcalar = [float(p) for p in metin.split(":")]
+    if len(parcalar) == 1:
+        return parcalar
+    bas, son = parcalar[0], parcalar[1]
+    adim = parcalar[2] if len(parcalar) > 2 else 1.0
+    n = int(round((son - bas) / adim)) + 1
+    return [bas + i * adim for i in range(max(n, 0))]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Muadil listelerini dosyaya aktar")
+    ap.add_argument("liste", choices=("muadil", "lama", "t"))
+    ap.add_argument("Wx", type=float, help="hedef Wx (mm³)")
+    ap.add_argument("Wy", type=float, help="hedef Wy (mm³)")
+    ap.add_argument("cikti", help="dosya (.csv, .parquet veya .xlsx)")
+    ap.add_argument("--H", default="100", help="lama h / T H (mm): değer veya bas:son:adim")
+    ap.add_argument("--t", default="4:10", help="T kalınlık aralığı t_min:t_max (mm)")
+    ap.add_argument("--b-adim", type=int, default=10,
+                    help="T flanş genişliği adımı (mm); 0: sürekli")
+    ap.add_argument("--tolerans", type=float, default=None,
+                    help="muadil / lama bant toleransı (varsayılan 0.10 / 0.02)")
+    args = ap.parse_args(argv)
+
+    if args.liste == "muadil":
+        tolerans = 0.10 if args.tolerans is None else args.tolerans
+        bloklar = muadil_bloklari(args.Wx, args.Wy, tolerans)
+    elif args.liste == "lama":
+        tolerans = 0.02 if args.tolerans is None else args.tolerans
+        bloklar = lama_bloklari(args.Wx, args.Wy, _aralik(args.H), tolerans=tolerans)
+    else:
+        t = [float(p) for p in args.t.split(":")]
+        t_min, t_max = t[0], t[-1]
+        bloklar = t_bloklari(args.Wx, args.Wy, _aralik(args.H), t_min, t_max,
+                             b_adim=args.b_adim or None)
+    n = disa_aktar(bloklar, args.cikti)
+    print("{}: {} satır".format(args.cikti, n), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""Üretici / EN / ASME kataloglarını tables/ şemasına aktarır.
+
+Dosya satır satır okunur; her satır doğrulanır, tekrarlar ayıklanır ve
+sonuç doğrudan tables/<aile>.py modülüne yazılır. Dosyada A_mm2, Ix_mm4,
+Iy_mm4, Wx_mm3, Wy_mm3 sütunları varsa (katalogdaki tablo değerleri)
+onlar da yazılır ve yaklaşık formüllerin yerine kullanılır.
+
+Örnek:
+    python -m profil_core.ice_aktar ipe ipe_tam.csv
+    python -m profil_core.ice_aktar boru asme_b36_10.xlsx --esle OD="Outside Diameter"
+"""
+import argparse
+import csv
+import math
+import os
+import stat
+import sys
+import tempfile
+
+from profil_core.aileler import KATALOG_OZELLIKLERI
+
+TABLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tables")
+
+
+# ---------------------------------------------------------
+# GEOMETRI KONTROLLERI
+# ---------------------------------------------------------
+def _kontrol_boru(r):
+    return r["t"] < r["OD"] / 2.0
+
+
+def _kontrol_rhs(r):
+    return 2 * r["t"] < min(r["A"], r["B"])
+
+
+def _kontrol_L(r):
+    return r["t"] < min(r["a"], r["b"])
+
+
+def _kontrol_I(r):
+    return 2 * r["tf"] < r["h"] and r["tw"] < r["b"]
+
+
+def _kontrol_bulb(r):
+    return r["t"] < r["B"]
+
+
+def _kontrol_lama(r):
+    return r["t"] <= r["h"]
+
+
+# ---------------------------------------------------------
+# AILE SEMALARI (tables/*.py ile aynı alanlar)
+# ---------------------------------------------------------
+SEMALAR = {
+    "boru": {"tablo": "BORU_TABLO", "alanlar": ["DN", "SCH", "OD", "t"],
+             "anahtar": ("DN", "SCH"), "kontrol": _kontrol_boru},
+    "rhs": {"tablo": "RHS_TABLO", "alanlar": ["profil", "A", "B", "t"],
+            "anahtar": ("profil",), "kontrol": _kontrol_rhs},
+    "l_equal": {"tablo": "L_EQUAL_TABLO", "alanlar": ["profil", "a", "b", "t"],
+                "anahtar": ("profil",), "kontrol": _kontrol_L},
+    "l_unequal": {"tablo": "L_UNEQUAL_TABLO", "alanlar": ["profil", "a", "b", "t"],
+                  "anahtar": ("profil",), "kontrol": _kontrol_L},
+    "ipe": {"tablo": "IPE_TABLO", "alanlar": ["profil", "h", "b", "tw", "tf"],
+            "anahtar": ("profil",), "kontrol": _kontrol_I},
+    "hea": {"tablo": "HEA_TABLO", "alanlar": ["profil", "h", "b", "tw", "tf"],
+            "anahtar": ("profil",), "kontrol": _kontrol_I},
+    "heb": {"tablo": "HEB_TABLO", "alanlar": ["profil", "h", "b", "tw", "tf"],
+            "anahtar": ("profil",), "kontrol": _kontrol_I},
+    "upn": {"tablo": "UPN_TABLO", "alanlar": ["profil", "h", "b", "tw", "tf"],
+            "anahtar": ("profil",), "kontrol": _kontrol_I},
+    "bulbflat": {"tablo": "BULBFLAT_TABLO", "alanlar": ["profil", "B", "t"],
+                 "anahtar": ("profil",), "kontrol": _kontrol_bulb},
+    "round": {"tablo": "ROUND_TABLO", "alanlar": ["profil", "d"],
+              "anahtar": ("profil",), "kontrol": None},
+    "square": {"tablo": "SQUARE_TABLO", "alanlar": ["profil", "a"],
+               "anahtar": ("profil",), "kontrol": None},
+    "lama": {"tablo": "LAMA_TABLO", "alanlar": ["profil", "h", "t"],
+             "anahtar": ("profil",), "kontrol": _kontrol_lama},
+}
+
+
+# ---------------------------------------------------------
+# HAM SATIR OKUMA (AKIS HALINDE)
+# ---------------------------------------------------------
+def ham_satirlar(yol, ayirici=","):
+    """CSV veya XLSX dosyasındaki satırları sözlük olarak üretir."""
+    if yol.lower().endswith((".xlsx", ".xlsm")):
+        try:
+            import openpyxl  # XLSX desteği isteğe bağlı
+        except ImportError:
+            raise ValueError("XLSX okumak için openpyxl kurulu olmalı")
+        kitap = openpyxl.load_workbook(yol, read_only=True, data_only=True)
+        try:
+            satirlar = kitap.active.iter_rows(values_only=True)
+            basliklar = [str(b).strip() if b is not None else "" for b in next(satirlar, [])]
+            for degerler in satirlar:
+                yield dict(zip(basliklar, degerler))
+        finally:
+            kitap.close()
+    else:
+        with open(yol, encoding="utf-8-sig", newline="") as f:
+            for satir in csv.DictReader(f, delimiter=ayirici):
+                yield {(k or "").strip(): v for k, v in satir.items()}
+
+
+def _sayi(deger):
+    if isinstance(deger, str):
+        deger = deger.strip().replace(",", ".")
+    deger = float(deger)
+    # "inf" / "nan" float() ile okunur ama tablo modülüne literal olarak yazılamaz
+    if not math.isfinite(deger):
+        raise ValueError("sonlu bir sayı değil: {}".format(deger))
+    return deger
+
+
+def _tam_sayi(deger, alan):
+    # DN 50.5 / SCH 80.5 kırpılırsa başka, geçerli bir boru olarak aktarılır
+    deger = _sayi(deger)
+    if not deger.is_integer():
+        raise ValueError("'{}' tam sayı olmalı: {:g}".format(alan, deger))
+    return int(deger)
+
+
+def _sch(deger):
+    deger = str(deger).strip()
+    return _tam_sayi(deger, "SCH") if deger.replace(".", "", 1).isdigit() else deger.upper()
+
+
+def satir_dogrula(aile, ham, esleme=None):
+    """Ham satırı aile şemasına çevirir; geçersizse ValueError."""
+    sema = SEMALAR[aile]
+    esleme = esleme or {}
+    r = {}
+    for alan in sema["alanlar"]:
+        deger = ham.get(esleme.get(alan, alan))
+        if deger is None or (isinstance(deger, str) and not deger.strip()):
+            raise ValueError("'{}' alanı boş".format(alan))
+        if alan == "profil":
+            r[alan] = str(deger).strip()
+        elif alan == "DN":
+            r[alan] = _tam_sayi(deger, alan)
+        elif alan == "SCH":
+            r[alan] = _sch(deger)
+        else:
+            r[alan] = _sayi(deger)
+            if not r[alan] > 0:
+                raise ValueError("'{}' pozitif olmalı".format(alan))
+    if sema["kontrol"] and not sema["kontrol"](r):
+        raise ValueError("geometri tutarsız: {}".format(r))
+    # İsteğe bağlı tablo değerleri (A, I, W); formülle bulunanların yerine geçer
+    for alan in KATALOG_OZELLIKLERI:
+        deger = ham.get(esleme.get(alan, alan))
+        if deger is None or (isinstance(deger, str) and not deger.strip()):
+            continue
+        r[alan] = _sayi(deger)
+        if not r[alan] > 0:
+            raise ValueError("'{}' pozitif olmalı".format(alan))
+    return r
+
+
+def gecerli_satirlar(aile, yol, esleme=None, ayirici=",", rapor=None):
+    """Doğrulanmış ve tekrarı ayıklanmış satırları üretir.
+
+    Bellekte yalnızca görülen anahtarlar tutulur. rapor sözlüğü verilirse
+    okunan/yazılan/tekrar/hatalı sayıları ve ilk hatalar doldurulur.
+    """
+    anahtar_alanlari = SEMALAR[aile]["anahtar"]
+    rapor = rapor if rapor is not None else {}
+    rapor.update({"okunan": 0, "gecerli": 0, "tekrar": 0, "hatali": 0, "hatalar": []})
+    gorulen = set()
+    for no, ham in enumerate(ham_satirlar(yol, ayirici), 2):
+        rapor["okunan"] += 1
+        try:
+            r = satir_dogrula(aile, ham, esleme)
+        except (ValueError, TypeError) as e:
+            rapor["hatali"] += 1
+            if len(rapor["hatalar"]) < 20:
+                rapor["hatalar"].append("satır {}: {}".format(no, e))
+            continue
+        anahtar = tuple(r[a] for a in anahtar_alanlari)
+        if anahtar in gorulen:
+            rapor["tekrar"] += 1
+            continue
+        gorulen.add(anahtar)
+        rapor["gecerli"] += 1
+        yield r
+
+
+# ---------------------------------------------------------
+# TABLO MODULU YAZMA
+# ---------------------------------------------------------
+def _dosya_kipi(yol):
+    """Yazılacak dosyanın izinleri: varsa mevcut dosyanınki, yoksa umask'a
+    göre yeni dosyanınki (mkstemp her zaman 0600 açar)."""
+    try:
+        return stat.S_IMODE(os.stat(yol).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def tablo_yaz(aile, satirlar, yol=None):
+    """Satırları tables/<aile>.py biçiminde yazar (geçici dosya + os.replace)."""
+    tablo = SEMALAR[aile]["tablo"]
+    yol = yol or os.path.join(TABLES_DIR, aile + ".py")
+    fd, gecici = tempfile.mkstemp(suffix=".py", dir=os.path.dirname(os.path.abspath(yol)))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("\n# -*- coding: utf-8 -*-\n{} = [\n".format(tablo))
+            # repr: satır sonu vb. içeren metinler de geçerli literal olarak yazılır
+            for r in satirlar:
+                f.write("    {" + ", ".join(
+                    '"{}": {!r}'.format(k, v) for k, v in r.items()) + "},\n")
+            f.write("]\n")
+        os.chmod(gecici, _dosya_kipi(yol))
+        os.replace(gecici, yol)
+    except BaseException:
+        os.unlink(gecici)
+        raise
+    return yol
+
+
+def ice_aktar(aile, girdi, cikti=None, esleme=None, ayirici=","):
+    """Katalog dosyasını doğrulayıp tablo modülüne yazar; raporu döndürür."""
+    if aile not in SEMALAR:
+        raise ValueError("Bilinmeyen aile: {} ({})".format(aile, ", ".join(SEMALAR)))
+    rapor = {}
+    rapor["cikti"] = tablo_yaz(aile, gecerli_satirlar(aile, girdi, esleme, ayirici, rapor), cikti)
+    return rapor
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Katalog dosyasını tables/ şemasına aktar")
+    ap.add_argument("aile", choices=sorted(SEMALAR))
+    ap.add_argument("girdi", help="katalog dosyası (.csv veya .xlsx)")
+    ap.add_argument("--cikti", help="yazılacak modül (varsayılan: tables/<aile>.py)")
+    ap.add_argument("--esle", action="append", default=[], metavar="ALAN=SUTUN",
+                    help="şema alanını dosyadaki sütun adına eşle")
+    ap.add_argument("--ayirici", default=",", help="CSV ayırıcı karakteri")
+    args = ap.parse_args(argv)
+
+    esleme = dict(e.split("=", 1) for e in args.esle)
+    rapor = ice_aktar(args.aile, args.girdi, args.cikti, esleme, args.ayirici)
+    print("{cikti}: {okunan} okundu, {gecerli} yazıldı, {tekrar} tekrar, {hatali} hatalı".format(
+        **rapor), file=sys.stderr)
+    for h in rapor["hatalar"]:
+        print("  " + h, file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
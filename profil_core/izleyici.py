@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Katalog kaynaklarını izler; değişen aileyi çalışırken yeniden yükler.
+
+tables/<aile>.py değişince (boyut ya da mtime_ns) yalnızca o aile
+yeniden okunur ve ondan türeyen yapılar güncellenir:
+
+    aileler     satır özellikleri (önce hesaplanır; hatalı tablo yüklenmez)
+    kolonsal    ailenin sütunsal önbelleği (parmak izi değiştiği için)
+    katalog     indeksin o aileye ait dilimi (KatalogIndeksi.aile_degistir)
+    pareto      ailenin kendi cephesi ve katalog cephesi
+    lama        stok grupları (tablo kimliğinden)
+
+Yeni indeks ve cephe eskileri değiştirilmeden yanlarında kurulur ve tek
+atamayla devreye girer, ardından katalog sürümü artar. Aramalar başta
+aldıkları yapıyı sonuna kadar kullanır: yeniden yüklemeye denk gelen bir
+çalıştırma eski sürümle tutarlı biter, sonraki çağrılar yeni sürümü
+görür. Katalogdan okuyan önbelleklerin anahtarında sürüm bulunur.
+
+Bu süreçte tablosu okunmuş ya da sütunsal önbelleği açılmış (indeks,
+Pareto cephesi) her aile, kullanıldığı andaki kaynak imzasıyla izlenir;
+her süreç (Streamlit sunucusu, servis işçileri) kendi kopyasını yeniler.
+Bakım için tablo dosyasını yerinde değiştirmek (ör. profil_core.ice_aktar)
+yeterlidir.
+
+    PROFIL_KATALOG_IZLE=2     # izleme aralığı (s); 0 izlemeyi kapatır
+"""
+import logging
+import os
+import threading
+import time
+
+from profil_core.aileler import aile_degistir
+from profil_core.tablolar import degisen_aileler, kaynak_imzasi, tablo_oku
+
+IZLEME_ARALIGI = float(os.environ.get("PROFIL_KATALOG_IZLE", "2"))
+
+_log = logging.getLogger(__name__)
+
+# aile -> (kaynak imzası, hata metni); aynı imzalı kaynak yeniden denenmez
+_HATALAR = {}
+
+
+def yenileme_hatalari():
+    """Yüklenemeyen aileler: aile -> hata metni (eski tablo kullanımda)."""
+    return {aile: mesaj for aile, (_, mesaj) in sorted(list(_HATALAR.items()))}
+
+
+# ---------------------------------------------------------
+# YENIDEN YUKLEME
+# ---------------------------------------------------------
+def katalogu_yenile(aileler=None):
+    """Kaynağı değişen (ya da verilen) aileleri yeniden yükler; yenilenen aileler.
+
+    Okunamayan ya da özellikleri hesaplanamayan bir ailenin eski tablosu
+    kalır; hata yenileme_hatalari()'nda görünür ve kaynak yeniden
+    değişene kadar denenmez.
+    """
+    from profil_core.katalog import (
+        katalog_indeksi_guncelle, katalog_kilidi, katalog_surumu_artir,
+    )
+    from profil_core.pareto import pareto_cephesi_guncelle
+
+    with katalog_kilidi():
+        adaylar = degisen_aileler() if aileler is None else list(aileler)
+        yenilenen = []
+        for aile in adaylar:
+            imza = kaynak_imzasi(aile)
+            hata = _HATALAR.get(aile)
+            if aileler is None and hata is not None and hata[0] == imza:
+                continue
+            try:
+                satirlar, imza = tablo_oku(aile)
+                aile_degistir(aile, satirlar, imza)
+            except Exception as e:  # yayınlanan hatalı tablo süreci düşürmemeli
+                _HATALAR[aile] = (imza, "{}: {}".format(type(e).__name__, e))
+                continue
+            _HATALAR.pop(aile, None)
+            yenilenen.append(aile)
+        if yenilenen:
+            katalog_indeksi_guncelle(yenilenen)
+            pareto_cephesi_guncelle(yenilenen)
+            katalog_surumu_artir()
+        return yenilenen
+
+
+# ---------------------------------------------------------
+# IZLEYICI
+# ---------------------------------------------------------
+class KatalogIzleyici(threading.Thread):
+    """aralik saniyede bir katalogu_yenile() çağıran arka plan iş parçacığı."""
+
+    def __init__(self, aralik=IZLEME_ARALIGI):
+        super().__init__(name="katalog-izleyici", daemon=True)
+        self.aralik = aralik
+        self._dur = threading.Event()
+
+    def run(self):
+        bildirilen = {}
+        while not self._dur.wait(self.aralik):
+            t0 = time.perf_counter()
+            yenilenen = katalogu_yenile()
+            if yenilenen:
+                _log.info("Katalog yenilendi: %s (%.0f ms)", ", ".join(yenilenen),
+                          (time.perf_counter() - t0) * 1000.0)
+            hatalar = yenileme_hatalari()
+            for aile, mesaj in hatalar.items():
+                if bildirilen.get(aile) != mesaj:
+                    _log.warning("Katalog yüklenemedi, eski tablo kullanılıyor: %s: %s",
+                                 aile, mesaj)
+            bildirilen = hatalar
+
+    def durdur(self):
+        self._dur.set()
+
+
+_IZLEYICI = None
+_IZLEYICI_KILIDI = threading.Lock()
+
+
+def izlemeyi_baslat(aralik=None):
+    """Süreç başına tek izleyiciyi başlatır; aralık 0 ise izlenmez (None döner)."""
+    global _IZLEYICI
+    aralik = IZLEME_ARALIGI if aralik is None else aralik
+    if aralik <= 0:
+        return None
+    with _IZLEYICI_KILIDI:
+        if _IZLEYICI is None or not _IZLEYICI.is_alive():
+            _IZLEYICI = KatalogIzleyici(aralik)
+            _IZLEYICI.start()
+        return _IZLEYICI
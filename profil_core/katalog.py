@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+import math
+import os
+import threading
+from itertools import groupby
+
+from profil_core.aileler import AILELER, KATALOG_AILELERI, ozellik_satirlari
+
+
+# ---------------------------------------------------------
+# TUM PROFILLERIN WX – WY LISTESI
+# ---------------------------------------------------------
+def build_all_profiles_wx_wy():
+    """Katalog ailelerinin Wx'i tanımlı satırları; değerler aile kaydında
+    önceden hesaplanmış özelliklerden okunur (katalog değerleri öncelikli)."""
+    lst = []
+    for aile in KATALOG_AILELERI:
+        tip = AILELER[aile]["kisa"]
+        for o in ozellik_satirlari(aile):
+            if o["Wx_mm3"]:
+                lst.append({"Profil": o["etiket"], "Tip": tip,
+                            "Wx_mm3": o["Wx_mm3"], "Wy_mm3": o["Wy_mm3"]})
+    return lst
+
+
+def _aile_araliklari(profiller):
+    """aile -> (ilk, son) satır aralığı (KATALOG_AILELERI sırasıyla).
+
+    Satırlar aile aile, katalog sırasıyla gelmiyorsa None.
+    """
+    sira = {AILELER[a]["kisa"]: n for n, a in enumerate(KATALOG_AILELERI)}
+    sayilar = {}
+    onceki = -1
+    for tip, grup in groupby(r["Tip"] for r in profiller):
+        n = sira.get(tip, -1)
+        if n <= onceki:
+            return None
+        sayilar[KATALOG_AILELERI[n]] = sum(1 for _ in grup)
+        onceki = n
+    araliklar = {}
+    bas = 0
+    for aile in KATALOG_AILELERI:
+        araliklar[aile] = (bas, bas + sayilar.get(aile, 0))
+        bas = araliklar[aile][1]
+    return araliklar
+
+
+# ---------------------------------------------------------
+# SIRALI WX / WY INDEKSI
+# ---------------------------------------------------------
+# Satır sözlüklerinin alanları (build_all_profiles_wx_wy sırasıyla)
+_ALANLAR = ("Profil", "Tip", "Wx_mm3", "Wy_mm3")
+
+
+class KatalogIndeksi:
+    """Katalog satırlarını Wx ve Wy'ye göre sıralı tutar.
+
+    Satırlar sütun sütun NumPy dizilerinde (_ALANLAR) saklanır. Her eksen
+    için kararlı argsort ile sıralı değer dizisi ve satır numaraları
+    tutulur; bir [min, max] bandındaki satırlar searchsorted ile
+    O(log n + k)'da bulunur. Satır sözlükleri yalnızca sorgunun döndürdüğü
+    satırlar için kurulur (satirlar). kg_m (satırlarla aynı sırada kg/m)
+    verilirse k-NN araması kütle eksenini de kullanır. aileler, aile ->
+    (ilk, son) satır aralığıdır; satırlar aile sırasında değilse None.
+
+    Kurulduktan sonra değişmez (k-d ağacı dışında, o da ilk k-NN
+    sorgusunda bir kez kurulur); bir ailenin değişmesi aile_degistir ile
+    yeni bir indeks üretir.
+    """
+
+    def __init__(self, sutunlar, kg_m=None, aileler=None):
+        import numpy as np
+
+        self.sutunlar = {a: np.asarray(sutunlar[a]) for a in _ALANLAR}
+        self.kg_m = kg_m
+        self.aileler = aileler
+        self._wx_id, self._wx = self._sirala(self.sutunlar["Wx_mm3"])
+        self._wy_id, self._wy = self._sirala(self.sutunlar["Wy_mm3"])
+        self._agac = None
+
+    @classmethod
+    def satirlardan(cls, profiller, kg_m=None):
+        """build_all_profiles_wx_wy biçimindeki satır sözlüklerinden indeks."""
+        import numpy as np
+
+        sutunlar = {a: np.asarray([r[a] for r in profiller], dtype=str) for a in _ALANLAR[:2]}
+        for a in _ALANLAR[2:]:
+            sutunlar[a] = np.asarray([r[a] for r in profiller], dtype=np.float64)
+        return cls(sutunlar, kg_m, _aile_araliklari(profiller))
+
+    def __len__(self):
+        return len(self._wx)
+
+    @staticmethod
+    def _sirala(degerler):
+        import numpy as np
+
+        ids = np.argsort(degerler, kind="stable")
+        return ids, degerler[ids]
+
+    @staticmethod
+    def _birlestir(ids, degerler, bas, son, yeni_degerler):
+        import numpy as np
+
+        kalan = (ids < bas) | (ids >= son)
+        k_id, k_deger = ids[kalan], degerler[kalan]
+        k_id = np.where(k_id >= son, k_id + (len(yeni_degerler) - (son - bas)), k_id)
+        sira = np.argsort(yeni_degerler, kind="stable")
+        y_deger = yeni_degerler[sira]
+        # Kararlı sıralamayla aynı sıra: yeni satır, eşit değerli kalan
+        # satırlardan numarası bas'tan küçük olanların ardına girer
+        once = np.concatenate(([0], np.cumsum(k_id < bas)))
+        sol = k_deger.searchsorted(y_deger, "left")
+        sag = k_deger.searchsorted(y_deger, "right")
+        yer = sol + once[sag] - once[sol]
+        return np.insert(k_id, yer, sira + bas), np.insert(k_deger, yer, y_deger)
+
+    def aile_degistir(self, aile, sutunlar, kg_m=None):
+        """Ailenin dilimi sutunlar (ve kg_m) ile değişmiş yeni indeks.
+
+        Diğer ailelerin satırları yeniden sıralanmaz: sıralı eksenlerden
+        eski dilim çıkarılır, sonraki satır numaraları kaydırılır ve yeni
+        satırlar searchsorted ile yerlerine eklenir (O(n + m log m)). Sonuç
+        tüm satırlardan kurulan indeksle aynıdır; bu indeks değişmez.
+        """
+        import numpy as np
+
+        if self.aileler is None:
+            raise ValueError("İndeks satırları aile sırasında değil; yeniden kurulmalı")
+        bas, son = self.aileler[aile]
+        fark = len(sutunlar["Wx_mm3"]) - (son - bas)
+        yeni = object.__new__(KatalogIndeksi)
+        yeni.sutunlar = {a: np.concatenate((d[:bas], sutunlar[a], d[son:]))
+                         for a, d in self.sutunlar.items()}
+        if self.kg_m is None or kg_m is None:
+            yeni.kg_m = None
+        else:
+            yeni.kg_m = np.concatenate((self.kg_m[:bas], kg_m, self.kg_m[son:]))
+        yeni.aileler = {}
+        kay = 0  # aileden sonra gelenler fark kadar kayar
+        for a, (i, j) in self.aileler.items():
+            if a == aile:
+                yeni.aileler[a] = (bas, son + fark)
+                kay = fark
+            else:
+                yeni.aileler[a] = (i + kay, j + kay)
+        yeni._wx_id, yeni._wx = self._birlestir(self._wx_id, self._wx, bas, son,
+                                                np.asarray(sutunlar["Wx_mm3"]))
+        yeni._wy_id, yeni._wy = self._birlestir(self._wy_id, self._wy, bas, son,
+                                                np.asarray(sutunlar["Wy_mm3"]))
+        yeni._agac = None
+        return yeni
+
+    def satirlar(self, ids):
+        """ids satırlarının sözlükleri (build_all_profiles_wx_wy biçiminde)."""
+        import numpy as np
+
+        ids = np.asarray(ids, dtype=np.intp)
+        return [dict(zip(_ALANLAR, r))
+                for r in zip(*(self.sutunlar[a][ids].tolist() for a in _ALANLAR))]
+
+    @staticmethod
+    def _aralik(degerler, ids, alt, ust):
+        return ids[degerler.searchsorted(alt, "left"):degerler.searchsorted(ust, "right")]
+
+    def wx_araligi(self, Wx_min, Wx_max):
+        return self._aralik(self._wx, self._wx_id, Wx_min, Wx_max)
+
+    def wy_araligi(self, Wy_min, Wy_max):
+        return self._aralik(self._wy, self._wy_id, Wy_min, Wy_max)
+
+    def bant(self, Wx_min, Wx_max, Wy_min, Wy_max):
+        """Wx VEYA Wy bandına düşen satır numaraları (katalog sırasında)."""
+        import numpy as np
+
+        return np.union1d(self.wx_araligi(Wx_min, Wx_max), self.wy_araligi(Wy_min, Wy_max))
+
+    def _knn_agaci(self):
+        """log Wx, log Wy (ve varsa log kg/m) üzerinde k-d ağacı; ilk k-NN
+        sorgusunda bir kez kurulur. Logaritması alınamayan satırlar dışarıda
+        kalır; dönen dizi ağaç satırlarını katalog satırlarına eşler."""
+        if self._agac is None:
+            import numpy as np
+            from profil_core.knn import KDAgaci
+
+            sutunlar = [self.sutunlar["Wx_mm3"], self.sutunlar["Wy_mm3"]]
+            if self.kg_m is not None:
+                sutunlar.append(self.kg_m)
+            D = np.column_stack(sutunlar).astype(np.float64, copy=False)
+            gecerli = np.all(np.isfinite(D) & (D > 0), axis=1)
+            eslem = np.flatnonzero(gecerli)
+            self._agac = (KDAgaci(np.log(D[gecerli])), eslem)
+        return self._agac
+
+    def knn(self, Wx, Wy, kg_m=None, k=10, agirliklar=(1.0, 1.0, 1.0)):
+        """(log Wx, log Wy, log kg/m) uzayında en yakın k satır: (mesafe, satır no).
+
+        agirliklar eksen çarpanlarıdır; kg_m verilmezse veya indekste kütle
+        yoksa kütle ekseni kullanılmaz.
+        """
+        agac, eslem = self._knn_agaci()
+        nokta = [math.log(Wx), math.log(Wy)]
+        w = [agirliklar[0], agirliklar[1]]
+        if agac.boyut == 3:
+            nokta.append(math.log(kg_m) if kg_m else 0.0)
+            w.append(agirliklar[2] if kg_m else 0.0)
+        mesafe, ids = agac.sorgula(nokta, k, w)
+        return mesafe.tolist(), eslem[ids].tolist()
+
+
+# ---------------------------------------------------------
+# SURUM
+# ---------------------------------------------------------
+# İndeks / Pareto cephesi kurulumu ve katalog yenilemesi bu kilitle sıralanır
+_KILIT = threading.RLock()
+
+# Katalog her değiştiğinde artar; katalogdan okuyan önbelleklerin anahtarına girer
+_SURUM = 0
+
+
+def _kilidi_yenile():
+    # fork anında başka bir iş parçacığının tuttuğu kilit çocukta hiç açılmaz
+    global _KILIT
+    _KILIT = threading.RLock()
+
+
+# os.register_at_fork yalnızca POSIX'te var (Windows'ta süreçler fork ile açılmaz)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_kilidi_yenile)
+
+
+def katalog_kilidi():
+    """Katalog yapılarını kuran ya da değiştiren kodun aldığı (yeniden girilebilir) kilit."""
+    return _KILIT
+
+
+def katalog_surumu():
+    return _SURUM
+
+
+def katalog_surumu_artir():
+    """Yeni yapılar devreye alındıktan sonra çağrılır; yeni sürüm numarası."""
+    global _SURUM
+    with _KILIT:
+        _SURUM += 1
+        return _SURUM
+
+
+_INDEKS = None
+
+
+def _indeks_kur(derle):
+    """Katalog ailelerinin sütunlarından indeks (aile aralıklarıyla)."""
+    import numpy as np
+    from profil_core.kolonsal import aile_sutunlari
+
+    parcalar, kutleler, araliklar = [], [], {}
+    bas = 0
+    for aile in KATALOG_AILELERI:
+        sutunlar, kg_m = aile_sutunlari(aile, derle)
+        parcalar.append(sutunlar)
+        kutleler.append(kg_m)
+        araliklar[aile] = (bas, bas + len(kg_m))
+        bas += len(kg_m)
+    sutunlar = {a: np.concatenate([p[a] for p in parcalar]) for a in _ALANLAR}
+    return KatalogIndeksi(sutunlar, np.concatenate(kutleler), araliklar)
+
+
+def katalog_indeksi():
+    """Süreç başına bir kez kurulan katalog indeksi.
+
+    Sütunlar derlenmiş sütunsal önbellekten (profil_core.kolonsal) okunur;
+    önbellek dizini yazılamıyorsa tablolardan doğrudan hesaplanır. Dönen
+    indeks değişmez; katalog yenilenince yerine yenisi konur, elinde eski
+    indeks olan arama onunla tutarlı biter.
+    """
+    global _INDEKS
+    indeks = _INDEKS
+    if indeks is None:
+        with _KILIT:
+            if _INDEKS is None:
+                try:
+                    _INDEKS = _indeks_kur(derle=False)
+                except OSError:
+                    _INDEKS = _indeks_kur(derle=True)
+            indeks = _INDEKS
+    return indeks
+
+
+def katalog_indeksi_guncelle(aileler):
+    """Kurulu indeksin yalnızca aileler dilimlerini yenileyip yeni indeksi
+    devreye alır (tablolar önceden değiştirilmiş olmalı).
+
+    İndeks henüz kurulmadıysa bir şey yapılmaz; satırları aile sırasında
+    değilse (ör. katalog_indeksi_sifirla ile verilmiş) bir sonraki çağrıda
+    baştan kurulur.
+    """
+    global _INDEKS
+    from profil_core.kolonsal import aile_sutunlari
+
+    with _KILIT:
+        indeks = _INDEKS
+        if indeks is None:
+            return None
+        if indeks.aileler is None:
+            _INDEKS = None
+            return None
+        for aile in aileler:
+            if aile not in indeks.aileler:
+                continue
+            try:
+                sutunlar, kg_m = aile_sutunlari(aile)
+            except OSError:
+                sutunlar, kg_m = aile_sutunlari(aile, derle=True)
+            indeks = indeks.aile_degistir(aile, sutunlar, kg_m)
+        _INDEKS = indeks
+        return indeks
+
+
+def katalog_indeksi_sifirla(profiller=None, kg_m=None):
+    """İndeksi verilen satırlarla kurar; None ise bir sonraki çağrıda yeniden kurulur."""
+    global _INDEKS
+    with _KILIT:
+        _INDEKS = KatalogIndeksi.satirlardan(profiller, kg_m) if profiller is not None else None
+        katalog_surumu_artir()
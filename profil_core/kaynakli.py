@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Sac levhalardan kaynaklı yapma kesitler (I, kutu, U, T).
+
+Her topoloji, parametre dizilerinden dikdörtgen levhalar (genişlik,
+yükseklik, merkez x, merkez y; mm) üretir. levha_kesiti bu levhaların
+ağırlık merkezini, Ix / Iy'sini ve ekstrem fiber mesafelerini kesin
+olarak ve NumPy yayınlamasıyla hesaplar; Python düzeyinde aday döngüsü
+yoktur. Arama, (t_f, t_w, b_f) ızgarasını t_f başına bloklar halinde
+değerlendirir ve en iyi adayları sınırlı bir tamponda tutar.
+"""
+import numpy as np
+
+from profil_core.tprofil import en_iyiler
+
+
+# ---------------------------------------------------------
+# LEVHA TOPLULUGU
+# ---------------------------------------------------------
+def levha_kesiti(levhalar):
+    """Üst üste binmeyen dikdörtgen levhalardan kesit özellikleri.
+
+    levhalar: (b, h, x_c, y_c) dörtlüleri; b yatay, h düşey boyut (mm).
+    Dönen sözlük: A (mm²), x_bar, y_bar (mm), Ix, Iy (mm⁴; ağırlık
+    merkezinden geçen eksenlere göre), Wx, Wy (mm³).
+    """
+    A = 0.0
+    Sx = 0.0
+    Sy = 0.0
+    for b, h, x_c, y_c in levhalar:
+        a = b * h
+        A = A + a
+        Sx = Sx + a * y_c
+        Sy = Sy + a * x_c
+    y_bar = Sx / A
+    x_bar = Sy / A
+
+    Ix = 0.0
+    Iy = 0.0
+    ust = alt = sag = sol = None
+    for b, h, x_c, y_c in levhalar:
+        a = b * h
+        Ix = Ix + b * h ** 3 / 12.0 + a * (y_c - y_bar) ** 2
+        Iy = Iy + h * b ** 3 / 12.0 + a * (x_c - x_bar) ** 2
+        ust = y_c + h / 2.0 if ust is None else np.maximum(ust, y_c + h / 2.0)
+        alt = y_c - h / 2.0 if alt is None else np.minimum(alt, y_c - h / 2.0)
+        sag = x_c + b / 2.0 if sag is None else np.maximum(sag, x_c + b / 2.0)
+        sol = x_c - b / 2.0 if sol is None else np.minimum(sol, x_c - b / 2.0)
+
+    c_x = np.maximum(ust - y_bar, y_bar - alt)
+    c_y = np.maximum(sag - x_bar, x_bar - sol)
+    return {"A": A, "x_bar": x_bar, "y_bar": y_bar, "Ix": Ix, "Iy": Iy,
+            "Wx": Ix / c_x, "Wy": Iy / c_y}
+
+
+# ---------------------------------------------------------
+# TOPOLOJILER
+# ---------------------------------------------------------
+# Her fonksiyon (H, t_f, t_w, b_f) -> (levhalar, gecerli maske, h_w).
+# H toplam yükseklik, b_f toplam flanş genişliğidir.
+def _levhalar_I(H, t_f, t_w, b_f):
+    h_w = H - 2.0 * t_f
+    levhalar = [(b_f, t_f, 0.0, t_f / 2.0),
+                (b_f, t_f, 0.0, H - t_f / 2.0),
+                (t_w, h_w, 0.0, H / 2.0)]
+    return levhalar, (h_w > 0) & (b_f > t_w), h_w
+
+
+def _levhalar_kutu(H, t_f, t_w, b_f):
+    h_w = H - 2.0 * t_f
+    x_w = b_f / 2.0 - t_w / 2.0
+    levhalar = [(b_f, t_f, 0.0, t_f / 2.0),
+                (b_f, t_f, 0.0, H - t_f / 2.0),
+                (t_w, h_w, -x_w, H / 2.0),
+                (t_w, h_w, x_w, H / 2.0)]
+    return levhalar, (h_w > 0) & (b_f > 2.0 * t_w), h_w
+
+
+def _levhalar_U(H, t_f, t_w, b_f):
+    # Gövde tam yükseklikte; flanşlar gövdenin bir yanına b_f - t_w çıkıntı yapar
+    h_w = H
+    b_c = b_f - t_w
+    levhalar = [(t_w, H, t_w / 2.0, H / 2.0),
+                (b_c, t_f, t_w + b_c / 2.0, t_f / 2.0),
+                (b_c, t_f, t_w + b_c / 2.0, H - t_f / 2.0)]
+    return levhalar, (H > 2.0 * t_f) & (b_c > 0), h_w
+
+
+def _levhalar_T(H, t_f, t_w, b_f):
+    h_w = H - t_f
+    levhalar = [(b_f, t_f, 0.0, h_w + t_f / 2.0),
+                (t_w, h_w, 0.0, h_w / 2.0)]
+    return levhalar, (h_w > 0) & (b_f >= t_w), h_w
+
+
+TOPOLOJILER = {
+    "I": _levhalar_I,
+    "Kutu": _levhalar_kutu,
+    "U": _levhalar_U,
+    "T": _levhalar_T,
+}
+
+
+def kaynakli_kesit(topoloji, H, t_f, t_w, b_f):
+    """Topolojinin kesit özellikleri (girdiler yayınlanır) + gecerli, h_w."""
+    levhalar, gecerli, h_w = TOPOLOJILER[topoloji](H, t_f, t_w, b_f)
+    k = levha_kesiti(levhalar)
+    k["gecerli"] = gecerli
+    k["h_w"] = h_w
+    return k
+
+
+# ---------------------------------------------------------
+# MUADIL ARAMASI
+# ---------------------------------------------------------
+def kaynakli_bloklari(topoloji, Wx_target, Wy_target, H, t_list, b_list, tolerans=0.10):
+    """(t_f, t_w, b_f) ızgarasını t_f başına blok olarak değerlendirir (üreteç).
+
+    Wx veya Wy'si hedefin ±tolerans bandında kalan geçerli adaylar dizi
+    sözlüğü olarak üretilir; "sira" ızgaradaki döngü sırasıdır.
+    """
+    t_f = np.asarray(t_list, dtype=np.float64)
+    t_w = np.asarray(t_list, dtype=np.float64)
+    b_f = np.asarray(b_list, dtype=np.float64)
+    if t_f.size == 0 or b_f.size == 0:
+        return
+    TW, BF = np.meshgrid(t_w, b_f, indexing="ij")
+    TW, BF = TW.ravel(), BF.ravel()
+    for i, t in enumerate(t_f.tolist()):
+        TF = np.full(TW.shape, t)
+        k = kaynakli_kesit(topoloji, H, TF, TW, BF)
+        Wx, Wy = k["Wx"], k["Wy"]
+
+        dWx = np.abs(Wx - Wx_target)
+        dWy = np.abs(Wy - Wy_target)
+        bant = np.zeros(Wx.shape, dtype=bool)
+        if Wx_target > 0:
+            bant |= dWx <= tolerans * Wx_target
+        if Wy_target > 0:
+            bant |= dWy <= tolerans * Wy_target
+        maske = k["gecerli"] & bant
+
+        yield {
+            "t_f": TF[maske],
+            "t_w": TW[maske],
+            "b_f": BF[maske],
+            "h_w": np.broadcast_to(k["h_w"], TW.shape)[maske],
+            "A": k["A"][maske],
+            "Wx": Wx[maske],
+            "Wy": Wy[maske],
+            "dWx": dWx[maske],
+            "dWy": dWy[maske],
+            "skor": dWx[maske] + dWy[maske],
+            "sira": i * TW.size + np.flatnonzero(maske),
+        }
+
+
+def kaynakli_ara(topoloji, Wx_target, Wy_target, H, t_list, b_list, tolerans=0.10,
+                 top_k=None, offset=0):
+    """tprofil.t_profil_ara'nın topolojiden bağımsız karşılığı.
+
+    Dönen dizi sözlüğü: t_f, t_w, b_f, h_w, A, Wx, Wy, dWx, dWy, skor
+    (skora, eşitlikte ızgara sırasına göre); "eslesen" ve
+    "degerlendirilen" aday sayılarıdır. top_k verilirse yalnızca
+    offset + top_k adaylık tampon tutulur.
+    """
+    sonuc, eslesen = en_iyiler(kaynakli_bloklari(topoloji, Wx_target, Wy_target, H, t_list,
+                                                 b_list, tolerans), top_k, offset)
+    if sonuc is None:
+        bos = np.empty(0)
+        sonuc = {k: bos for k in ("t_f", "t_w", "b_f", "h_w", "A", "Wx", "Wy", "dWx", "dWy",
+                                  "skor")}
+    sonuc["eslesen"] = eslesen
+    sonuc["degerlendirilen"] = len(t_list) * len(t_list) * len(b_list)
+    return sonuc
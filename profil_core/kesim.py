@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""Kesim planı: istenen boyları stok çubuklara yerleştirme (cutting stock).
+
+Testere payı (kerf) her kesimde kaybolur. Bir çubuğa konan her parça
+boy + kerf yer kaplar ve çubuğun kapasitesi stok + kerf alınır; böylece
+çubuğun sonuna tam oturan parçanın kesimi gerekmez.
+
+Büyük listeler için First-Fit Decreasing (ilk uyan, azalan sırada)
+kullanılır; ilk uyan çubuk bir maksimum segment ağacıyla O(log n)'de
+bulunur. Küçük listelerde, FFD alt sınıra ulaşmadıysa derinlik öncelikli
+kesin arama süre sınırı içinde daha az çubuklu yerleşim arar; süre
+dolarsa bulunan en iyi plan döner.
+"""
+import math
+import time
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+from profil_core.kesit import agirlik_hesap
+
+_EPS = 1e-9
+
+
+# ---------------------------------------------------------
+# GIRDI
+# ---------------------------------------------------------
+def kesim_listesi_coz(metin):
+    """"6000", "2450 x 4" veya "2450*4" satırlarından boy listesi (mm).
+
+    Ondalık ayırıcı nokta veya virgül olabilir; boş satırlar ve # ile
+    başlayan açıklamalar atlanır.
+    """
+    boylar = []
+    for no, satir in enumerate(metin.splitlines(), 1):
+        satir = satir.split("#", 1)[0].strip().lower()
+        if not satir:
+            continue
+        for ayirici in ("x", "*", ";"):
+            if ayirici in satir:
+                boy, adet = satir.split(ayirici, 1)
+                break
+        else:
+            boy, adet = satir, "1"
+        try:
+            boy = float(boy.strip().replace(",", "."))
+            adet = int(adet.strip())
+        except ValueError:
+            raise ValueError("Kesim listesi {}. satır okunamadı: {!r}".format(no, satir))
+        if boy <= 0 or adet <= 0:
+            raise ValueError("Kesim listesi {}. satır: boy ve adet pozitif olmalı".format(no))
+        boylar.extend([boy] * adet)
+    return boylar
+
+
+# ---------------------------------------------------------
+# FIRST-FIT DECREASING
+# ---------------------------------------------------------
+def _ffd(boylar, kapasite):
+    """Azalan sıradaki boylar için çubuk numaraları (ilk uyan çubuk).
+
+    Açılmamış çubuklar da tam kapasiteyle ağaçtadır; en soldaki uygun
+    yaprak ya açık bir çubuk ya da sıradaki yeni çubuktur.
+    """
+    n = 1
+    while n < len(boylar):
+        n *= 2
+    agac = [kapasite] * (2 * n)
+    atama = []
+    for w in boylar:
+        d = 1
+        while d < n:
+            d = 2 * d if agac[2 * d] >= w - _EPS else 2 * d + 1
+        atama.append(d - n)
+        agac[d] -= w
+        d //= 2
+        while d:
+            agac[d] = max(agac[2 * d], agac[2 * d + 1])
+            d //= 2
+    return atama
+
+
+def _alt_sinir(boylar, kapasite):
+    """Martello–Toth L2 alt sınırı (en az ⌈Σw / C⌉).
+
+    Her a ≤ C/2 eşiği için C - a'dan büyük parçalar tek başına, C/2'den
+    büyükler ayrı çubuklarda kalır; C/2 ile a arasındaki parçalar ancak
+    bu çubukların boşluğuna ya da yeni çubuklara sığar. Boylar bir kez
+    sıralanır; her eşiğin sayı ve toplamları önek toplamlarından bisect
+    ile alınır (O(n log n)).
+    """
+    C = kapasite
+    w = sorted(boylar)
+    P = [0.0] + list(accumulate(w))
+    n = len(w)
+    alt = math.ceil(P[n] / C - _EPS)
+    yari = bisect_right(w, C / 2.0 + _EPS)
+    onceki = None
+    for i in range(yari):
+        a = w[i]
+        if a == onceki:
+            continue
+        onceki = a
+        tek = bisect_right(w, C - a + _EPS)
+        n1 = n - tek
+        n2 = max(0, tek - yari)
+        t2 = P[tek] - P[yari] if tek > yari else 0.0
+        t3 = P[min(yari, tek)] - P[bisect_left(w, a - _EPS, 0, yari)]
+        artan = t3 - (n2 * C - t2)
+        alt = max(alt, n1 + n2 + max(0, math.ceil(artan / C - _EPS)))
+    return alt
+
+
+# ---------------------------------------------------------
+# KESIN ARAMA (SURE SINIRLI)
+# ---------------------------------------------------------
+class _SureDoldu(Exception):
+    pass
+
+
+def _sigar_mi(boylar, kapasite, m, bitis):
+    """Boylar (azalan) m çubuğa sığıyorsa çubuk numaraları, yoksa None.
+
+    Çubuk çubuk doldurulur (bin completion): her çubuğa kalan en uzun
+    parça konur ve çubuk, eşit boylar tek tip sayılarak, artık hiçbir
+    parça sığmayacak biçimde tamamlanır. Çubuklarda kalan boşlukların
+    toplamı m·C - Σw payını aşan dallar kesilir; sıkı listelerde arama
+    bu sayede küçük kalır.
+    """
+    tipler = sorted(set(boylar), reverse=True)
+    adet = [0] * len(tipler)
+    sira = {t: i for i, t in enumerate(tipler)}
+    for w in boylar:
+        adet[sira[w]] += 1
+    pay = [m * kapasite - sum(boylar)]
+    if pay[0] < -_EPS:
+        return None
+    cubuklar = []
+    icerik = []
+    dugum = [0]
+
+    def en_kisa():
+        for i in range(len(tipler) - 1, -1, -1):
+            if adet[i]:
+                return tipler[i]
+        return None
+
+    def yeni_cubuk(acik):
+        i0 = next((i for i, a in enumerate(adet) if a), None)
+        if i0 is None:
+            return True
+        if acik == 0:
+            return False
+        ilk = len(icerik)
+        adet[i0] -= 1
+        icerik.append(i0)
+        bulundu = tamamla(i0, kapasite - tipler[i0], acik, ilk)
+        icerik.pop()
+        adet[i0] += 1
+        return bulundu
+
+    def tamamla(bas, bos, acik, ilk):
+        dugum[0] += 1
+        if dugum[0] % 4096 == 0 and time.perf_counter() > bitis:
+            raise _SureDoldu
+        for j in range(bas, len(tipler)):
+            if adet[j] and tipler[j] <= bos + _EPS:
+                adet[j] -= 1
+                icerik.append(j)
+                bulundu = tamamla(j, bos - tipler[j], acik, ilk)
+                icerik.pop()
+                adet[j] += 1
+                if bulundu:
+                    return True
+        # Kapatma: çubuk dolu sayılır (hiçbir parça sığmaz) ve boşluk paya sığar
+        kisa = en_kisa()
+        if bos > pay[0] + _EPS or (kisa is not None and kisa <= bos + _EPS):
+            return False
+        pay[0] -= bos
+        cubuklar.append(icerik[ilk:])
+        if yeni_cubuk(acik - 1):
+            return True
+        cubuklar.pop()
+        pay[0] += bos
+        return False
+
+    if not yeni_cubuk(m):
+        return None
+    indeksler = [[] for _ in tipler]
+    for i in range(len(boylar) - 1, -1, -1):
+        indeksler[sira[boylar[i]]].append(i)
+    atama = [0] * len(boylar)
+    for j, cubuk in enumerate(cubuklar):
+        for t in cubuk:
+            atama[indeksler[t].pop()] = j
+    return atama
+
+
+# ---------------------------------------------------------
+# PLAN
+# ---------------------------------------------------------
+def _yerlesim(boylar, kapasite, kesin_esik, bitis):
+    """(çubuk numaraları, çubuk sayısı, alt sınır, optimal mi, yöntem)."""
+    atama = _ffd(boylar, kapasite)
+    m = max(atama) + 1 if atama else 0
+    alt = _alt_sinir(boylar, kapasite) if boylar else 0
+    if m <= alt:
+        return atama, m, alt, True, "ffd"
+    if len(boylar) > kesin_esik:
+        return atama, m, alt, False, "ffd"
+    try:
+        for hedef in range(alt, m):
+            bulunan = _sigar_mi(boylar, kapasite, hedef, bitis)
+            if bulunan is not None:
+                return bulunan, hedef, alt, True, "kesin"
+            # hedef çubuğa sığmıyorsa alt sınır bir artar
+            alt = hedef + 1
+    except _SureDoldu:
+        return atama, m, alt, False, "ffd"
+    return atama, m, alt, True, "kesin"
+
+
+def _cubuk(stok, parcalar, kerf):
+    toplam = sum(parcalar)
+    r = stok - toplam - (len(parcalar) - 1) * kerf
+    # Kalan kerf'ten kısaysa son parçayı kesmeye gerek yok; o kısım talaş olur
+    kalan = r - kerf if r > kerf + _EPS else 0.0
+    return {"stok_mm": stok, "parcalar": parcalar, "parca_sayisi": len(parcalar),
+            "kullanilan_mm": stok - kalan, "kalan_mm": kalan}
+
+
+def kesim_plani(boylar, stok_boylari=(6000.0, 12000.0), kerf=3.0, A_m2=None, rho=None,
+                sure_siniri=0.5, kesin_esik=120):
+    """boylar (mm) listesini stok çubuklara yerleştirir.
+
+    Her stok boyu için çubuk sayısı en aza indirilir (FFD, gerekirse süre
+    sınırlı kesin arama); ardından her çubuk içeriğinin sığdığı en kısa
+    stok boyuna indirilir. Satın alınan toplam boyu en küçük olan aday
+    seçilir. A_m2 ve rho verilirse ağırlıklar agirlik_hesap ile eklenir.
+
+    Dönen sözlük: cubuklar (stok_mm, parcalar, kullanilan_mm, kalan_mm),
+    stok_adetleri, cubuk_sayisi, satin_alinan_mm, gereken_mm, fire_mm,
+    fire_orani, alt_sinir (seçilen stok boyunda çubuk sayısı), optimal,
+    yontem.
+    """
+    stoklar = sorted({float(s) for s in stok_boylari})
+    if not stoklar or stoklar[0] <= 0:
+        raise ValueError("En az bir pozitif stok boyu gerekli")
+    if kerf < 0:
+        raise ValueError("Kerf negatif olamaz")
+    boylar = sorted((float(b) for b in boylar), reverse=True)
+    if boylar and boylar[-1] <= 0:
+        raise ValueError("Kesim boyları pozitif olmalı")
+    if boylar and boylar[0] > stoklar[-1] + _EPS:
+        raise ValueError("{:g} mm parça en uzun stok boyundan ({:g} mm) uzun".format(
+            boylar[0], stoklar[-1]))
+
+    bitis = time.perf_counter() + sure_siniri
+    w = [b + kerf for b in boylar]
+    en_iyi = None
+    for stok in stoklar:
+        if boylar and boylar[0] > stok + _EPS:
+            continue
+        atama, m, alt, optimal, yontem = _yerlesim(w, stok + kerf, kesin_esik, bitis)
+        gruplar = [[] for _ in range(m)]
+        for b, j in zip(boylar, atama):
+            gruplar[j].append(b)
+        cubuklar = []
+        for parcalar in gruplar:
+            dolu = sum(parcalar) + (len(parcalar) - 1) * kerf
+            kisa = next(s for s in stoklar if s >= dolu - _EPS)
+            cubuklar.append(_cubuk(kisa, parcalar, kerf))
+        satin = sum(c["stok_mm"] for c in cubuklar)
+        aday = (satin, m, -stok)
+        if en_iyi is None or aday < en_iyi[0]:
+            en_iyi = (aday, cubuklar, alt, optimal, yontem)
+
+    _, cubuklar, alt, optimal, yontem = en_iyi
+    cubuklar.sort(key=lambda c: (-c["stok_mm"], c["kalan_mm"]))
+    stok_adetleri = {}
+    for c in cubuklar:
+        stok_adetleri[c["stok_mm"]] = stok_adetleri.get(c["stok_mm"], 0) + 1
+    satin = sum(c["stok_mm"] for c in cubuklar)
+    gereken = sum(boylar)
+    plan = {
+        "cubuklar": cubuklar,
+        "stok_adetleri": stok_adetleri,
+        "cubuk_sayisi": len(cubuklar),
+        "satin_alinan_mm": satin,
+        "gereken_mm": gereken,
+        "fire_mm": satin - gereken,
+        "fire_orani": (satin - gereken) / satin if satin else 0.0,
+        "alt_sinir": alt,
+        "optimal": optimal,
+        "yontem": yontem,
+    }
+    if A_m2 is not None and rho is not None:
+        plan["satin_alinan_kg"] = agirlik_hesap(A_m2, satin / 1000.0, rho)
+        plan["gereken_kg"] = agirlik_hesap(A_m2, gereken / 1000.0, rho)
+        plan["fire_kg"] = agirlik_hesap(A_m2, (satin - gereken) / 1000.0, rho)
+    return plan
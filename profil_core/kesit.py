@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+import math
+
+
+# ---------------------------------------------------------
+# AGIRLIK HESABI
+# ---------------------------------------------------------
+MALZEMELER = {"Çelik": 7.85, "Paslanmaz Çelik": 7.90, "Alüminyum": 2.70}
+
+
+def agirlik_hesap(A_m2, L_m, rho_g_cm3):
+    hacim_m3 = A_m2 * L_m
+    return hacim_m3 * rho_g_cm3 * 1000.0
+
+
+# ---------------------------------------------------------
+# KESIT ALANLARI (m²)
+# ---------------------------------------------------------
+def alan_boru(row):
+    OD_m = row["OD"] / 1000.0
+    t_m = row["t"] / 1000.0
+    ID_m = OD_m - 2 * t_m
+    return (math.pi / 4.0) * (OD_m ** 2 - ID_m ** 2)
+
+
+def alan_rhs(row):
+    A_m = row["A"] / 1000.0
+    B_m = row["B"] / 1000.0
+    t_m = row["t"] / 1000.0
+    return A_m * B_m - (A_m - 2 * t_m) * (B_m - 2 * t_m)
+
+
+def alan_L(row):
+    a_m = row["a"] / 1000.0
+    b_m = row["b"] / 1000.0
+    t_m = row["t"] / 1000.0
+    return (a_m * t_m) + (b_m * t_m) - (t_m * t_m)
+
+
+def alan_I(row):
+    """IPE / HEA / HEB / UPN: iki flanş + gövde (yaklaşık)."""
+    h = row["h"] / 1000.0
+    b = row["b"] / 1000.0
+    tw = row["tw"] / 1000.0
+    tf = row["tf"] / 1000.0
+    return 2 * (b * tf) + (h - 2 * tf) * tw
+
+
+def alan_round(row):
+    d_m = row["d"] / 1000.0
+    return math.pi * (d_m / 2.0) ** 2
+
+
+def alan_square(row):
+    a_m = row["a"] / 1000.0
+    return a_m * a_m
+
+
+def alan_bulb(row):
+    B_m = row["B"] / 1000.0
+    t_m = row["t"] / 1000.0
+    return B_m * t_m * 1.2  # yaklasik
+
+
+def alan_lama(row):
+    return (row["h"] / 1000.0) * (row["t"] / 1000.0)
+
+
+# ---------------------------------------------------------
+# WX – WY HESAPLARI
+# ---------------------------------------------------------
+def wx_wy_boru(row):
+    OD = row.get("OD")
+    t = row.get("t")
+    if not OD or not t:
+        return None, None
+    OD_m = OD / 1000.0
+    t_m = t / 1000.0
+    ID_m = OD_m - 2 * t_m
+    if ID_m <= 0:
+        return None, None
+    Ix_m4 = (math.pi / 64.0) * (OD_m ** 4 - ID_m ** 4)
+    Wx_m3 = Ix_m4 / (OD_m / 2.0)
+    Wx_mm3 = Wx_m3 * 1e9
+    return Wx_mm3, Wx_mm3
+
+
+def wx_wy_rhs(row):
+    A = row.get("A")
+    B = row.get("B")
+    t = row.get("t")
+    if not A or not B or not t:
+        return None, None
+    h = A / 1000.0
+    b = B / 1000.0
+    t_m = t / 1000.0
+    if h <= 2 * t_m or b <= 2 * t_m:
+        return None, None
+    Ix = (b * h ** 3 - (b - 2 * t_m) * (h - 2 * t_m) ** 3) / 12.0
+    Iy = (h * b ** 3 - (h - 2 * t_m) * (b - 2 * t_m) ** 3) / 12.0
+    Wx = Ix / (h / 2.0)
+    Wy = Iy / (b / 2.0)
+    return Wx * 1e9, Wy * 1e9
+
+
+def wx_wy_rect(h_mm, b_mm):
+    if h_mm is None or b_mm is None:
+        return None, None
+    h = h_mm / 1000.0
+    b = b_mm / 1000.0
+    Ix = b * h ** 3 / 12.0
+    Iy = h * b ** 3 / 12.0
+    Wx = Ix / (h / 2.0)
+    Wy = Iy / (b / 2.0)
+    return Wx * 1e9, Wy * 1e9
+
+
+def wx_wy_ipe(row):
+    return wx_wy_rect(row.get("h"), row.get("b"))
+
+
+def wx_wy_hea(row):
+    return wx_wy_rect(row.get("h"), row.get("b"))
+
+
+def wx_wy_heb(row):
+    return wx_wy_rect(row.get("h"), row.get("b"))
+
+
+def wx_wy_upn(row):
+    return wx_wy_rect(row.get("h"), row.get("b"))
+
+
+def wx_wy_L(row):
+    a = row.get("a")
+    b = row.get("b")
+    t = row.get("t")
+    if not a or not b or not t:
+        return None, None
+    a_m = a / 1000.0
+    b_m = b / 1000.0
+    t_m = t / 1000.0
+    Ix = (b_m * a_m ** 3 - (b_m - t_m) * (a_m - t_m) ** 3) / 12.0
+    Iy = (a_m * b_m ** 3 - (a_m - t_m) * (b_m - t_m) ** 3) / 12.0
+    Wx = Ix / (a_m / 2.0)
+    Wy = Iy / (b_m / 2.0)
+    return Wx * 1e9, Wy * 1e9
+
+
+def wx_wy_round(row):
+    d = row.get("d")
+    if not d:
+        return None, None
+    d_m = d / 1000.0
+    Ix = math.pi * d_m ** 4 / 64.0
+    Wx = Ix / (d_m / 2.0)
+    Wx_mm3 = Wx * 1e9
+    return Wx_mm3, Wx_mm3
+
+
+def wx_wy_square(row):
+    a = row.get("a")
+    if not a:
+        return None, None
+    a_m = a / 1000.0
+    Ix = a_m ** 4 / 12.0
+    Wx = Ix / (a_m / 2.0)
+    Wx_mm3 = Wx * 1e9
+    return Wx_mm3, Wx_mm3
+
+
+def wx_wy_bulb(row):
+    B = row.get("B")
+    t = row.get("t")
+    if not B or not t:
+        return None, None
+    return wx_wy_rect(t, B)
+
+
+def wx_wy_flatbar(b_mm, h_mm):
+    """Dikdörtgen lama için Wx, Wy (mm³). b=kalınlık, h=yükseklik."""
+    b = b_mm / 1000.0
+    h = h_mm / 1000.0
+    Ix = b * h ** 3 / 12.0
+    Iy = h * b ** 3 / 12.0
+    Wx = Ix / (h / 2.0)
+    Wy = Iy / (b / 2.0)
+    return Wx * 1e9, Wy * 1e9
+
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Az boyutlu noktalar için NumPy tabanlı k-d ağacı (k en yakın komşu).
+
+Ağaç bir kez kurulur: noktalar yaprak başına en fazla `yaprak` nokta
+kalana kadar en geniş eksende ortancadan bölünür. Sorguda eksen
+ağırlıklı Öklid mesafesi kullanılır; ağırlıklar kurulumdan bağımsızdır.
+"""
+import heapq
+
+import numpy as np
+
+
+class KDAgaci:
+    def __init__(self, noktalar, yaprak=32):
+        X = np.ascontiguousarray(noktalar, dtype=np.float64)
+        if X.ndim != 2:
+            raise ValueError("noktalar (n, boyut) biçiminde olmalı")
+        self.boyut = X.shape[1]
+        self.n = X.shape[0]
+
+        # Düğüm dizileri; yapraklarda eksen = -1, [bas, son) sira[] aralığı
+        eksen, esik, sol, sag, bas, son = [], [], [], [], [], []
+        sira = np.arange(self.n)
+        yigin = [(0, self.n, None, False)]
+        while yigin:
+            b, s, ebeveyn, sag_mi = yigin.pop()
+            d = len(eksen)
+            if ebeveyn is not None:
+                (sag if sag_mi else sol)[ebeveyn] = d
+            eksen.append(-1)
+            esik.append(0.0)
+            sol.append(-1)
+            sag.append(-1)
+            bas.append(b)
+            son.append(s)
+            if s - b <= yaprak:
+                continue
+            parca = X[sira[b:s]]
+            ax = int(np.argmax(parca.max(axis=0) - parca.min(axis=0)))
+            m = (s - b) // 2
+            bolum = np.argpartition(parca[:, ax], m)
+            sira[b:s] = sira[b:s][bolum]
+            eksen[d] = ax
+            esik[d] = X[sira[b + m], ax]
+            yigin.append((b + m, s, d, True))
+            yigin.append((b, b + m, d, False))
+
+        self._X = X[sira]
+        self._sira = sira
+        self._eksen = eksen
+        self._esik = esik
+        self._sol = sol
+        self._sag = sag
+        self._bas = bas
+        self._son = son
+
+    def sorgula(self, nokta, k, agirliklar=None):
+        """nokta'ya en yakın k noktanın (mesafe, satır no) dizileri.
+
+        Mesafe = sqrt(Σ (w_i · Δ_i)²); eşit mesafede küçük satır no önce gelir.
+        """
+        q = np.asarray(nokta, dtype=np.float64)
+        w = np.ones(self.boyut) if agirliklar is None else np.asarray(agirliklar, dtype=np.float64)
+        k = min(int(k), self.n)
+        if k <= 0:
+            return np.empty(0), np.empty(0, dtype=np.intp)
+
+        X, sira = self._X, self._sira
+        eksen, esik, sol, sag = self._eksen, self._esik, self._sol, self._sag
+        bas, son = self._bas, self._son
+        qx, w2 = q.tolist(), (w * w).tolist()
+
+        # En iyi k aday: (-d², -satır) en büyük yığın; kök en kötü aday
+        enler = []
+        # (düğüm, düzleme olan ağırlıklı mesafe²) ile derinlik öncelikli arama
+        bekleyen = [(0.0, 0)]
+        while bekleyen:
+            alt, d = bekleyen.pop()
+            if len(enler) == k and alt > -enler[0][0]:
+                continue
+            ax = eksen[d]
+            if ax < 0:
+                b, s = bas[d], son[d]
+                d2 = (((X[b:s] - q) ** 2) * w2).sum(axis=1)
+                ids = sira[b:s]
+                if len(enler) == k:
+                    yakinlar = d2 <= -enler[0][0]
+                    d2, ids = d2[yakinlar], ids[yakinlar]
+                for m2, i in zip(d2.tolist(), ids.tolist()):
+                    aday = (-m2, -i)
+                    if len(enler) < k:
+                        heapq.heappush(enler, aday)
+                    elif aday > enler[0]:
+                        heapq.heapreplace(enler, aday)
+                continue
+            fark = qx[ax] - esik[d]
+            yakin, uzak = (sol[d], sag[d]) if fark < 0 else (sag[d], sol[d])
+            bekleyen.append((max(alt, fark * fark * w2[ax]), uzak))
+            bekleyen.append((alt, yakin))
+
+        enler.sort(reverse=True)
+        mesafe = np.sqrt(np.asarray([-m2 for m2, _ in enler]))
+        ids = np.asarray([-i for _, i in enler], dtype=np.intp)
+        return mesafe, ids
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""Derlenmiş, sütunsal katalog önbelleği.
+
+Her aile tables/<aile>.py kaynağından bir kez derlenir ve sütun başına
+bir .npy dosyası olarak (boyutlar + aileler.kesit_ozellikleri: A, Ix,
+Iy, Wx, Wy, kg/m, H_max, t_min, t_max) yazılır. Açılışta dosyalar
+bellek eşlemeli (mmap) okunur; aynı makinedeki tüm Streamlit işçileri
+işletim sisteminin sayfa önbelleğindeki tek kopyayı paylaşır. Kaynak
+tablo, kesit formülleri veya aile kaydı değişince önbellek dizini de
+değişir ve aile yeniden derlenir.
+
+    python -m profil_core.kolonsal          # tüm aileleri derle
+"""
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+
+from profil_core import aileler, kesit
+from profil_core.aileler import AILELER, KATALOG_AILELERI, kesit_ozellikleri
+from profil_core.ice_aktar import SEMALAR, TABLES_DIR
+from profil_core.tablolar import izlenen_imza, kaynak_yolu, tablo
+
+# Dosya biçimi değişince artırılır; eski önbellekler kendiliğinden geçersiz olur
+BICIM_SURUMU = 2
+
+CACHE_DIR = os.environ.get(
+    "PROFIL_KATALOG_CACHE",
+    os.path.join(os.path.dirname(TABLES_DIR), ".katalog_cache"))
+
+_METIN_ALANLARI = ("profil", "SCH")
+
+# aileler.kesit_ozellikleri'nden yazılan sütunlar
+_TURETILMIS = ("etiket", "A_m2", "A_mm2", "Ix_mm4", "Iy_mm4", "Wx_mm3", "Wy_mm3", "kg_m",
+               "H_max", "t_min", "t_max")
+
+
+# ---------------------------------------------------------
+# DERLEME
+# ---------------------------------------------------------
+def parmak_izi(aile):
+    """Kaynak tablo + kesit formülleri + aile kaydı + biçim sürümünden önbellek anahtarı.
+
+    Kaynağın izlenen imzası (tablolar.izlenen_imza) kullanılır: tablo
+    bellekteyse okunduğu andaki, değilse ailenin ilk kullanıldığı andaki
+    imza. Dosya sonradan değişse de anahtar derlenen satırlarla eşleşir;
+    değişikliği izleyici görür ve aileyi yeniden yükler.
+    """
+    h = hashlib.sha1(str(BICIM_SURUMU).encode())
+    yollar = (kaynak_yolu(aile), kesit.__file__, aileler.__file__)
+    for yol, imza in zip(yollar, (izlenen_imza(aile), None, None)):
+        if imza is None:
+            st = os.stat(yol)
+            imza = st.st_size, st.st_mtime_ns
+        h.update("{}:{}:{};".format(yol, *imza).encode())
+    return h.hexdigest()[:16]
+
+
+def aile_derle(aile, satirlar=None):
+    """Bir ailenin sütunlarını (NumPy dizileri) hesaplar."""
+    if satirlar is None:
+        satirlar = tablo(aile)
+
+    sutunlar = {a: [] for a in SEMALAR[aile]["alanlar"]}
+    turetilmis = {k: [] for k in _TURETILMIS}
+    for r in satirlar:
+        for a in sutunlar:
+            sutunlar[a].append(r[a])
+        o = kesit_ozellikleri(aile, r)
+        for k in _TURETILMIS:
+            turetilmis[k].append(np.nan if o[k] is None else o[k])
+
+    diziler = {}
+    for ad, degerler in list(sutunlar.items()) + list(turetilmis.items()):
+        if ad in _METIN_ALANLARI or ad == "etiket":
+            diziler[ad] = np.asarray([str(d) for d in degerler], dtype=str)
+        else:
+            diziler[ad] = np.asarray(degerler, dtype=np.float64)
+    return diziler
+
+
+# ---------------------------------------------------------
+# ONBELLEK YAZMA / OKUMA
+# ---------------------------------------------------------
+def _aile_dizini(aile):
+    return os.path.join(CACHE_DIR, "v{}".format(BICIM_SURUMU), aile)
+
+
+def aile_yaz(aile):
+    """Aileyi derleyip önbelleğe yazar; yazılan dizini döndürür."""
+    hedef = os.path.join(_aile_dizini(aile), parmak_izi(aile))
+    os.makedirs(os.path.dirname(hedef), exist_ok=True)
+    gecici = tempfile.mkdtemp(dir=os.path.dirname(hedef))
+    try:
+        for ad, dizi in aile_derle(aile).items():
+            np.save(os.path.join(gecici, ad + ".npy"), dizi)
+        try:
+            os.rename(gecici, hedef)
+        except OSError:  # başka bir süreç aynı anda yazdı
+            shutil.rmtree(gecici, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(gecici, ignore_errors=True)
+        raise
+    # aynı ailenin eski sürümlerini temizle
+    for ad in os.listdir(_aile_dizini(aile)):
+        yol = os.path.join(_aile_dizini(aile), ad)
+        if yol != hedef and not ad.startswith("tmp"):
+            shutil.rmtree(yol, ignore_errors=True)
+    return hedef
+
+
+def aile_yukle(aile):
+    """Ailenin sütunlarını bellek eşlemeli açar; önbellek eskiyse yeniden derler."""
+    dizin = os.path.join(_aile_dizini(aile), parmak_izi(aile))
+    if not os.path.isdir(dizin):
+        dizin = aile_yaz(aile)
+    return {
+        ad[:-4]: np.load(os.path.join(dizin, ad), mmap_mode="r")
+        for ad in os.listdir(dizin) if ad.endswith(".npy")
+    }
+
+
+def katalog_yukle(aileler=None):
+    return {aile: aile_yukle(aile) for aile in (aileler or AILELER)}
+
+
+def aile_sutunlari(aile, derle=False):
+    """Ailenin katalog satırları sütun sütun (Profil, Tip, Wx_mm3, Wy_mm3;
+    build_all_profiles_wx_wy sırasıyla) ve aynı sırada kg/m dizisi.
+
+    derle=True ise önbellek yerine bellekteki tablodan hesaplanır.
+    """
+    d = aile_derle(aile) if derle else aile_yukle(aile)
+    Wx = np.asarray(d["Wx_mm3"])
+    gecerli = np.isfinite(Wx) & (Wx != 0)
+    sutunlar = {
+        "Profil": d["etiket"][gecerli],
+        "Tip": np.full(np.count_nonzero(gecerli), AILELER[aile]["kisa"]),
+        "Wx_mm3": Wx[gecerli],
+        "Wy_mm3": np.asarray(d["Wy_mm3"])[gecerli],
+    }
+    return sutunlar, np.asarray(d["kg_m"])[gecerli]
+
+
+def katalog_kutleleri(derle=False):
+    """build_all_profiles_wx_wy satırlarıyla aynı sırada kg/m (aileler.KG_M_MALZEME) dizisi.
+
+    derle=True ise önbellek yerine bellekteki tablolardan hesaplanır
+    (önbellek dizini yazılamadığında veya tablolar tablo_ayarla ile
+    değiştirildiğinde).
+    """
+    parcalar = []
+    for aile in KATALOG_AILELERI:
+        d = aile_derle(aile) if derle else aile_yukle(aile)
+        Wx = d["Wx_mm3"]
+        parcalar.append(np.asarray(d["kg_m"])[np.isfinite(Wx) & (Wx != 0)])
+    return np.concatenate(parcalar)
+
+
+def main(argv=None):
+    for aile in AILELER:
+        dizin = aile_yaz(aile)
+        n = len(np.load(os.path.join(dizin, "etiket.npy"), mmap_mode="r"))
+        print("{:10s} {:7d} satır -> {}".format(aile, n, dizin), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
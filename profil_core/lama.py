@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+import math
+from bisect import bisect_left, bisect_right
+
+from profil_core.kesit import wx_wy_flatbar
+from profil_core.tablolar import tablo
+
+# Varsayılan tarama: 2..100 mm tam sayı kalınlıklar
+LAMA_T_ADAYLARI = range(2, 101)
+
+# Kayan nokta farkları için aralık sınırlarında bırakılan pay (bağıl)
+_PAY = 1e-9
+
+
+# ---------------------------------------------------------
+# LAMA KALINLIK ARALIKLARI (KAPALI FORM)
+# ---------------------------------------------------------
+def lama_t_araliklari(Wx_target, Wy_target, h_mm, tolerans=0.02, t_min=None, t_max=None):
+    """Sabit h_mm yükseklikte Wx VEYA Wy'yi hedefin ±tolerans bandında
+    tutan kalınlık aralıkları [(t_alt, t_ust), ...] (mm, sıralı, birleşik).
+
+    Lama için Wx = t·h²/6 (t'de doğrusal), Wy = h·t²/6 (t'de karesel)
+    olduğundan bant sınırları doğrudan çözülür; tarama yapılmaz.
+    """
+    if Wx_target is None or Wy_target is None or h_mm is None:
+        return []
+    if Wx_target <= 0 or Wy_target <= 0 or h_mm <= 0:
+        return []
+
+    alt = max(0.0, 1.0 - tolerans)
+    ust = 1.0 + tolerans
+    araliklar = [
+        (6.0 * Wx_target * alt / h_mm ** 2, 6.0 * Wx_target * ust / h_mm ** 2),
+        (math.sqrt(6.0 * Wy_target * alt / h_mm), math.sqrt(6.0 * Wy_target * ust / h_mm)),
+    ]
+
+    sonuc = []
+    for a, b in sorted(araliklar):
+        if t_min is not None:
+            a = max(a, t_min)
+        if t_max is not None:
+            b = min(b, t_max)
+        if a > b:
+            continue
+        if sonuc and a <= sonuc[-1][1]:
+            sonuc[-1] = (sonuc[-1][0], max(sonuc[-1][1], b))
+        else:
+            sonuc.append((a, b))
+    return sonuc
+
+
+def lama_t_adaylari(araliklar, t_adaylari):
+    """Sıralı t_adaylari içinden araliklar'a düşenler (bisect ile)."""
+    secilen = set()
+    for a, b in araliklar:
+        i = bisect_left(t_adaylari, a * (1.0 - _PAY))
+        j = bisect_right(t_adaylari, b * (1.0 + _PAY))
+        secilen.update(t_adaylari[i:j])
+    return sorted(secilen)
+
+
+def lama_satiri(Wx_target, Wy_target, h_mm, t, tolerans=0.02, ad=None):
+    """h_mm x t lama için sonuç satırı; bant dışındaysa None."""
+    Wx_l, Wy_l = wx_wy_flatbar(t, h_mm)
+    dWx = abs(Wx_l - Wx_target)
+    dWy = abs(Wy_l - Wy_target)
+    if not (dWx <= tolerans * Wx_target or dWy <= tolerans * Wy_target):
+        return None
+    return {
+        "Lama": ad or "{} x {}".format(h_mm, t),
+        "h (mm)": h_mm,
+        "t (mm)": t,
+        "Wx_lama (mm³)": Wx_l,
+        "Wy_lama (mm³)": Wy_l,
+        "ΔWx": dWx,
+        "ΔWy": dWy,
+        "Toplam Skor": dWx + dWy
+    }
+
+
+# ---------------------------------------------------------
+# STOK LAMA LISTESINDE MUADIL (H VE T SERBEST)
+# ---------------------------------------------------------
+def _stok_grupla(lama_tablo):
+    gruplar = {}
+    adlar = {}
+    for r in lama_tablo:
+        gruplar.setdefault(r["h"], set()).add(r["t"])
+        adlar[(r["h"], r["t"])] = r.get("profil")
+    return sorted((h, sorted(ts)) for h, ts in gruplar.items()), adlar
+
+
+# (kaynak tablo, stok, adlar); tablo değişince yeniden gruplanır
+_STOK = None
+
+
+def lama_muadil_2d(Wx_target, Wy_target, lama_tablo=None, tolerans=0.02):
+    """Hem h hem t serbest: stok lama ölçüleri (tables/lama.py) içinden Wx VEYA Wy'si
+    ±tolerans bandında olanlar, skora göre sıralı.
+
+    Her yükseklik için kalınlık aralığı kapalı formdan bulunur, o
+    yüksekliğin stok kalınlıkları bisect ile seçilir.
+    """
+    global _STOK
+    if Wx_target is None or Wy_target is None:
+        return []
+    if lama_tablo is None:
+        satirlar = tablo("lama")
+        if _STOK is None or _STOK[0] is not satirlar:
+            _STOK = (satirlar,) + _stok_grupla(satirlar)
+        _, stok, adlar = _STOK
+    else:
+        stok, adlar = _stok_grupla(lama_tablo)
+
+    liste = []
+    for h, ts in stok:
+        araliklar = lama_t_araliklari(Wx_target, Wy_target, h, tolerans)
+        for t in lama_t_adaylari(araliklar, ts):
+            satir = lama_satiri(Wx_target, Wy_target, h, t, tolerans, adlar[(h, t)])
+            if satir:
+                liste.append(satir)
+
+    liste.sort(key=lambda x: x["Toplam Skor"])
+    return liste
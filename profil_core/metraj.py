@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""Toplu metraj: (aile, boyutlar, uzunluk, yoğunluk) dizilerinden alan ve kütle.
+
+kesit.alan_* fonksiyonları yalnızca aritmetik kullandığından satır
+sözlüğü yerine sütun dizileri sözlüğüyle de çalışır. Burada her aile
+kendi satırları için bir kez, NumPy dizileriyle çağrılır; arayüz, toplu
+hesap ve metraj aynı formülü paylaşır. Boyutu verilmeyen satırların
+alanı sütunsal katalogdan (aile, etiket) ile bulunur.
+
+    python -m profil_core.metraj metraj.csv
+"""
+import csv
+import sys
+
+import numpy as np
+
+from profil_core.aileler import AILELER
+from profil_core.ice_aktar import SEMALAR
+from profil_core.kesit import MALZEMELER, agirlik_hesap
+from profil_core.kolonsal import aile_yukle
+from profil_core.uye import TIP_AILELERI, profil_tipi_coz
+
+# Boyut olmayan şema alanları
+_ETIKET_ALANLARI = ("profil", "DN", "SCH")
+
+
+def aile_coz(ad):
+    """Aile anahtarı ("ipe"), profil tipi ya da kısa ad ("IPE") -> aile."""
+    if ad in AILELER:
+        return ad
+    if str(ad).strip().lower() in AILELER:
+        return str(ad).strip().lower()
+    return TIP_AILELERI[profil_tipi_coz(ad)]
+
+
+def boyut_alanlari(aile):
+    """Ailenin alan formülünün kullandığı boyutlar (mm)."""
+    return [a for a in SEMALAR[aile]["alanlar"] if a not in _ETIKET_ALANLARI]
+
+
+def _boyut_hatasi(aile, boyutlar):
+    """Adı olmayan satırlar için eksik boyut sütunlarını adlandıran hata."""
+    alanlar = boyut_alanlari(aile)
+    eksik = [x for x in alanlar if x not in boyutlar]
+    if eksik:
+        return ValueError("{} satırlarında profil adı yok; boyut sütunu eksik: {}".format(
+            aile, ", ".join(eksik)))
+    return ValueError("{} satırlarında boyutlar ({}) ya da profil adı gerekli".format(
+        aile, ", ".join(alanlar)))
+
+
+def _gruplar(degerler):
+    """Benzersiz değerler, satır başına grup numarası ve grupların satırları."""
+    benzersiz, ters = np.unique(degerler, return_inverse=True)
+    sira = np.argsort(ters, kind="stable")
+    sinir = np.searchsorted(ters[sira], np.arange(len(benzersiz) + 1))
+    return benzersiz, ters, [sira[sinir[i]:sinir[i + 1]] for i in range(len(benzersiz))]
+
+
+# ---------------------------------------------------------
+# ALAN
+# ---------------------------------------------------------
+def _katalog_alani(aile, etiketler):
+    d = aile_yukle(aile)
+    etiket = np.asarray(d["etiket"])
+    sira = np.argsort(etiket)
+    konum = np.minimum(np.searchsorted(etiket[sira], etiketler), len(sira) - 1)
+    bulundu = etiket[sira][konum] == etiketler
+    if not bulundu.all():
+        eksik = sorted(set(etiketler[~bulundu].tolist()))
+        raise ValueError("Katalogda bulunamadı ({}): {}".format(aile, ", ".join(eksik[:5])))
+    return np.asarray(d["A_m2"])[sira[konum]]
+
+
+def toplu_alan(aile, boyutlar=None, profil=None):
+    """(n,) aile adlarından kesit alanları (m²).
+
+    boyutlar: alan adı -> (n,) dizi (mm); satırın ailesinde kullanılmayan
+    alanlar yok sayılır. Boyutu eksik (NaN) satırlar, profil (n,) etiket
+    dizisi verilmişse katalogdan alınır.
+    """
+    aile = np.asarray(aile, dtype=str)
+    boyutlar = {ad: np.asarray(d, dtype=np.float64) for ad, d in (boyutlar or {}).items()}
+    profil = None if profil is None else np.asarray(profil, dtype=str)
+    A = np.full(aile.shape, np.nan)
+    benzersiz, _, gruplar = _gruplar(aile)
+    for ad, ids in zip(benzersiz.tolist(), gruplar):
+        a = aile_coz(ad)
+        alanlar = boyut_alanlari(a)
+        if all(x in boyutlar for x in alanlar):
+            A[ids] = AILELER[a]["alan"]({x: boyutlar[x][ids] for x in alanlar})
+        eksik = ids[np.isnan(A[ids])]
+        if eksik.size:
+            if profil is None or (profil[eksik] == "").any():
+                raise _boyut_hatasi(a, boyutlar)
+            A[eksik] = _katalog_alani(a, profil[eksik])
+    return A
+
+
+def _malzemeler(n, malzeme):
+    """Benzersiz malzeme adları, satır başına numaraları ve yoğunlukları."""
+    benzersiz, ters = np.unique(np.broadcast_to(np.asarray(malzeme, dtype=str), (n,)),
+                                return_inverse=True)
+    bilinmeyen = [m for m in benzersiz.tolist() if m not in MALZEMELER]
+    if bilinmeyen:
+        raise ValueError("Bilinmeyen malzeme: {}".format(", ".join(bilinmeyen)))
+    return benzersiz, ters, np.asarray([MALZEMELER[m] for m in benzersiz.tolist()])[ters]
+
+
+def _yogunluklar(n, yogunluk, malzeme):
+    if yogunluk is not None:
+        return np.broadcast_to(np.asarray(yogunluk, dtype=np.float64), (n,))
+    if malzeme is None:
+        return np.full(n, MALZEMELER["Çelik"])
+    return _malzemeler(n, malzeme)[2]
+
+
+def toplu_agirlik(aile, uzunluk_mm, yogunluk=None, malzeme=None, adet=1, boyutlar=None,
+                  profil=None):
+    """Satır başına A_m2, kg_m ve kg dizileri (tek vektörel geçiş).
+
+    yogunluk (g/cm³) verilmezse malzeme adlarından, o da yoksa çelik
+    alınır; uzunluk_mm ve adet satır başınadır (ya da skaler).
+    """
+    A = toplu_alan(aile, boyutlar, profil)
+    rho = _yogunluklar(A.size, yogunluk, malzeme)
+    L_m = np.asarray(uzunluk_mm, dtype=np.float64) / 1000.0 * np.asarray(adet, dtype=np.float64)
+    return {"A_m2": A, "kg_m": agirlik_hesap(A, 1.0, rho), "kg": agirlik_hesap(A, L_m, rho)}
+
+
+# ---------------------------------------------------------
+# GRUPLU TOPLAMLAR
+# ---------------------------------------------------------
+def gruplu_toplam(anahtar, **degerler):
+    """anahtar'ın her benzersiz değeri için satır sayısı ve degerler toplamı."""
+    return _toplamlar(*np.unique(anahtar, return_inverse=True), **degerler)
+
+
+def _toplamlar(benzersiz, ters, **degerler):
+    toplamlar = {ad: np.bincount(ters, weights=np.broadcast_to(d, ters.shape),
+                                 minlength=len(benzersiz))
+                 for ad, d in degerler.items()}
+    sayi = np.bincount(ters, minlength=len(benzersiz))
+    return [dict({"Anahtar": b, "Satır": int(n)},
+                 **{ad: float(t[i]) for ad, t in toplamlar.items()})
+            for i, (b, n) in enumerate(zip(benzersiz.tolist(), sayi.tolist()))]
+
+
+def _profil_etiketleri(aile, boyutlar, profil):
+    """Satır başına profil anahtarı; adı olmayan satırlar "<Tip> <boyutlar>" diye adlanır."""
+    n = len(aile)
+    boyutlar = boyutlar or {}
+    etiket = np.full(n, "") if profil is None else np.asarray(profil, dtype=str)
+    adsiz = etiket == ""
+    if not adsiz.any():
+        return etiket
+    benzersiz, _, gruplar = _gruplar(np.asarray(aile, dtype=str)[adsiz])
+    aileler = [aile_coz(ad) for ad in benzersiz.tolist()]
+    for a in aileler:
+        if any(x not in boyutlar for x in boyut_alanlari(a)):
+            raise _boyut_hatasi(a, boyutlar)
+    satirlar = np.flatnonzero(adsiz)
+    for a, ids in zip(aileler, gruplar):
+        ids = satirlar[ids]
+        B = np.column_stack([np.asarray(boyutlar[x], dtype=np.float64)[ids]
+                             for x in boyut_alanlari(a)])
+        tekil, ters = np.unique(B, axis=0, return_inverse=True)
+        adlar = np.asarray([AILELER[a]["kisa"] + " " + "x".join("{:g}".format(v) for v in satir)
+                            for satir in tekil.tolist()])
+        if adlar.itemsize > etiket.itemsize:
+            etiket = etiket.astype(adlar.dtype)
+        etiket[ids] = adlar[ters.ravel()]
+    return etiket
+
+
+def metraj(aile, uzunluk_mm, yogunluk=None, malzeme=None, adet=1, boyutlar=None, profil=None):
+    """toplu_agirlik + profil ve malzeme başına toplamlar.
+
+    Dönen sözlük: satır dizileri (A_m2, kg_m, kg), "profil_toplamlari"
+    ve "malzeme_toplamlari" (Anahtar, Satır, Uzunluk (m), Ağırlık (kg)).
+    """
+    n = np.asarray(aile).size
+    if yogunluk is None and malzeme is not None:
+        malzeme_gruplari = _malzemeler(n, malzeme)
+        yogunluk = malzeme_gruplari[2]
+    else:
+        malzeme_gruplari = None
+    sonuc = toplu_agirlik(aile, uzunluk_mm, yogunluk, None, adet, boyutlar, profil)
+    L_m = np.broadcast_to(np.asarray(uzunluk_mm, dtype=np.float64) / 1000.0
+                          * np.asarray(adet, dtype=np.float64), (n,))
+    toplamlar = {"Uzunluk (m)": L_m, "Ağırlık (kg)": sonuc["kg"]}
+    sonuc["profil_toplamlari"] = gruplu_toplam(
+        _profil_etiketleri(aile, boyutlar, profil), **toplamlar)
+    if malzeme_gruplari is not None:
+        sonuc["malzeme_toplamlari"] = _toplamlar(*malzeme_gruplari[:2], **toplamlar)
+    else:
+        # Malzeme adı yoksa yoğunluğa göre
+        sonuc["malzeme_toplamlari"] = gruplu_toplam(
+            _yogunluklar(n, yogunluk, None), **toplamlar)
+    return sonuc
+
+
+# ---------------------------------------------------------
+# KOMUT SATIRI
+# ---------------------------------------------------------
+def _sutun(satirlar, ad, sayi=True):
+    degerler = [r.get(ad) for r in satirlar]
+    if not sayi:
+        return np.asarray([d or "" for d in degerler], dtype=str)
+    return np.asarray([float(str(d).replace(",", ".")) if d not in (None, "") else np.nan
+                       for d in degerler])
+
+
+def main(argv=None):
+    """CSV sütunları: tip, profil, boyutlar (h, b, t, ...), uzunluk_mm, adet, malzeme."""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("kullanım: python -m profil_core.metraj metraj.csv", file=sys.stderr)
+        return 2
+    with open(argv[0], encoding="utf-8-sig", newline="") as f:
+        satirlar = list(csv.DictReader(f))
+    sutunlar = set().union(*(r.keys() for r in satirlar)) if satirlar else set()
+    boyutlar = {ad: _sutun(satirlar, ad)
+                for ad in sorted({b for a in AILELER for b in boyut_alanlari(a)} & sutunlar)}
+    sonuc = metraj(
+        _sutun(satirlar, "tip", sayi=False),
+        _sutun(satirlar, "uzunluk_mm"),
+        malzeme=_sutun(satirlar, "malzeme", sayi=False) if "malzeme" in sutunlar else None,
+        adet=np.nan_to_num(_sutun(satirlar, "adet"), nan=1.0) if "adet" in sutunlar else 1,
+        boyutlar=boyutlar,
+        profil=_sutun(satirlar, "profil", sayi=False) if "profil" in sutunlar else None,
+    )
+    for baslik in ("profil_toplamlari", "malzeme_toplamlari"):
+        print(baslik)
+        for r in sonuc[baslik]:
+            print("  {:30s} {:7d} {:12.2f} m {:14.2f} kg".format(
+                r["Anahtar"], r["Satır"], r["Uzunluk (m)"], r["Ağırlık (kg)"]))
+    print("Toplam: {:.2f} kg".format(float(sonuc["kg"].sum())))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
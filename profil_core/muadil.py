@@ -0,0 +1,532 @@
+# -*- coding: utf-8 -*-
+import atexit
+import heapq
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from profil_core.katalog import katalog_indeksi, katalog_surumu
+from profil_core.lama import (
+    LAMA_T_ADAYLARI, lama_t_araliklari, lama_t_adaylari, lama_satiri,
+)
+from profil_core.olcum import olculen, sayac
+from profil_core.onbellek import onbellekli
+from profil_core.sonuc import (
+    KAYNAKLI_SEMASI, LAMA_SEMASI, MUADIL_SEMASI, T_SEMASI, SonucTablosu, sayfa_dogrula,
+)
+
+# Önbellek ömrü (s); aynı profiller oturumlar arasında sık tekrarlanır
+ONBELLEK_TTL = 3600
+
+
+def _skor(satir):
+    return satir["Toplam Skor"]
+
+
+def _bos(sutunlu, sema):
+    return SonucTablosu(sema, {ad: [] for ad, _, _ in sema}) if sutunlu else []
+
+
+def _sayfa(satirlar, top_k=None, offset=0):
+    """Skora göre sıralı satırların [offset, offset + top_k) dilimi.
+
+    satirlar bir üreteç olabilir; top_k verilirse yalnızca offset + top_k
+    satırlık bir yığın tutulur. Eşit skorlar üretim sırasını korur.
+    """
+    sayfa_dogrula(top_k, offset)
+    if top_k is None:
+        return sorted(satirlar, key=_skor)[offset:]
+    return heapq.nsmallest(offset + top_k, satirlar, key=_skor)[offset:]
+
+
+# ---------------------------------------------------------
+# %10 MUADIL PROFIL LISTESI (WX/WY)
+# ---------------------------------------------------------
+@olculen("muadil")
+@onbellekli(max_boyut=512, ttl=ONBELLEK_TTL, surum=katalog_surumu)
+def muadil_liste_10yuzde(Wx_target, Wy_target, tolerans=0.10, top_k=None, offset=0,
+                         sutunlu=False):
+    """Wx veya Wy'si hedefin ±tolerans bandında kalan katalog profilleri.
+
+    Aday satırlar sıralı indeksten alınır ve skorları sütunlar üzerinde
+    hesaplanır; satır sözlükleri yalnızca dönen satırlar (top_k verilirse
+    offset'ten sonraki en iyi top_k satır) için kurulur.
+    sutunlu=True ise satır listesi yerine SonucTablosu (MUADIL_SEMASI).
+    """
+    sayfa_dogrula(top_k, offset)
+    if Wx_target is None or Wy_target is None:
+        return _bos(sutunlu, MUADIL_SEMASI)
+
+    import numpy as np
+
+    indeks = katalog_indeksi()
+    ids = indeks.bant(Wx_target * (1.0 - tolerans), Wx_target * (1.0 + tolerans),
+                      Wy_target * (1.0 - tolerans), Wy_target * (1.0 + tolerans))
+    dWx = np.abs(Wx_target - indeks.sutunlar["Wx_mm3"][ids])
+    dWy = np.abs(Wy_target - indeks.sutunlar["Wy_mm3"][ids])
+    skor = dWx + dWy
+    son = len(skor) if top_k is None else min(len(skor), offset + top_k)
+    if son < len(skor):
+        # Yalnızca son'uncu en küçük skora kadar olanlar sıralanır; eşiğe eşit
+        # tüm satırlar alındığından eşitlikler tam sıralamadaki gibi çözülür
+        if son == 0:
+            aday = np.empty(0, dtype=np.intp)
+        else:
+            aday = np.flatnonzero(skor <= np.partition(skor, son - 1)[son - 1])
+    else:
+        aday = np.arange(len(skor))
+    # Kararlı sıralama: eşit skorlarda katalog sırası korunur (_sayfa ile aynı)
+    sira = aday[np.argsort(skor[aday], kind="stable")][offset:son]
+
+    sonuc = indeks.satirlar(ids[sira])
+    for r, x, y in zip(sonuc, dWx[sira].tolist(), dWy[sira].tolist()):
+        r["ΔWx"] = x
+        r["ΔWy"] = y
+        r["Toplam Skor"] = x + y
+    sayac(katalog=len(indeks), degerlendirilen=len(ids), tutulan=len(sonuc))
+    return SonucTablosu.satirlardan(MUADIL_SEMASI, sonuc, len(ids)) if sutunlu else sonuc
+
+
+# ---------------------------------------------------------
+# EN YAKIN K MUADIL (LOG WX, LOG WY, KG/M)
+# ---------------------------------------------------------
+@olculen("muadil_knn")
+@onbellekli(max_boyut=512, ttl=ONBELLEK_TTL, surum=katalog_surumu)
+def muadil_knn(Wx_target, Wy_target, kg_m_target=None, k=10, agirliklar=(1.0, 1.0, 1.0),
+               yogunluk=None):
+    """(log Wx, log Wy, log kg/m) uzayında hedefe en yakın k katalog profili.
+
+    Tolerans bandı yoktur; bant boşken de en yakın kesitler döner. Log
+    ölçek sayesinde Wx ve Wy oransal farklarla eşit tartılır; agirliklar
+    (Wx, Wy, kg/m) eksen çarpanlarıdır. Katalog kg/m değerleri çelik
+    içindir; yogunluk (g/cm³) verilirse kataloğun o malzemedeki kg/m
+    değerleriyle karşılaştırılır. kg_m_target None ise kütle ekseni
+    kullanılmaz.
+    """
+    if Wx_target is None or Wy_target is None or Wx_target <= 0 or Wy_target <= 0:
+        return []
+
+    from profil_core.aileler import KG_M_MALZEME
+    from profil_core.kesit import MALZEMELER
+
+    oran = 1.0 if yogunluk is None else yogunluk / MALZEMELER[KG_M_MALZEME]
+    indeks = katalog_indeksi()
+    kutle_hedefi = kg_m_target / oran if kg_m_target else None
+    mesafeler, ids = indeks.knn(Wx_target, Wy_target, kutle_hedefi, k, agirliklar)
+
+    sonuc = []
+    for mesafe, i, r2 in zip(mesafeler, ids, indeks.satirlar(ids)):
+        r2["ΔWx"] = abs(Wx_target - r2["Wx_mm3"])
+        r2["ΔWy"] = abs(Wy_target - r2["Wy_mm3"])
+        if indeks.kg_m is not None:
+            r2["kg/m"] = float(indeks.kg_m[i]) * oran
+        r2["Mesafe"] = mesafe
+        sonuc.append(r2)
+    sayac(katalog=len(indeks), tutulan=len(sonuc))
+    return sonuc
+
+
+# ---------------------------------------------------------
+# EN HAFIF MUADIL (PARETO CEPHESI)
+# ---------------------------------------------------------
+@olculen("en_hafif")
+@onbellekli(max_boyut=512, ttl=ONBELLEK_TTL, surum=katalog_surumu)
+def en_hafif_muadiller(Wx_min, Wy_min, malzeme="Çelik", top_k=None, kg_m_ref=None):
+    """Wx ≥ Wx_min ve Wy ≥ Wy_min sağlayan, baskılanmayan kesitler (en hafif önce).
+
+    Sorgu profil_core.pareto cephesi üzerinde yapılır; tüm aileler (lama
+    dahil) kapsanır. kg_m_ref verilirse her satıra "Ağırlık Oranı"
+    (kg/m / kg_m_ref) eklenir.
+    """
+    sayfa_dogrula(top_k)
+    if Wx_min is None or Wy_min is None:
+        return []
+
+    from profil_core.pareto import pareto_cephesi
+
+    cephe = pareto_cephesi()
+    sonuc = cephe.sorgula(Wx_min, Wy_min, malzeme, top_k)
+    if kg_m_ref:
+        for r in sonuc:
+            r["Ağırlık Oranı"] = r["kg/m"] / kg_m_ref
+    sayac(katalog=cephe.katalog_boyutu, cephe=len(cephe), tutulan=len(sonuc))
+    return sonuc
+
+
+# ---------------------------------------------------------
+# LAMA MUADIL (WX/WY HEDEFINE GORE)
+# ---------------------------------------------------------
+@olculen("lama")
+@onbellekli(max_boyut=512, ttl=ONBELLEK_TTL)
+def lama_muadil_wx_wy(Wx_target, Wy_target, h_mm, t_adaylari=None, tolerans=0.02,
+                      top_k=None, offset=0, sutunlu=False):
+    """Verilen Wx, Wy hedeflerine göre sabit h_mm yükseklikte
+    hangi lama kalınlıkları (%2 toleransla) muadil olabilir?
+    Burada şart Wx veya Wy'den en az biri tolerans bandında olsun (VEYA).
+
+    Uygun kalınlık aralıkları lama_t_araliklari ile kapalı formdan
+    bulunur; yalnızca bu aralıklara düşen t_adaylari (sıralı, kesirli
+    olabilir; varsayılan 2..100 mm tam sayılar) değerlendirilir.
+    top_k / offset ile skora göre sıralı listenin bir sayfası alınır;
+    sutunlu=True ise SonucTablosu (LAMA_SEMASI) döner."""
+    sayfa_dogrula(top_k, offset)
+    if Wx_target is None or Wy_target is None or h_mm is None:
+        return _bos(sutunlu, LAMA_SEMASI)
+    if t_adaylari is None:
+        t_adaylari = LAMA_T_ADAYLARI
+
+    araliklar = lama_t_araliklari(Wx_target, Wy_target, h_mm, tolerans)
+
+    adaylar = lama_t_adaylari(araliklar, t_adaylari)
+    # Aday sayısı kalınlık listesiyle sınırlı; eşleşenler sayılmak için tutulur
+    satirlar = [s for s in (lama_satiri(Wx_target, Wy_target, h_mm, t, tolerans)
+                            for t in adaylar) if s]
+    liste = _sayfa(satirlar, top_k, offset)
+    sayac(degerlendirilen=len(adaylar), eslesen=len(satirlar), tutulan=len(liste))
+    return SonucTablosu.satirlardan(LAMA_SEMASI, liste, len(satirlar)) if sutunlu else liste
+
+
+# ---------------------------------------------------------
+# T PROFIL MUADIL (WX/WY HEDEFINE GORE)
+# ---------------------------------------------------------
+@olculen("t_profil")
+@onbellekli(max_boyut=64, ttl=ONBELLEK_TTL)
+def t_profil_wx_wy(Wx_target, Wy_target, H_mm, t_min_mm, t_max_mm,
+                   t_adaylari=None, b_adim=10, top_k=None, offset=0,
+                   genislikler=None, budama=True, sutunlu=False):
+    """
+    H_mm toplam yüksekliğe sahip T profil için
+    flanş + gövde kombinasyonlarını tarar.
+    Flanş: b_f x t_f
+    Gövde: h_w x t_w  (H = t_f + h_w)
+    Wx/Wy hedefe %10 içinde olanları listeler.
+    t_min_mm ve t_max_mm: flanş ve gövde kalınlığı için min/max (mm)
+    t_adaylari: kalınlık adayları (varsayılan T_ADAYLARI)
+    b_adim: flanş genişliği adımı (mm); None ise genişlik süreklidir
+    top_k, offset: skora göre sıralı listenin [offset, offset + top_k)
+    sayfası (top_k None ise tüm liste)
+    genislikler: stok sac genişlikleri (mm); verilirse b_adim ızgarası
+    yerine aralıktaki bu genişlikler kullanılır
+    budama: True ise her kalınlık çifti için uygun b_f aralıkları
+    t_profil_budamali ile çözülür ve yalnızca bu aralıklara düşen
+    genişlikler hesaplanır; False ise tüm ızgara t_profil_ara ile
+    t_f blokları halinde taranır. İki yol aynı listeyi verir.
+    sutunlu: True ise arama dizileri satır sözlüklerine çevrilmeden
+    SonucTablosu (T_SEMASI) olarak döner.
+    """
+    sayfa_dogrula(top_k, offset)
+    if Wx_target is None or Wy_target is None or H_mm is None:
+        return _bos(sutunlu, T_SEMASI)
+    if t_min_mm is None or t_max_mm is None or t_min_mm <= 0 or t_max_mm < t_min_mm:
+        return _bos(sutunlu, T_SEMASI)
+
+    H = float(H_mm)
+    if H <= 0:
+        return _bos(sutunlu, T_SEMASI)
+
+    # NumPy yalnızca T araması gerektiğinde yüklenir
+    from profil_core.tprofil import T_ADAYLARI
+
+    if t_adaylari is None:
+        t_adaylari = T_ADAYLARI
+    t_list = [t for t in t_adaylari if t_min_mm <= t <= t_max_mm]
+    if not t_list:
+        return _bos(sutunlu, T_SEMASI)
+
+    s = _t_ara(Wx_target, Wy_target, H, t_list, b_adim, genislikler, budama, top_k, offset)
+    sayac(degerlendirilen=s["degerlendirilen"], eslesen=s["eslesen"], tutulan=len(s["skor"]))
+    if sutunlu:
+        return _t_tablosu(s, b_adim is None and genislikler is None, s["eslesen"])
+    return _t_satirlari(s, b_adim is None and genislikler is None)
+
+
+def _b_araligi(H):
+    # Flanş genişliği: H'nin yaklaşık 0.5x ile 2x arası (10 mm'ye yuvarlı)
+    b_min = max(20.0, 0.5 * H)
+    b_max = 2.0 * H
+    return int(round(b_min / 10.0) * 10), int(round(b_max / 10.0) * 10)
+
+
+def _t_ara(Wx_target, Wy_target, H, t_list, b_adim=10, genislikler=None, budama=True,
+           top_k=None, offset=0, t_f_list=None):
+    """Tek bir H için T aramasının dizi sözlüğü (bkz. tprofil.t_profil_ara);
+    her satırın H'si "H" dizisindedir."""
+    from profil_core.tprofil import t_profil_ara, t_profil_budamali
+
+    b_start, b_end = _b_araligi(H)
+    if genislikler is not None:
+        b_list = sorted(b for b in genislikler if b_start <= b <= b_end)
+    elif b_adim is not None:
+        b_list = range(b_start, b_end + 1, b_adim)
+    else:
+        b_list = None
+
+    if b_list is None or budama:
+        s = t_profil_budamali(Wx_target, Wy_target, H, t_list, b_start, b_end, b_list,
+                              top_k=top_k, offset=offset, t_f_list=t_f_list)
+    else:
+        s = t_profil_ara(Wx_target, Wy_target, H, t_list, b_list, top_k=top_k, offset=offset)
+    s["H"] = [H] * len(s["skor"])
+    return s
+
+
+def t_profil_satirlari(Wx_target, Wy_target, H, t_f, t_list, b_adim=10, genislikler=None):
+    """Tek bir (H, t_f) çifti için t_profil_wx_wy satırları, skora göre
+    sıralı; gövde kalınlıkları t_list'ten alınır. Bellekte yalnızca bu
+    flanş kalınlığının budanmış adayları bulunur.
+    """
+    H = float(H)
+    s = _t_ara(Wx_target, Wy_target, H, t_list, b_adim, genislikler, t_f_list=[t_f])
+    return _t_satirlari(s, b_adim is None and genislikler is None)
+
+
+def _liste(d):
+    return d.tolist() if hasattr(d, "tolist") else d
+
+
+# T_SEMASI sütunu -> arama dizisi
+_T_DIZILERI = (("H (mm)", "H"), ("b_f (mm)", "b_f"), ("t_f (mm)", "t_f"), ("h_w (mm)", "h_w"),
+               ("t_w (mm)", "t_w"), ("Wx_T (mm³)", "Wx"), ("Wy_T (mm³)", "Wy"), ("ΔWx", "dWx"),
+               ("ΔWy", "dWy"), ("Toplam Skor", "skor"))
+
+
+def _t_tablosu(s, surekli=False, eslesen=None):
+    etiketler = ["T (flanş {}x{}, gövde {}x{})".format(round(b_f, 2) if surekli else b_f, t_f,
+                                                        h_w, t_w)
+                 for b_f, t_f, h_w, t_w in zip(*(_liste(s[k])
+                                                 for k in ("b_f", "t_f", "h_w", "t_w")))]
+    return SonucTablosu(T_SEMASI, dict({"T Profil": etiketler},
+                                       **{ad: s[k] for ad, k in _T_DIZILERI}), eslesen)
+
+
+def _t_satirlari(s, surekli=False):
+    sonuc = []
+    for H, t_f, t_w, b_f, h_w, Wx_mm3, Wy_mm3, dWx, dWy, skor in zip(*(
+            _liste(s[k]) for k in ("H", "t_f", "t_w", "b_f", "h_w", "Wx", "Wy", "dWx", "dWy", "skor"))):
+        sonuc.append({
+            "T Profil": "T (flanş {}x{}, gövde {}x{})".format(
+                round(b_f, 2) if surekli else b_f, t_f, h_w, t_w),
+            "H (mm)": H,
+            "b_f (mm)": b_f,
+            "t_f (mm)": t_f,
+            "h_w (mm)": h_w,
+            "t_w (mm)": t_w,
+            "Wx_T (mm³)": Wx_mm3,
+            "Wy_T (mm³)": Wy_mm3,
+            "ΔWx": dWx,
+            "ΔWy": dWy,
+            "Toplam Skor": skor
+        })
+    return sonuc
+
+
+# ---------------------------------------------------------
+# KAYNAKLI YAPMA KESIT MUADIL (I, KUTU, U, T)
+# ---------------------------------------------------------
+@olculen("kaynakli")
+@onbellekli(max_boyut=64, ttl=ONBELLEK_TTL)
+def kaynakli_wx_wy(topoloji, Wx_target, Wy_target, H_mm, t_min_mm, t_max_mm,
+                   t_adaylari=None, b_adim=10, top_k=None, offset=0, sutunlu=False):
+    """Levhalardan yapılan topoloji ("I", "Kutu", "U", "T") kesitleri içinde
+    Wx veya Wy'si hedefe %10 yakın olanlar; t_profil_wx_wy ile aynı
+    kalınlık ve flanş genişliği ızgarası kullanılır. Kesit özellikleri
+    profil_core.kaynakli ile kesin olarak hesaplanır. b_adim gereklidir:
+    sürekli flanş genişliği (b_adim=None) yalnızca T aramasında çözülür.
+    sutunlu=True ise SonucTablosu (KAYNAKLI_SEMASI) döner.
+    """
+    sayfa_dogrula(top_k, offset)
+    if b_adim is None or b_adim <= 0:
+        raise ValueError("Kaynaklı kesitlerde flanş genişliği adımı (b_adim) pozitif olmalı")
+    if Wx_target is None or Wy_target is None or H_mm is None:
+        return _bos(sutunlu, KAYNAKLI_SEMASI)
+    if t_min_mm is None or t_max_mm is None or t_min_mm <= 0 or t_max_mm < t_min_mm:
+        return _bos(sutunlu, KAYNAKLI_SEMASI)
+    H = float(H_mm)
+    if H <= 0:
+        return _bos(sutunlu, KAYNAKLI_SEMASI)
+
+    from profil_core.kaynakli import kaynakli_ara
+    from profil_core.tprofil import T_ADAYLARI
+
+    if t_adaylari is None:
+        t_adaylari = T_ADAYLARI
+    t_list = [t for t in t_adaylari if t_min_mm <= t <= t_max_mm]
+    if not t_list:
+        return _bos(sutunlu, KAYNAKLI_SEMASI)
+
+    b_start, b_end = _b_araligi(H)
+    s = kaynakli_ara(topoloji, Wx_target, Wy_target, H, t_list,
+                     range(b_start, b_end + 1, b_adim), top_k=top_k, offset=offset)
+    sayac(degerlendirilen=s["degerlendirilen"], eslesen=s["eslesen"], tutulan=len(s["skor"]))
+
+    if sutunlu:
+        n = len(s["skor"])
+        return SonucTablosu(KAYNAKLI_SEMASI, {
+            "Kesit": ["{} (flanş {:g}x{:g}, gövde {:g}x{:g})".format(topoloji, b_f, t_f, h_w, t_w)
+                      for b_f, t_f, h_w, t_w in zip(*(s[k].tolist()
+                                                      for k in ("b_f", "t_f", "h_w", "t_w")))],
+            "Topoloji": [topoloji] * n,
+            "H (mm)": [H] * n,
+            "b_f (mm)": s["b_f"], "t_f (mm)": s["t_f"], "h_w (mm)": s["h_w"],
+            "t_w (mm)": s["t_w"], "A (mm²)": s["A"], "Wx (mm³)": s["Wx"], "Wy (mm³)": s["Wy"],
+            "ΔWx": s["dWx"], "ΔWy": s["dWy"], "Toplam Skor": s["skor"],
+        }, s["eslesen"])
+    sonuc = []
+    for t_f, t_w, b_f, h_w, A, Wx_mm3, Wy_mm3, dWx, dWy, skor in zip(*(
+            s[k].tolist() for k in ("t_f", "t_w", "b_f", "h_w", "A", "Wx", "Wy", "dWx", "dWy",
+                                    "skor"))):
+        sonuc.append({
+            "Kesit": "{} (flanş {:g}x{:g}, gövde {:g}x{:g})".format(topoloji, b_f, t_f, h_w, t_w),
+            "Topoloji": topoloji,
+            "H (mm)": H,
+            "b_f (mm)": b_f,
+            "t_f (mm)": t_f,
+            "h_w (mm)": h_w,
+            "t_w (mm)": t_w,
+            "A (mm²)": A,
+            "Wx (mm³)": Wx_mm3,
+            "Wy (mm³)": Wy_mm3,
+            "ΔWx": dWx,
+            "ΔWy": dWy,
+            "Toplam Skor": skor
+        })
+    return sonuc
+
+
+# ---------------------------------------------------------
+# COKLU YUKSEKLIK T PROFIL (SUREC HAVUZU)
+# ---------------------------------------------------------
+def _t_h_parcasi(Wx_target, Wy_target, H, t_list, t_f_list, b_adim, genislikler, top_k):
+    """Havuz işçisi: bir (H, t_f grubu) parçasının en iyi top_k adayı."""
+    s = _t_ara(Wx_target, Wy_target, H, t_list, b_adim, genislikler, True, top_k,
+               t_f_list=t_f_list)
+    s["sayac"] = (s.pop("degerlendirilen"), s.pop("eslesen"))
+    return s
+
+
+def _t_h_parcalari(H_listesi, t_list, isci):
+    """(H, t_f grubu) parçaları; H sayısı azsa t_f listesi bölünerek
+    en az 4 x isci parça üretilir."""
+    grup = max(1, min(len(t_list), -(-4 * isci // max(1, len(H_listesi)))))
+    boyut = -(-len(t_list) // grup)
+    for H in H_listesi:
+        for i in range(0, len(t_list), boyut):
+            yield H, t_list[i:i + boyut]
+
+
+# Süreç başına tek, uzun ömürlü havuz (uygulama): işçiler ilk aramada bir kez
+# kurulur, sunucu süreci her aramada yeniden çatallanmaz.
+_HAVUZ = None
+_HAVUZ_ISCI = 0
+_HAVUZ_KILIDI = threading.Lock()
+
+
+def _ortak_havuz(isci, yenile=False):
+    """isci işçili ortak havuz; ilk çağrıda (ya da boyut değişince) kurulur."""
+    global _HAVUZ, _HAVUZ_ISCI
+    with _HAVUZ_KILIDI:
+        if _HAVUZ is not None and (yenile or _HAVUZ_ISCI != isci):
+            # Boyut değişince eski havuzdaki işler tamamlanır; bozuk havuzda iptal edilir
+            _HAVUZ.shutdown(wait=False, cancel_futures=yenile)
+            _HAVUZ = None
+        if _HAVUZ is None:
+            _HAVUZ = ProcessPoolExecutor(max_workers=isci)
+            _HAVUZ_ISCI = isci
+        return _HAVUZ
+
+
+def _havuzu_kapat():
+    global _HAVUZ
+    with _HAVUZ_KILIDI:
+        if _HAVUZ is not None:
+            _HAVUZ.shutdown(cancel_futures=True)
+            _HAVUZ = None
+
+
+def _havuzu_unut():
+    # Çocuk süreç ebeveynin havuzunu kullanamaz; gerekirse kendi havuzunu kurar
+    global _HAVUZ, _HAVUZ_KILIDI
+    _HAVUZ = None
+    _HAVUZ_KILIDI = threading.Lock()
+
+
+atexit.register(_havuzu_kapat)
+if hasattr(os, "register_at_fork"):  # yalnızca POSIX
+    os.register_at_fork(after_in_child=_havuzu_unut)
+
+
+def _havuzda_calistir(argumanlar, isci, kalici_havuz):
+    if not kalici_havuz:
+        with ProcessPoolExecutor(max_workers=min(isci, len(argumanlar))) as havuz:
+            return list(havuz.map(_t_h_parcasi, *zip(*argumanlar)))
+    try:
+        return list(_ortak_havuz(isci).map(_t_h_parcasi, *zip(*argumanlar)))
+    except BrokenProcessPool:
+        # Bir işçi öldüyse havuz kullanılamaz; yenisi kurulup bir kez denenir
+        return list(_ortak_havuz(isci, yenile=True).map(_t_h_parcasi, *zip(*argumanlar)))
+
+
+@olculen("t_profil_h_araligi")
+@onbellekli(max_boyut=32, ttl=ONBELLEK_TTL)
+def t_profil_h_araligi(Wx_target, Wy_target, H_min_mm, H_max_mm, H_adim_mm, t_min_mm, t_max_mm,
+                       t_adaylari=None, b_adim=10, top_k=50, genislikler=None, isci=None,
+                       sutunlu=False, kalici_havuz=True):
+    """t_profil_wx_wy'nin H_min..H_max (H_adim adımlı) yükseklik aralığındaki hali.
+
+    (H, t_f, t_w) uzayı (H, t_f grubu) parçalarına bölünür; parçalar
+    süreç havuzunda budamalı aramayla değerlendirilir ve her işçinin en
+    iyi top_k adayı ana süreçte (skor, H, t_f, t_w, b_f) sırasıyla
+    birleştirilir. Sonuç parçalamadan ve işçi sayısından bağımsızdır.
+    isci: süreç sayısı (varsayılan tüm çekirdekler; 1 ise havuz kurulmaz).
+    kalici_havuz: True ise süreç ömrü boyunca açık kalan ortak havuz
+    kullanılır; False ise çağrı başına havuz kurulur (CLI, ölçümler).
+    sutunlu: True ise SonucTablosu (T_SEMASI) döner.
+    """
+    sayfa_dogrula(top_k)
+    if Wx_target is None or Wy_target is None or H_min_mm is None or H_max_mm is None:
+        return _bos(sutunlu, T_SEMASI)
+    if t_min_mm is None or t_max_mm is None or t_min_mm <= 0 or t_max_mm < t_min_mm:
+        return _bos(sutunlu, T_SEMASI)
+    if not H_adim_mm or H_adim_mm <= 0 or H_max_mm < H_min_mm:
+        return _bos(sutunlu, T_SEMASI)
+
+    from profil_core.tprofil import T_ADAYLARI
+
+    if t_adaylari is None:
+        t_adaylari = T_ADAYLARI
+    t_list = [t for t in t_adaylari if t_min_mm <= t <= t_max_mm]
+    n_H = int((H_max_mm - H_min_mm) / H_adim_mm + 1e-9) + 1
+    H_listesi = [float(H_min_mm + i * H_adim_mm) for i in range(n_H)]
+    H_listesi = [H for H in H_listesi if H > 0]
+    if not t_list or not H_listesi:
+        return _bos(sutunlu, T_SEMASI)
+
+    isci = isci or os.cpu_count() or 1
+    parcalar = list(_t_h_parcalari(H_listesi, t_list, isci))
+    argumanlar = [(Wx_target, Wy_target, H, t_list, t_f, b_adim, genislikler, top_k)
+                  for H, t_f in parcalar]
+    if isci == 1:
+        sonuclar = [_t_h_parcasi(*a) for a in argumanlar]
+    else:
+        sonuclar = _havuzda_calistir(argumanlar, isci, kalici_havuz)
+
+    alanlar = ("H", "t_f", "t_w", "b_f", "h_w", "Wx", "Wy", "dWx", "dWy", "skor")
+    adaylar = []
+    degerlendirilen = eslesen = 0
+    for s in sonuclar:
+        degerlendirilen += s["sayac"][0]
+        eslesen += s["sayac"][1]
+        sutunlar = [_liste(s[k]) for k in alanlar]
+        for H, t_f, t_w, b_f, *satir in zip(*sutunlar):
+            adaylar.append((satir[-1], H, t_f, t_w, b_f, satir))
+    en_iyi = heapq.nsmallest(top_k, adaylar) if top_k is not None else sorted(adaylar)
+
+    birlesik = dict(zip(alanlar, zip(*[a[1:5] + tuple(a[5]) for a in en_iyi]))) if en_iyi \
+        else {k: [] for k in alanlar}
+    sayac(parca=len(parcalar), isci=isci, degerlendirilen=degerlendirilen, eslesen=eslesen,
+          tutulan=len(en_iyi))
+    if sutunlu:
+        return _t_tablosu(birlesik, b_adim is None and genislikler is None, eslesen)
+    return _t_satirlari(birlesik, b_adim is None and genislikler is None)
+
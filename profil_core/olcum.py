@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""Hesapla hattı için aşama süreleri, aday sayaçları ve bellek tepe değeri.
+
+Bir Olcum etkinken (baslat ... bitir) @olculen ile işaretli fonksiyonlar
+kendi aşamalarını kaydeder; arama fonksiyonları sayac() ile değerlendirilen
+ve tutulan aday sayılarını ekler. Etkin ölçüm yoksa ek maliyet yalnızca
+bir ContextVar okumasıdır.
+
+tracemalloc süreç geneli çalışır: aynı süreçte (ör. Streamlit
+oturumları) birden fazla bellek ölçümü etkinse izleme ilk ölçümle
+başlar, sonuncusuyla durur ve tepe değer yalnızca başka ölçüm yokken
+sıfırlanır. Örtüşen ölçümlerin tepe değeri süreç genelidir
+(bellek_paylasimli).
+
+PROFIL_OLCUM_LOG ortam değişkeni bir dosya yolu gösteriyorsa her ölçüm o
+dosyaya bir JSON satırı olarak eklenir.
+"""
+import contextvars
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+OLCUM_LOG = os.environ.get("PROFIL_OLCUM_LOG")
+
+_ETKIN = contextvars.ContextVar("profil_olcum", default=None)
+_ASAMA = contextvars.ContextVar("profil_olcum_asama", default=None)
+_YAZ_KILIDI = threading.Lock()
+
+# Etkin bellek ölçümü sayısı; tracemalloc'u bu modül başlattıysa True
+_BELLEK_KILIDI = threading.Lock()
+_BELLEK_OLCUMLERI = 0
+_TRACEMALLOC_BIZDE = False
+
+
+def _bellek_baslat():
+    """Bellek ölçümünü kaydeder; başka ölçüm de etkinse True."""
+    global _BELLEK_OLCUMLERI, _TRACEMALLOC_BIZDE
+    with _BELLEK_KILIDI:
+        if _BELLEK_OLCUMLERI == 0:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                _TRACEMALLOC_BIZDE = True
+        _BELLEK_OLCUMLERI += 1
+        return _BELLEK_OLCUMLERI > 1
+
+
+def _bellek_bitir():
+    """(tepe KB, başka ölçüm de etkin miydi); son ölçümde izleme durur."""
+    global _BELLEK_OLCUMLERI, _TRACEMALLOC_BIZDE
+    with _BELLEK_KILIDI:
+        tepe = tracemalloc.get_traced_memory()[1] / 1024.0
+        _BELLEK_OLCUMLERI -= 1
+        paylasimli = _BELLEK_OLCUMLERI > 0
+        if not paylasimli and _TRACEMALLOC_BIZDE:
+            tracemalloc.stop()
+            _TRACEMALLOC_BIZDE = False
+        return tepe, paylasimli
+
+
+class Olcum:
+    """Tek bir Hesapla çalışmasının ölçüm kaydı."""
+
+    def __init__(self, ad, bellek=False, **baglam):
+        self.ad = ad
+        self.bellek = bellek
+        self.baglam = baglam
+        self.asamalar = []
+        self.toplam_sn = None
+        self.bellek_tepe_kb = None
+        self.bellek_paylasimli = False
+        self._t0 = None
+        self._jeton = None
+
+    def baslat(self):
+        if self.bellek:
+            self.bellek_paylasimli = _bellek_baslat()
+        self._jeton = _ETKIN.set(self)
+        self._t0 = time.perf_counter()
+        return self
+
+    def bitir(self):
+        self.toplam_sn = time.perf_counter() - self._t0
+        _ETKIN.reset(self._jeton)
+        if self.bellek:
+            self.bellek_tepe_kb, paylasimli = _bellek_bitir()
+            self.bellek_paylasimli = self.bellek_paylasimli or paylasimli
+        return self
+
+    def __enter__(self):
+        return self.baslat()
+
+    def __exit__(self, *exc):
+        self.bitir()
+        return False
+
+    @contextmanager
+    def asama(self, ad, **sayaclar):
+        """Bir kod bloğunu ad adlı aşama olarak zamanlar."""
+        kayit = {"asama": ad}
+        kayit.update(sayaclar)
+        jeton = _ASAMA.set(kayit)
+        t0 = time.perf_counter()
+        try:
+            yield kayit
+        finally:
+            kayit["sn"] = time.perf_counter() - t0
+            _ASAMA.reset(jeton)
+            self.asamalar.append(kayit)
+
+    def kayit(self):
+        return {
+            "zaman": datetime.datetime.now().isoformat(timespec="milliseconds"),
+            "ad": self.ad,
+            "baglam": self.baglam,
+            "toplam_sn": self.toplam_sn,
+            "bellek_tepe_kb": self.bellek_tepe_kb,
+            "bellek_paylasimli": self.bellek_paylasimli,
+            "asamalar": self.asamalar,
+        }
+
+    def yaz(self, yol=None):
+        """Kaydı JSON satırı olarak yol'a (varsayılan PROFIL_OLCUM_LOG) ekler."""
+        yol = yol or OLCUM_LOG
+        if not yol:
+            return False
+        satir = json.dumps(self.kayit(), ensure_ascii=False, default=str) + "\n"
+        with _YAZ_KILIDI:
+            with open(yol, "a", encoding="utf-8") as f:
+                f.write(satir)
+        return True
+
+
+def etkin_olcum():
+    return _ETKIN.get()
+
+
+@contextmanager
+def asama(ad, **sayaclar):
+    """Etkin ölçüm varsa bloğu ad adlı aşama olarak zamanlar."""
+    olcum = _ETKIN.get()
+    if olcum is None:
+        yield None
+        return
+    with olcum.asama(ad, **sayaclar) as kayit:
+        yield kayit
+
+
+def sayac(**degerler):
+    """Etkin aşamaya sayaç ekler (ör. degerlendirilen=..., tutulan=...)."""
+    kayit = _ASAMA.get()
+    if kayit is not None:
+        kayit.update(degerler)
+
+
+def olculen(asama_adi):
+    """Fonksiyonu, etkin bir ölçüm varsa asama_adi aşaması olarak zamanlar."""
+    def sar(fonk):
+        @functools.wraps(fonk)
+        def sarmal(*args, **kwargs):
+            olcum = _ETKIN.get()
+            if olcum is None:
+                return fonk(*args, **kwargs)
+            with olcum.asama(asama_adi):
+                return fonk(*args, **kwargs)
+        return sarmal
+    return sar
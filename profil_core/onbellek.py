@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+from profil_core.olcum import sayac
+
+# Ad -> LRUOnbellek; arayüzde istatistik göstermek için
+ONBELLEKLER = {}
+
+
+def _dondur(deger):
+    if isinstance(deger, (list, tuple)):
+        return tuple(_dondur(d) for d in deger)
+    if isinstance(deger, range):
+        return ("range", deger.start, deger.stop, deger.step)
+    if hasattr(deger, "dtype") and hasattr(deger, "tobytes"):
+        # NumPy dizisi (ya da skaleri); NumPy burada içe aktarılmaz
+        return ("nd", deger.dtype.str, deger.shape, deger.tobytes())
+    return deger
+
+
+# ---------------------------------------------------------
+# SINIRLI LRU / TTL ONBELLEK
+# ---------------------------------------------------------
+class LRUOnbellek:
+    """Sayısal girdilere göre anahtarlanan, boyutu ve ömrü sınırlı önbellek.
+
+    Süreç içindeki tüm oturumlar ve yeniden çalıştırmalar aynı önbelleği
+    paylaşır. Sonuç listeleri her çağrıda kopyalanarak döner; satır
+    sözlükleri ve sütunlu tablolar (sonuc.SonucTablosu) ortaktır ve
+    değiştirilmemelidir.
+
+    surum verilirse (argümansız çağrılabilir, ör. katalog.katalog_surumu)
+    dönen değer anahtara girer; sürüm artınca eski kayıtlar bir daha
+    bulunmaz ve LRU sırasıyla düşer.
+    """
+
+    def __init__(self, fonk, max_boyut=256, ttl=None, surum=None):
+        functools.update_wrapper(self, fonk)
+        self.fonk = fonk
+        self.max_boyut = max_boyut
+        self.ttl = ttl
+        self.surum = surum
+        self.isabet = 0
+        self.iskalama = 0
+        self._veri = OrderedDict()
+        self._kilit = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        anahtar = (_dondur(args), tuple(sorted((k, _dondur(v)) for k, v in kwargs.items())))
+        if self.surum is not None:
+            anahtar = (self.surum(),) + anahtar
+        try:
+            hash(anahtar)
+        except TypeError:
+            # Dondurulamayan argüman (ör. sözlük): önbelleksiz hesaplanır
+            return self.fonk(*args, **kwargs)
+        bulundu, deger = self.getir(anahtar)
+        if not bulundu:
+            deger = self.fonk(*args, **kwargs)
+            self.koy(anahtar, deger)
+        return list(deger) if isinstance(deger, list) else deger
+
+    def getir(self, anahtar):
+        """(bulundu, değer); süresi dolmuş kayıt bulunmamış sayılır."""
+        simdi = time.monotonic()
+        with self._kilit:
+            kayit = self._veri.get(anahtar)
+            if kayit is not None and (self.ttl is None or simdi - kayit[0] <= self.ttl):
+                self._veri.move_to_end(anahtar)
+                self.isabet += 1
+                sayac(onbellek="isabet")
+                return True, kayit[1]
+            self.iskalama += 1
+        sayac(onbellek="iskalama")
+        return False, None
+
+    def koy(self, anahtar, deger):
+        with self._kilit:
+            self._veri[anahtar] = (time.monotonic(), deger)
+            self._veri.move_to_end(anahtar)
+            while len(self._veri) > self.max_boyut:
+                self._veri.popitem(last=False)
+
+    def temizle(self):
+        with self._kilit:
+            self._veri.clear()
+            self.isabet = 0
+            self.iskalama = 0
+
+    def istatistik(self):
+        with self._kilit:
+            toplam = self.isabet + self.iskalama
+            return {
+                "Önbellek": self.__name__,
+                "İsabet": self.isabet,
+                "Iskalama": self.iskalama,
+                "İsabet Oranı": self.isabet / toplam if toplam else 0.0,
+                "Kayıt": len(self._veri),
+                "Maks. Kayıt": self.max_boyut,
+                "TTL (s)": self.ttl,
+            }
+
+
+def onbellekli(max_boyut=256, ttl=None, surum=None):
+    """Liste (ya da sütunlu tablo) döndüren bir arama fonksiyonunu LRUOnbellek ile sarar."""
+    def sar(fonk):
+        onbellek = LRUOnbellek(fonk, max_boyut, ttl, surum)
+        ONBELLEKLER[fonk.__name__] = onbellek
+        return onbellek
+    return sar
+
+
+def onbellek_istatistikleri():
+    return [o.istatistik() for o in ONBELLEKLER.values()]
+
+
+def onbellekleri_temizle():
+    for o in ONBELLEKLER.values():
+        o.temizle()
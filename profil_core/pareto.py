@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""En hafif muadil kesitler: (Wx, Wy) ↔ kg/m Pareto cephesi.
+
+Bir kesit, başka bir kesit Wx ve Wy'de en az onun kadar büyük ve
+kg/m'de en az onun kadar hafifse (en az birinde kesin) baskılanır.
+"En az bu kadar rijit en hafif kesit" her zaman cephededir; bu yüzden
+sorgu yalnızca cephe üzerinde yapılır.
+
+Cephe tüm tables/*_TABLO aileleri (lama dahil) üzerinde kg/m'ye göre
+sıralayıp tarayan bir algoritmayla kurulur: O(n log n). Bir ailede
+baskılanan satır tüm katalogda da baskılandığından önce her ailenin
+kendi cephesi bulunur, katalog cephesi bunların birleşiminden kurulur;
+bir aile değişince yalnızca onun cephesi yeniden hesaplanır.
+"""
+import numpy as np
+
+from profil_core.kesit import MALZEMELER
+from profil_core.sonuc import sayfa_dogrula
+
+
+# ---------------------------------------------------------
+# SIRALA – TARA
+# ---------------------------------------------------------
+def pareto_on_yuz(Wx, Wy, kg_m):
+    """Baskılanmayan satırların numaraları (kg/m artan sırada).
+
+    Satırlar kg/m artan (eşitlikte Wx, sonra Wy azalan) sırayla taranır.
+    Görülen satırların Wx sırasına göre en büyük Wy'si bir Fenwick
+    ağacında tutulur; Wx'i yeni satırınkine eşit ya da büyük olanların en
+    büyük Wy'si yeni satırınkinden küçük değilse satır baskılanmıştır.
+    Sorgu ve güncelleme O(log n)'dir. Aynı (Wx, Wy, kg/m) değerli
+    satırlardan katalogda önce geleni kalır.
+    """
+    Wx = np.asarray(Wx, dtype=np.float64)
+    Wy = np.asarray(Wy, dtype=np.float64)
+    kg_m = np.asarray(kg_m, dtype=np.float64)
+    sira = np.lexsort((np.arange(Wx.size), -Wy, -Wx, kg_m))
+    # Wx azalan sıra numarası (1'den): Wx'i x'e eşit ya da büyük olanlar bir önektir
+    _, no = np.unique(-Wx, return_inverse=True)
+    no = no.reshape(-1) + 1
+
+    agac = [float("-inf")] * (int(no.max()) + 1 if no.size else 1)
+    cephe = []
+    for i, k, y in zip(sira.tolist(), no[sira].tolist(), Wy[sira].tolist()):
+        j, en_buyuk = k, float("-inf")
+        while j > 0:
+            if agac[j] > en_buyuk:
+                en_buyuk = agac[j]
+            j -= j & -j
+        if en_buyuk >= y:
+            continue
+        # Baskılananlar ağaca eklenmez: onları baskılayan satır zaten oradadır
+        while k < len(agac):
+            if agac[k] < y:
+                agac[k] = y
+            k += k & -k
+        cephe.append(i)
+    return cephe
+
+
+# ---------------------------------------------------------
+# KATALOG CEPHESI
+# ---------------------------------------------------------
+class ParetoCephesi:
+    """Katalog sütunlarından kurulan cephe; satırlar kg/m artan sıradadır.
+
+    kg_m, ref_malzeme içindir. Tüm katalog tek malzemeden olduğu sürece
+    yoğunluk bütün kg/m değerlerini aynı oranda ölçekler ve cephe üyeliği
+    değişmez; malzemeye göre yalnızca kg/m sütunu ölçeklenir.
+    """
+
+    def __init__(self, profil, tip, Wx, Wy, kg_m, ref_malzeme="Çelik", katalog_boyutu=None):
+        Wx = np.asarray(Wx, dtype=np.float64)
+        Wy = np.asarray(Wy, dtype=np.float64)
+        kg_m = np.asarray(kg_m, dtype=np.float64)
+        gecerli = np.flatnonzero(np.isfinite(Wx) & np.isfinite(Wy) & np.isfinite(kg_m))
+        ids = gecerli[pareto_on_yuz(Wx[gecerli], Wy[gecerli], kg_m[gecerli])]
+
+        self.katalog_boyutu = len(Wx) if katalog_boyutu is None else katalog_boyutu
+        self.ref_malzeme = ref_malzeme
+        self.profil = [profil[i] for i in ids.tolist()]
+        self.tip = [tip[i] for i in ids.tolist()]
+        self.Wx = Wx[ids]
+        self.Wy = Wy[ids]
+        self.kg_m = {m: kg_m[ids] * (rho / MALZEMELER[ref_malzeme])
+                     for m, rho in MALZEMELER.items()}
+
+    def __len__(self):
+        return len(self.profil)
+
+    def sorgula(self, Wx_min=0.0, Wy_min=0.0, malzeme="Çelik", top_k=None):
+        """Wx ≥ Wx_min ve Wy ≥ Wy_min olan cephe kesitleri, en hafif önce."""
+        sayfa_dogrula(top_k)
+        ids = np.flatnonzero((self.Wx >= Wx_min) & (self.Wy >= Wy_min))
+        if top_k is not None:
+            ids = ids[:top_k]
+        kg_m = self.kg_m[malzeme]
+        return [{
+            "Profil": self.profil[i],
+            "Tip": self.tip[i],
+            "Wx_mm3": float(self.Wx[i]),
+            "Wy_mm3": float(self.Wy[i]),
+            "kg/m": float(kg_m[i]),
+        } for i in ids.tolist()]
+
+
+# aile -> (profil, Wx, Wy, kg_m, satır sayısı): ailenin kendi cephesi, katalog sırasıyla
+_AILE_CEPHELERI = {}
+
+
+def _aile_cephesi(aile, derle):
+    from profil_core.kolonsal import aile_derle, aile_yukle
+
+    d = aile_derle(aile) if derle else aile_yukle(aile)
+    Wx = np.asarray(d["Wx_mm3"], dtype=np.float64)
+    Wy = np.asarray(d["Wy_mm3"], dtype=np.float64)
+    kg_m = np.asarray(d["kg_m"], dtype=np.float64)
+    gecerli = np.flatnonzero(np.isfinite(Wx) & np.isfinite(Wy) & np.isfinite(kg_m))
+    # Katalog sırası korunur: eş değerli satırlardan önce geleni kalır
+    ids = np.sort(gecerli[pareto_on_yuz(Wx[gecerli], Wy[gecerli], kg_m[gecerli])])
+    return d["etiket"][ids].tolist(), Wx[ids], Wy[ids], kg_m[ids], len(Wx)
+
+
+def _cephe_kur(derle, aileler=()):
+    """Aile cephelerinden katalog cephesi; aileler ve henüz hesaplanmamış
+    aileler yeniden hesaplanır."""
+    from profil_core.aileler import AILELER, KATALOG_AILELERI, KG_M_MALZEME
+
+    profil, tip, Wx, Wy, kg_m = [], [], [], [], []
+    toplam = 0
+    for aile in KATALOG_AILELERI + ["lama"]:
+        if aile in aileler or aile not in _AILE_CEPHELERI:
+            _AILE_CEPHELERI[aile] = _aile_cephesi(aile, derle)
+        p, x, y, k, n = _AILE_CEPHELERI[aile]
+        profil.extend(p)
+        tip.extend([AILELER[aile]["kisa"]] * len(p))
+        Wx.append(x)
+        Wy.append(y)
+        kg_m.append(k)
+        toplam += n
+    return ParetoCephesi(profil, tip, np.concatenate(Wx), np.concatenate(Wy),
+                         np.concatenate(kg_m), ref_malzeme=KG_M_MALZEME, katalog_boyutu=toplam)
+
+
+_CEPHE = None
+
+
+def pareto_cephesi():
+    """Süreç başına bir kez kurulan cephe (sütunsal önbellekten)."""
+    global _CEPHE
+    cephe = _CEPHE
+    if cephe is None:
+        from profil_core.katalog import katalog_kilidi
+        with katalog_kilidi():
+            if _CEPHE is None:
+                try:
+                    _CEPHE = _cephe_kur(derle=False)
+                except OSError:
+                    _AILE_CEPHELERI.clear()
+                    _CEPHE = _cephe_kur(derle=True)
+            cephe = _CEPHE
+    return cephe
+
+
+def pareto_cephesi_guncelle(aileler):
+    """Kurulu cephede yalnızca aileler cephelerini yeniden hesaplayıp yeni
+    cepheyi devreye alır (tablolar önceden değiştirilmiş olmalı); cephe
+    henüz kurulmadıysa bir şey yapılmaz."""
+    global _CEPHE
+    from profil_core.katalog import katalog_kilidi
+
+    with katalog_kilidi():
+        if _CEPHE is not None:
+            try:
+                _CEPHE = _cephe_kur(derle=False, aileler=aileler)
+            except OSError:
+                _AILE_CEPHELERI.clear()
+                _CEPHE = _cephe_kur(derle=True)
+        return _CEPHE
+
+
+def pareto_cephesi_sifirla(derle=False):
+    """Cepheyi yeniden kurar (derle=True: bellekteki tablolardan); yoksa
+    bir sonraki çağrıda kurulur."""
+    global _CEPHE
+    from profil_core.katalog import katalog_kilidi, katalog_surumu_artir
+
+    with katalog_kilidi():
+        _AILE_CEPHELERI.clear()
+        _CEPHE = _cephe_kur(derle=True) if derle else None
+        katalog_surumu_artir()
+        return _CEPHE
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Sütunlu, tipli arama sonuçları.
+
+Satır sözlüğü listelerinde st.dataframe her yeniden çalıştırmada tüm
+satırları tarayıp şemayı yeniden çıkarır. SonucTablosu aynı sonucu sabit
+bir şemayla (sütun adı, tip, gösterim biçimi) sütun dizileri olarak
+tutar: aramanın NumPy dizileri kopyalanmadan sarılır, arrow() sayısal
+sütunları kopyasız bir pyarrow tablosuna çevirir ve sayı biçimleri
+veriye değil gösterime (column_config) uygulanır.
+
+Arama fonksiyonları sutunlu=True ile bu tabloyu döndürür. Tablolar
+önbellekte paylaşıldığından diziler salt okunurdur.
+"""
+# Gösterim biçimleri (printf)
+_OLCU = "%g"
+_MODUL = "%.1f"
+
+# Şemalar: (sütun, float | str, biçim); satır sözlüklerinin anahtarlarıyla aynı sırada
+MUADIL_SEMASI = (
+    ("Profil", str, None), ("Tip", str, None),
+    ("Wx_mm3", float, _MODUL), ("Wy_mm3", float, _MODUL),
+    ("ΔWx", float, _MODUL), ("ΔWy", float, _MODUL), ("Toplam Skor", float, _MODUL),
+)
+
+LAMA_SEMASI = (
+    ("Lama", str, None), ("h (mm)", float, _OLCU), ("t (mm)", float, _OLCU),
+    ("Wx_lama (mm³)", float, _MODUL), ("Wy_lama (mm³)", float, _MODUL),
+    ("ΔWx", float, _MODUL), ("ΔWy", float, _MODUL), ("Toplam Skor", float, _MODUL),
+)
+
+T_SEMASI = (
+    ("T Profil", str, None), ("H (mm)", float, _OLCU), ("b_f (mm)", float, _OLCU),
+    ("t_f (mm)", float, _OLCU), ("h_w (mm)", float, _OLCU), ("t_w (mm)", float, _OLCU),
+    ("Wx_T (mm³)", float, _MODUL), ("Wy_T (mm³)", float, _MODUL),
+    ("ΔWx", float, _MODUL), ("ΔWy", float, _MODUL), ("Toplam Skor", float, _MODUL),
+)
+
+KAYNAKLI_SEMASI = (
+    ("Kesit", str, None), ("Topoloji", str, None), ("H (mm)", float, _OLCU),
+    ("b_f (mm)", float, _OLCU), ("t_f (mm)", float, _OLCU), ("h_w (mm)", float, _OLCU),
+    ("t_w (mm)", float, _OLCU), ("A (mm²)", float, _MODUL),
+    ("Wx (mm³)", float, _MODUL), ("Wy (mm³)", float, _MODUL),
+    ("ΔWx", float, _MODUL), ("ΔWy", float, _MODUL), ("Toplam Skor", float, _MODUL),
+)
+
+
+def sayfa_dogrula(top_k=None, offset=0):
+    """Sayfa parametreleri: top_k (None ya da ≥ 0) ve offset (≥ 0); negatif
+    değerler dilimlemede sondan sayılacağından ValueError."""
+    if top_k is not None and top_k < 0:
+        raise ValueError("top_k negatif olamaz: {}".format(top_k))
+    if offset is None or offset < 0:
+        raise ValueError("offset negatif olamaz: {}".format(offset))
+
+
+def _dizi(degerler, tip):
+    # NumPy yalnızca sütunlu sonuç istendiğinde yüklenir
+    import numpy as np
+
+    d = np.asarray(degerler, dtype=np.float64 if tip is float else str)
+    d.flags.writeable = False
+    return d
+
+
+class SonucTablosu:
+    """Sabit şemalı sonuç: sütun adı -> 1-B NumPy dizisi (float64 ya da metin).
+
+    eslesen: aramanın top_k / offset sayfalamasından önceki eşleşme sayısı
+    (verilmezse satır sayısı).
+    """
+
+    def __init__(self, sema, sutunlar, eslesen=None):
+        self.sema = tuple(sema)
+        self.sutunlar = {ad: _dizi(sutunlar[ad], tip) for ad, tip, _ in self.sema}
+        self.eslesen = len(self) if eslesen is None else eslesen
+        self._arrow = None
+
+    @classmethod
+    def satirlardan(cls, sema, satirlar, eslesen=None):
+        """Satır sözlüklerinden (şemadaki anahtarlarla) tablo."""
+        return cls(sema, {ad: [r[ad] for r in satirlar] for ad, _, _ in sema}, eslesen)
+
+    def __len__(self):
+        return len(self.sutunlar[self.sema[0][0]])
+
+    def __getitem__(self, i):
+        """Dilim -> aynı dizilerin görünümüyle tablo; tam sayı -> satır sözlüğü."""
+        if isinstance(i, slice):
+            return SonucTablosu(self.sema, {ad: d[i] for ad, d in self.sutunlar.items()},
+                                self.eslesen)
+        return {ad: d[i].item() for ad, d in self.sutunlar.items()}
+
+    def satirlar(self):
+        """Satır sözlükleri (Python sayıları), tablo sırasıyla."""
+        adlar = list(self.sutunlar)
+        return [dict(zip(adlar, r)) for r in zip(*(d.tolist() for d in self.sutunlar.values()))]
+
+    def bicimler(self):
+        """Sayısal sütun -> printf gösterim biçimi."""
+        return {ad: bicim for ad, _, bicim in self.sema if bicim}
+
+    def arrow(self):
+        """pyarrow tablosu; sayısal sütunlar NumPy belleğini paylaşır."""
+        if self._arrow is None:
+            try:
+                import pyarrow as pa  # Arrow desteği isteğe bağlı (Streamlit ile gelir)
+            except ImportError:
+                raise ValueError("Arrow tablosu için pyarrow kurulu olmalı")
+            self._arrow = pa.table({ad: pa.array(d) for ad, d in self.sutunlar.items()})
+        return self._arrow
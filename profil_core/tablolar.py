@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+import importlib
+import importlib.util
+import os
+import types
+
+_TABLOLAR = {}
+
+# aile -> okunduğu anki kaynak imzası (bkz. kaynak_imzasi); tablo_ayarla ile
+# verilen tabloların imzası yoktur, kaynakları izlenmez
+_IMZALAR = {}
+
+_YOLLAR = {}
+
+
+def kaynak_yolu(aile):
+    """tables/<aile>.py dosya yolu."""
+    try:
+        return _YOLLAR[aile]
+    except KeyError:
+        yol = _YOLLAR[aile] = importlib.util.find_spec("tables." + aile).origin
+        return yol
+
+
+def kaynak_imzasi(aile):
+    """tables/<aile>.py'nin (boyut, mtime_ns) çifti; dosya yoksa None."""
+    try:
+        st = os.stat(kaynak_yolu(aile))
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def tablo(aile):
+    """tables/<aile>.py içindeki <AILE>_TABLO listesi; ilk kullanımda yüklenir."""
+    try:
+        return _TABLOLAR[aile]
+    except KeyError:
+        pass
+    # İmza okumadan önce alınır: arada değişen dosya sonraki kontrolde
+    # yenilenir. Aile önbellekten zaten kullanılıyorsa o imza kalır;
+    # kaynak o zamandan beri değiştiyse türeyen yapılar da yenilenir.
+    imza = kaynak_imzasi(aile)
+    modul = importlib.import_module("tables." + aile)
+    _TABLOLAR[aile] = getattr(modul, aile.upper() + "_TABLO")
+    _IMZALAR.setdefault(aile, imza)
+    return _TABLOLAR[aile]
+
+
+def yuklu_aileler():
+    return sorted(_TABLOLAR)
+
+
+def tablo_ayarla(aile, satirlar, imza=None):
+    """Ailenin tablosunu verilen satırlarla değiştirir (sentetik katalog, test,
+    yeniden yükleme). imza, satırların okunduğu kaynağın imzasıdır."""
+    _TABLOLAR[aile] = satirlar
+    if imza is None:
+        _IMZALAR.pop(aile, None)
+    else:
+        _IMZALAR[aile] = imza
+
+
+def tablo_oku(aile):
+    """tables/<aile>.py'yi yeniden okur; (satırlar, imza). Tablo değiştirilmez.
+
+    Kaynak .pyc yerine doğrudan dosyadan derlenir; aynı saniyede yazılan
+    değişiklikler de görülür. Dosya hatalıysa derleme hatası yükselir.
+    """
+    ad = "tables." + aile
+    yol = kaynak_yolu(aile)
+    imza = kaynak_imzasi(aile)
+    with open(yol, "rb") as f:
+        kaynak = f.read()
+    modul = types.ModuleType(ad)
+    modul.__file__ = yol
+    modul.__package__ = "tables"
+    exec(compile(kaynak, yol, "exec"), modul.__dict__)
+    return getattr(modul, aile.upper() + "_TABLO"), imza
+
+
+def tablo_imzasi(aile):
+    """Bellekteki tablonun ya da ondan türeyen yapıların dayandığı kaynak
+    imzası; aile henüz kullanılmamışsa ya da tablo_ayarla ile imzasız
+    verilmişse None."""
+    return _IMZALAR.get(aile)
+
+
+def izlenen_imza(aile):
+    """tablo_imzasi; aile henüz kullanılmamışsa kaynağın şimdiki imzası
+    kaydedilip döner (tablo yüklenmeden sütunsal önbellekten okunan aileler
+    de böylece izlenir). Kaynak yoksa None."""
+    imza = _IMZALAR.get(aile)
+    if imza is None and aile not in _TABLOLAR:
+        imza = kaynak_imzasi(aile)
+        if imza is not None:
+            imza = _IMZALAR.setdefault(aile, imza)
+    return imza
+
+
+def degisen_aileler():
+    """İzlenen aileler içinden kaynağı kullanıldığından beri değişenler."""
+    return [aile for aile, imza in sorted(list(_IMZALAR.items())) if kaynak_imzasi(aile) != imza]
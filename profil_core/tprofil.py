@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from profil_core.sonuc import sayfa_dogrula
+
+# Kalınlık adayları (tipik sac/lamalar) – 4-30 mm
+T_ADAYLARI = [4, 5, 6, 7, 8, 9, 10, 12, 15, 20, 25, 30]
+
+
+# ---------------------------------------------------------
+# T KESIT WX – WY (VEKTOREL)
+# ---------------------------------------------------------
+def t_kesit_wx_wy(H, t_f, t_w, b_f):
+    """T kesit için Wx, Wy (mm³). Girdiler NumPy kurallarıyla yayılır.
+
+    Flanş: b_f x t_f, gövde: h_w x t_w (H = t_f + h_w).
+    """
+    h_w = H - t_f
+
+    A_f = b_f * t_f         # flanş alanı
+    A_w = t_w * h_w         # gövde alanı
+
+    # Flanş ve gövde ağırlık merkezleri (y)
+    y_f = h_w + t_f / 2.0
+    y_w = h_w / 2.0
+
+    A_toplam = A_f + A_w
+    y_bar = (A_f * y_f + A_w * y_w) / A_toplam
+
+    # Ix: x eksenine göre
+    Ix_f = b_f * t_f ** 3 / 12.0
+    Ix_w = t_w * h_w ** 3 / 12.0
+    Ix = Ix_f + A_f * (y_f - y_bar) ** 2 + Ix_w + A_w * (y_w - y_bar) ** 2
+
+    # Iy: y eksenine göre
+    Iy_f = t_f * b_f ** 3 / 12.0
+    Iy_w = h_w * t_w ** 3 / 12.0
+    Iy = Iy_f + Iy_w
+
+    # Ekstrem fiber mesafeleri
+    c_x = np.maximum(H - y_bar, y_bar)
+    c_y = b_f / 2.0
+
+    # Birimler: mm^4 -> m^4, sonra Wx,Wy -> mm^3
+    Wx_mm3 = (Ix * 1e-12) / (c_x / 1000.0) * 1e9
+    Wy_mm3 = (Iy * 1e-12) / (c_y / 1000.0) * 1e9
+    return Wx_mm3, Wy_mm3
+
+
+# ---------------------------------------------------------
+# T PROFIL IZGARA ARAMASI
+# ---------------------------------------------------------
+_ALANLAR = ("t_f", "t_w", "b_f", "h_w", "Wx", "Wy", "dWx", "dWy", "skor")
+
+
+def _bos():
+    bos = np.empty(0)
+    return {k: bos for k in _ALANLAR + ("sira",)}
+
+
+def t_profil_bloklari(Wx_target, Wy_target, H, t_list, b_list, tolerans=0.10):
+    """Izgarayı t_f başına bir blok olarak değerlendirir (üreteç).
+
+    Her blok, toleransı sağlayan adayların dizi sözlüğüdür; "sira" tüm
+    ızgaradaki (t_f, t_w, b_f) döngü sırasıdır. Bellekte aynı anda tek
+    blok (len(t_list) x len(b_list) aday) bulunur.
+    """
+    t_f = np.asarray([t for t in t_list if H - t > 0])
+    t_w = np.asarray(t_list)
+    b_f = np.asarray(b_list)
+    if t_f.size == 0 or t_w.size == 0 or b_f.size == 0:
+        return
+    TW, BF = np.meshgrid(t_w, b_f, indexing="ij")
+    TW, BF = TW.ravel(), BF.ravel()
+    taban = 0
+    for t in t_f:
+        TF = np.full(TW.shape, t)
+        Wx, Wy = t_kesit_wx_wy(H, TF, TW, BF)
+
+        dWx = np.abs(Wx - Wx_target)
+        dWy = np.abs(Wy - Wy_target)
+        maske = np.zeros(Wx.shape, dtype=bool)
+        if Wx_target > 0:
+            maske |= dWx <= tolerans * Wx_target
+        if Wy_target > 0:
+            maske |= dWy <= tolerans * Wy_target
+
+        yield {
+            "t_f": TF[maske],
+            "t_w": TW[maske],
+            "b_f": BF[maske],
+            "h_w": H - TF[maske],
+            "Wx": Wx[maske],
+            "Wy": Wy[maske],
+            "dWx": dWx[maske],
+            "dWy": dWy[maske],
+            "skor": dWx[maske] + dWy[maske],
+            "sira": taban + np.flatnonzero(maske),
+        }
+        taban += TW.size
+
+
+def _birlestir(bloklar):
+    return {k: np.concatenate([b[k] for b in bloklar]) for k in bloklar[0]}
+
+
+def _sec(blok, sira):
+    return {k: v[sira] for k, v in blok.items()}
+
+
+def en_iyiler(bloklar, top_k=None, offset=0):
+    """Dizi sözlüğü bloklarının skora (eşitlikte "sira"ya) göre sıralı
+    [offset, offset + top_k) dilimi ve tüm eşleşen aday sayısı.
+
+    top_k verilirse bloklar en fazla offset + top_k adaylık sınırlı bir
+    tampona süzülür. Dilimden "sira" çıkarılır; hiç blok yoksa None döner.
+    """
+    sayfa_dogrula(top_k, offset)
+    n = None if top_k is None else offset + top_k
+    tampon = None
+    tumu = []
+    eslesen = 0
+    for blok in bloklar:
+        eslesen += blok["skor"].size
+        if n is None:
+            tumu.append(blok)
+            continue
+        tampon = blok if tampon is None else _birlestir([tampon, blok])
+        if tampon["skor"].size > n:
+            tampon = _sec(tampon, np.lexsort((tampon["sira"], tampon["skor"]))[:n])
+    if tampon is not None:
+        tumu = [tampon]
+    if not tumu:
+        return None, eslesen
+
+    s = _birlestir(tumu) if len(tumu) > 1 else tumu[0]
+    sonuc = _sec(s, np.lexsort((s["sira"], s["skor"]))[offset:n])
+    del sonuc["sira"]
+    return sonuc, eslesen
+
+
+def t_profil_ara(Wx_target, Wy_target, H, t_list, b_list, tolerans=0.10, top_k=None, offset=0):
+    """(t_f, t_w, b_f) ızgarasında Wx veya Wy'si hedefin ±tolerans bandında
+    kalan adayları skora göre (eşitlikte t_f, t_w, b_f döngü sırasıyla)
+    sıralı dizi sözlüğü olarak döndürür: t_f, t_w, b_f, h_w, Wx, Wy, dWx,
+    dWy, skor. "eslesen" tüm eşleşen, "degerlendirilen" hesaplanan aday
+    sayısıdır.
+
+    top_k verilirse bloklar en fazla offset + top_k adaylık sınırlı bir
+    tampona süzülür ve yalnızca [offset, offset + top_k) dilimi döner.
+    """
+    sonuc, eslesen = en_iyiler(t_profil_bloklari(Wx_target, Wy_target, H, t_list, b_list,
+                                                 tolerans), top_k, offset)
+    if sonuc is None:
+        sonuc = _bos()
+        del sonuc["sira"]
+    sonuc["eslesen"] = eslesen
+    sonuc["degerlendirilen"] = sum(H - t > 0 for t in t_list) * len(t_list) * len(b_list)
+    return sonuc
+
+
+# ---------------------------------------------------------
+# BUDAMALI T ARAMASI (B_F ARALIKLARI)
+# ---------------------------------------------------------
+# Sınır karşılaştırmalarında kayan nokta payı; budama asla uygun adayı atmamalı
+_GUVENLIK = 1e-9
+
+
+def _wx_wy_sinirlari(H, TF, TW, lo, hi):
+    """b_f ∈ [lo, hi] için Wx ve Wy'nin alt/üst sınırları (mm³).
+
+    Sabit t_f, t_w için Ix ve ağırlık merkezi y_bar b_f ile artar; c_x =
+    max(H - y_bar, y_bar) uçlarda en büyük, H/2'yi geçiyorsa orada en
+    küçüktür. Wy = t_f·b²/6 + h_w·t_w³/(6b) iki monoton terimden oluşur.
+    """
+    h_w = H - TF
+    A_w = TW * h_w
+    y_f = h_w + TF / 2.0
+    y_w = h_w / 2.0
+
+    def ix_ybar(b):
+        A_f = b * TF
+        A = A_f + A_w
+        y_bar = (A_f * y_f + A_w * y_w) / A
+        Ix = (b * TF ** 3 / 12.0 + A_f * (y_f - y_bar) ** 2
+              + TW * h_w ** 3 / 12.0 + A_w * (y_w - y_bar) ** 2)
+        return Ix, y_bar
+
+    Ix_lo, y_lo = ix_ybar(lo)
+    Ix_hi, y_hi = ix_ybar(hi)
+    c_lo = np.maximum(H - y_lo, y_lo)
+    c_hi = np.maximum(H - y_hi, y_hi)
+    c_min = np.where((y_lo <= H / 2.0) & (y_hi >= H / 2.0), H / 2.0, np.minimum(c_lo, c_hi))
+    c_max = np.maximum(c_lo, c_hi)
+
+    K = h_w * TW ** 3 / 6.0
+    return (Ix_lo / c_max, Ix_hi / c_min,
+            TF * lo ** 2 / 6.0 + K / hi, TF * hi ** 2 / 6.0 + K / lo)
+
+
+def _bant_durumu(alt, ust, hedef, tolerans):
+    """[alt, ust] aralığının hedef bandıyla ilişkisi: (kesişebilir, tamamen içeride)."""
+    if not hedef > 0:
+        yok = np.zeros(alt.shape, dtype=bool)
+        return yok, yok
+    b_alt = hedef * (1.0 - tolerans)
+    b_ust = hedef * (1.0 + tolerans)
+    kesisir = (ust >= b_alt * (1.0 - _GUVENLIK)) & (alt <= b_ust * (1.0 + _GUVENLIK))
+    icinde = (alt >= b_alt * (1.0 + _GUVENLIK)) & (ust <= b_ust * (1.0 - _GUVENLIK))
+    return kesisir, icinde
+
+
+def b_f_araliklari(Wx_target, Wy_target, H, t_list, b_min, b_max, tolerans=0.10,
+                   hassasiyet=0.5, t_f_list=None):
+    """Her (t_f, t_w) çifti için Wx veya Wy bandını sağlayabilecek b_f
+    aralıklarını dal-sınır ile bulur.
+
+    [b_min, b_max] aralığı ikiye bölünerek ilerlenir: sınırları hiçbir
+    banda ulaşamayan parçalar atılır, tamamı bantta kalanlar doğrudan
+    kabul edilir, kararsız parçalar hassasiyet (mm) genişliğine inince
+    sınır parçası olarak tutulur. Hedefe ulaşamayan çiftler hiç
+    görünmez. Dönen (i_f, i_w, lo, hi) dizileri çift ve lo'ya göre
+    sıralı, bitişik parçaları birleştirilmiştir; i_f, i_w t_list
+    içindeki sıralardır (t_f için yalnızca H - t_f > 0 olanlar).
+    t_f_list verilirse flanş kalınlıkları yalnızca ondan alınır.
+    """
+    t_f = np.asarray([t for t in (t_list if t_f_list is None else t_f_list) if H - t > 0],
+                     dtype=float)
+    t_w = np.asarray(t_list, dtype=float)
+    if t_f.size == 0 or t_w.size == 0 or not b_max >= b_min:
+        bos = np.empty(0)
+        return bos.astype(int), bos.astype(int), bos, bos
+
+    IF, IW = np.meshgrid(np.arange(t_f.size), np.arange(t_w.size), indexing="ij")
+    IF, IW = IF.ravel(), IW.ravel()
+    lo = np.full(IF.shape, float(b_min))
+    hi = np.full(IF.shape, float(b_max))
+
+    sonuc = []
+    while IF.size:
+        TF, TW = t_f[IF], t_w[IW]
+        Wx_alt, Wx_ust, Wy_alt, Wy_ust = _wx_wy_sinirlari(H, TF, TW, lo, hi)
+        x_kesisir, x_icinde = _bant_durumu(Wx_alt, Wx_ust, Wx_target, tolerans)
+        y_kesisir, y_icinde = _bant_durumu(Wy_alt, Wy_ust, Wy_target, tolerans)
+
+        kabul = x_icinde | y_icinde | ((x_kesisir | y_kesisir) & (hi - lo <= hassasiyet))
+        sonuc.append((IF[kabul], IW[kabul], lo[kabul], hi[kabul]))
+
+        bol = (x_kesisir | y_kesisir) & ~kabul
+        IF, IW, lo, hi = IF[bol], IW[bol], lo[bol], hi[bol]
+        orta = (lo + hi) / 2.0
+        IF, IW = np.concatenate([IF, IF]), np.concatenate([IW, IW])
+        lo, hi = np.concatenate([lo, orta]), np.concatenate([orta, hi])
+
+    IF, IW, lo, hi = (np.concatenate(d) for d in zip(*sonuc))
+    if IF.size == 0:
+        return IF, IW, lo, hi
+    sira = np.lexsort((lo, IW, IF))
+    IF, IW, lo, hi = IF[sira], IW[sira], lo[sira], hi[sira]
+
+    # Aynı çiftte uç uca eklenen parçaları birleştir
+    yeni = np.ones(IF.shape, dtype=bool)
+    yeni[1:] = (IF[1:] != IF[:-1]) | (IW[1:] != IW[:-1]) | (lo[1:] > hi[:-1])
+    grup = np.flatnonzero(yeni)
+    son = np.append(grup[1:], IF.size) - 1
+    return IF[grup], IW[grup], lo[grup], hi[son]
+
+
+def _kok_araligi(f, lo, hi, adim=60):
+    """f(lo) ve f(hi) işaret değiştiren aralıklarda f'nin kökünü içeren
+    dar aralık (ikiye bölme); uçlarda f'nin işareti baştaki uçlarınkidir."""
+    f_lo = f(lo)
+    for _ in range(adim):
+        orta = (lo + hi) / 2.0
+        f_orta = f(orta)
+        ayni = np.signbit(f_orta) == np.signbit(f_lo)
+        lo = np.where(ayni, orta, lo)
+        f_lo = np.where(ayni, f_orta, f_lo)
+        hi = np.where(ayni, hi, orta)
+    return lo, hi
+
+
+def _kok(f, lo, hi, adim=60):
+    """f(lo) ve f(hi) işaret değiştiren aralıklarda f'nin kökü (ikiye bölme)."""
+    lo, hi = _kok_araligi(f, lo, hi, adim)
+    return (lo + hi) / 2.0
+
+
+def _surekli_adaylar(Wx_target, Wy_target, H, t_f, t_w, IF, IW, lo, hi, tolerans=0.10):
+    """Her uygun aralık için skoru en küçük uygun b_f.
+
+    Aralıktaki uygun noktalar Wx ve Wy bantlarının birleşimidir; skor en
+    küçüğü ya bir bandın ucunda ya da Wx = hedef / Wy = hedef kökündedir.
+    Adaylar aralık uçları, bu kökler ve bant uçlarını içeren dar
+    aralıkların iki ucudur. Bant ucu, kökün iki yanında |W - hedef| -
+    tolerans·hedef'in işaret değiştirdiği yerde aranır; dar aralığın bir
+    ucu bant süzgecindeki karşılaştırmayla birebir bandın içindedir.
+    Bantta olmayan adaylar seçilmez; uygun aday yoksa aralığın ilk ucu
+    döner (satır sonradan bant süzgecinde elenir).
+    """
+    TF, TW = t_f[IF], t_w[IW]
+    adaylar = [lo, hi]
+    for j, hedef in ((0, Wx_target), (1, Wy_target)):
+        if not hedef > 0:
+            continue
+
+        def fark(b, j=j, hedef=hedef):
+            return t_kesit_wx_wy(H, TF, TW, b)[j] - hedef
+
+        def bant_disi(b, j=j, hedef=hedef):
+            return np.abs(t_kesit_wx_wy(H, TF, TW, b)[j] - hedef) - tolerans * hedef
+
+        degisir = np.signbit(fark(lo)) != np.signbit(fark(hi))
+        kok = np.where(degisir, _kok(fark, lo, hi), lo)
+        adaylar.append(kok)
+        # Kökün iki yanında W hedefe göre tek yönlüdür: bant ucu en fazla bir tane
+        for a, b in ((lo, kok), (kok, hi)):
+            degisir = np.signbit(bant_disi(a)) != np.signbit(bant_disi(b))
+            u_lo, u_hi = _kok_araligi(bant_disi, a, b)
+            adaylar.append(np.where(degisir, u_lo, lo))
+            adaylar.append(np.where(degisir, u_hi, lo))
+    B = np.stack(adaylar)
+    Wx, Wy = t_kesit_wx_wy(H, TF, TW, B)
+    dWx, dWy = np.abs(Wx - Wx_target), np.abs(Wy - Wy_target)
+    uygun = np.zeros(B.shape, dtype=bool)
+    if Wx_target > 0:
+        uygun |= dWx <= tolerans * Wx_target
+    if Wy_target > 0:
+        uygun |= dWy <= tolerans * Wy_target
+    en_iyi = np.argmin(np.where(uygun, dWx + dWy, np.inf), axis=0)
+    return B[en_iyi, np.arange(IF.size)]
+
+
+def t_profil_budamali(Wx_target, Wy_target, H, t_list, b_min, b_max, genislikler=None,
+                      tolerans=0.10, top_k=None, offset=0, hassasiyet=None, t_f_list=None):
+    """t_profil_ara ile aynı sonucu, yalnızca uygun b_f aralıklarına düşen
+    genişlikleri değerlendirerek verir.
+
+    genislikler: stok sac genişlikleri (mm, artan sıralı). Aralıklar bu
+    değerlere oturtulur ve adaylar tam formülle yeniden süzülür; sonuç
+    genislikler ızgarasındaki t_profil_ara ile aynıdır. None verilirse
+    genişlik süreklidir: her uygun aralık için skoru en küçük b_f (uçlar
+    ve Wx/Wy = hedef kökleri arasından) tek satır olarak döner.
+    t_f_list verilirse flanş kalınlıkları yalnızca ondan alınır (ızgarayı
+    süreçlere bölmek için).
+    """
+    sayfa_dogrula(top_k, offset)
+    t_f = np.asarray([t for t in (t_list if t_f_list is None else t_f_list) if H - t > 0])
+    t_w = np.asarray(t_list)
+    if hassasiyet is None:
+        # Stok genişlikleri arasındaki en küçük boşluktan dar parçaları bölmeye gerek yok
+        if genislikler is None:
+            hassasiyet = 1e-3
+        elif len(genislikler) > 1:
+            hassasiyet = max(float(np.min(np.diff(genislikler))), 1e-3)
+        else:
+            hassasiyet = float(b_max) - float(b_min)
+    IF, IW, lo, hi = b_f_araliklari(Wx_target, Wy_target, H, t_list, b_min, b_max,
+                                    tolerans, hassasiyet, t_f_list)
+
+    if genislikler is None:
+        B = _surekli_adaylar(Wx_target, Wy_target, H, t_f.astype(float),
+                             t_w.astype(float), IF, IW, lo, hi, tolerans)
+        sira = np.arange(IF.size)
+    else:
+        stok = np.asarray(genislikler)
+        i0 = np.searchsorted(stok, lo, side="left")
+        i1 = np.searchsorted(stok, hi, side="right")
+        adet = i1 - i0
+        IF, IW = np.repeat(IF, adet), np.repeat(IW, adet)
+        IB = np.arange(adet.sum()) - np.repeat(np.cumsum(adet) - adet - i0, adet)
+        B = stok[IB]
+        sira = (IF * t_w.size + IW) * stok.size + IB
+
+    TF, TW = t_f[IF], t_w[IW]
+    Wx, Wy = t_kesit_wx_wy(H, TF, TW, B)
+    dWx = np.abs(Wx - Wx_target)
+    dWy = np.abs(Wy - Wy_target)
+    maske = np.zeros(Wx.shape, dtype=bool)
+    if Wx_target > 0:
+        maske |= dWx <= tolerans * Wx_target
+    if Wy_target > 0:
+        maske |= dWy <= tolerans * Wy_target
+
+    s = {
+        "t_f": TF[maske],
+        "t_w": TW[maske],
+        "b_f": B[maske],
+        "h_w": H - TF[maske],
+        "Wx": Wx[maske],
+        "Wy": Wy[maske],
+        "dWx": dWx[maske],
+        "dWy": dWy[maske],
+        "skor": dWx[maske] + dWy[maske],
+        "sira": sira[maske],
+    }
+    n = None if top_k is None else offset + top_k
+    sonuc = _sec(s, np.lexsort((s["sira"], s["skor"]))[offset:n])
+    del sonuc["sira"]
+    sonuc["eslesen"] = int(maske.sum())
+    sonuc["degerlendirilen"] = maske.size
+    return sonuc
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+from profil_core.aileler import AILELER, kesit_ozellikleri, ozellik
+from profil_core.tablolar import tablo
+
+PROFIL_TIPLERI = [
+    "Boru",
+    "Kutu Profil (RHS/SHS)",
+    "Köşebent (L Eşit)",
+    "Köşebent (L Eşit Değil)",
+    "U Profil (UPN)",
+    "I Profil (IPE)",
+    "H Profil (HEA)",
+    "H Profil (HEB)",
+    "Yuvarlak Dolu",
+    "Kare Dolu",
+    "Hollanda Profili (Bulb Flat)",
+    "Lama (Flat Bar)"
+]
+
+# Toplu girdilerde kabul edilen kısa adlar
+KISA_ADLAR = {
+    "BORU": "Boru",
+    "RHS": "Kutu Profil (RHS/SHS)",
+    "SHS": "Kutu Profil (RHS/SHS)",
+    "L": "Köşebent (L Eşit)",
+    "L_ESIT": "Köşebent (L Eşit)",
+    "L_ESIT_DEGIL": "Köşebent (L Eşit Değil)",
+    "UPN": "U Profil (UPN)",
+    "IPE": "I Profil (IPE)",
+    "HEA": "H Profil (HEA)",
+    "HEB": "H Profil (HEB)",
+    "YUVARLAK": "Yuvarlak Dolu",
+    "KARE": "Kare Dolu",
+    "BULB": "Hollanda Profili (Bulb Flat)",
+    "BF": "Hollanda Profili (Bulb Flat)",
+    "LAMA": "Lama (Flat Bar)",
+}
+
+# Profil tipi -> tables/ ailesi (PROFIL_TIPLERI sırasıyla)
+TIP_AILELERI = {tip: aile for tip in PROFIL_TIPLERI
+                for aile, k in AILELER.items() if k["tip"] == tip}
+
+
+def profil_tipi_coz(tip):
+    """Arayüz adı veya kısa addan profil tipini döndürür."""
+    if tip in PROFIL_TIPLERI:
+        return tip
+    kisa = str(tip).strip().upper().replace(" ", "_")
+    if kisa in KISA_ADLAR:
+        return KISA_ADLAR[kisa]
+    raise ValueError("Bilinmeyen profil tipi: {}".format(tip))
+
+
+# ---------------------------------------------------------
+# UYE KESIT BILGILERI (ARAYUZLE AYNI KAYIT)
+# ---------------------------------------------------------
+def uye_kesit(tip, profil=None, DN=None, SCH=None, h_mm=None, t_mm=None):
+    """Bir üyenin kesit alanı (m²), Wx, Wy (mm³), muadil aramalarında
+    kullanılan H_max ve T kalınlık aralığı (t_min, t_max).
+
+    profil: tablo adı (ör. "IPE 100"); boru için DN + SCH,
+    lama için h_mm + t_mm verilir. Katalog satırlarının değerleri
+    aileler.ozellik ile önceden hesaplanmış tablodan okunur.
+    """
+    tip = profil_tipi_coz(tip)
+    aile = TIP_AILELERI[tip]
+
+    if aile == "boru":
+        sch = str(SCH).strip().upper()
+        sec = [r for r in tablo("boru") if r["DN"] == DN and str(r["SCH"]).upper() == sch]
+        if not sec:
+            raise ValueError("Tabloda bulunamadı: DN {} SCH {}".format(DN, SCH))
+        o = ozellik("boru", AILELER["boru"]["etiket"](sec[0]))
+    elif aile == "lama":
+        if not h_mm or not t_mm or h_mm <= 0 or t_mm <= 0:
+            raise ValueError("Lama için h_mm ve t_mm gerekli")
+        o = kesit_ozellikleri("lama", {"profil": "", "h": h_mm, "t": t_mm})
+    else:
+        o = ozellik(aile, profil)
+
+    return {"tip": tip, "A_m2": o["A_m2"], "Wx": o["Wx_mm3"], "Wy": o["Wy_mm3"],
+            "H_max": o["H_max"], "t_min": o["t_min"], "t_max": o["t_max"]}
@@ -0,0 +1,427 @@
+# -*- coding: utf-8 -*-
+"""Hesap çekirdeği için yerel JSON/HTTP servisi (ERP / CAD entegrasyonu).
+
+Yalnızca standart kütüphane (asyncio) kullanır ve localhost'a bağlanır.
+Uç noktalar (POST, gövde JSON):
+    /agirlik   üye (tip, profil | DN + SCH | h_mm + t_mm), metraj_mm, malzeme
+    /kesit     üye -> A, Wx, Wy, H_max, t_min, t_max
+    /muadil    Wx + Wy veya üye; tolerans, top_k, offset
+    /lama      Wx + Wy + h_mm veya üye; top_k, offset
+    /t_profil  Wx + Wy + H_mm + t_min_mm + t_max_mm veya üye; b_adim, top_k, offset
+    /kesim     üye, boylar (mm listesi), stok_boylari, kerf_mm, malzeme
+    /toplu     {"istekler": [{"yol": "/muadil", "govde": {...}}, ...]}
+GET /saglik ve /onbellek durum bilgisi verir.
+
+Ağır aramalar süreç havuzunda çalışır; olay döngüsü yalnızca G/Ç yapar.
+Yanıtlar (yol, katalog sürümü, kanonik gövde) anahtarıyla önbelleğe
+alınır ve aynı anda gelen eş istekler tek hesapta birleştirilir.
+
+tables/*.py değişince katalog çalışırken yenilenir (profil_core.izleyici):
+işçiler her istekten önce kaynakları denetler, ana süreç izleme
+aralığında bir sürümü artırır; önbellekteki eski yanıtlar en geç bu
+aralık kadar döner.
+
+Örnek:
+    python profil_servis.py --port 8765 --isci 4
+    curl -s localhost:8765/muadil -d '{"tip": "IPE", "profil": "IPE 200"}'
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from profil_core.aileler import AILELER
+from profil_core.izleyici import izlemeyi_baslat, katalogu_yenile, yenileme_hatalari
+from profil_core.katalog import katalog_surumu
+from profil_core.kesim import kesim_plani
+from profil_core.kesit import MALZEMELER, agirlik_hesap
+from profil_core.muadil import muadil_liste_10yuzde, lama_muadil_wx_wy, t_profil_wx_wy
+from profil_core.onbellek import ONBELLEKLER, LRUOnbellek, onbellek_istatistikleri
+from profil_core.sonuc import sayfa_dogrula
+from profil_core.tablolar import tablo
+from profil_core.uye import uye_kesit
+
+YEREL_ADRESLER = ("127.0.0.1", "localhost", "::1")
+MAKS_GOVDE = 4 * 1024 * 1024
+MAKS_TOPLU = 1000
+VARSAYILAN_TOP_K = 50
+
+DURUM_METINLERI = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 500: "Internal Server Error",
+}
+
+
+class IstekHatasi(Exception):
+    """İstemciye HTTP durum koduyla dönecek hata."""
+
+    def __init__(self, durum, mesaj):
+        super().__init__(mesaj)
+        self.durum = durum
+
+
+# ---------------------------------------------------------
+# GOVDE COZUMLEME
+# ---------------------------------------------------------
+def _sayi(govde, ad, tip=float, varsayilan=None):
+    deger = govde.get(ad)
+    if deger is None or deger == "":
+        if varsayilan is None:
+            raise ValueError("Eksik alan: {}".format(ad))
+        return varsayilan
+    if isinstance(deger, str):
+        deger = deger.replace(",", ".")
+    deger = float(deger)
+    if tip is int:
+        # 2.7 gibi değerler sessizce kırpılmaz
+        if not deger.is_integer():
+            raise ValueError("'{}' tam sayı olmalı: {:g}".format(ad, deger))
+        return int(deger)
+    return tip(deger)
+
+
+def _secimli(govde, ad, tip=float):
+    return _sayi(govde, ad, tip) if govde.get(ad) not in (None, "") else None
+
+
+def _uye(govde):
+    return uye_kesit(
+        govde.get("tip"),
+        profil=govde.get("profil") or None,
+        DN=_secimli(govde, "DN", int),
+        SCH=govde.get("SCH"),
+        h_mm=_secimli(govde, "h_mm"),
+        t_mm=_secimli(govde, "t_mm"),
+    )
+
+
+def _hedef(govde):
+    """Gövdede Wx/Wy varsa onlar, yoksa üyenin kesiti (kesit sözlüğü ya da None)."""
+    if "Wx" in govde or "Wy" in govde:
+        return _sayi(govde, "Wx"), _sayi(govde, "Wy"), None
+    kesit = _uye(govde)
+    return kesit["Wx"], kesit["Wy"], kesit
+
+
+def _sayfa_parametreleri(govde):
+    top_k = _sayi(govde, "top_k", int, VARSAYILAN_TOP_K)
+    offset = _sayi(govde, "offset", int, 0)
+    sayfa_dogrula(top_k, offset)
+    return top_k, offset
+
+
+# ---------------------------------------------------------
+# UC NOKTALAR
+# ---------------------------------------------------------
+def _malzeme(govde):
+    malzeme = govde.get("malzeme") or "Çelik"
+    if malzeme not in MALZEMELER:
+        raise ValueError("Bilinmeyen malzeme: {}".format(malzeme))
+    return malzeme, MALZEMELER[malzeme]
+
+
+def agirlik(govde):
+    kesit = _uye(govde)
+    metraj_mm = _sayi(govde, "metraj_mm", varsayilan=0.0)
+    malzeme, rho = _malzeme(govde)
+    return {
+        "tip": kesit["tip"],
+        "malzeme": malzeme,
+        "metraj_mm": metraj_mm,
+        "A_mm2": kesit["A_m2"] * 1e6,
+        "kg_m": agirlik_hesap(kesit["A_m2"], 1.0, rho),
+        "agirlik_kg": agirlik_hesap(kesit["A_m2"], metraj_mm / 1000.0, rho),
+    }
+
+
+def kesit(govde):
+    k = _uye(govde)
+    return {
+        "tip": k["tip"],
+        "A_mm2": k["A_m2"] * 1e6,
+        "Wx_mm3": k["Wx"],
+        "Wy_mm3": k["Wy"],
+        "H_max_mm": k["H_max"],
+        "t_min_mm": k["t_min"],
+        "t_max_mm": k["t_max"],
+    }
+
+
+def muadil(govde):
+    Wx, Wy, _ = _hedef(govde)
+    top_k, offset = _sayfa_parametreleri(govde)
+    tolerans = _sayi(govde, "tolerans", varsayilan=0.10)
+    return {"Wx_mm3": Wx, "Wy_mm3": Wy,
+            "sonuc": muadil_liste_10yuzde(Wx, Wy, tolerans, top_k=top_k, offset=offset)}
+
+
+def lama(govde):
+    Wx, Wy, k = _hedef(govde)
+    h_mm = _sayi(govde, "h_mm") if k is None else k["H_max"]
+    top_k, offset = _sayfa_parametreleri(govde)
+    return {"Wx_mm3": Wx, "Wy_mm3": Wy, "h_mm": h_mm,
+            "sonuc": lama_muadil_wx_wy(Wx, Wy, h_mm, top_k=top_k, offset=offset)}
+
+
+def t_profil(govde):
+    Wx, Wy, k = _hedef(govde)
+    if k is None:
+        H = _sayi(govde, "H_mm")
+        t_min = _sayi(govde, "t_min_mm")
+        t_max = _sayi(govde, "t_max_mm")
+    else:
+        H, t_min, t_max = k["H_max"], k["t_min"], k["t_max"]
+    top_k, offset = _sayfa_parametreleri(govde)
+    # "b_adim": null -> sürekli flanş genişliği
+    b_adim = None if govde.get("b_adim", 10) is None else _sayi(govde, "b_adim", int, 10)
+    return {"Wx_mm3": Wx, "Wy_mm3": Wy, "H_mm": H,
+            "sonuc": t_profil_wx_wy(Wx, Wy, H, t_min, t_max, b_adim=b_adim,
+                                    top_k=top_k, offset=offset)}
+
+
+def kesim(govde):
+    k = _uye(govde)
+    malzeme, rho = _malzeme(govde)
+    boylar = govde.get("boylar")
+    if not isinstance(boylar, list):
+        raise ValueError("'boylar' listesi bekleniyor")
+    plan = kesim_plani(boylar, govde.get("stok_boylari") or (6000.0, 12000.0),
+                       _sayi(govde, "kerf_mm", varsayilan=3.0), k["A_m2"], rho)
+    # JSON nesne anahtarları metin olmalı
+    plan["stok_adetleri"] = {"{:g}".format(s): n for s, n in plan["stok_adetleri"].items()}
+    plan.update(tip=k["tip"], malzeme=malzeme)
+    return plan
+
+
+# Yol -> (fonksiyon, ağır mı); ağır olanlar süreç havuzunda çalışır
+UC_NOKTALAR = {
+    "/agirlik": (agirlik, False),
+    "/kesit": (kesit, False),
+    "/muadil": (muadil, True),
+    "/lama": (lama, True),
+    "/t_profil": (t_profil, True),
+    "/kesim": (kesim, True),
+}
+
+
+def _json_varsayilan(deger):
+    # NumPy skalerleri
+    if hasattr(deger, "item"):
+        return deger.item()
+    raise TypeError("JSON'a çevrilemiyor: {!r}".format(type(deger)))
+
+
+def _kodla(nesne):
+    return json.dumps(nesne, ensure_ascii=False, default=_json_varsayilan).encode("utf-8")
+
+
+def uc_nokta_calistir(yol, govde):
+    """Süreç havuzunda çalışan giriş noktası: (durum, JSON baytları)."""
+    fonk, _ = UC_NOKTALAR[yol]
+    # Değişen tablolar bu süreçte yenilenir (değişiklik yoksa yalnızca stat)
+    katalogu_yenile()
+    try:
+        return 200, _kodla(fonk(govde))
+    except (ValueError, TypeError, KeyError) as e:
+        return 400, _kodla({"hata": str(e)})
+
+
+# ---------------------------------------------------------
+# SERVIS
+# ---------------------------------------------------------
+class ProfilServisi:
+    """asyncio üzerinde HTTP/1.1 (keep-alive) JSON servisi."""
+
+    def __init__(self, isci=None, onbellek_boyutu=4096, ttl=3600):
+        self.isci = isci or os.cpu_count() or 1
+        # Anahtar (yol, kanonik gövde); değer kodlanmış (durum, JSON) yanıtı
+        self.onbellek = LRUOnbellek(uc_nokta_calistir, onbellek_boyutu, ttl)
+        ONBELLEKLER[uc_nokta_calistir.__name__] = self.onbellek
+        self._havuz = None
+        self._hafif = None
+        self._ucusta = {}
+
+    def baslat(self):
+        # Sürüm tüm aileler için artsın diye ana süreç her tabloyu izler
+        for aile in AILELER:
+            tablo(aile)
+        izlemeyi_baslat()
+        self._havuz = ProcessPoolExecutor(max_workers=self.isci)
+        self._hafif = ThreadPoolExecutor(max_workers=4)
+
+    def kapat(self):
+        for h in (self._havuz, self._hafif):
+            if h is not None:
+                h.shutdown(cancel_futures=True)
+        self._havuz = self._hafif = None
+
+    async def _hesapla(self, yol, govde):
+        loop = asyncio.get_running_loop()
+        if not UC_NOKTALAR[yol][1]:
+            return await loop.run_in_executor(self._hafif, uc_nokta_calistir, yol, govde)
+        try:
+            return await loop.run_in_executor(self._havuz, uc_nokta_calistir, yol, govde)
+        except BrokenProcessPool:
+            # Bir işçi öldüyse havuz kullanılamaz; yenisi kurulup bir kez denenir
+            eski, self._havuz = self._havuz, ProcessPoolExecutor(max_workers=self.isci)
+            eski.shutdown(wait=False, cancel_futures=True)
+            return await loop.run_in_executor(self._havuz, uc_nokta_calistir, yol, govde)
+
+    async def yanitla(self, yol, govde):
+        """Tek bir uç nokta isteği: önbellek -> uçuştaki eş istek -> hesap."""
+        if yol not in UC_NOKTALAR:
+            raise IstekHatasi(404, "Bilinmeyen uç nokta: {}".format(yol))
+        if not isinstance(govde, dict):
+            raise IstekHatasi(400, "Gövde bir JSON nesnesi olmalı")
+        anahtar = (yol, katalog_surumu(), json.dumps(govde, sort_keys=True, ensure_ascii=False))
+        bulundu, yanit = self.onbellek.getir(anahtar)
+        if bulundu:
+            return yanit
+
+        gorev = self._ucusta.get(anahtar)
+        if gorev is None:
+            gorev = asyncio.ensure_future(self._hesapla(yol, govde))
+            self._ucusta[anahtar] = gorev
+            try:
+                yanit = await gorev
+            finally:
+                del self._ucusta[anahtar]
+            # Yalnızca başarılı yanıtlar önbelleğe alınır; hatalı istekler onu doldurmasın
+            if yanit[0] == 200:
+                self.onbellek.koy(anahtar, yanit)
+            return yanit
+        return await asyncio.shield(gorev)
+
+    async def toplu(self, govde):
+        istekler = govde.get("istekler") if isinstance(govde, dict) else None
+        if not isinstance(istekler, list):
+            raise IstekHatasi(400, "'istekler' listesi bekleniyor")
+        if len(istekler) > MAKS_TOPLU:
+            raise IstekHatasi(413, "Toplu istekte en fazla {} kalem olabilir".format(MAKS_TOPLU))
+
+        async def tek(istek):
+            try:
+                if not isinstance(istek, dict):
+                    raise IstekHatasi(400, "Her kalem bir JSON nesnesi olmalı")
+                return await self.yanitla(istek.get("yol"), istek.get("govde") or {})
+            except IstekHatasi as e:
+                return e.durum, _kodla({"hata": str(e)})
+
+        yanitlar = await asyncio.gather(*(tek(i) for i in istekler))
+        # Kalem gövdeleri zaten kodlanmış JSON; yeniden çözmeden birleştirilir
+        parcalar = [b'{"durum": %d, "govde": %s}' % (d, g) for d, g in yanitlar]
+        return 200, b'{"yanitlar": [' + b", ".join(parcalar) + b"]}"
+
+    async def isle(self, yontem, yol, govde_bayt):
+        yol = yol.split("?", 1)[0].rstrip("/") or "/"
+        if yontem == "GET":
+            if yol == "/saglik":
+                return 200, _kodla({"durum": "hazir", "isci": self.isci,
+                                    "uc_noktalar": sorted(UC_NOKTALAR) + ["/toplu"],
+                                    "katalog_surumu": katalog_surumu(),
+                                    "katalog_hatalari": yenileme_hatalari()})
+            if yol == "/onbellek":
+                return 200, _kodla(onbellek_istatistikleri())
+            if yol in UC_NOKTALAR or yol == "/toplu":
+                raise IstekHatasi(405, "Bu uç nokta POST bekler")
+            raise IstekHatasi(404, "Bilinmeyen uç nokta: {}".format(yol))
+        if yontem != "POST":
+            raise IstekHatasi(405, "Desteklenmeyen yöntem: {}".format(yontem))
+
+        try:
+            govde = json.loads(govde_bayt or b"{}")
+        except ValueError as e:
+            raise IstekHatasi(400, "Geçersiz JSON: {}".format(e))
+        if yol == "/toplu":
+            return await self.toplu(govde)
+        return await self.yanitla(yol, govde)
+
+    # -----------------------------------------------------
+    # HTTP/1.1
+    # -----------------------------------------------------
+    async def baglanti(self, okuyucu, yazici):
+        try:
+            while True:
+                try:
+                    baslik = await okuyucu.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                satirlar = baslik.decode("latin-1").split("\r\n")
+                try:
+                    yontem, yol, surum = satirlar[0].split(" ", 2)
+                except ValueError:
+                    return
+                basliklar = {}
+                for s in satirlar[1:]:
+                    if ":" in s:
+                        ad, deger = s.split(":", 1)
+                        basliklar[ad.strip().lower()] = deger.strip()
+                acik_kalsin = (surum == "HTTP/1.1"
+                               and basliklar.get("connection", "").lower() != "close")
+
+                try:
+                    uzunluk = int(basliklar.get("content-length", 0))
+                    if uzunluk > MAKS_GOVDE:
+                        acik_kalsin = False
+                        raise IstekHatasi(413, "Gövde en fazla {} bayt olabilir".format(MAKS_GOVDE))
+                    govde = await okuyucu.readexactly(uzunluk) if uzunluk > 0 else b""
+                    durum, yanit = await self.isle(yontem.upper(), yol, govde)
+                except IstekHatasi as e:
+                    durum, yanit = e.durum, _kodla({"hata": str(e)})
+                except asyncio.IncompleteReadError:
+                    return
+                except Exception as e:  # servis ayakta kalmalı
+                    durum, yanit = 500, _kodla({"hata": "{}: {}".format(type(e).__name__, e)})
+
+                yazici.write(
+                    "HTTP/1.1 {} {}\r\nContent-Type: application/json; charset=utf-8\r\n"
+                    "Content-Length: {}\r\nConnection: {}\r\n\r\n".format(
+                        durum, DURUM_METINLERI.get(durum, ""), len(yanit),
+                        "keep-alive" if acik_kalsin else "close").encode("latin-1") + yanit)
+                await yazici.drain()
+                if not acik_kalsin:
+                    return
+        finally:
+            yazici.close()
+
+    async def calistir(self, host="127.0.0.1", port=8765, hazir=None):
+        self.baslat()
+        try:
+            sunucu = await asyncio.start_server(self.baglanti, host, port, limit=64 * 1024)
+            async with sunucu:
+                if hazir is not None:
+                    hazir(sunucu)
+                await sunucu.serve_forever()
+        finally:
+            self.kapat()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Profil hesap çekirdeği için yerel JSON servisi")
+    ap.add_argument("--host", default="127.0.0.1", help="yalnızca yerel adresler: " + ", ".join(YEREL_ADRESLER))
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--isci", type=int, default=None, help="arama süreç sayısı (varsayılan: çekirdek sayısı)")
+    ap.add_argument("--onbellek", type=int, default=4096, help="önbellekte tutulacak yanıt sayısı")
+    args = ap.parse_args(argv)
+    if args.host not in YEREL_ADRESLER:
+        ap.error("servis yalnızca localhost'a bağlanır")
+
+    servis = ProfilServisi(isci=args.isci, onbellek_boyutu=args.onbellek)
+
+    def hazir(sunucu):
+        adres = sunucu.sockets[0].getsockname()
+        print("Profil servisi http://{}:{} ({} işçi)".format(adres[0], adres[1], servis.isci),
+              file=sys.stderr)
+
+    try:
+        asyncio.run(servis.calistir(args.host, args.port, hazir))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
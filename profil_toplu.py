@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""Toplu (arayüzsüz) ağırlık ve muadil hesabı.
+
+Girdi CSV veya JSONL; her satır bir üye:
+    tip, profil | DN + SCH | h_mm + t_mm, metraj_mm, malzeme
+
+Örnek:
+    python profil_toplu.py uyeler.csv sonuc.jsonl --isci 8 --parca 500
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from profil_core.disa_aktar import PARCA, disa_aktar, satir_bloklari
+from profil_core.kesit import MALZEMELER, agirlik_hesap
+from profil_core.muadil import muadil_liste_10yuzde, lama_muadil_wx_wy, t_profil_wx_wy
+from profil_core.uye import uye_kesit
+
+CSV_ALANLARI = [
+    "satir", "tip", "profil", "metraj_mm", "malzeme", "A_mm2", "agirlik_kg",
+    "Wx_mm3", "Wy_mm3", "muadil_sayisi", "en_iyi_muadil",
+    "lama_sayisi", "en_iyi_lama", "t_sayisi", "en_iyi_t", "hata",
+]
+
+# Parquet / XLSX sütun tipleri (CSV_ALANLARI sırasıyla)
+_SAYI_ALANLARI = {
+    "satir": int, "metraj_mm": float, "A_mm2": float, "agirlik_kg": float,
+    "Wx_mm3": float, "Wy_mm3": float, "muadil_sayisi": int, "lama_sayisi": int,
+    "t_sayisi": int,
+}
+SONUC_SEMASI = [(a, _SAYI_ALANLARI.get(a, str)) for a in CSV_ALANLARI]
+
+
+# ---------------------------------------------------------
+# GIRDI OKUMA (AKIS HALINDE)
+# ---------------------------------------------------------
+def _sayi(deger, tip=float):
+    if deger is None or deger == "":
+        return None
+    if isinstance(deger, str):
+        deger = deger.replace(",", ".")
+    deger = float(deger)
+    if tip is int:
+        # DN 50.5 sessizce DN 50'ye kırpılıp yanlış boruyla eşleşmemeli
+        if not deger.is_integer():
+            raise ValueError("Tam sayı bekleniyor: {:g}".format(deger))
+        return int(deger)
+    return tip(deger)
+
+
+class OkunamayanUye:
+    """uyeleri_oku'nun çözülemeyen ya da nesne olmayan JSONL satırı yerine
+    ürettiği işaret; uye_hesapla bunu hatalı satıra çevirir."""
+
+    def __init__(self, hata):
+        self.hata = hata
+
+
+def uyeleri_oku(yol, ayirici=","):
+    """Girdi dosyasındaki üyeleri satır satır üretir (dosya belleğe alınmaz).
+
+    Bozuk JSONL satırları toplu hesabı durdurmaz; yerlerine OkunamayanUye
+    üretilir.
+    """
+    with open(yol, encoding="utf-8-sig", newline="") as f:
+        if yol.lower().endswith((".jsonl", ".ndjson")):
+            for satir in f:
+                if not satir.strip():
+                    continue
+                try:
+                    uye = json.loads(satir)
+                except ValueError as e:
+                    yield OkunamayanUye("Geçersiz JSON: {}".format(e))
+                    continue
+                if not isinstance(uye, dict):
+                    yield OkunamayanUye("Üye bir JSON nesnesi olmalı")
+                    continue
+                yield uye
+        else:
+            for satir in csv.DictReader(f, delimiter=ayirici):
+                yield satir
+
+
+# ---------------------------------------------------------
+# TEK UYE HESABI
+# ---------------------------------------------------------
+def uye_hesapla(no, uye, top_k=5, aramalar=True):
+    """Bir üye için ağırlık, Wx/Wy ve (istenirse) muadil listeleri."""
+    if not isinstance(uye, dict):
+        hata = uye.hata if isinstance(uye, OkunamayanUye) else "Üye bir JSON nesnesi olmalı"
+        return {"satir": no, "hata": hata}
+    sonuc = {"satir": no, "tip": uye.get("tip"), "profil": uye.get("profil")}
+    try:
+        kesit = uye_kesit(
+            uye.get("tip"),
+            profil=uye.get("profil") or None,
+            DN=_sayi(uye.get("DN"), int),
+            SCH=uye.get("SCH"),
+            h_mm=_sayi(uye.get("h_mm")),
+            t_mm=_sayi(uye.get("t_mm")),
+        )
+        metraj_mm = _sayi(uye.get("metraj_mm")) or 0.0
+        malzeme = uye.get("malzeme") or "Çelik"
+        if malzeme not in MALZEMELER:
+            raise ValueError("Bilinmeyen malzeme: {}".format(malzeme))
+
+        Wx, Wy = kesit["Wx"], kesit["Wy"]
+        sonuc.update({
+            "tip": kesit["tip"],
+            "metraj_mm": metraj_mm,
+            "malzeme": malzeme,
+            "A_mm2": kesit["A_m2"] * 1e6,
+            "agirlik_kg": agirlik_hesap(kesit["A_m2"], metraj_mm / 1000.0, MALZEMELER[malzeme]),
+            "Wx_mm3": Wx,
+            "Wy_mm3": Wy,
+        })
+        if aramalar:
+            # Aramalar top_k ile sınırlı; *_sayisi aramanın saydığı tüm eşleşmelerdir
+            tablolar = {
+                "muadil": muadil_liste_10yuzde(Wx, Wy, top_k=top_k, sutunlu=True),
+                "lama": lama_muadil_wx_wy(Wx, Wy, kesit["H_max"], top_k=top_k, sutunlu=True),
+                "t": t_profil_wx_wy(Wx, Wy, kesit["H_max"], kesit["t_min"], kesit["t_max"],
+                                    top_k=top_k, sutunlu=True),
+            }
+            for ad, tablo in tablolar.items():
+                sonuc[ad + "_sayisi"] = tablo.eslesen
+                sonuc[ad] = tablo.satirlar()
+    except (ValueError, TypeError, KeyError) as e:
+        sonuc["hata"] = str(e)
+    return sonuc
+
+
+def _parca_hesapla(parca, top_k, aramalar):
+    return [uye_hesapla(no, uye, top_k, aramalar) for no, uye in parca]
+
+
+# ---------------------------------------------------------
+# PARALEL AKIS
+# ---------------------------------------------------------
+def _parcalar(uyeler, boyut):
+    it = enumerate(uyeler, 1)
+    while True:
+        parca = list(islice(it, boyut))
+        if not parca:
+            return
+        yield parca
+
+
+def toplu_hesapla(uyeler, isci=None, parca=500, top_k=5, aramalar=True):
+    """Üyeleri parçalara bölüp süreç havuzunda hesaplar; sonuçları girdi
+    sırasıyla üretir. Aynı anda en fazla 2 x isci parça bellekte tutulur."""
+    isci = isci or os.cpu_count() or 1
+    if isci == 1:
+        for p in _parcalar(uyeler, parca):
+            yield from _parca_hesapla(p, top_k, aramalar)
+        return
+
+    with ProcessPoolExecutor(max_workers=isci) as havuz:
+        bekleyen = []
+        for p in _parcalar(uyeler, parca):
+            bekleyen.append(havuz.submit(_parca_hesapla, p, top_k, aramalar))
+            if len(bekleyen) >= 2 * isci:
+                yield from bekleyen.pop(0).result()
+        for f in bekleyen:
+            yield from f.result()
+
+
+# ---------------------------------------------------------
+# CIKTI YAZMA
+# ---------------------------------------------------------
+def _ilk_ad(liste, anahtar):
+    return liste[0][anahtar] if liste else ""
+
+
+def _csv_satiri(s):
+    satir = {k: s.get(k, "") for k in CSV_ALANLARI}
+    if "muadil" in s:
+        satir["en_iyi_muadil"] = _ilk_ad(s["muadil"], "Profil")
+        satir["en_iyi_lama"] = _ilk_ad(s["lama"], "Lama")
+        satir["en_iyi_t"] = _ilk_ad(s["t"], "T Profil")
+    return satir
+
+
+def _tipli_satir(s):
+    """_csv_satiri; boş ya da sayıya çevrilemeyen sayısal alanlar None."""
+    satir = _csv_satiri(s)
+    for a, tip in _SAYI_ALANLARI.items():
+        try:
+            satir[a] = tip(satir[a])
+        except (TypeError, ValueError):
+            satir[a] = None
+    return satir
+
+
+def sonuclari_yaz(sonuclar, yol, parca=PARCA):
+    """Sonuçları geldikçe yazar. .csv / .parquet / .xlsx özet satırları,
+    diğerleri JSONL. Parquet ve XLSX parca satırlık bloklarla yazılır."""
+    n = hata = 0
+    if yol.lower().endswith((".parquet", ".pq", ".xlsx")):
+        sayac = [0, 0]
+
+        def satirlar():
+            for s in sonuclar:
+                sayac[0] += 1
+                sayac[1] += "hata" in s
+                yield _tipli_satir(s)
+
+        disa_aktar(satir_bloklari(satirlar(), parca), yol, sema=SONUC_SEMASI)
+        return tuple(sayac)
+    with open(yol, "w", encoding="utf-8", newline="") as f:
+        if yol.lower().endswith(".csv"):
+            yazici = csv.DictWriter(f, fieldnames=CSV_ALANLARI)
+            yazici.writeheader()
+            for s in sonuclar:
+                yazici.writerow(_csv_satiri(s))
+                n += 1
+                hata += "hata" in s
+        else:
+            for s in sonuclar:
+                f.write(json.dumps(s, ensure_ascii=False) + "\n")
+                n += 1
+                hata += "hata" in s
+    return n, hata
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Toplu profil ağırlık ve muadil hesabı")
+    ap.add_argument("girdi", help="üye listesi (.csv veya .jsonl)")
+    ap.add_argument("cikti", help="sonuç dosyası (.jsonl, .csv, .parquet veya .xlsx)")
+    ap.add_argument("--isci", type=int, default=None, help="süreç sayısı (varsayılan: çekirdek sayısı)")
+    ap.add_argument("--parca", type=int, default=500, help="parça başına üye sayısı")
+    ap.add_argument("--top-k", type=int, default=5, help="her aramadan tutulacak sonuç sayısı (*_sayisi sütunları kesilmemiş sayıdır)")
+    ap.add_argument("--sadece-agirlik", action="store_true", help="muadil aramalarını atla")
+    ap.add_argument("--ayirici", default=",", help="CSV ayırıcı karakteri")
+    args = ap.parse_args(argv)
+
+    sonuclar = toplu_hesapla(uyeleri_oku(args.girdi, args.ayirici), isci=args.isci,
+                             parca=args.parca, top_k=args.top_k,
+                             aramalar=not args.sadece_agirlik)
+    n, hata = sonuclari_yaz(sonuclar, args.cikti)
+    print("{} üye işlendi, {} hatalı.".format(n, hata), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+
+# -*- coding: utf-8 -*-
+# Stok lama ölçüleri (sıcak haddelenmiş, EN 10058 tipik seri)
+_H = [20, 25, 30, 35, 40, 45, 50, 60, 70, 80, 90, 100, 110, 120, 140, 150, 160, 180, 200]
+_T = [3, 4, 5, 6, 8, 10, 12, 15, 20, 25, 30]
+
+LAMA_TABLO = [
+    {"profil": "{}x{}".format(h, t), "h": float(h), "t": float(t)}
+    for h in _H for t in _T if t < h
+]
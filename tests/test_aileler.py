@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""Aile kaydı: kesit_ozellikleri, kayıttan önceki aile başına dallarla
+(alan, Wx/Wy, H_max, t_min, t_max) ve elle yazılmış skaler Ix/Iy
+formülleriyle aynı olmalı; katalog değerleri formülün önüne geçmeli."""
+import math
+
+import pytest
+
+from profil_core.aileler import AILELER, kesit_ozellikleri, ozellik_satirlari
+from profil_core.kesit import (
+    MALZEMELER, agirlik_hesap,
+    alan_boru, alan_rhs, alan_L, alan_I, alan_round, alan_square, alan_bulb, alan_lama,
+    wx_wy_boru, wx_wy_rhs, wx_wy_L, wx_wy_ipe, wx_wy_hea, wx_wy_heb,
+    wx_wy_upn, wx_wy_round, wx_wy_square, wx_wy_bulb, wx_wy_flatbar,
+)
+
+
+# Kayıttan önceki arayüz dalları: aile -> satır -> (A_m2, (Wx, Wy), H_max, t_min, t_max)
+ESKI_DALLAR = {
+    "boru": lambda g: (alan_boru(g), wx_wy_boru(g), g["OD"], g["t"], 2 * g["t"]),
+    "rhs": lambda g: (alan_rhs(g), wx_wy_rhs(g), max(g["A"], g["B"]), g["t"], 2 * g["t"]),
+    "l_equal": lambda g: (alan_L(g), wx_wy_L(g), max(g["a"], g["b"]), g["t"], 2 * g["t"]),
+    "l_unequal": lambda g: (alan_L(g), wx_wy_L(g), max(g["a"], g["b"]), g["t"], 2 * g["t"]),
+    "ipe": lambda g: (alan_I(g), wx_wy_ipe(g), g["h"], g["tw"], 2 * g["tw"]),
+    "hea": lambda g: (alan_I(g), wx_wy_hea(g), g["h"], g["tw"], 2 * g["tw"]),
+    "heb": lambda g: (alan_I(g), wx_wy_heb(g), g["h"], g["tw"], 2 * g["tw"]),
+    "upn": lambda g: (alan_I(g), wx_wy_upn(g), g["h"], g["tw"], 2 * g["tw"]),
+    "round": lambda g: (alan_round(g), wx_wy_round(g), g["d"], 4.0, 10.0),
+    "square": lambda g: (alan_square(g), wx_wy_square(g), g["a"], 4.0, 10.0),
+    "bulbflat": lambda g: (alan_bulb(g), wx_wy_bulb(g), g["B"], g["t"], 2 * g["t"]),
+    "lama": lambda g: (alan_lama({"h": g["h"], "t": g["t"]}), wx_wy_flatbar(g["t"], g["h"]),
+                       g["h"], g["t"], 2 * g["t"]),
+}
+
+
+def _dikdortgen(h, b):
+    return b * h ** 3 / 12.0, h * b ** 3 / 12.0
+
+
+def _boru(g):
+    Ix = math.pi / 64.0 * (g["OD"] ** 4 - (g["OD"] - 2 * g["t"]) ** 4)
+    return Ix, Ix
+
+
+def _rhs(g):
+    h, b, t = g["A"], g["B"], g["t"]
+    return ((b * h ** 3 - (b - 2 * t) * (h - 2 * t) ** 3) / 12.0,
+            (h * b ** 3 - (h - 2 * t) * (b - 2 * t) ** 3) / 12.0)
+
+
+def _L(g):
+    a, b, t = g["a"], g["b"], g["t"]
+    return ((b * a ** 3 - (b - t) * (a - t) ** 3) / 12.0,
+            (a * b ** 3 - (a - t) * (b - t) ** 3) / 12.0)
+
+
+# aile -> satır -> (Ix, Iy) mm⁴; kesit.py'deki kabullerle (I/H kesitleri h x b dikdörtgen)
+IX_IY = {
+    "boru": _boru,
+    "rhs": _rhs,
+    "l_equal": _L,
+    "l_unequal": _L,
+    "ipe": lambda g: _dikdortgen(g["h"], g["b"]),
+    "hea": lambda g: _dikdortgen(g["h"], g["b"]),
+    "heb": lambda g: _dikdortgen(g["h"], g["b"]),
+    "upn": lambda g: _dikdortgen(g["h"], g["b"]),
+    "round": lambda g: (math.pi * g["d"] ** 4 / 64.0,) * 2,
+    "square": lambda g: (g["a"] ** 4 / 12.0,) * 2,
+    "bulbflat": lambda g: _dikdortgen(g["t"], g["B"]),
+    "lama": lambda g: _dikdortgen(g["h"], g["t"]),
+}
+
+
+def _yakin(a, b):
+    return a == pytest.approx(b, rel=1e-9)
+
+
+@pytest.mark.parametrize("aile", sorted(AILELER))
+def test_eski_dallar_ve_skaler_formullerle_ayni(aile):
+    satirlar = ozellik_satirlari(aile)
+    assert satirlar
+    rho = agirlik_hesap(1.0, 1.0, MALZEMELER["Çelik"])
+    for o in satirlar:
+        A, (Wx, Wy), H_max, t_min, t_max = ESKI_DALLAR[aile](o)
+        Ix, Iy = IX_IY[aile](o)
+
+        assert _yakin(o["A_m2"], A) and _yakin(o["A_mm2"], A * 1e6)
+        assert _yakin(o["kg_m"], A * rho)
+        assert (o["H_max"], o["t_min"], o["t_max"]) == (H_max, t_min, t_max)
+        assert _yakin(o["Wx_mm3"], Wx) and _yakin(o["Wy_mm3"], Wy)
+        assert _yakin(o["Ix_mm4"], Ix) and _yakin(o["Iy_mm4"], Iy)
+
+
+def test_katalog_degerleri_onceliklidir():
+    g = {"profil": "IPE X", "h": 200.0, "b": 100.0, "tw": 5.6, "tf": 8.5}
+    formul = kesit_ozellikleri("ipe", g)
+
+    o = kesit_ozellikleri("ipe", dict(g, A_mm2=2850.0, Wx_mm3=194000.0, Iy_mm4=1.42e6))
+    assert o["A_mm2"] == 2850.0 and _yakin(o["A_m2"], 2850e-6)
+    assert _yakin(o["kg_m"], 2850e-6 * agirlik_hesap(1.0, 1.0, MALZEMELER["Çelik"]))
+    # Yalnızca W verilirse I, yalnızca I verilirse W ekstrem fiber mesafesiyle türetilir
+    assert o["Wx_mm3"] == 194000.0 and _yakin(o["Ix_mm4"], 194000.0 * 100.0)
+    assert o["Iy_mm4"] == 1.42e6 and _yakin(o["Wy_mm3"], 1.42e6 / 50.0)
+
+    # Boş katalog alanları formül değerini değiştirmez
+    bos = kesit_ozellikleri("ipe", dict(g, A_mm2="", Wx_mm3=None))
+    assert bos == formul
+
+
+def test_tanimsiz_geometri_none():
+    o = kesit_ozellikleri("boru", {"DN": 15, "SCH": 40, "OD": 10.0, "t": 6.0})
+    assert o["Wx_mm3"] is None and o["Ix_mm4"] is None
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Kesit çizimleri: her aile ve kaynaklı topoloji için geçerli SVG, doğru
+genel ölçüler ve boyut satırı; çizimler önbellekten döner."""
+import re
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from profil_core.cizim import (
+    GENISLIK_PX, YUKSEKLIK_PX, _CIZIMLER, boyut_alanlari, kesit_svg, statik_gorsel,
+)
+from profil_core.ice_aktar import SEMALAR
+from profil_core.kaynakli import TOPOLOJILER
+from profil_core.tablolar import tablo
+
+NS = "{http://www.w3.org/2000/svg}"
+
+# aile -> ilk katalog satırının beklenen (genişlik, yükseklik) ölçüsü (mm)
+GENEL_OLCULER = {
+    "boru": lambda r: (r["OD"], r["OD"]),
+    "rhs": lambda r: (r["B"], r["A"]),
+    "l_equal": lambda r: (r["b"], r["a"]),
+    "l_unequal": lambda r: (r["b"], r["a"]),
+    "ipe": lambda r: (r["b"], r["h"]),
+    "hea": lambda r: (r["b"], r["h"]),
+    "heb": lambda r: (r["b"], r["h"]),
+    "upn": lambda r: (r["b"], r["h"]),
+    "bulbflat": lambda r: (2.2 * r["t"], r["B"]),
+    "round": lambda r: (r["d"], r["d"]),
+    "square": lambda r: (r["a"], r["a"]),
+    "lama": lambda r: (r["t"], r["h"]),
+}
+
+
+def _coz(svg):
+    kok = ET.fromstring(svg)
+    assert kok.tag == NS + "svg"
+    assert float(kok.get("width")) <= GENISLIK_PX + 0.5
+    assert float(kok.get("height")) <= YUKSEKLIK_PX + 0.5
+    yol = kok.find(NS + "path")
+    assert yol.get("fill-rule") == "evenodd"
+    assert re.match(r"M-?\d", yol.get("d"))
+    return [t.text for t in kok.iter(NS + "text")]
+
+
+def test_tum_aileler_cizilir():
+    assert set(GENEL_OLCULER) == set(SEMALAR)
+    for aile, olcu in GENEL_OLCULER.items():
+        r = tablo(aile)[0]
+        genislik, yukseklik, satir = _coz(kesit_svg(aile, r))
+        W, H = olcu(r)
+        assert float(genislik) == pytest.approx(W, abs=0.01)
+        assert float(yukseklik) == pytest.approx(H, abs=0.01)
+        assert satir == "  ".join("{}={:g}".format(a, r[a]) for a in boyut_alanlari(aile))
+
+
+def test_lama_boyutlari():
+    # Arayüz seçimi lama için h ve t'yi taşır; profil ve fazladan alanlar çizimi etkilemez
+    svg = kesit_svg("lama", {"profil": "100x10", "h": 100.0, "t": 10.0, "kg/m": 7.85})
+    assert _coz(svg) == ["10", "100", "h=100  t=10"]
+    assert kesit_svg("lama", {"h": 100, "t": 10}) is svg
+    with pytest.raises(KeyError):
+        kesit_svg("lama", {"h": 100.0})
+
+
+@pytest.mark.parametrize("topoloji", sorted(TOPOLOJILER))
+def test_kaynakli_topolojiler(topoloji):
+    g = {"H": 300.0, "b_f": 150.0, "t_f": 12.0, "t_w": 8.0}
+    genislik, yukseklik, satir = _coz(kesit_svg(topoloji, g))
+    assert float(genislik) == 150.0
+    assert float(yukseklik) == 300.0
+    assert satir == "H=300  b_f=150  t_f=12  t_w=8"
+
+
+def test_boru_deligi_ayni_yolda():
+    svg = kesit_svg("boru", {"OD": 100.0, "t": 5.0, "DN": 80, "SCH": 40})
+    d = ET.fromstring(svg).find(NS + "path").get("d")
+    assert d.count("M") == 2 and d.count(" a") == 4
+
+
+def test_onbellek_isabeti():
+    g = {"h": 123.0, "t": 7.0}
+    once = _CIZIMLER.isabet
+    ilk = kesit_svg("lama", g)
+    assert kesit_svg("lama", dict(g, profil="başka ad")) is ilk
+    assert _CIZIMLER.isabet == once + 1
+    assert kesit_svg("lama", {"h": 124.0, "t": 7.0}) != ilk
+
+
+def test_statik_gorsel(tmp_path):
+    yol = tmp_path / "a.png"
+    yol.write_bytes(b"\x89PNG")
+    assert statik_gorsel(str(yol)) == b"\x89PNG"
+    yol.write_bytes(b"yeni")
+    assert statik_gorsel(str(yol)) == b"\x89PNG"
+    assert statik_gorsel(str(tmp_path / "yok.png")) is None
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""Dışa aktarma: blok bölme, aralık ayrıştırma ve yazıcıların gidiş-dönüşü."""
+import csv
+import importlib
+
+import pytest
+
+from profil_core.disa_aktar import _aralik, satir_bloklari, t_bloklari
+from profil_core.muadil import t_profil_wx_wy
+
+# profil_core.disa_aktar paket düzeyinde aynı adlı fonksiyonla gölgelenir
+disa_aktar = importlib.import_module("profil_core.disa_aktar")
+
+SEMA = [("Profil", str), ("n", int), ("x", float)]
+
+
+def _satirlar(n):
+    return [{"Profil": "P{}".format(i), "n": i, "x": i / 4.0} for i in range(n)]
+
+
+def _bloklar(n, parca):
+    return list(satir_bloklari(iter(_satirlar(n)), parca))
+
+
+def test_satir_bloklari_boler():
+    bloklar = _bloklar(25, 10)
+    assert [len(b) for b in bloklar] == [10, 10, 5]
+    assert [r for b in bloklar for r in b] == _satirlar(25)
+    assert [len(b) for b in _bloklar(20, 10)] == [10, 10]
+    assert _bloklar(0, 10) == []
+
+
+def test_aralik():
+    assert _aralik("80:120:10") == [80.0, 90.0, 100.0, 110.0, 120.0]
+    assert _aralik("4:7") == [4.0, 5.0, 6.0, 7.0]
+    assert _aralik("100") == [100.0]
+    assert _aralik("0:1:0.25") == [0.0, 0.25, 0.5, 0.75, 1.0]
+    assert _aralik("10:5") == []
+
+
+@pytest.mark.parametrize("sema", [SEMA, None])
+def test_csv_gidis_donus(tmp_path, sema):
+    yol = tmp_path / "sonuc.csv"
+    bloklar = _bloklar(25, 10) + [[]]
+
+    assert disa_aktar.disa_aktar(bloklar, str(yol), sema=sema) == 25
+    with open(yol, encoding="utf-8", newline="") as f:
+        okunan = list(csv.DictReader(f))
+    assert okunan == [{"Profil": r["Profil"], "n": str(r["n"]), "x": repr(r["x"])}
+                      for r in _satirlar(25)]
+
+
+def test_csv_bos_sema_ile_baslik(tmp_path):
+    yol = tmp_path / "bos.csv"
+    assert disa_aktar.disa_aktar([], str(yol), sema=SEMA) == 0
+    assert yol.read_text(encoding="utf-8").splitlines() == ["Profil,n,x"]
+
+
+def test_bicim_coz():
+    assert disa_aktar.bicim_coz("a.CSV") == "csv"
+    assert disa_aktar.bicim_coz("a.pq") == "parquet"
+    assert disa_aktar.bicim_coz("a.dat", "xlsx") == "xlsx"
+    with pytest.raises(ValueError):
+        disa_aktar.bicim_coz("a.txt")
+
+
+def test_parquet_gidis_donus(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    yol = tmp_path / "sonuc.parquet"
+
+    assert disa_aktar.disa_aktar(_bloklar(25, 10), str(yol)) == 25
+    assert pq.read_table(str(yol)).to_pylist() == [
+        {"Profil": r["Profil"], "n": float(r["n"]), "x": r["x"]} for r in _satirlar(25)]
+
+
+def test_xlsx_gidis_donus(tmp_path, monkeypatch):
+    openpyxl = pytest.importorskip("openpyxl")
+    monkeypatch.setattr(disa_aktar, "XLSX_SAYFA_SATIRI", 10)
+    yol = tmp_path / "sonuc.xlsx"
+
+    assert disa_aktar.disa_aktar(_bloklar(25, 7), str(yol), sema=SEMA) == 25
+    kitap = openpyxl.load_workbook(str(yol), read_only=True)
+    sayfalar = [list(s.iter_rows(values_only=True)) for s in kitap.worksheets]
+    assert [len(s) for s in sayfalar] == [11, 11, 6]
+    assert all(s[0] == ("Profil", "n", "x") for s in sayfalar)
+    assert [dict(zip(("Profil", "n", "x"), r)) for s in sayfalar for r in s[1:]] == _satirlar(25)
+
+
+def test_t_bloklari_tum_listeyi_verir():
+    bloklar = list(t_bloklari(50000, 20000, [100.0, 120.0], 4, 10))
+    assert all(bloklar)
+    satirlar = [r for b in bloklar for r in b]
+    beklenen = (t_profil_wx_wy(50000, 20000, 100.0, 4, 10)
+                + t_profil_wx_wy(50000, 20000, 120.0, 4, 10))
+
+    def anahtar(r):
+        return r["H (mm)"], r["t_f (mm)"], r["t_w (mm)"], r["b_f (mm)"]
+
+    assert sorted(satirlar, key=anahtar) == sorted(beklenen, key=anahtar)
+
+
+@pytest.mark.parametrize("liste, tolerans, beklenen", [
+    ("muadil", None, 0.10), ("muadil", "0", 0.0), ("lama", None, 0.02), ("lama", "0", 0.0),
+])
+def test_main_sifir_tolerans(tmp_path, monkeypatch, liste, tolerans, beklenen):
+    gelen = []
+
+    def kaydet(*args, **kwargs):
+        gelen.append(kwargs.get("tolerans", args[-1]))
+        return iter(())
+
+    monkeypatch.setattr(disa_aktar, "muadil_bloklari", kaydet)
+    monkeypatch.setattr(disa_aktar, "lama_bloklari", kaydet)
+    argv = [liste, "50000", "20000", str(tmp_path / "a.csv")]
+    if tolerans is not None:
+        argv += ["--tolerans", tolerans]
+
+    assert disa_aktar.main(argv) == 0
+    assert gelen == [beklenen]
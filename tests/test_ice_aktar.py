@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""tablo_yaz ile yazılan tablo modülü tablo_oku ile aynı satırlarla okunmalı."""
+import os
+import stat
+
+import pytest
+
+from profil_core import tablolar
+from profil_core.ice_aktar import gecerli_satirlar, satir_dogrula, tablo_yaz
+from profil_core.tablolar import tablo_oku
+
+
+def test_tablo_yaz_tablo_oku_gidis_donus(tmp_path, monkeypatch):
+    satirlar = [
+        {"profil": "HEB 100", "h": 100.0, "b": 100.0, "tw": 6.0, "tf": 10.0},
+        {"profil": 'HEB "özel"\nikinci satır', "h": 120.5, "b": 120.0, "tw": 6.5, "tf": 11.0},
+        {"profil": "C:\\yol\\'tırnak'\t\r", "h": 140.0, "b": 140.0, "tw": 7.0, "tf": 12.0},
+    ]
+    yol = tmp_path / "heb.py"
+    monkeypatch.setitem(tablolar._YOLLAR, "heb", str(yol))
+
+    assert tablo_yaz("heb", satirlar, str(yol)) == str(yol)
+    okunan, imza = tablo_oku("heb")
+
+    assert okunan == satirlar
+    assert imza == tablolar.kaynak_imzasi("heb")
+
+
+def test_tablo_yaz_dosya_izinlerini_korur(tmp_path):
+    satirlar = [{"profil": "HEB 100", "h": 100.0, "b": 100.0, "tw": 6.0, "tf": 10.0}]
+    yol = tmp_path / "heb.py"
+    yol.write_text("HEB_TABLO = []\n", encoding="utf-8")
+    os.chmod(yol, 0o644)
+
+    tablo_yaz("heb", satirlar, str(yol))
+    assert stat.S_IMODE(os.stat(yol).st_mode) == 0o644
+
+    yeni = tmp_path / "yeni.py"
+    eski = os.umask(0o022)
+    try:
+        tablo_yaz("heb", satirlar, str(yeni))
+    finally:
+        os.umask(eski)
+    assert stat.S_IMODE(os.stat(yeni).st_mode) == 0o644
+
+
+@pytest.mark.parametrize("deger", ["inf", "-inf", "nan", "Infinity", float("inf")])
+def test_sonlu_olmayan_degerler_reddedilir(deger):
+    ham = {"profil": "HEB 100", "h": deger, "b": "100", "tw": "6", "tf": "10"}
+    with pytest.raises(ValueError):
+        satir_dogrula("heb", ham)
+
+    ham = {"profil": "HEB 100", "h": "100", "b": "100", "tw": "6", "tf": "10", "Wx_mm3": deger}
+    with pytest.raises(ValueError):
+        satir_dogrula("heb", ham)
+
+
+def test_sonlu_olmayan_satir_rapora_hatali_yazilir(tmp_path):
+    girdi = tmp_path / "heb.csv"
+    girdi.write_text("profil,h,b,tw,tf\nHEB 100,100,100,6,10\nHEB 120,inf,120,6.5,11\n",
+                     encoding="utf-8")
+    rapor = {}
+    satirlar = list(gecerli_satirlar("heb", str(girdi), rapor=rapor))
+
+    assert [r["profil"] for r in satirlar] == ["HEB 100"]
+    assert rapor["hatali"] == 1
+
+
+@pytest.mark.parametrize("DN, SCH", [("50.5", "40"), ("50", "80.5"), (50.5, 40), ("50", 40.5)])
+def test_tam_sayi_olmayan_dn_sch_reddedilir(DN, SCH):
+    with pytest.raises(ValueError):
+        satir_dogrula("boru", {"DN": DN, "SCH": SCH, "OD": "60.3", "t": "3.91"})
+
+
+def test_tam_sayi_degerli_dn_sch_kabul_edilir():
+    r = satir_dogrula("boru", {"DN": "50.0", "SCH": "40", "OD": "60,3", "t": "3.91"})
+    assert (r["DN"], r["SCH"]) == (50, 40)
+    assert satir_dogrula("boru", {"DN": 50, "SCH": "xs", "OD": 60.3, "t": 5.54})["SCH"] == "XS"
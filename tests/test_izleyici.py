@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Katalog izleyicisi: tablosu hiç yüklenmemiş, yalnızca sütunsal önbellekten
+okunan bir ailenin kaynağı değişince indeks ve Pareto cephesi yenilenmeli.
+
+Her senaryo depo kopyasında ayrı bir süreçte çalışır; tables/ ve önbellek
+dizini geçici dizindedir.
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Sıcak açılış: indeks ve cephe önbellekten; yalnızca ipe tablosu yüklenir.
+# HEB 100 kaynakta çok hafif ve rijit bir kesite çevrilir (cepheye girer).
+_SENARYO = r"""
+import json, sys
+from profil_core.ice_aktar import tablo_yaz
+from profil_core.izleyici import katalogu_yenile
+from profil_core.katalog import katalog_indeksi
+from profil_core.pareto import pareto_cephesi
+from profil_core.tablolar import tablo, tablo_oku, yuklu_aileler
+
+def heb100():
+    indeks = katalog_indeksi()
+    i = indeks.sutunlar["Profil"].tolist().index("HEB 100")
+    cephe = pareto_cephesi()
+    return {"Wx": indeks.satirlar([i])[0]["Wx_mm3"],
+            "cephe": [float(x) for p, x in zip(cephe.profil, cephe.Wx) if p == "HEB 100"]}
+
+once = heb100()
+tablo("ipe")
+yuklu = yuklu_aileler()
+satirlar, _ = tablo_oku("heb")
+for r in satirlar:
+    if r["profil"] == "HEB 100":
+        r.update(h=400.0, b=400.0, tw=1.0, tf=1.5)
+tablo_yaz("heb", satirlar)
+if sys.argv[1] == "secim":
+    tablo("heb")  # kullanıcı aileyi izleyiciden önce seçer
+print(json.dumps({"yuklu": yuklu, "once": once, "yenilenen": katalogu_yenile(),
+                  "sonra": heb100()}))
+"""
+
+
+@pytest.fixture
+def kopya(tmp_path):
+    hedef = tmp_path / "depo"
+    yoksay = shutil.ignore_patterns("__pycache__")
+    for ad in ("profil_core", "tables"):
+        shutil.copytree(os.path.join(KOK, ad), str(hedef / ad), ignore=yoksay)
+    ortam = dict(os.environ, PROFIL_KATALOG_CACHE=str(tmp_path / "onbellek"),
+                 PROFIL_KATALOG_IZLE="0", PYTHONDONTWRITEBYTECODE="1")
+    subprocess.run([sys.executable, "-m", "profil_core.kolonsal"], cwd=str(hedef), env=ortam,
+                   check=True, capture_output=True)
+    return hedef, ortam
+
+
+@pytest.mark.parametrize("adim", ["izleyici", "secim"])
+def test_yuklenmemis_aile_degisince_indeks_ve_cephe_yenilenir(kopya, adim):
+    hedef, ortam = kopya
+    cikti = subprocess.run([sys.executable, "-c", _SENARYO, adim], cwd=str(hedef), env=ortam,
+                           check=True, capture_output=True, text=True).stdout
+    s = json.loads(cikti)
+
+    assert "heb" not in s["yuklu"]
+    assert s["yenilenen"] == ["heb"]
+    assert s["sonra"]["Wx"] != s["once"]["Wx"]
+    assert s["sonra"]["cephe"] == [s["sonra"]["Wx"]]
+    assert s["sonra"]["cephe"] != s["once"]["cephe"]
+
+
+def test_fork_kancasi_olmayan_platformda_ice_aktarilir():
+    # Windows'ta os.register_at_fork yoktur
+    kod = "import os; del os.register_at_fork; import profil_core.katalog"
+    subprocess.run([sys.executable, "-c", kod], cwd=KOK, check=True, capture_output=True)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Kaynaklı yapma kesitler: levha toplamı elle çözülen kapalı formlarla,
+T ise tprofil.t_kesit_wx_wy ile aynı olmalı; arama bandın dışına çıkmamalı."""
+import numpy as np
+import pytest
+
+from profil_core.kaynakli import kaynakli_kesit
+from profil_core.muadil import kaynakli_wx_wy
+from profil_core.tprofil import T_ADAYLARI, t_kesit_wx_wy
+
+
+def test_T_tprofil_ile_ayni():
+    TF, TW, BF = np.meshgrid([4.0, 10.0, 25.0], [4.0, 8.0, 20.0], [40.0, 150.0, 400.0])
+    for H in (60.0, 200.0, 500.0):
+        k = kaynakli_kesit("T", H, TF, TW, BF)
+        Wx, Wy = t_kesit_wx_wy(H, TF, TW, BF)
+        np.testing.assert_allclose(k["Wx"], Wx, rtol=1e-12)
+        np.testing.assert_allclose(k["Wy"], Wy, rtol=1e-12)
+
+
+def test_I_kapali_form():
+    # H=200, flanş 100x10, gövde 180x6
+    k = kaynakli_kesit("I", 200.0, 10.0, 6.0, 100.0)
+    Ix = 100 * 200 ** 3 / 12 - 94 * 180 ** 3 / 12           # 20 982 666.7
+    Iy = 2 * 10 * 100 ** 3 / 12 + 180 * 6 ** 3 / 12          # 1 669 906.7
+    assert k["A"] == pytest.approx(2 * 100 * 10 + 180 * 6)
+    assert k["Ix"] == pytest.approx(Ix)
+    assert k["Iy"] == pytest.approx(Iy)
+    assert k["Wx"] == pytest.approx(Ix / 100)
+    assert k["Wy"] == pytest.approx(Iy / 50)
+    assert k["h_w"] == 180.0
+
+
+def test_kutu_kapali_form():
+    # H=200, b=100, flanş 10, gövdeler 8: dış dikdörtgen eksi iç boşluk
+    k = kaynakli_kesit("Kutu", 200.0, 10.0, 8.0, 100.0)
+    Ix = 100 * 200 ** 3 / 12 - 84 * 180 ** 3 / 12           # 25 842 666.7
+    Iy = 200 * 100 ** 3 / 12 - 180 * 84 ** 3 / 12           # 7 776 106.7
+    assert k["A"] == pytest.approx(100 * 200 - 84 * 180)
+    assert k["Wx"] == pytest.approx(Ix / 100)
+    assert k["Wy"] == pytest.approx(Iy / 50)
+
+
+def test_U_kapali_form():
+    # H=200, gövde 200x6, flanşlar 74x10 (b_f=80); y eksenine göre simetrik değil
+    k = kaynakli_kesit("U", 200.0, 10.0, 6.0, 80.0)
+    A_w, A_f = 6 * 200, 2 * 74 * 10
+    x_bar = (A_w * 3 + A_f * 43) / (A_w + A_f)              # 25.09
+    Ix = 80 * 200 ** 3 / 12 - 74 * 180 ** 3 / 12
+    Iy = (200 * 6 ** 3 / 12 + A_w * (3 - x_bar) ** 2
+          + 2 * 10 * 74 ** 3 / 12 + A_f * (43 - x_bar) ** 2)
+    assert k["x_bar"] == pytest.approx(x_bar)
+    assert k["Wx"] == pytest.approx(Ix / 100)
+    assert k["Wy"] == pytest.approx(Iy / max(80 - x_bar, x_bar))
+
+
+def test_gecersiz_kesitler():
+    assert not kaynakli_kesit("I", 20.0, 10.0, 6.0, 100.0)["gecerli"]
+    assert not kaynakli_kesit("Kutu", 200.0, 10.0, 8.0, 16.0)["gecerli"]
+    assert not kaynakli_kesit("U", 200.0, 10.0, 6.0, 6.0)["gecerli"]
+    assert not kaynakli_kesit("T", 200.0, 10.0, 30.0, 20.0)["gecerli"]
+
+
+@pytest.mark.parametrize("topoloji", ["I", "Kutu", "U", "T"])
+def test_arama_bandi(topoloji):
+    Wx_t, Wy_t, H = 150000.0, 30000.0, 200.0
+    tablo = kaynakli_wx_wy(topoloji, Wx_t, Wy_t, H, 4, 12, sutunlu=True)
+    satirlar = tablo.satirlar()
+    assert satirlar
+
+    for r in satirlar:
+        assert (abs(r["Wx (mm³)"] - Wx_t) <= 0.10 * Wx_t
+                or abs(r["Wy (mm³)"] - Wy_t) <= 0.10 * Wy_t)
+        assert r["Toplam Skor"] == pytest.approx(r["ΔWx"] + r["ΔWy"])
+    skorlar = [r["Toplam Skor"] for r in satirlar]
+    assert skorlar == sorted(skorlar)
+
+    # Izgarada banda düşen bütün geçerli adaylar sayılmış olmalı
+    t = np.asarray([x for x in T_ADAYLARI if 4 <= x <= 12], dtype=float)
+    TF, TW, BF = (a.ravel() for a in np.meshgrid(t, t, np.arange(100.0, 401.0, 10.0),
+                                                 indexing="ij"))
+    k = kaynakli_kesit(topoloji, H, TF, TW, BF)
+    bant = (np.abs(k["Wx"] - Wx_t) <= 0.10 * Wx_t) | (np.abs(k["Wy"] - Wy_t) <= 0.10 * Wy_t)
+    assert tablo.eslesen == len(satirlar) == int((bant & k["gecerli"]).sum())
+
+    sayfa = kaynakli_wx_wy(topoloji, Wx_t, Wy_t, H, 4, 12, top_k=3, offset=2)
+    assert sayfa == satirlar[2:5]
+
+
+@pytest.mark.parametrize("b_adim", [None, 0])
+def test_surekli_genislik_reddedilir(b_adim):
+    with pytest.raises(ValueError):
+        kaynakli_wx_wy("I", 150000, 30000, 200, 4, 12, b_adim=b_adim)
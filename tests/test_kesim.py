@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Kesim planı: alt sınır, optimal bayrağı ve planın geçerliliği küçük
+listelerde kaba kuvvet optimumuna karşı denetlenir."""
+import random
+from collections import Counter
+
+import pytest
+
+from profil_core.kesim import _alt_sinir, _ffd, kesim_listesi_coz, kesim_plani
+
+
+def _optimum(w, C):
+    """w (parça + kerf) için gereken en az çubuk (bit maskesi DP)."""
+    n = len(w)
+    # dp[maske] = (çubuk sayısı, son çubuktaki doluluk)
+    dp = [None] * (1 << n)
+    dp[0] = (1, 0.0)
+    for maske in range(1 << n):
+        if dp[maske] is None:
+            continue
+        adet, dolu = dp[maske]
+        for i in range(n):
+            if maske >> i & 1:
+                continue
+            aday = (adet, dolu + w[i]) if dolu + w[i] <= C + 1e-9 else (adet + 1, w[i])
+            yeni = maske | 1 << i
+            if dp[yeni] is None or aday < dp[yeni]:
+                dp[yeni] = aday
+    return dp[-1][0] if n else 0
+
+
+def _listeler(n_liste=150, tohum=5):
+    rnd = random.Random(tohum)
+    for _ in range(n_liste):
+        stok = rnd.choice([1000.0, 6000.0])
+        kerf = rnd.choice([0.0, 3.0, 4.0])
+        n = rnd.randint(1, 11)
+        tur = rnd.random()
+        if tur < 0.3:
+            boylar = [float(rnd.randint(1, int(stok))) for _ in range(n)]
+        elif tur < 0.7:  # C/5 - C/2 arası: FFD'nin sık yanıldığı bölge
+            boylar = [float(rnd.randint(int(stok / 5), int(stok / 2))) for _ in range(n)]
+        else:  # az sayıda farklı boy: eşitlikler ve tam dolan çubuklar
+            secenek = [stok / 2, stok / 3, stok / 4 - kerf, stok - kerf, stok / 5]
+            boylar = [max(1.0, rnd.choice(secenek)) for _ in range(n)]
+        yield boylar, stok, kerf
+
+
+def _gecerli(plan, boylar, stoklar, kerf):
+    yerlesen = []
+    for c in plan["cubuklar"]:
+        assert c["stok_mm"] in stoklar
+        assert sum(c["parcalar"]) + (len(c["parcalar"]) - 1) * kerf <= c["stok_mm"] + 1e-6
+        yerlesen.extend(c["parcalar"])
+    assert Counter(yerlesen) == Counter(float(b) for b in boylar)
+    assert plan["cubuk_sayisi"] == len(plan["cubuklar"])
+    assert plan["satin_alinan_mm"] == pytest.approx(sum(c["stok_mm"] for c in plan["cubuklar"]))
+
+
+@pytest.mark.parametrize("boylar,stok,kerf", list(_listeler()))
+def test_alt_sinir_optimum_ve_plan(boylar, stok, kerf):
+    C = stok + kerf
+    w = sorted((b + kerf for b in boylar), reverse=True)
+    optimum = _optimum(w, C)
+
+    assert _alt_sinir(w, C) <= optimum
+
+    atama = _ffd(w, C)
+    doluluk = Counter()
+    for x, j in zip(w, atama):
+        doluluk[j] += x
+    assert max(doluluk.values()) <= C + 1e-9
+
+    plan = kesim_plani(boylar, stok_boylari=(stok,), kerf=kerf, sure_siniri=5.0)
+    _gecerli(plan, boylar, [stok], kerf)
+    assert plan["alt_sinir"] <= optimum <= plan["cubuk_sayisi"]
+    if plan["optimal"]:
+        assert plan["cubuk_sayisi"] == optimum
+
+
+def test_buyuk_liste_ve_karisik_stoklar_gecerli():
+    rnd = random.Random(2)
+    boylar = [float(rnd.randint(100, 5900)) for _ in range(400)]
+    stoklar = (6000.0, 12000.0)
+    plan = kesim_plani(boylar, stok_boylari=stoklar, kerf=4.0, sure_siniri=0.2)
+    _gecerli(plan, boylar, stoklar, 4.0)
+    assert plan["yontem"] == "ffd"
+
+
+def test_sure_dolunca_ffd_plani_doner():
+    rnd = random.Random(3)
+    boylar = [float(rnd.randint(1000, 3500)) for _ in range(60)]
+    plan = kesim_plani(boylar, stok_boylari=(6000.0,), kerf=3.0, sure_siniri=0.0)
+    _gecerli(plan, boylar, [6000.0], 3.0)
+    assert plan["alt_sinir"] <= plan["cubuk_sayisi"]
+
+
+def test_kesim_listesi_coz():
+    metin = "6000\n2450 x 2\n# açıklama\n\n1200,5*3  # parça\n800;1\n"
+    assert kesim_listesi_coz(metin) == [6000.0, 2450.0, 2450.0, 1200.5, 1200.5, 1200.5, 800.0]
+
+
+@pytest.mark.parametrize("satir", ["2400;0", "2400 x -1", "0 x 2", "-5", "2400 x 1.5", "abc"])
+def test_kesim_listesi_gecersiz_satir(satir):
+    with pytest.raises(ValueError):
+        kesim_listesi_coz("1000\n" + satir)
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""KDAgaci.sorgula, ağırlıklı Öklid mesafesiyle kaba kuvvet k-NN ile aynı
+(mesafe, satır no) listesini vermeli; eşit mesafede küçük satır no önce."""
+import numpy as np
+import pytest
+
+from profil_core.knn import KDAgaci
+
+
+def _kaba_kuvvet(X, q, k, w):
+    d2 = (((X - q) ** 2) * (w * w)).sum(axis=1)
+    ids = np.lexsort((np.arange(len(X)), d2))[:k]
+    return np.sqrt(d2[ids]), ids
+
+
+def _noktalar(rnd, n, boyut, izgara):
+    if izgara:  # tam sayı ızgara: çok sayıda eşit mesafe ve yinelenen nokta
+        return rnd.integers(0, 4, size=(n, boyut)).astype(float)
+    return rnd.normal(size=(n, boyut))
+
+
+@pytest.mark.parametrize("izgara", [False, True])
+@pytest.mark.parametrize("boyut", [2, 3])
+@pytest.mark.parametrize("n,yaprak", [(1, 32), (7, 2), (300, 4), (2000, 32)])
+def test_kaba_kuvvetle_ayni(n, yaprak, boyut, izgara):
+    rnd = np.random.default_rng(n * 10 + boyut)
+    X = _noktalar(rnd, n, boyut, izgara)
+    agac = KDAgaci(X, yaprak=yaprak)
+    agirlik_secenekleri = [None, np.ones(boyut), rnd.uniform(0.1, 3.0, boyut),
+                           np.r_[0.0, np.ones(boyut - 1)], np.zeros(boyut)]
+    for _ in range(10):
+        q = _noktalar(rnd, 1, boyut, izgara)[0]
+        for w in agirlik_secenekleri:
+            for k in (1, 5, n, n + 3):
+                mesafe, ids = agac.sorgula(q, k, w)
+                beklenen_m, beklenen_ids = _kaba_kuvvet(X, q, k, np.ones(boyut) if w is None else w)
+                assert ids.tolist() == beklenen_ids.tolist()
+                assert mesafe.tolist() == beklenen_m.tolist()
+
+
+def test_k_sifir_ve_hatali_girdi():
+    agac = KDAgaci(np.zeros((5, 2)))
+    mesafe, ids = agac.sorgula([0.0, 0.0], 0)
+    assert mesafe.size == 0 and ids.size == 0
+    with pytest.raises(ValueError):
+        KDAgaci(np.zeros(5))
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Lama araması: kapalı form kalınlık aralıkları (lama_t_araliklari) ile
+bulunan liste, ilk sürümdeki tüm kalınlıkları tarayan skaler döngüyle aynı
+olmalı; bant ucuna düşen kalınlıklar da aynı karara bağlanmalı."""
+import random
+
+import pytest
+
+from profil_core.kesit import wx_wy_flatbar
+from profil_core.lama import LAMA_T_ADAYLARI, lama_muadil_2d, lama_t_araliklari
+from profil_core.muadil import lama_muadil_wx_wy
+from profil_core.tablolar import tablo
+
+
+def _taban(Wx_t, Wy_t, h, t_adaylari, tolerans):
+    """(h, t) -> skor; ilk sürümdeki tarama döngüsü."""
+    sonuc = {}
+    for t in t_adaylari:
+        Wx_l, Wy_l = wx_wy_flatbar(t, h)
+        if Wx_l is None or Wy_l is None or Wx_t <= 0 or Wy_t <= 0:
+            continue
+        dWx, dWy = abs(Wx_l - Wx_t), abs(Wy_l - Wy_t)
+        if dWx <= tolerans * Wx_t or dWy <= tolerans * Wy_t:
+            sonuc[(h, t)] = dWx + dWy
+    return sonuc
+
+
+def _hedefler(n=6, tohum=3):
+    """Bir lamaya yakın hedefler; ikisi bir kalınlığı tam bant ucuna koyar."""
+    rnd = random.Random(tohum)
+    for i in range(n):
+        h = rnd.choice([20.0, 55.0, 100.0, 237.5])
+        Wx, Wy = wx_wy_flatbar(rnd.uniform(2, 60), h)
+        yield h, Wx * rnd.uniform(0.8, 1.2), Wy * rnd.uniform(0.8, 1.2)
+    for t, k in ((7, 1.0 / 1.02), (12, 1.0 / 0.98)):
+        Wx, Wy = wx_wy_flatbar(t, 100.0)
+        yield 100.0, Wx * k, Wy * 5.0
+
+
+def _anahtarli(satirlar):
+    return {(r["h (mm)"], r["t (mm)"]): r["Toplam Skor"] for r in satirlar}
+
+
+def _sirali(satirlar):
+    skorlar = [r["Toplam Skor"] for r in satirlar]
+    return skorlar == sorted(skorlar)
+
+
+@pytest.mark.parametrize("tolerans", [0.02, 0.1, 0.5, 1.5])
+@pytest.mark.parametrize("t_adaylari", [None, [x / 4.0 for x in range(4, 321)]])
+@pytest.mark.parametrize("h,Wx,Wy", list(_hedefler()))
+def test_kapali_form_taramayla_ayni(h, Wx, Wy, t_adaylari, tolerans):
+    liste = lama_muadil_wx_wy(Wx, Wy, h, t_adaylari=t_adaylari, tolerans=tolerans)
+    taban = _taban(Wx, Wy, h, LAMA_T_ADAYLARI if t_adaylari is None else t_adaylari,
+                   tolerans)
+
+    assert _sirali(liste)
+    assert _anahtarli(liste) == taban
+
+
+@pytest.mark.parametrize("tolerans", [0.02, 0.2])
+def test_araliklar_taramanin_uclarini_kapsar(tolerans):
+    # 0.01 mm adımlı taramada bantta kalan her kalınlık bir aralığın içindedir
+    ts = [x / 100.0 for x in range(100, 10001)]
+    for h, Wx, Wy in _hedefler():
+        araliklar = lama_t_araliklari(Wx, Wy, h, tolerans)
+        for _, t in _taban(Wx, Wy, h, ts, tolerans):
+            assert any(a * (1 - 1e-9) <= t <= b * (1 + 1e-9) for a, b in araliklar)
+
+
+@pytest.mark.parametrize("tolerans", [0.02, 0.3])
+@pytest.mark.parametrize("h,Wx,Wy", list(_hedefler()))
+def test_2d_stok_taramasiyla_ayni(h, Wx, Wy, tolerans):
+    liste = lama_muadil_2d(Wx, Wy, tolerans=tolerans)
+    taban = {}
+    for r in tablo("lama"):
+        taban.update(_taban(Wx, Wy, r["h"], [r["t"]], tolerans))
+
+    assert _sirali(liste)
+    assert _anahtarli(liste) == taban
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Toplu metraj: toplu_agirlik ve metraj, satır satır agirlik_hesap ile
+aynı alanı, kütleyi ve toplamları vermeli."""
+import random
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+from profil_core.aileler import AILELER, ozellik_satirlari
+from profil_core.kesit import MALZEMELER, agirlik_hesap
+from profil_core.metraj import boyut_alanlari, metraj, toplu_agirlik
+
+_AILELER = ("ipe", "heb", "boru", "rhs", "l_unequal", "lama", "round")
+
+
+def _uyeler(n=400, tohum=11):
+    """(aile, kısa ad, boyutlar, profil, uzunluk, adet, malzeme, A_m2) satırları;
+    yarısı boyutla, yarısı katalog adıyla verilir. Aile, metraj CSV'sindeki
+    gibi ya anahtarla ("ipe") ya da kısa adla ("IPE") yazılır."""
+    rnd = random.Random(tohum)
+    malzemeler = list(MALZEMELER)
+    for _ in range(n):
+        aile = rnd.choice(_AILELER)
+        r = rnd.choice(ozellik_satirlari(aile))
+        boyutlu = rnd.random() < 0.5
+        boyutlar = {x: float(r[x]) for x in boyut_alanlari(aile)} if boyutlu else {}
+        A = AILELER[aile]["alan"](r) if boyutlu else r["A_m2"]
+        ad = AILELER[aile]["kisa"] if aile in ("ipe", "heb") else aile
+        yield (aile, ad, boyutlar, "" if boyutlu else r["etiket"],
+               rnd.choice([500.0, 1250.5, 6000.0]), rnd.randint(1, 4), rnd.choice(malzemeler), A)
+
+
+def _sutunlar(uyeler):
+    tum_alanlar = sorted({x for a in _AILELER for x in boyut_alanlari(a)})
+    return (
+        np.asarray([u[1] for u in uyeler]),
+        np.asarray([u[4] for u in uyeler]),
+        np.asarray([u[5] for u in uyeler], dtype=float),
+        np.asarray([u[6] for u in uyeler]),
+        {x: np.asarray([u[2].get(x, np.nan) for u in uyeler]) for x in tum_alanlar},
+        np.asarray([u[3] for u in uyeler]),
+    )
+
+
+def test_toplu_agirlik_satir_satir_hesapla_ayni():
+    uyeler = list(_uyeler())
+    aile, uzunluk, adet, malzeme, boyutlar, profil = _sutunlar(uyeler)
+    sonuc = toplu_agirlik(aile, uzunluk, malzeme=malzeme, adet=adet, boyutlar=boyutlar,
+                          profil=profil)
+    for i, u in enumerate(uyeler):
+        rho = MALZEMELER[u[6]]
+        assert sonuc["A_m2"][i] == pytest.approx(u[7], rel=1e-12)
+        assert sonuc["kg_m"][i] == pytest.approx(agirlik_hesap(u[7], 1.0, rho), rel=1e-12)
+        assert sonuc["kg"][i] == pytest.approx(
+            agirlik_hesap(u[7], u[4] / 1000.0 * u[5], rho), rel=1e-12)
+
+
+def test_metraj_toplamlari_satir_toplamlariyla_ayni():
+    uyeler = list(_uyeler())
+    aile, uzunluk, adet, malzeme, boyutlar, profil = _sutunlar(uyeler)
+    sonuc = metraj(aile, uzunluk, malzeme=malzeme, adet=adet, boyutlar=boyutlar,
+                   profil=profil)
+
+    beklenen = defaultdict(lambda: [0, 0.0, 0.0])
+    for u in uyeler:
+        b = beklenen[u[6]]
+        b[0] += 1
+        b[1] += u[4] / 1000.0 * u[5]
+        b[2] += agirlik_hesap(u[7], u[4] / 1000.0 * u[5], MALZEMELER[u[6]])
+    bulunan = {r["Anahtar"]: r for r in sonuc["malzeme_toplamlari"]}
+    assert bulunan.keys() == beklenen.keys()
+    for m, (satir, uzunluk_m, kg) in beklenen.items():
+        assert bulunan[m]["Satır"] == satir
+        assert bulunan[m]["Uzunluk (m)"] == pytest.approx(uzunluk_m, rel=1e-12)
+        assert bulunan[m]["Ağırlık (kg)"] == pytest.approx(kg, rel=1e-12)
+
+    profiller = sonuc["profil_toplamlari"]
+    assert sum(r["Satır"] for r in profiller) == len(uyeler)
+    assert sum(r["Ağırlık (kg)"] for r in profiller) == pytest.approx(sonuc["kg"].sum(), rel=1e-12)
+    adli = {r["Anahtar"]: r for r in profiller}
+    for u in uyeler:
+        if u[3]:
+            assert u[3] in adli
+
+
+def test_adsiz_satirda_eksik_boyut_sutunu_adlandirilir():
+    with pytest.raises(ValueError, match="tw, tf"):
+        metraj(["ipe", "ipe"], [1000.0, 2000.0], boyutlar={"h": [100.0, 120.0], "b": [55.0, 64.0]},
+               profil=["", "IPE 120"])
+    with pytest.raises(ValueError, match="h, b, tw, tf"):
+        metraj(["ipe"], [1000.0], profil=[""])
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""muadil_liste_10yuzde: top_k / offset sayfası, tüm listenin kararlı
+sıralamasından alınan dilimle aynı olmalı (eşit skorlarda katalog sırası)."""
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+from profil_core import muadil
+from profil_core.katalog import KatalogIndeksi
+
+
+def _indeks(n, tohum):
+    # Az sayıda farklı Wx / Wy: çok sayıda eşit skor ve yinelenen satır
+    rnd = random.Random(tohum)
+    return KatalogIndeksi.satirlardan([{
+        "Profil": "P{}".format(i), "Tip": "IPE",
+        "Wx_mm3": float(rnd.choice([900, 950, 1000, 1050, 1100])),
+        "Wy_mm3": float(rnd.choice([450, 500, 550])),
+    } for i in range(n)])
+
+
+def _taban(indeks, Wx, Wy, tolerans):
+    sonuc = []
+    for r in indeks.satirlar(range(len(indeks))):
+        if (abs(r["Wx_mm3"] - Wx) <= tolerans * Wx or abs(r["Wy_mm3"] - Wy) <= tolerans * Wy):
+            sonuc.append(r["Profil"])
+    skor = {r["Profil"]: abs(Wx - r["Wx_mm3"]) + abs(Wy - r["Wy_mm3"])
+            for r in indeks.satirlar(range(len(indeks)))}
+    return sorted(sonuc, key=skor.__getitem__)  # sorted kararlı: katalog sırası
+
+
+@pytest.mark.parametrize("n", [1, 40, 300])
+def test_sayfa_tam_siralamanin_dilimi(monkeypatch, n):
+    indeks = _indeks(n, n)
+    monkeypatch.setattr(muadil, "katalog_indeksi", lambda: indeks)
+    for Wx, Wy in [(1000.0, 500.0), (975.0, 475.0), (1100.0, 450.0)]:
+        tum = [r["Profil"] for r in muadil.muadil_liste_10yuzde.fonk(Wx, Wy)]
+        assert tum == _taban(indeks, Wx, Wy, 0.10)
+        for top_k in (0, 1, 3, 7, n, n + 5):
+            for offset in (0, 1, 5, n):
+                sayfa = muadil.muadil_liste_10yuzde.fonk(Wx, Wy, top_k=top_k, offset=offset)
+                assert [r["Profil"] for r in sayfa] == tum[offset:offset + top_k]
+                tablo = muadil.muadil_liste_10yuzde.fonk(Wx, Wy, top_k=top_k, offset=offset,
+                                                         sutunlu=True)
+                assert tablo.eslesen == len(tum)
+
+
+def test_fork_kancasi_olmayan_platformda_ice_aktarilir():
+    # Windows'ta os.fork ve os.register_at_fork yoktur; ortak havuz kancası atlanmalı
+    kod = "import os; del os.fork, os.register_at_fork; import profil_core.muadil"
+    kok = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", kod], cwd=kok, check=True, capture_output=True)
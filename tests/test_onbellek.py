@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""LRUOnbellek: isabet, LRU düşürme, TTL, sürüm değişimi ve dondurulamayan
+argümanlar."""
+import numpy as np
+
+from profil_core import onbellek
+from profil_core.muadil import t_profil_wx_wy
+from profil_core.onbellek import LRUOnbellek
+
+
+class Saat:
+    def __init__(self):
+        self.t = 1000.0
+
+    def __call__(self):
+        return self.t
+
+
+def _sayan(cagrilar):
+    def ara(*args, **kwargs):
+        cagrilar.append((args, kwargs))
+        return [len(cagrilar)]
+    return ara
+
+
+def test_isabet_ve_liste_kopyasi():
+    cagrilar = []
+    o = LRUOnbellek(_sayan(cagrilar), max_boyut=4)
+
+    ilk = o(1, [2, 3], b=range(0, 10, 2))
+    ilk.append("değişti")
+    assert o(1, (2, 3), b=range(0, 10, 2)) == [1]
+    assert len(cagrilar) == 1
+    assert (o.isabet, o.iskalama) == (1, 1)
+
+    assert o(1, [2, 4], b=range(0, 10, 2)) == [2]
+    assert len(cagrilar) == 2
+
+
+def test_lru_dusurme():
+    cagrilar = []
+    o = LRUOnbellek(_sayan(cagrilar), max_boyut=2)
+    o(1)
+    o(2)
+    o(1)  # 1 en son kullanılan olur; 3 eklenince 2 düşer
+    o(3)
+    assert len(cagrilar) == 3
+
+    o(1)
+    assert len(cagrilar) == 3
+    o(2)
+    assert len(cagrilar) == 4
+    assert o.istatistik()["Kayıt"] == 2
+
+
+def test_ttl_dolunca_yeniden_hesaplanir(monkeypatch):
+    saat = Saat()
+    monkeypatch.setattr(onbellek.time, "monotonic", saat)
+    cagrilar = []
+    o = LRUOnbellek(_sayan(cagrilar), ttl=10)
+
+    o(1)
+    saat.t += 10
+    assert o(1) == [1]
+    saat.t += 10.5
+    assert o(1) == [2]
+    assert len(cagrilar) == 2
+
+
+def test_surum_degisince_eski_kayit_bulunmaz():
+    surum = [0]
+    cagrilar = []
+    o = LRUOnbellek(_sayan(cagrilar), surum=lambda: surum[0])
+
+    o(1)
+    o(1)
+    assert len(cagrilar) == 1
+    surum[0] += 1
+    assert o(1) == [2]
+    assert o(1) == [2]
+    assert len(cagrilar) == 2
+
+
+def test_numpy_argumanlari_anahtarlanir():
+    cagrilar = []
+    o = LRUOnbellek(_sayan(cagrilar))
+
+    o(genislikler=np.array([80.0, 100.0]))
+    o(genislikler=np.array([80.0, 100.0]))
+    assert len(cagrilar) == 1
+    o(genislikler=np.array([80.0, 110.0]))
+    o(genislikler=np.array([80, 100]))
+    o(genislikler=np.array([[80.0, 100.0]]))
+    assert len(cagrilar) == 4
+
+
+def test_dondurulamayan_arguman_onbelleksiz_hesaplanir():
+    cagrilar = []
+    o = LRUOnbellek(_sayan(cagrilar))
+
+    assert o({"a": 1}) == [1]
+    assert o({"a": 1}) == [2]
+    assert o.istatistik()["Kayıt"] == 0
+
+
+def test_t_profil_numpy_genislikler():
+    stok = [80.0, 100.0, 120.0]
+    beklenen = t_profil_wx_wy(50000, 20000, 200, 4, 10, genislikler=stok)
+    assert t_profil_wx_wy(50000, 20000, 200, 4, 10, genislikler=np.array(stok)) == beklenen
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Pareto cephesi: sırala-tara sonucu O(n²) baskınlık süzgeciyle aynı olmalı."""
+import numpy as np
+import pytest
+
+from profil_core.pareto import ParetoCephesi, pareto_on_yuz
+
+
+def _kaba(Wx, Wy, kg_m):
+    """Baskılanmayan satırlar; aynı değerlilerden ilki kalır (kg/m artan sırada)."""
+    cephe = []
+    for i in range(len(Wx)):
+        baskin = False
+        for j in range(len(Wx)):
+            if j == i:
+                continue
+            en_az = Wx[j] >= Wx[i] and Wy[j] >= Wy[i] and kg_m[j] <= kg_m[i]
+            kesin = Wx[j] > Wx[i] or Wy[j] > Wy[i] or kg_m[j] < kg_m[i]
+            if en_az and (kesin or j < i):
+                baskin = True
+                break
+        if not baskin:
+            cephe.append(i)
+    return sorted(cephe, key=lambda i: (kg_m[i], -Wx[i], -Wy[i], i))
+
+
+@pytest.mark.parametrize("tohum", range(40))
+def test_kaba_kuvvetle_ayni(tohum):
+    rnd = np.random.default_rng(tohum)
+    n = int(rnd.integers(1, 120))
+    # Küçük tam sayı değerleri: kg/m ve Wx/Wy'de bol eşitlik
+    ust = int(rnd.choice([3, 8, 50]))
+    Wx = rnd.integers(1, ust, n).astype(float)
+    Wy = rnd.integers(1, ust, n).astype(float)
+    kg_m = rnd.integers(1, max(ust // 2, 2), n).astype(float)
+
+    assert pareto_on_yuz(Wx, Wy, kg_m) == _kaba(Wx, Wy, kg_m)
+
+
+def test_surekli_degerler():
+    rnd = np.random.default_rng(99)
+    Wx, Wy = rnd.lognormal(10, 1, (2, 400))
+    kg_m = np.round(rnd.lognormal(3, 0.5, 400), 1)
+    assert pareto_on_yuz(Wx, Wy, kg_m) == _kaba(Wx, Wy, kg_m)
+
+
+def test_bos():
+    assert pareto_on_yuz([], [], []) == []
+
+
+def test_cephe_sorgusu_en_hafifi_verir():
+    profil = ["A", "B", "C", "D", "E"]
+    Wx = [100.0, 200.0, 150.0, 200.0, float("nan")]
+    Wy = [50.0, 80.0, 40.0, 90.0, 10.0]
+    kg_m = [10.0, 20.0, 15.0, 20.0, 1.0]
+    cephe = ParetoCephesi(profil, ["x"] * 5, Wx, Wy, kg_m)
+
+    assert cephe.profil == ["A", "C", "D"]
+    assert [r["Profil"] for r in cephe.sorgula(120.0, 60.0)] == ["D"]
+    assert cephe.sorgula(300.0, 0.0) == []
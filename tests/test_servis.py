@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Servis uç noktaları: başarılı yanıt, girdi hatası (400), /toplu ve
+yalnızca başarılı yanıtların önbelleğe alınması. Havuz kurulmadan
+(baslat çağrılmadan) ağır uç noktalar varsayılan yürütücüde çalışır."""
+import asyncio
+import json
+
+import pytest
+
+from profil_servis import ProfilServisi, uc_nokta_calistir
+
+UYE = {"tip": "IPE", "profil": "IPE 160"}
+
+
+def _coz(yanit):
+    durum, govde = yanit
+    return durum, json.loads(govde)
+
+
+def test_agirlik_basarili():
+    durum, g = _coz(uc_nokta_calistir("/agirlik", dict(UYE, metraj_mm=2000)))
+    assert durum == 200
+    assert g["agirlik_kg"] == pytest.approx(2 * g["kg_m"])
+
+
+def test_muadil_sayfasi():
+    durum, g = _coz(uc_nokta_calistir("/muadil", dict(UYE, top_k=1)))
+    assert durum == 200
+    assert [r["Profil"] for r in g["sonuc"]] == ["IPE 160"]
+
+
+@pytest.mark.parametrize("alan, deger", [
+    ("top_k", 2.7), ("offset", 1.5), ("top_k", "2,5"), ("b_adim", 2.5), ("top_k", "on"),
+])
+def test_tam_sayi_olmayan_deger_400(alan, deger):
+    govde = dict(UYE, **{alan: deger})
+    durum, g = _coz(uc_nokta_calistir("/t_profil", govde))
+    assert durum == 400
+    assert "hata" in g
+
+
+def test_tam_sayi_degerli_ondalik_kabul_edilir():
+    assert uc_nokta_calistir("/muadil", dict(UYE, top_k=2.0))[0] == 200
+
+
+def test_yanitla_yalnizca_basariliyi_onbellege_alir():
+    servis = ProfilServisi(isci=1, onbellek_boyutu=16)
+
+    async def calistir():
+        hatali = await servis.yanitla("/muadil", dict(UYE, top_k=2.7))
+        ilk = await servis.yanitla("/muadil", dict(UYE, top_k=2))
+        ikinci = await servis.yanitla("/muadil", dict(UYE, top_k=2))
+        return hatali, ilk, ikinci
+
+    hatali, ilk, ikinci = asyncio.run(calistir())
+    assert hatali[0] == 400
+    assert ilk == ikinci and ilk[0] == 200
+    ist = servis.onbellek.istatistik()
+    assert ist["Kayıt"] == 1
+    assert ist["İsabet"] == 1
+
+
+def test_toplu():
+    servis = ProfilServisi(isci=1)
+    govde = {"istekler": [
+        {"yol": "/kesit", "govde": UYE},
+        {"yol": "/muadil", "govde": dict(UYE, offset=0.5)},
+        {"yol": "/yok", "govde": {}},
+        "kalem değil",
+    ]}
+
+    durum, yanit = asyncio.run(servis.isle("POST", "/toplu", json.dumps(govde).encode("utf-8")))
+    assert durum == 200
+    yanitlar = json.loads(yanit)["yanitlar"]
+    assert [y["durum"] for y in yanitlar] == [200, 400, 404, 400]
+    assert yanitlar[0]["govde"]["Wx_mm3"] > 0
+    assert servis.onbellek.istatistik()["Kayıt"] == 1
+
+
+@pytest.mark.parametrize("yol, sayfa", [
+    ("/muadil", {"top_k": -1}), ("/t_profil", {"top_k": -2}),
+    ("/muadil", {"offset": -2, "top_k": 5}), ("/lama", {"offset": -1}),
+])
+def test_negatif_sayfa_400(yol, sayfa):
+    durum, g = _coz(uc_nokta_calistir(yol, dict(UYE, **sayfa)))
+    assert durum == 400
+    assert "negatif" in g["hata"]
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""SonucTablosu: sütunlu sonuçlar satır sözlüğü listeleriyle aynı satırları
+vermeli; eslesen sayfalamadan önceki eşleşme sayısı olmalı."""
+import pytest
+
+from profil_core.muadil import (
+    kaynakli_wx_wy, lama_muadil_wx_wy, muadil_liste_10yuzde, t_profil_wx_wy,
+)
+from profil_core.sonuc import MUADIL_SEMASI, T_SEMASI, SonucTablosu
+
+# (ad, arama(**sayfa)) çiftleri; her arama hem satır listesi hem tablo döndürür
+ARAMALAR = [
+    ("muadil", lambda **k: muadil_liste_10yuzde(120000, 60000, 0.5, **k)),
+    ("lama", lambda **k: lama_muadil_wx_wy(20000, 3000, 100, tolerans=0.3, **k)),
+    ("t_profil", lambda **k: t_profil_wx_wy(50000, 20000, 100, 4, 10, **k)),
+    ("t_surekli", lambda **k: t_profil_wx_wy(50000, 20000, 100, 4, 10, b_adim=None, **k)),
+    ("kaynakli", lambda **k: kaynakli_wx_wy("I", 150000, 30000, 200, 4, 12, **k)),
+]
+
+
+@pytest.mark.parametrize("ad, ara", ARAMALAR, ids=[a for a, _ in ARAMALAR])
+def test_satirlar_liste_ile_ayni(ad, ara):
+    liste = ara()
+    tablo = ara(sutunlu=True)
+    assert len(liste) > 3
+    assert tablo.satirlar() == liste
+    assert len(tablo) == tablo.eslesen == len(liste)
+    assert [ad for ad, _, _ in tablo.sema] == list(liste[0])
+
+
+@pytest.mark.parametrize("ad, ara", ARAMALAR, ids=[a for a, _ in ARAMALAR])
+def test_eslesen_sayfa_oncesi_sayidir(ad, ara):
+    liste = ara()
+    sayfa = ara(sutunlu=True, top_k=2, offset=1)
+    assert len(sayfa) == 2
+    assert sayfa.eslesen == len(liste)
+    assert sayfa.satirlar() == liste[1:3]
+
+    sondan = ara(sutunlu=True, top_k=10, offset=len(liste) - 1)
+    assert len(sondan) == 1
+    assert sondan.eslesen == len(liste)
+
+
+def test_bos_tablo():
+    for tablo in (muadil_liste_10yuzde(None, None, sutunlu=True),
+                  t_profil_wx_wy(50000, 20000, 100, 50, 60, sutunlu=True),
+                  SonucTablosu.satirlardan(T_SEMASI, [])):
+        assert len(tablo) == 0
+        assert tablo.eslesen == 0
+        assert tablo.satirlar() == []
+        assert len(tablo[0:5]) == 0
+        assert set(tablo.sutunlar) == {ad for ad, _, _ in tablo.sema}
+
+
+def test_dilim_ve_satir():
+    satirlar = [{"Profil": "P{}".format(i), "Tip": "X", "Wx_mm3": float(i), "Wy_mm3": 1.0,
+                 "ΔWx": 0.5, "ΔWy": 0.25, "Toplam Skor": 0.75} for i in range(5)]
+    tablo = SonucTablosu.satirlardan(MUADIL_SEMASI, satirlar, eslesen=40)
+
+    assert tablo[3] == satirlar[3]
+    alt = tablo[1:3]
+    assert alt.satirlar() == satirlar[1:3]
+    assert alt.eslesen == 40
+    assert alt.sutunlar["Wx_mm3"].base is not None
+    assert not tablo.sutunlar["Wx_mm3"].flags.writeable
+    assert tablo.bicimler()["Toplam Skor"] == "%.1f"
+    assert "Profil" not in tablo.bicimler()
+
+
+def test_arrow():
+    pa = pytest.importorskip("pyarrow")
+    tablo = lama_muadil_wx_wy(20000, 3000, 100, sutunlu=True)
+    a = tablo.arrow()
+    assert a.num_rows == len(tablo)
+    assert a.schema.field("h (mm)").type == pa.float64()
+    assert a.to_pylist() == tablo.satirlar()
+
+
+@pytest.mark.parametrize("ad, ara", ARAMALAR, ids=[a for a, _ in ARAMALAR])
+@pytest.mark.parametrize("sayfa", [{"top_k": -1}, {"offset": -2, "top_k": 5}, {"offset": -1}])
+def test_negatif_sayfa_reddedilir(ad, ara, sayfa):
+    with pytest.raises(ValueError):
+        ara(**sayfa)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Toplu hesap: tek süreçte uye_hesapla ve sonuclari_yaz; hatalı satırlar
+hata alanıyla yazılır, *_sayisi sayfalamadan önceki eşleşme sayısıdır."""
+import csv
+import json
+
+import pytest
+
+from profil_core.muadil import lama_muadil_wx_wy, muadil_liste_10yuzde, t_profil_wx_wy
+from profil_core.uye import uye_kesit
+from profil_toplu import CSV_ALANLARI, sonuclari_yaz, toplu_hesapla, uye_hesapla, uyeleri_oku
+
+UYELER = [
+    {"tip": "IPE", "profil": "IPE 160", "metraj_mm": "2000", "malzeme": ""},
+    {"tip": "Boru", "DN": "50", "SCH": "40", "metraj_mm": "1500,5"},
+    {"tip": "Boru", "DN": "50.5", "SCH": "40", "metraj_mm": "1000"},
+    {"tip": "IPE", "profil": "IPE 999"},
+    {"tip": "IPE", "profil": "IPE 160", "malzeme": "Ahşap"},
+]
+
+
+def test_uye_hesapla_sayilar():
+    s = uye_hesapla(1, UYELER[0], top_k=2)
+    assert "hata" not in s
+    assert s["agirlik_kg"] == pytest.approx(2 * s["A_mm2"] * 1e-6 * 7850)
+
+    k = uye_kesit("IPE", profil="IPE 160")
+    Wx, Wy = k["Wx"], k["Wy"]
+    tam = {
+        "muadil": muadil_liste_10yuzde(Wx, Wy),
+        "lama": lama_muadil_wx_wy(Wx, Wy, k["H_max"]),
+        "t": t_profil_wx_wy(Wx, Wy, k["H_max"], k["t_min"], k["t_max"]),
+    }
+    for ad, liste in tam.items():
+        assert s[ad + "_sayisi"] == len(liste)
+        assert s[ad] == liste[:2]
+
+
+@pytest.mark.parametrize("uye", [
+    {"tip": "Boru", "DN": "50.5", "SCH": "40"},
+    {"tip": "Boru", "DN": 50.5, "SCH": "40"},
+    {"tip": "Boru", "DN": "elli", "SCH": "40"},
+])
+def test_tam_sayi_olmayan_dn_hata(uye):
+    s = uye_hesapla(7, uye, aramalar=False)
+    assert s["satir"] == 7
+    assert "hata" in s
+    assert "Wx_mm3" not in s
+
+
+def test_tam_sayi_degerli_dn_kabul_edilir():
+    assert uye_hesapla(1, {"tip": "Boru", "DN": "50.0", "SCH": "40"}, aramalar=False)["Wx_mm3"] \
+        == uye_hesapla(1, {"tip": "Boru", "DN": 50, "SCH": "40"}, aramalar=False)["Wx_mm3"]
+
+
+def test_sonuclari_yaz_csv(tmp_path):
+    yol = str(tmp_path / "sonuc.csv")
+    n, hata = sonuclari_yaz(toplu_hesapla(UYELER, isci=1, parca=2, top_k=3), yol)
+    assert (n, hata) == (5, 3)
+
+    with open(yol, encoding="utf-8", newline="") as f:
+        satirlar = list(csv.DictReader(f))
+    assert list(satirlar[0]) == CSV_ALANLARI
+    assert [r["satir"] for r in satirlar] == ["1", "2", "3", "4", "5"]
+    assert [bool(r["hata"]) for r in satirlar] == [False, False, True, True, True]
+
+    ilk = satirlar[0]
+    s = uye_hesapla(1, UYELER[0], top_k=3)
+    assert ilk["en_iyi_muadil"] == s["muadil"][0]["Profil"] == "IPE 160"
+    assert ilk["en_iyi_lama"] == (s["lama"][0]["Lama"] if s["lama"] else "")
+    for ad in ("muadil", "lama", "t"):
+        assert int(ilk[ad + "_sayisi"]) == s[ad + "_sayisi"]
+    assert satirlar[2]["muadil_sayisi"] == ""
+
+
+def test_sonuclari_yaz_jsonl(tmp_path):
+    yol = str(tmp_path / "sonuc.jsonl")
+    n, hata = sonuclari_yaz(toplu_hesapla(UYELER[:3], isci=1, aramalar=False), yol)
+    assert (n, hata) == (3, 1)
+    with open(yol, encoding="utf-8") as f:
+        satirlar = [json.loads(s) for s in f]
+    assert satirlar[1]["metraj_mm"] == 1500.5
+    assert "Tam sayı" in satirlar[2]["hata"]
+
+
+def test_bozuk_jsonl_satirlari_hatali_yazilir(tmp_path):
+    girdi = tmp_path / "uyeler.jsonl"
+    girdi.write_text("\n".join([
+        json.dumps({"tip": "IPE", "profil": "IPE 160", "metraj_mm": 1000}),
+        '{"tip": "IPE", "profil": ',
+        "[1, 2]",
+        "",
+        "42",
+        json.dumps({"tip": "Boru", "DN": 50, "SCH": "40"}),
+    ]) + "\n", encoding="utf-8")
+    cikti = str(tmp_path / "sonuc.jsonl")
+
+    sonuclar = toplu_hesapla(uyeleri_oku(str(girdi)), isci=1, aramalar=False)
+    assert sonuclari_yaz(sonuclar, cikti) == (5, 3)
+    with open(cikti, encoding="utf-8") as f:
+        satirlar = [json.loads(s) for s in f]
+    assert [s["satir"] for s in satirlar] == [1, 2, 3, 4, 5]
+    assert "Geçersiz JSON" in satirlar[1]["hata"]
+    assert satirlar[2] == {"satir": 3, "hata": "Üye bir JSON nesnesi olmalı"}
+    assert "hata" in satirlar[3]
+    assert "hata" not in satirlar[0] and "hata" not in satirlar[4]
+
+
+def test_bozuk_satir_isaretcisi_surec_havuzundan_gecer(tmp_path):
+    girdi = tmp_path / "uyeler.jsonl"
+    girdi.write_text('{"tip": "IPE", "profil": "IPE 160"}\nbozuk\n', encoding="utf-8")
+    sonuclar = list(toplu_hesapla(uyeleri_oku(str(girdi)), isci=2, parca=1, aramalar=False))
+    assert [("hata" in s) for s in sonuclar] == [False, True]
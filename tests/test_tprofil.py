@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""T profil araması: budamalı çözüm (budama=True) tüm ızgarayı tarayan
+yol (budama=False) ve ilk sürümdeki skaler döngüyle aynı listeyi vermeli."""
+import random
+
+import pytest
+
+from profil_core.muadil import _b_araligi, t_profil_wx_wy
+from profil_core.tprofil import T_ADAYLARI, t_profil_ara
+
+
+def _taban_wx_wy(H, t_f, t_w, b_f):
+    # İlk sürümdeki skaler T kesit formülü
+    h_w = H - t_f
+    A_f = b_f * t_f
+    A_w = t_w * h_w
+    y_f = h_w + t_f / 2.0
+    y_w = h_w / 2.0
+    y_bar = (A_f * y_f + A_w * y_w) / (A_f + A_w)
+    Ix = (b_f * t_f ** 3 / 12.0 + A_f * (y_f - y_bar) ** 2
+          + t_w * h_w ** 3 / 12.0 + A_w * (y_w - y_bar) ** 2)
+    Iy = t_f * b_f ** 3 / 12.0 + h_w * t_w ** 3 / 12.0
+    c_x = max(H - y_bar, y_bar)
+    return Ix * 1e-12 / (c_x / 1000.0) * 1e9, Iy * 1e-12 / (b_f / 2.0 / 1000.0) * 1e9
+
+
+def _taban(Wx_t, Wy_t, H, t_list, b_list, tolerans=0.10):
+    """(t_f, t_w, b_f) -> skor; ilk sürümdeki tüm ızgara döngüsü."""
+    sonuc = {}
+    for t_f in t_list:
+        if H - t_f <= 0:
+            continue
+        for t_w in t_list:
+            for b_f in b_list:
+                Wx, Wy = _taban_wx_wy(H, t_f, t_w, b_f)
+                if ((Wx_t > 0 and abs(Wx - Wx_t) <= tolerans * Wx_t)
+                        or (Wy_t > 0 and abs(Wy - Wy_t) <= tolerans * Wy_t)):
+                    sonuc[(t_f, t_w, b_f)] = abs(Wx - Wx_t) + abs(Wy - Wy_t)
+    return sonuc
+
+
+def _hedefler(n=4, tohum=7):
+    rnd = random.Random(tohum)
+    for _ in range(n):
+        H = rnd.choice([150.0, 237.5, 400.0])
+        t_f, t_w = rnd.choice(T_ADAYLARI[:8]), rnd.choice(T_ADAYLARI[:8])
+        b_f = rnd.uniform(*_b_araligi(H))
+        Wx, Wy = _taban_wx_wy(H, t_f, t_w, b_f)
+        yield H, Wx * rnd.uniform(0.9, 1.1), Wy * rnd.uniform(0.9, 1.1)
+
+
+def _anahtarli(satirlar):
+    return {(r["t_f (mm)"], r["t_w (mm)"], r["b_f (mm)"]): r["Toplam Skor"] for r in satirlar}
+
+
+def _sirali(satirlar):
+    skorlar = [r["Toplam Skor"] for r in satirlar]
+    return skorlar == sorted(skorlar)
+
+
+@pytest.mark.parametrize("b_adim", [10, 5, 3])
+@pytest.mark.parametrize("H,Wx,Wy", list(_hedefler()))
+def test_budama_izgara_ve_taban_ayni(H, Wx, Wy, b_adim):
+    t_min, t_max = 4, 30
+    budamali = t_profil_wx_wy(Wx, Wy, H, t_min, t_max, b_adim=b_adim, budama=True)
+    izgara = t_profil_wx_wy(Wx, Wy, H, t_min, t_max, b_adim=b_adim, budama=False)
+    b_start, b_end = _b_araligi(H)
+    taban = _taban(Wx, Wy, H, [t for t in T_ADAYLARI if t_min <= t <= t_max],
+                   range(b_start, b_end + 1, b_adim))
+
+    assert taban
+    assert budamali == izgara
+    assert _sirali(budamali)
+    bulunan = _anahtarli(budamali)
+    assert bulunan.keys() == taban.keys()
+    for k, skor in taban.items():
+        assert bulunan[k] == pytest.approx(skor, rel=1e-9)
+
+
+@pytest.mark.parametrize("H,Wx,Wy", list(_hedefler()))
+def test_surekli_genislik_izgaranin_en_iyisinden_kotu_degil(H, Wx, Wy):
+    """b_adim=None: her kalınlık çifti için bulunan en iyi sürekli b_f,
+    1 mm ızgaranın o çiftteki en iyi satırından kötü olamaz."""
+    t_list = [t for t in T_ADAYLARI if 4 <= t <= 30]
+    surekli = t_profil_wx_wy(Wx, Wy, H, 4, 30, b_adim=None)
+    b_start, b_end = _b_araligi(H)
+    taban = _taban(Wx, Wy, H, t_list, range(b_start, b_end + 1))
+
+    assert _sirali(surekli)
+    en_iyi = {}
+    for r in surekli:
+        assert b_start - 1e-6 <= r["b_f (mm)"] <= b_end + 1e-6
+        Wx_r, Wy_r = _taban_wx_wy(H, r["t_f (mm)"], r["t_w (mm)"], r["b_f (mm)"])
+        assert abs(Wx_r - Wx) <= 0.10 * Wx * (1 + 1e-9) or abs(Wy_r - Wy) <= 0.10 * Wy * (1 + 1e-9)
+        cift = (r["t_f (mm)"], r["t_w (mm)"])
+        en_iyi[cift] = min(en_iyi.get(cift, float("inf")), r["Toplam Skor"])
+    for (t_f, t_w, _), skor in taban.items():
+        assert en_iyi[(t_f, t_w)] <= skor * (1 + 1e-9)
+
+
+@pytest.mark.parametrize("top_k,offset", [(None, 0), (7, 0), (5, 3), (50, 40)])
+@pytest.mark.parametrize("sifir", [None, "Wx", "Wy"])
+@pytest.mark.parametrize("H,Wx,Wy", list(_hedefler(2, tohum=5)))
+def test_izgara_motoru_skaler_siralamayla_ayni(H, Wx, Wy, sifir, top_k, offset):
+    """t_profil_ara: skaler döngünün skora (eşitlikte döngü sırasına) göre
+    kararlı sıralamasının [offset, offset + top_k) dilimi; sıfır hedef bant
+    koşuluna katılmaz."""
+    Wx, Wy = (0.0 if sifir == "Wx" else Wx), (0.0 if sifir == "Wy" else Wy)
+    t_list = [4, 5, 6, 8, 10, 12.5]
+    b_list = [37.5 + 7.25 * i for i in range(70)]
+    taban = _taban(Wx, Wy, H, t_list, b_list, tolerans=0.15)
+    sirali = sorted(taban.items(), key=lambda kv: kv[1])  # kararlı: döngü sırası korunur
+    n = None if top_k is None else offset + top_k
+
+    s = t_profil_ara(Wx, Wy, H, t_list, b_list, tolerans=0.15, top_k=top_k, offset=offset)
+    assert len(sirali) > 10
+    assert s["eslesen"] == len(sirali)
+    assert s["degerlendirilen"] == len(t_list) ** 2 * len(b_list)
+    assert list(zip(s["t_f"], s["t_w"], s["b_f"])) == [k for k, _ in sirali[offset:n]]
+    assert list(s["skor"]) == pytest.approx([v for _, v in sirali[offset:n]], rel=1e-12)